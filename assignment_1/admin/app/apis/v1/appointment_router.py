@@ -6,7 +6,9 @@ import asyncio
 from datetime import date
 
 from fastapi import APIRouter, Path, Query, status
+from fastapi.responses import StreamingResponse
 
+from app.core.constants import AppointmentExportFormat
 from app.core.constants.appointment_status import AppointmentStatus
 from app.dtos import (
     AppointmentListItemResponse,
@@ -15,6 +17,7 @@ from app.dtos import (
     AppointmentStatusUpdateRequest,
 )
 from app.services import (
+    service_export_appointments,
     service_get_appointment_daily_counts,
     service_get_appointment_status_counts,
     service_get_appointment_timeslot_counts,
@@ -39,6 +42,10 @@ async def api_get_appointments(
     doctor_id: int | None = Query(default=None, description="의사 ID"),
     treatment_id: int | None = Query(default=None, description="진료 항목 ID"),
     status: AppointmentStatus | None = Query(default=None, description="예약 상태"),
+    include_total: bool = Query(default=True, description="총 건수/총 페이지 수 포함 여부 (false면 has_next만 반환)"),
+    cursor: str | None = Query(
+        default=None, min_length=1, description="이전 응답의 next_cursor (지정 시 page 대신 커서 다음부터 조회)"
+    ),
 ) -> AppointmentListResponse:
     """관리자용 예약 목록을 페이지네이션과 함께 조회합니다."""
     return await service_get_appointments(
@@ -49,6 +56,38 @@ async def api_get_appointments(
         doctor_id=doctor_id,
         treatment_id=treatment_id,
         status=status,
+        include_total=include_total,
+        cursor=cursor,
+    )
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="예약 내보내기",
+)
+async def api_export_appointments(
+    export_format: AppointmentExportFormat = Query(
+        default=AppointmentExportFormat.NDJSON, alias="format", description="내보내기 형식 (ndjson, csv)"
+    ),
+    start_date: date | None = Query(default=None, description="조회 시작일"),
+    end_date: date | None = Query(default=None, description="조회 종료일"),
+    doctor_id: int | None = Query(default=None, description="의사 ID"),
+    treatment_id: int | None = Query(default=None, description="진료 항목 ID"),
+    status: AppointmentStatus | None = Query(default=None, description="예약 상태"),
+) -> StreamingResponse:
+    """조건에 맞는 예약 전체를 페이지 없이 NDJSON/CSV로 스트리밍합니다."""
+    return StreamingResponse(
+        service_export_appointments(
+            export_format=export_format,
+            start_date=start_date,
+            end_date=end_date,
+            doctor_id=doctor_id,
+            treatment_id=treatment_id,
+            status=status,
+        ),
+        media_type=export_format.media_type,
+        headers={"Content-Disposition": f'attachment; filename="appointments.{export_format.value}"'},
     )
 
 
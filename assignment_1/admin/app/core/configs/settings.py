@@ -69,6 +69,17 @@ class Settings(BaseSettings):
     max_advance_booking_days: int = Field(default=30, description="최대 예약 가능 일수")
     min_advance_booking_hours: int = Field(default=2, description="최소 예약 시간 (시간)")
 
+    # 예약 내보내기 (서버 측 커서에서 한 번에 읽어 응답으로 보내는 건수)
+    appointment_export_batch_size: int = Field(default=1000, description="예약 내보내기 1회 조회 건수")
+
+    # ============================================================================
+    # 캐시 설정
+    # ============================================================================
+
+    # 예약 목록 총 건수 캐시 (필터 조건별, 짧은 TTL 동안 같은 필터의 페이지 이동 시 COUNT 재실행 방지)
+    appointment_count_cache_ttl_seconds: float = Field(default=5.0, description="예약 건수 캐시 유지 시간 (초)")
+    appointment_count_cache_max_entries: int = Field(default=1000, description="예약 건수 캐시 최대 항목 수")
+
     # ============================================================================
     # 계산된 속성들
     # ============================================================================
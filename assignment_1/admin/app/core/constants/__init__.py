@@ -1,13 +1,17 @@
 """상수 모듈"""
 
+from app.core.constants.appointment_export_format import AppointmentExportFormat
 from app.core.constants.appointment_status import AppointmentStatus
+from app.core.constants.cache_names import CacheNames
 from app.core.constants.department import Department
 from app.core.constants.error_messages import ErrorMessages
 from app.core.constants.hospital_constants import HospitalOperationConstants
 from app.core.constants.visit_type import VisitType
 
 __all__ = [
+    "AppointmentExportFormat",
     "AppointmentStatus",
+    "CacheNames",
     "Department",
     "ErrorMessages",
     "HospitalOperationConstants",
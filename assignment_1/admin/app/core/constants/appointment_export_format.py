@@ -0,0 +1,21 @@
+"""예약 내보내기 형식 상수"""
+
+from __future__ import annotations
+
+from enum import StrEnum
+
+
+class AppointmentExportFormat(StrEnum):
+    """예약 내보내기 형식"""
+
+    NDJSON = "ndjson"  # 한 줄에 예약 하나 (JSON)
+    CSV = "csv"  # 첫 줄 헤더 + 예약별 한 줄
+
+    @property
+    def media_type(self) -> str:
+        """응답 Content-Type"""
+        media_types = {
+            AppointmentExportFormat.NDJSON: "application/x-ndjson",
+            AppointmentExportFormat.CSV: "text/csv",
+        }
+        return media_types[self]
@@ -22,6 +22,7 @@ class ErrorMessages:
 
     # 공통
     INVALID_PAGINATION = "페이지 정보가 올바르지 않습니다."
+    INVALID_CURSOR = "유효하지 않은 커서입니다."
 
     # 예약 관련
     APPOINTMENT_NOT_FOUND = "예약을 찾을 수 없습니다."
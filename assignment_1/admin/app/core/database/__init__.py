@@ -4,6 +4,7 @@ from .connection_async import (
     get_async_session,
     get_db_session,
 )
+from .migrations import Migration, apply_migrations, get_applied_versions, load_migrations
 from .orm import Base, BaseModel, TimestampMixin
 
 __all__ = [
@@ -14,4 +15,9 @@ __all__ = [
     "Base",
     "BaseModel",
     "TimestampMixin",
+    # 스키마 마이그레이션
+    "Migration",
+    "load_migrations",
+    "get_applied_versions",
+    "apply_migrations",
 ]
@@ -0,0 +1,117 @@
+"""
+스키마 마이그레이션
+
+database/init.sql은 새 DB의 전체 스키마, database/migrations/<버전>_<이름>.sql은 기존 DB를 갱신하는 변경분
+적용한 버전은 schema_migrations 테이블에 기록하고, 새 DB는 init.sql에서 반영된 버전을 미리 기록
+"""
+
+from __future__ import annotations
+
+import pathlib
+from dataclasses import dataclass
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+# 저장소 기준 마이그레이션 디렉터리 (admin/app/core/database → assignment_1/database/migrations)
+MIGRATIONS_DIR = pathlib.Path(__file__).resolve().parents[4] / "database" / "migrations"
+
+# 여러 곳에서 동시에 실행해도 한 번만 적용되도록 잡는 네임드 락
+MIGRATION_LOCK_NAME = "schema_migrations"
+
+
+@dataclass(frozen=True, slots=True)
+class Migration:
+    """마이그레이션 파일 (version 순서로 적용)"""
+
+    version: str
+    name: str
+    statements: tuple[str, ...]
+
+
+def load_migrations(directory: pathlib.Path = MIGRATIONS_DIR) -> list[Migration]:
+    """
+    마이그레이션 파일 목록 (버전 오름차순)
+
+    파일 하나에 여러 SQL을 둘 수 있으며 줄 끝의 ;로 구분 (-- 주석 줄은 제외)
+    MySQL DDL은 문장마다 커밋되므로 되도록 파일 하나에 ALTER TABLE 하나만 작성
+    """
+    migrations: list[Migration] = []
+    for path in sorted(directory.glob("*.sql")):
+        version, _, name = path.stem.partition("_")
+        if not version.isdigit() or not name:
+            raise ValueError(f"마이그레이션 파일명은 <버전>_<이름>.sql 형식이어야 합니다: {path.name}")
+
+        lines = [line for line in path.read_text(encoding="utf-8").splitlines() if not line.lstrip().startswith("--")]
+        statements = tuple(
+            statement.strip().removesuffix(";").strip()
+            for statement in "\n".join(lines).split(";\n")
+            if statement.strip().removesuffix(";").strip()
+        )
+        migrations.append(Migration(version=version, name=name, statements=statements))
+
+    versions = [migration.version for migration in migrations]
+    if len(set(versions)) != len(versions):
+        raise ValueError(f"마이그레이션 버전이 중복되었습니다: {versions}")
+    return migrations
+
+
+# init.sql의 schema_migrations와 같은 정의 (이력 테이블이 생기기 전에 만든 DB용)
+_CREATE_MIGRATION_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version VARCHAR(20) PRIMARY KEY COMMENT '마이그레이션 버전 (파일명 앞 번호)',
+    name VARCHAR(255) NOT NULL COMMENT '마이그레이션 이름',
+    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP COMMENT '적용 일시'
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='스키마 마이그레이션 이력'
+"""
+
+
+async def get_applied_versions(connection: AsyncConnection) -> set[str]:
+    """적용된 마이그레이션 버전 목록 (이력 테이블이 없으면 빈 목록)"""
+    table = await connection.scalar(text("SHOW TABLES LIKE 'schema_migrations'"))
+    if table is None:
+        return set()
+    result = await connection.execute(text("SELECT version FROM schema_migrations"))
+    return set(result.scalars().all())
+
+
+async def apply_migrations(
+    connection: AsyncConnection,
+    migrations: list[Migration],
+    *,
+    lock_timeout_seconds: int = 10,
+) -> list[Migration]:
+    """
+    적용되지 않은 마이그레이션을 버전 순으로 적용 후 기록 (적용한 마이그레이션 반환)
+
+    같은 커넥션에서 네임드 락을 잡은 채로 확인/적용하므로 동시에 실행해도 중복 적용되지 않음
+    중간에 실패하면 그 앞까지만 기록된 상태로 예외 (실패한 마이그레이션은 원인을 고친 뒤 다시 실행)
+    """
+    acquired = await connection.scalar(
+        text("SELECT GET_LOCK(:name, :timeout)"), {"name": MIGRATION_LOCK_NAME, "timeout": lock_timeout_seconds}
+    )
+    if acquired != 1:
+        raise TimeoutError("다른 마이그레이션이 실행 중입니다.")
+
+    try:
+        await connection.exec_driver_sql(_CREATE_MIGRATION_TABLE_SQL)
+        applied_versions = await get_applied_versions(connection)
+        await connection.commit()
+
+        applied: list[Migration] = []
+        for migration in migrations:
+            if migration.version in applied_versions:
+                continue
+            for statement in migration.statements:
+                await connection.exec_driver_sql(statement)
+            await connection.execute(
+                text("INSERT INTO schema_migrations (version, name) VALUES (:version, :name)"),
+                {"version": migration.version, "name": migration.name},
+            )
+            await connection.commit()
+            applied.append(migration)
+        return applied
+    finally:
+        await connection.rollback()
+        await connection.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": MIGRATION_LOCK_NAME})
+        await connection.commit()
@@ -14,7 +14,9 @@ class AppointmentListResponse(BaseModel):
     model_config = FROZEN_CONFIG
 
     items: list[AppointmentListItemResponse] = Field(default_factory=list, description="예약 목록")
-    page: int = Field(..., ge=1, description="현재 페이지")
+    page: int | None = Field(..., ge=1, description="현재 페이지 (커서 방식 조회면 null)")
     page_size: int = Field(..., ge=1, description="페이지 크기")
-    total_count: int = Field(..., ge=0, description="총 예약 수")
-    total_pages: int = Field(..., ge=0, description="총 페이지 수")
+    total_count: int | None = Field(..., ge=0, description="총 예약 수 (include_total=false이면 null)")
+    total_pages: int | None = Field(..., ge=0, description="총 페이지 수 (include_total=false이면 null)")
+    has_next: bool = Field(..., description="다음 페이지 존재 여부")
+    next_cursor: str | None = Field(None, description="다음 페이지 커서 (cursor로 전달, 마지막 페이지면 null)")
@@ -5,6 +5,8 @@ Admin App Models
 """
 
 from app.models.appointment import Appointment
+from app.models.appointment_slot_tick import AppointmentSlotTick
+from app.models.cache_version import CacheVersion
 from app.models.doctor import Doctor
 from app.models.hospital_slot import HospitalSlot
 from app.models.patient import Patient
@@ -12,6 +14,8 @@ from app.models.treatment import Treatment
 
 __all__ = [
     "Appointment",
+    "AppointmentSlotTick",
+    "CacheVersion",
     "Doctor",
     "HospitalSlot",
     "Patient",
@@ -6,12 +6,13 @@ Admin App - Appointment 모델
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from datetime import datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Text, func, select, update
+from sqlalchemy import CursorResult, DateTime, Enum, ForeignKey, Row, Select, Text, and_, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, joinedload, mapped_column, relationship
 
 from app.core.constants.appointment_status import AppointmentStatus
 from app.core.constants.visit_type import VisitType
@@ -48,17 +49,10 @@ class Appointment(BaseModel, TimestampMixin):
     visit_type: Mapped[VisitType] = mapped_column(Enum(VisitType), nullable=False, comment="초진/재진")
     memo: Mapped[str | None] = mapped_column(Text, nullable=True, comment="예약 메모")
 
-    # 관계 설정
-    doctor: Mapped["Doctor"] = relationship("Doctor", back_populates="appointments", lazy="joined")
-    patient: Mapped["Patient"] = relationship("Patient", back_populates="appointments", lazy="joined")
-    treatment: Mapped["Treatment"] = relationship("Treatment", back_populates="appointments", lazy="joined")
-
-    @property
-    def appointment_end_datetime(self) -> datetime:
-        """예약 종료 시간 계산 (시작 시간 + 진료 소요 시간)"""
-        from datetime import timedelta
-
-        return self.appointment_datetime + timedelta(minutes=self.treatment.duration_minutes)
+    # 관계 설정 (기본은 로딩하지 않고 접근 시 에러, 관련 데이터가 필요한 조회에서만 로딩 옵션을 명시)
+    doctor: Mapped["Doctor"] = relationship("Doctor", back_populates="appointments", lazy="raise")
+    patient: Mapped["Patient"] = relationship("Patient", back_populates="appointments", lazy="raise")
+    treatment: Mapped["Treatment"] = relationship("Treatment", back_populates="appointments", lazy="raise")
 
     @property
     def is_completed(self) -> bool:
@@ -70,11 +64,6 @@ class Appointment(BaseModel, TimestampMixin):
         """활성 예약인지 확인 (취소되지 않은 예약)"""
         return self.status != AppointmentStatus.CANCELLED
 
-    @property
-    def duration_minutes(self) -> int:
-        """예약 소요 시간 (분)"""
-        return self.treatment.duration_minutes
-
     def can_transition_to(self, new_status: AppointmentStatus) -> bool:
         """상태 전환 가능 여부 확인"""
         # 상태 전환 규칙: PENDING → CONFIRMED → COMPLETED 또는 CANCELLED
@@ -89,7 +78,18 @@ class Appointment(BaseModel, TimestampMixin):
 
     @classmethod
     async def get_by_id(cls, session: AsyncSession, appointment_id: int) -> Appointment | None:
-        return await session.get(cls, appointment_id)
+        """예약 조회 (응답 구성용 의사/진료 항목/환자 함께 로드)"""
+        query = (
+            select(cls)
+            .options(
+                joinedload(cls.doctor, innerjoin=True),
+                joinedload(cls.treatment, innerjoin=True),
+                joinedload(cls.patient, innerjoin=True),
+            )
+            .where(cls.id == appointment_id)
+        )
+        result = await session.execute(query)
+        return result.scalar_one_or_none()
 
     @classmethod
     async def update_status(
@@ -98,27 +98,33 @@ class Appointment(BaseModel, TimestampMixin):
         appointment_id: int,
         *,
         status: AppointmentStatus,
-    ) -> None:
-        query = update(cls).where(cls.id == appointment_id).values(status=status)
-        await session.execute(query)
+        current_status: AppointmentStatus,
+    ) -> bool:
+        """예약 상태 변경 (현재 상태가 current_status인 경우에만 변경, 변경 여부 반환)"""
+        query = update(cls).where(cls.id == appointment_id, cls.status == current_status).values(status=status)
+        result = cast(CursorResult[Any], await session.execute(query))
+        return result.rowcount == 1
 
     @classmethod
     async def get_filtered(
         cls,
         session: AsyncSession,
         *,
-        page: int,
-        page_size: int,
+        offset: int,
+        limit: int,
+        after: tuple[datetime, int] | None = None,
         start_datetime: datetime | None = None,
         end_datetime: datetime | None = None,
         doctor_id: int | None = None,
         treatment_id: int | None = None,
         status: AppointmentStatus | None = None,
-    ) -> tuple[list[AppointmentSummaryData], int]:
-        from app.models.doctor import Doctor
-        from app.models.patient import Patient
-        from app.models.treatment import Treatment
+    ) -> list[AppointmentSummaryData]:
+        """
+        조건에 맞는 예약을 (예약 일시, ID) 내림차순으로 최대 limit건 조회 (총 건수는 count_filtered)
 
+        after가 있으면 이전 페이지 마지막 예약의 (예약 일시, ID) 다음부터 조회 (커서 방식, offset은 0)
+        커서 조건은 MySQL이 idx_appointments_datetime_id 범위 검색으로 처리하도록 행 생성자 비교 대신 OR로 풀어서 작성
+        """
         conditions = cls._build_conditions(
             start_datetime=start_datetime,
             end_datetime=end_datetime,
@@ -127,68 +133,87 @@ class Appointment(BaseModel, TimestampMixin):
             status=status,
         )
 
-        data_query = (
-            select(
-                cls.id.label("appointment_id"),
-                cls.appointment_datetime,
-                cls.status,
-                cls.visit_type,
-                cls.memo,
-                Doctor.id.label("doctor_id"),
-                Doctor.name.label("doctor_name"),
-                Treatment.id.label("treatment_id"),
-                Treatment.name.label("treatment_name"),
-                Treatment.duration_minutes.label("treatment_duration_minutes"),
-                Patient.id.label("patient_id"),
-                Patient.name.label("patient_name"),
-                Patient.phone.label("patient_phone"),
+        if after is not None:
+            after_datetime, after_id = after
+            conditions.append(
+                or_(
+                    cls.appointment_datetime < after_datetime,
+                    and_(cls.appointment_datetime == after_datetime, cls.id < after_id),
+                )
             )
-            .join(Doctor, cls.doctor_id == Doctor.id)
-            .join(Treatment, cls.treatment_id == Treatment.id)
-            .join(Patient, cls.patient_id == Patient.id)
+
+        query = cls._build_summary_query()
+        if conditions:
+            query = query.where(*conditions)
+        query = query.order_by(cls.appointment_datetime.desc(), cls.id.desc()).offset(offset).limit(limit)
+
+        rows = await session.execute(query)
+        return [cls._to_summary_data(row) for row in rows.all()]
+
+    @classmethod
+    async def count_filtered(
+        cls,
+        session: AsyncSession,
+        *,
+        start_datetime: datetime | None = None,
+        end_datetime: datetime | None = None,
+        doctor_id: int | None = None,
+        treatment_id: int | None = None,
+        status: AppointmentStatus | None = None,
+    ) -> int:
+        """
+        조건에 맞는 예약 수
+
+        의사/진료 항목/환자 외래키는 모두 NOT NULL이라 조인해도 건수가 같으므로 appointments만 집계
+        """
+        conditions = cls._build_conditions(
+            start_datetime=start_datetime,
+            end_datetime=end_datetime,
+            doctor_id=doctor_id,
+            treatment_id=treatment_id,
+            status=status,
         )
 
+        query = select(func.count()).select_from(cls)
         if conditions:
-            data_query = data_query.where(*conditions)
+            query = query.where(*conditions)
 
-        data_query = data_query.order_by(cls.appointment_datetime.desc())
-        data_query = data_query.offset((page - 1) * page_size).limit(page_size)
+        result = await session.execute(query)
+        return result.scalar_one()
 
-        count_query = (
-            select(func.count(cls.id))
-            .select_from(cls)
-            .join(Doctor, cls.doctor_id == Doctor.id)
-            .join(Treatment, cls.treatment_id == Treatment.id)
-            .join(Patient, cls.patient_id == Patient.id)
+    @classmethod
+    async def stream_filtered(
+        cls,
+        session: AsyncSession,
+        *,
+        batch_size: int,
+        start_datetime: datetime | None = None,
+        end_datetime: datetime | None = None,
+        doctor_id: int | None = None,
+        treatment_id: int | None = None,
+        status: AppointmentStatus | None = None,
+    ) -> AsyncIterator[list[AppointmentSummaryData]]:
+        """
+        조건에 맞는 예약을 예약 일시순으로 batch_size건씩 반환 (내보내기용)
+
+        서버 측 커서로 읽으므로 전체 결과를 메모리에 올리지 않고, 건수 조회도 하지 않음
+        """
+        conditions = cls._build_conditions(
+            start_datetime=start_datetime,
+            end_datetime=end_datetime,
+            doctor_id=doctor_id,
+            treatment_id=treatment_id,
+            status=status,
         )
 
+        query = cls._build_summary_query()
         if conditions:
-            count_query = count_query.where(*conditions)
-
-        total_result = await session.execute(count_query)
-        total_count = total_result.scalar_one()
-
-        rows = await session.execute(data_query)
-        summaries = [
-            AppointmentSummaryData(
-                id=row.appointment_id,
-                appointment_datetime=row.appointment_datetime,
-                status=row.status,
-                visit_type=row.visit_type,
-                memo=row.memo,
-                doctor_id=row.doctor_id,
-                doctor_name=row.doctor_name,
-                treatment_id=row.treatment_id,
-                treatment_name=row.treatment_name,
-                treatment_duration_minutes=row.treatment_duration_minutes,
-                patient_id=row.patient_id,
-                patient_name=row.patient_name,
-                patient_phone=row.patient_phone,
-            )
-            for row in rows.all()
-        ]
+            query = query.where(*conditions)
+        query = query.order_by(cls.appointment_datetime.asc(), cls.id.asc()).execution_options(yield_per=batch_size)
 
-        return summaries, total_count
+        result = await session.stream(query)
+        async for rows in result.partitions():
+            yield [cls._to_summary_data(row) for row in rows]
 
     @classmethod
     async def get_status_counts(
@@ -302,6 +327,52 @@ class Appointment(BaseModel, TimestampMixin):
         result = await session.execute(query)
         return [AppointmentVisitTypeCountItem(visit_type=row[0], count=row[1]) for row in result.all()]
 
+    @classmethod
+    def _build_summary_query(cls) -> Select[*tuple[Any, ...]]:
+        """예약 요약 조회 쿼리 (예약/의사/진료 항목/환자의 필요한 컬럼만 조회)"""
+        from app.models.doctor import Doctor
+        from app.models.patient import Patient
+        from app.models.treatment import Treatment
+
+        return (
+            select(
+                cls.id.label("appointment_id"),
+                cls.appointment_datetime,
+                cls.status,
+                cls.visit_type,
+                cls.memo,
+                Doctor.id.label("doctor_id"),
+                Doctor.name.label("doctor_name"),
+                Treatment.id.label("treatment_id"),
+                Treatment.name.label("treatment_name"),
+                Treatment.duration_minutes.label("treatment_duration_minutes"),
+                Patient.id.label("patient_id"),
+                Patient.name.label("patient_name"),
+                Patient.phone.label("patient_phone"),
+            )
+            .join(Doctor, cls.doctor_id == Doctor.id)
+            .join(Treatment, cls.treatment_id == Treatment.id)
+            .join(Patient, cls.patient_id == Patient.id)
+        )
+
+    @staticmethod
+    def _to_summary_data(row: Row[Any]) -> AppointmentSummaryData:
+        return AppointmentSummaryData(
+            id=row.appointment_id,
+            appointment_datetime=row.appointment_datetime,
+            status=row.status,
+            visit_type=row.visit_type,
+            memo=row.memo,
+            doctor_id=row.doctor_id,
+            doctor_name=row.doctor_name,
+            treatment_id=row.treatment_id,
+            treatment_name=row.treatment_name,
+            treatment_duration_minutes=row.treatment_duration_minutes,
+            patient_id=row.patient_id,
+            patient_name=row.patient_name,
+            patient_phone=row.patient_phone,
+        )
+
     @classmethod
     def _build_conditions(
         cls,
@@ -312,12 +383,13 @@ class Appointment(BaseModel, TimestampMixin):
         treatment_id: int | None = None,
         status: AppointmentStatus | None = None,
     ) -> list[Any]:
+        """조회 조건 생성 (기간은 [start_datetime, end_datetime) 반열린 구간)"""
         conditions: list[Any] = []
 
         if start_datetime is not None:
             conditions.append(cls.appointment_datetime >= start_datetime)
         if end_datetime is not None:
-            conditions.append(cls.appointment_datetime <= end_datetime)
+            conditions.append(cls.appointment_datetime < end_datetime)
         if doctor_id is not None:
             conditions.append(cls.doctor_id == doctor_id)
         if treatment_id is not None:
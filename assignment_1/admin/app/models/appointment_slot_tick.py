@@ -0,0 +1,30 @@
+"""
+Admin App - AppointmentSlotTick 모델
+
+의사별 15분 단위 예약 점유 구간 모델 (Patient App에서 예약 생성 시 함께 생성)
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database.orm import BaseModel, TimestampMixin
+
+
+class AppointmentSlotTick(BaseModel, TimestampMixin):
+    """취소되지 않은 예약이 점유한 의사별 15분 구간"""
+
+    __tablename__ = "appointment_slot_ticks"
+
+    appointment_id: Mapped[int] = mapped_column(ForeignKey("appointments.id"), nullable=False, comment="예약")
+    doctor_id: Mapped[int] = mapped_column(ForeignKey("doctors.id"), nullable=False, comment="담당 의사")
+    tick: Mapped[datetime] = mapped_column(DateTime, nullable=False, comment="점유 구간 시작 일시 (15분 단위)")
+
+    @classmethod
+    async def release(cls, session: AsyncSession, appointment_id: int) -> None:
+        """예약의 점유 구간 해제 (취소 시)"""
+        await session.execute(delete(cls).where(cls.appointment_id == appointment_id))
@@ -0,0 +1,38 @@
+"""
+Admin App - CacheVersion 모델
+
+서비스 간 인메모리 캐시 무효화를 위한 버전 정보 모델
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, String, func
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database.orm import Base
+
+
+class CacheVersion(Base):
+    """캐시 버전 정보 모델 (Patient App이 버전 변경을 감지해 캐시를 다시 구성)"""
+
+    __tablename__ = "cache_versions"
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True, comment="캐시 이름")
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, comment="캐시 버전")
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        comment="수정 시간",
+    )
+
+    @classmethod
+    async def bump(cls, session: AsyncSession, name: str) -> None:
+        """캐시 버전 증가 (호출한 트랜잭션과 함께 커밋됨)"""
+        query = insert(cls).values(name=name, version=1)
+        query = query.on_duplicate_key_update(version=cls.version + 1)
+        await session.execute(query)
@@ -28,7 +28,7 @@ class Doctor(BaseModel, TimestampMixin):
     department: Mapped[str] = mapped_column(String(50), nullable=False, comment="진료과")
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, comment="활성 상태")
 
-    appointments: Mapped[list[Appointment]] = relationship("Appointment", back_populates="doctor", lazy="select")
+    appointments: Mapped[list[Appointment]] = relationship("Appointment", back_populates="doctor", lazy="raise")
 
     # -------------------------------------------------------------------------
     # ORM 편의 메서드
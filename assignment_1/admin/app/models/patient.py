@@ -6,9 +6,11 @@ Admin App - Patient 모델
 
 from __future__ import annotations
 
+from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String
+from sqlalchemy import DateTime, Integer, String, func, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database.orm import BaseModel, TimestampMixin
@@ -26,10 +28,27 @@ class Patient(BaseModel, TimestampMixin):
     name: Mapped[str] = mapped_column(String(100), nullable=False, comment="환자 이름")
     phone: Mapped[str] = mapped_column(String(20), nullable=False, unique=True, comment="연락처")
 
+    # 방문 요약 (예약 완료 처리 시 갱신, Patient App이 초진/재진 판단에 사용)
+    completed_visit_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment="완료된 진료 수")
+    last_completed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True, comment="마지막 완료 진료 일시")
+
     # 관계 설정 (Admin App에서는 예약과의 관계 필요)
     appointments: Mapped[list["Appointment"]] = relationship(
         "Appointment",
         back_populates="patient",
-        lazy="select",
+        lazy="raise",
         order_by="Appointment.appointment_datetime.desc()",  # 최신 예약 순으로 정렬
     )
+
+    @classmethod
+    async def record_completed_visit(cls, session: AsyncSession, patient_id: int, completed_at: datetime) -> None:
+        """완료된 진료 반영 (완료 수 증가, 마지막 완료 일시는 더 최근 값으로 갱신)"""
+        query = (
+            update(cls)
+            .where(cls.id == patient_id)
+            .values(
+                completed_visit_count=cls.completed_visit_count + 1,
+                last_completed_at=func.greatest(func.coalesce(cls.last_completed_at, completed_at), completed_at),
+            )
+        )
+        await session.execute(query)
@@ -33,7 +33,7 @@ class Treatment(BaseModel, TimestampMixin):
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, comment="활성 상태")
 
     # 관계 설정 (Admin App에서는 예약과의 관계 필요)
-    appointments: Mapped[list["Appointment"]] = relationship("Appointment", back_populates="treatment", lazy="select")
+    appointments: Mapped[list["Appointment"]] = relationship("Appointment", back_populates="treatment", lazy="raise")
 
     @classmethod
     async def create_one(
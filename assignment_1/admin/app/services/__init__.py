@@ -1,4 +1,5 @@
 from app.services.appointment_service import (
+    service_export_appointments,
     service_get_appointment_daily_counts,
     service_get_appointment_status_counts,
     service_get_appointment_timeslot_counts,
@@ -39,6 +40,7 @@ __all__ = [
     "service_get_hospital_slots",
     "service_update_hospital_slot",
     "service_get_appointments",
+    "service_export_appointments",
     "service_update_appointment_status",
     "service_get_appointment_status_counts",
     "service_get_appointment_daily_counts",
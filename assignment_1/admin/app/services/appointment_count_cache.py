@@ -0,0 +1,107 @@
+"""
+Appointment Count Cache
+
+예약 목록 조회 필터별 총 건수 캐시
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+from app.core.configs.settings import settings
+from app.core.constants.appointment_status import AppointmentStatus
+
+# (시작 일시, 종료 일시, 의사 ID, 진료 항목 ID, 예약 상태) - 페이지 번호/크기와 무관
+AppointmentCountCacheKey = tuple[datetime | None, datetime | None, int | None, int | None, AppointmentStatus | None]
+
+
+class AppointmentCountCache:
+    """
+    필터 조건 → 총 예약 수 TTL 캐시
+
+    - 같은 필터로 페이지를 이동할 때 COUNT를 매번 다시 실행하지 않도록 ttl_seconds 동안 재사용
+    - 같은 프로세스의 예약 상태 변경은 invalidate로 즉시 폐기
+    - 다른 프로세스(Patient)의 예약 생성/취소는 폐기하지 않으므로 total_count/total_pages가 최대 ttl_seconds 동안 이전 값일 수 있음
+      (같은 응답의 items/has_next는 매번 새로 조회하므로 total_count와 어긋날 수 있음)
+    - 만료된 항목은 조회 시 제거하고, 저장 시 가장 오래 사용하지 않은 쪽부터 만료된 항목 제거
+    - 최대 항목 수를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[AppointmentCountCacheKey, tuple[int, float]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @staticmethod
+    def build_key(
+        *,
+        start_datetime: datetime | None,
+        end_datetime: datetime | None,
+        doctor_id: int | None,
+        treatment_id: int | None,
+        status: AppointmentStatus | None,
+    ) -> AppointmentCountCacheKey:
+        """필터 조건으로 캐시 키 생성 (날짜는 조회 범위 일시로 정규화된 값 사용)"""
+        return (start_datetime, end_datetime, doctor_id, treatment_id, status)
+
+    def get(self, key: AppointmentCountCacheKey) -> int | None:
+        """만료되지 않은 총 건수 (없거나 만료되었으면 None)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        if entry[1] <= time.monotonic():
+            del self._entries[key]
+            self._expirations += 1
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry[0]
+
+    def put(self, key: AppointmentCountCacheKey, total_count: int) -> None:
+        """총 건수 저장"""
+        monotonic_now = time.monotonic()
+        self._entries[key] = (total_count, monotonic_now + self._ttl_seconds)
+        self._entries.move_to_end(key)
+
+        # 오래 사용하지 않은 쪽부터 만료된 항목 제거 (만료되지 않은 항목을 만나면 중단)
+        while self._entries:
+            oldest_key, (_, expires_at) = next(iter(self._entries.items()))
+            if expires_at > monotonic_now:
+                break
+            del self._entries[oldest_key]
+            self._expirations += 1
+
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate(self) -> None:
+        """전체 폐기"""
+        self._entries.clear()
+
+    def get_stats(self) -> dict[str, int | float]:
+        """캐시 지표 (적중/미스/제거/만료 횟수, 현재 항목 수)"""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+            "size": len(self._entries),
+            "max_entries": self._max_entries,
+            "ttl_seconds": self._ttl_seconds,
+        }
+
+
+appointment_count_cache = AppointmentCountCache(
+    ttl_seconds=settings.appointment_count_cache_ttl_seconds,
+    max_entries=settings.appointment_count_cache_max_entries,
+)
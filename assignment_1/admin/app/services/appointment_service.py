@@ -3,11 +3,18 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import date, datetime, time
+import base64
+import binascii
+import csv
+import io
+import json
+from collections.abc import AsyncIterator
+from datetime import date, datetime, time, timedelta
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.constants import ErrorMessages
+from app.core.configs.settings import settings
+from app.core.constants import AppointmentExportFormat, ErrorMessages
 from app.core.constants.appointment_status import AppointmentStatus
 from app.core.database.connection_async import get_async_session
 from app.core.exceptions import MediSolveAiException
@@ -22,6 +29,10 @@ from app.dtos.appointment import (
     AppointmentVisitTypeCountItem,
 )
 from app.models.appointment import Appointment
+from app.models.appointment_slot_tick import AppointmentSlotTick
+from app.models.patient import Patient
+from app.services.appointment_count_cache import appointment_count_cache
+from app.services.cache_version_publisher import cache_version_publisher
 
 
 async def service_get_appointments(
@@ -33,37 +44,118 @@ async def service_get_appointments(
     doctor_id: int | None = None,
     treatment_id: int | None = None,
     status: AppointmentStatus | None = None,
+    include_total: bool = True,
+    cursor: str | None = None,
 ) -> AppointmentListResponse:
-    """예약 목록 조회"""
+    """
+    예약 목록 조회 ((예약 일시, ID) 내림차순)
+
+    - 페이지 방식: page/page_size로 OFFSET 조회 (기존 호환, 뒤 페이지일수록 건너뛰는 행이 많아짐)
+    - 커서 방식: cursor(이전 응답의 next_cursor)가 있으면 page를 무시하고 마지막 예약 다음부터 인덱스로 바로 조회
+    총 건수는 필터별로 잠시 캐시하고, 캐시에 없으면 페이지 조회와 별도 커넥션에서 동시에 집계
+    include_total=False면 총 건수를 집계하지 않고 다음 페이지 존재 여부만 반환 (무한 스크롤용)
+    """
 
     if page < 1 or page_size < 1 or page_size > 100:
         raise MediSolveAiException(ErrorMessages.INVALID_PAGINATION)
 
+    after = _decode_cursor(cursor) if cursor is not None else None
+
+    start_datetime = _to_start_datetime(start_date)
+    end_datetime = _to_end_datetime(end_date)
+
+    async def get_page() -> list[AppointmentSummaryData]:
+        # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+        async with get_async_session() as session:
+            return await Appointment.get_filtered(
+                session=session,
+                offset=(page - 1) * page_size if after is None else 0,
+                limit=page_size + 1,
+                after=after,
+                start_datetime=start_datetime,
+                end_datetime=end_datetime,
+                doctor_id=doctor_id,
+                treatment_id=treatment_id,
+                status=status,
+            )
+
+    async def count_total() -> int:
+        async with get_async_session() as session:
+            return await Appointment.count_filtered(
+                session=session,
+                start_datetime=start_datetime,
+                end_datetime=end_datetime,
+                doctor_id=doctor_id,
+                treatment_id=treatment_id,
+                status=status,
+            )
+
+    count_key = appointment_count_cache.build_key(
+        start_datetime=start_datetime,
+        end_datetime=end_datetime,
+        doctor_id=doctor_id,
+        treatment_id=treatment_id,
+        status=status,
+    )
+    total_count = appointment_count_cache.get(count_key) if include_total else None
+    if include_total and total_count is None:
+        summaries, counted_total = await asyncio.gather(get_page(), count_total())
+        appointment_count_cache.put(count_key, counted_total)
+        total_count = counted_total
+    else:
+        summaries = await get_page()
+
+    page_summaries = summaries[:page_size]
+    has_next = len(summaries) > page_size
+    return AppointmentListResponse(
+        items=[_map_summary_to_response(summary) for summary in page_summaries],
+        page=page if after is None else None,
+        page_size=page_size,
+        total_count=total_count,
+        total_pages=(
+            _calculate_total_pages(total_count=total_count, page_size=page_size) if total_count is not None else None
+        ),
+        has_next=has_next,
+        next_cursor=_encode_cursor(page_summaries[-1]) if has_next else None,
+    )
+
+
+async def service_export_appointments(
+    *,
+    export_format: AppointmentExportFormat,
+    start_date: date | None = None,
+    end_date: date | None = None,
+    doctor_id: int | None = None,
+    treatment_id: int | None = None,
+    status: AppointmentStatus | None = None,
+) -> AsyncIterator[str]:
+    """
+    예약 내보내기 (목록 조회와 같은 필터, 예약 일시순)
+
+    서버 측 커서에서 appointment_export_batch_size건씩 읽어 바로 NDJSON/CSV 청크로 변환 (건수 조회 없음)
+    """
     start_datetime = _to_start_datetime(start_date)
     end_datetime = _to_end_datetime(end_date)
 
     async with get_async_session() as session:
-        summaries, total_count = await Appointment.get_filtered(
+        if export_format == AppointmentExportFormat.CSV:
+            # Excel에서 한글이 깨지지 않도록 UTF-8 BOM을 헤더 앞에 추가
+            yield "\ufeff" + _to_csv_lines([list(AppointmentListItemResponse.model_fields)])
+
+        async for summaries in Appointment.stream_filtered(
             session=session,
-            page=page,
-            page_size=page_size,
+            batch_size=settings.appointment_export_batch_size,
             start_datetime=start_datetime,
             end_datetime=end_datetime,
             doctor_id=doctor_id,
             treatment_id=treatment_id,
             status=status,
-        )
-
-        items = [_map_summary_to_response(summary) for summary in summaries]
-        total_pages = _calculate_total_pages(total_count=total_count, page_size=page_size)
-
-        return AppointmentListResponse(
-            items=items,
-            page=page,
-            page_size=page_size,
-            total_count=total_count,
-            total_pages=total_pages,
-        )
+        ):
+            items = [_map_summary_to_response(summary) for summary in summaries]
+            if export_format == AppointmentExportFormat.CSV:
+                yield _to_csv_lines([list(item.model_dump(mode="json").values()) for item in items])
+            else:
+                yield "".join(f"{item.model_dump_json()}\n" for item in items)
 
 
 async def service_update_appointment_status(
@@ -80,15 +172,28 @@ async def service_update_appointment_status(
         if not appointment.can_transition_to(request.status):
             raise MediSolveAiException(ErrorMessages.APPOINTMENT_INVALID_STATUS_TRANSITION)
 
-        await Appointment.update_status(session=session, appointment_id=appointment_id, status=request.status)
-        await session.commit()
-        await asyncio.gather(
-            session.refresh(appointment),
-            session.refresh(appointment.doctor),
-            session.refresh(appointment.treatment),
-            session.refresh(appointment.patient),
+        appointment_date = appointment.appointment_datetime.date()
+        # 동시에 다른 요청이 상태를 바꾼 경우 변경하지 않음 (완료 수가 중복 반영되지 않도록)
+        is_updated = await Appointment.update_status(
+            session=session, appointment_id=appointment_id, status=request.status, current_status=appointment.status
         )
+        if not is_updated:
+            raise MediSolveAiException(ErrorMessages.APPOINTMENT_INVALID_STATUS_TRANSITION)
+        # 완료 시 환자 방문 요약 갱신 (예약 생성 시 예약 테이블 조회 없이 초진/재진 판단)
+        if request.status == AppointmentStatus.COMPLETED:
+            await Patient.record_completed_visit(
+                session=session, patient_id=appointment.patient_id, completed_at=appointment.appointment_datetime
+            )
+        # 취소 시 의사 점유 구간 해제 (같은 시간대에 다시 예약 가능)
+        if request.status == AppointmentStatus.CANCELLED:
+            await AppointmentSlotTick.release(session=session, appointment_id=appointment_id)
+        await session.commit()
+        # 같은 날짜의 예약 가능 시간 캐시가 무효화되도록 해당 날짜의 캐시 버전 증가 (실패해도 변경은 저장된 상태로 응답)
+        await cache_version_publisher.publish_appointment_dates(session=session, dates=[appointment_date])
+        # 상태별 예약 수가 바뀌므로 목록 총 건수 캐시 폐기
+        appointment_count_cache.invalidate()
 
+        # 상태는 UPDATE 시 세션의 객체에도 반영되고, 의사/진료 항목/환자는 조회 시 함께 로드했으므로 재조회 없음
         return _map_appointment_to_response(appointment)
 
 
@@ -191,9 +296,10 @@ def _to_start_datetime(target_date: date | None) -> datetime | None:
 
 
 def _to_end_datetime(target_date: date | None) -> datetime | None:
+    """종료 날짜의 다음날 00:00 (조회 범위의 배타적 상한)"""
     if target_date is None:
         return None
-    return datetime.combine(target_date, time.max)
+    return datetime.combine(target_date + timedelta(days=1), time.min)
 
 
 def _map_summary_to_response(summary: AppointmentSummaryData) -> AppointmentListItemResponse:
@@ -232,6 +338,27 @@ def _map_appointment_to_response(appointment: Appointment) -> AppointmentListIte
     )
 
 
+def _encode_cursor(summary: AppointmentSummaryData) -> str:
+    """목록 커서 생성 (마지막 예약의 (예약 일시, ID)를 base64url로 인코딩)"""
+    payload = {"datetime": summary.appointment_datetime.isoformat(), "id": summary.id}
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """목록 커서 해석 (형식이 잘못되었으면 에러)"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return datetime.fromisoformat(payload["datetime"]), int(payload["id"])
+    except (binascii.Error, UnicodeDecodeError, TypeError, KeyError, ValueError) as error:
+        raise MediSolveAiException(ErrorMessages.INVALID_CURSOR) from error
+
+
+def _to_csv_lines(rows: list[list[object]]) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(rows)
+    return buffer.getvalue()
+
+
 def _calculate_total_pages(*, total_count: int, page_size: int) -> int:
     if total_count == 0:
         return 0
@@ -0,0 +1,53 @@
+"""
+Cache Version Publisher
+
+예약 상태 변경 후 날짜별 예약 현황 캐시 버전 증가 (Patient 앱의 예약 가능 시간 캐시 무효화용)
+
+- 상태 변경 트랜잭션 안에서 버전을 올리면 같은 날짜의 예약 생성이 버전 행 잠금을 커밋까지 기다리므로,
+  상태 변경 커밋 후 별도의 짧은 트랜잭션에서 증가
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.constants import CacheNames
+from app.models.cache_version import CacheVersion
+
+
+class CacheVersionPublisher:
+    """예약 현황 버전 증가 (지표 포함)"""
+
+    def __init__(self) -> None:
+        self._published = 0
+        self._failures = 0
+
+    async def publish_appointment_dates(self, session: AsyncSession, dates: list[date]) -> None:
+        """
+        날짜별 예약 현황 버전 증가 후 커밋 (상태 변경 커밋 후 호출)
+
+        - 여러 날짜는 이름 순으로 증가 (요청 간 행 잠금 순서를 같게 유지)
+        - 상태 변경은 이미 커밋되었으므로 실패해도 예외 없이 실패 지표만 기록
+        """
+        names = sorted({CacheNames.appointments(appointment_date) for appointment_date in dates})
+        if not names:
+            return
+        try:
+            for name in names:
+                await CacheVersion.bump(session=session, name=name)
+            await session.commit()
+        except SQLAlchemyError:
+            await session.rollback()
+            self._failures += 1
+            return
+        self._published += len(names)
+
+    def get_stats(self) -> dict[str, int]:
+        """지표 (증가한 버전 수, 증가 실패 횟수)"""
+        return {"published": self._published, "failures": self._failures}
+
+
+cache_version_publisher = CacheVersionPublisher()
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.constants import ErrorMessages
+from app.core.constants import CacheNames, ErrorMessages
 from app.core.database.connection_async import get_async_session
 from app.core.exceptions import MediSolveAiException
 from app.dtos.doctor import (
@@ -13,6 +13,7 @@ from app.dtos.doctor import (
     DoctorSummaryData,
     DoctorUpdateRequest,
 )
+from app.models.cache_version import CacheVersion
 from app.models.doctor import Doctor
 
 # ============================================================================
@@ -29,6 +30,7 @@ async def service_create_doctor(request: DoctorCreateRequest) -> DoctorResponse:
             department=request.department,
             is_active=request.is_active,
         )
+        await CacheVersion.bump(session=session, name=CacheNames.DOCTORS)
         await session.commit()
         return _map_doctor_to_response(doctor)
 
@@ -69,6 +71,7 @@ async def service_update_doctor(doctor_id: int, request: DoctorUpdateRequest) ->
             department=request.department,
         )
 
+        await CacheVersion.bump(session=session, name=CacheNames.DOCTORS)
         await session.commit()
 
         if request.name is not None:
@@ -86,6 +89,7 @@ async def service_delete_doctor(doctor_id: int) -> None:
 
         await Doctor.set_active(session=session, doctor_id=doctor_id, is_active=False)
 
+        await CacheVersion.bump(session=session, name=CacheNames.DOCTORS)
         await session.commit()
 
 
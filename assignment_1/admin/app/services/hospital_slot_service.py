@@ -6,7 +6,7 @@ from datetime import datetime, time, timedelta
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.constants import ErrorMessages
+from app.core.constants import CacheNames, ErrorMessages
 from app.core.database.connection_async import get_async_session
 from app.core.exceptions import MediSolveAiException
 from app.dtos.hospital_slot import (
@@ -15,6 +15,7 @@ from app.dtos.hospital_slot import (
     HospitalSlotSummaryData,
     HospitalSlotUpdateRequest,
 )
+from app.models.cache_version import CacheVersion
 from app.models.hospital_slot import HospitalSlot
 
 # ============================================================================
@@ -35,6 +36,7 @@ async def service_create_hospital_slot(request: HospitalSlotCreateRequest) -> Ho
             max_capacity=request.max_capacity,
             is_active=request.is_active,
         )
+        await CacheVersion.bump(session=session, name=CacheNames.HOSPITAL_SLOTS)
         await session.commit()
         return _map_slot_to_response(slot)
 
@@ -62,6 +64,7 @@ async def service_update_hospital_slot(
             slot_id=slot_id,
             max_capacity=request.max_capacity,
         )
+        await CacheVersion.bump(session=session, name=CacheNames.HOSPITAL_SLOTS)
 
         await session.commit()
         await session.refresh(slot)
@@ -78,6 +81,7 @@ async def service_delete_hospital_slot(slot_id: int) -> None:
             raise MediSolveAiException(ErrorMessages.HOSPITAL_SLOT_NOT_FOUND)
 
         await HospitalSlot.set_active(session=session, slot_id=slot_id, is_active=False)
+        await CacheVersion.bump(session=session, name=CacheNames.HOSPITAL_SLOTS)
         await session.commit()
 
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.constants import ErrorMessages
+from app.core.constants import CacheNames, ErrorMessages
 from app.core.database.connection_async import get_async_session
 from app.core.exceptions import MediSolveAiException
 from app.dtos.treatment import (
@@ -13,6 +13,7 @@ from app.dtos.treatment import (
     TreatmentSummaryData,
     TreatmentUpdateRequest,
 )
+from app.models.cache_version import CacheVersion
 from app.models.treatment import Treatment
 
 # ============================================================================
@@ -31,6 +32,7 @@ async def service_create_treatment(request: TreatmentCreateRequest) -> Treatment
             description=request.description,
             is_active=request.is_active,
         )
+        await CacheVersion.bump(session=session, name=CacheNames.TREATMENTS)
         await session.commit()
         return _map_treatment_to_response(treatment)
 
@@ -76,6 +78,7 @@ async def service_update_treatment(treatment_id: int, request: TreatmentUpdateRe
             description=request.description,
         )
 
+        await CacheVersion.bump(session=session, name=CacheNames.TREATMENTS)
         await session.commit()
 
         if request.name is not None:
@@ -96,6 +99,7 @@ async def service_delete_treatment(treatment_id: int) -> None:
         await _get_treatment_or_raise(session=session, treatment_id=treatment_id)
 
         await Treatment.set_active(session=session, treatment_id=treatment_id, is_active=False)
+        await CacheVersion.bump(session=session, name=CacheNames.TREATMENTS)
         await session.commit()
 
 
@@ -0,0 +1,91 @@
+"""Admin Appointment Export API 테스트"""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.configs.settings import settings
+from app.core.constants import AppointmentStatus, VisitType
+from app.tests.mothers import AppointmentMother, DoctorMother, TreatmentMother
+from app.tests.test_client import MediSolveAiAdminClient
+
+
+async def test_export_appointments_ndjson_and_csv(
+    medisolveai_admin_client: MediSolveAiAdminClient,
+    session_maker_medisolveai: async_sessionmaker[AsyncSession],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """예약 내보내기 - 배치 경계를 넘어도 목록 조회와 같은 항목이 예약 일시순으로 모두 내보내지는지 테스트"""
+
+    doctor_mother = DoctorMother(medisolveai_admin_client)
+    treatment_mother = TreatmentMother(medisolveai_admin_client)
+    appointment_mother = AppointmentMother(session_maker_medisolveai)
+
+    # Given: 한 번에 2건씩 읽도록 설정, 의사 2명의 예약 5건 생성
+    monkeypatch.setattr(settings, "appointment_export_batch_size", 2)
+    (doctor_a, doctor_b), treatment = await asyncio.gather(
+        asyncio.gather(doctor_mother.create(name="Dr. Ahn"), doctor_mother.create(name="Dr. Bae")),
+        treatment_mother.create(name="레이저 시술", duration_minutes=30),
+    )
+    base_datetime = datetime(2025, 2, 3, 9, 0)
+    await asyncio.gather(
+        *[
+            appointment_mother.create(
+                doctor_id=(doctor_a if idx % 2 == 0 else doctor_b)["id"],
+                treatment_id=treatment["id"],
+                appointment_datetime=base_datetime + timedelta(hours=idx),
+                status=AppointmentStatus.CONFIRMED,
+                visit_type=VisitType.FIRST_VISIT,
+                memo=f"메모, {idx}",
+                patient_name=f"환자{idx}",
+                patient_phone=f"010-1234-000{idx}",
+            )
+            for idx in range(5)
+        ]
+    )
+    list_response = await medisolveai_admin_client.get_appointments(page=1, page_size=10)
+    expected_items = list(reversed(list_response.json()["items"]))
+
+    # When: NDJSON 전체, CSV 의사 필터 내보내기 (동시 실행)
+    ndjson_response, csv_response = await asyncio.gather(
+        medisolveai_admin_client.export_appointments(format="ndjson"),
+        medisolveai_admin_client.export_appointments(format="csv", doctor_id=doctor_a["id"]),
+    )
+
+    # Then: NDJSON은 목록 조회 항목과 같고 예약 일시 오름차순
+    assert ndjson_response.status_code == 200
+    assert ndjson_response.headers["content-type"].startswith("application/x-ndjson")
+    assert 'filename="appointments.ndjson"' in ndjson_response.headers["content-disposition"]
+    assert [json.loads(line) for line in ndjson_response.text.splitlines()] == expected_items
+
+    # Then: CSV는 헤더 + 의사 필터 결과 (쉼표가 들어간 메모도 한 칸으로 유지)
+    assert csv_response.status_code == 200
+    assert csv_response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(csv_response.content.decode("utf-8-sig"))))
+    assert [row["id"] for row in rows] == [
+        str(item["id"]) for item in expected_items if item["doctor_id"] == doctor_a["id"]
+    ]
+    assert [row["memo"] for row in rows] == ["메모, 0", "메모, 2", "메모, 4"]
+    assert {row["status"] for row in rows} == {AppointmentStatus.CONFIRMED.value}
+
+
+async def test_export_appointments_empty_csv_has_header_only(
+    medisolveai_admin_client: MediSolveAiAdminClient,
+) -> None:
+    """예약 내보내기 - 결과가 없으면 CSV는 헤더만 반환"""
+
+    # When: 예약이 없는 상태에서 CSV 내보내기
+    response = await medisolveai_admin_client.export_appointments(format="csv")
+
+    # Then: 헤더 한 줄
+    assert response.status_code == 200
+    lines = response.content.decode("utf-8-sig").splitlines()
+    assert len(lines) == 1
+    assert lines[0].startswith("id,appointment_datetime,status,visit_type,memo,")
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from datetime import date, datetime, timedelta
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.core.constants import AppointmentStatus, VisitType
+from app.core.constants import AppointmentStatus, ErrorMessages, VisitType
+from app.services.appointment_count_cache import AppointmentCountCache, appointment_count_cache
 from app.tests.mothers import AppointmentMother, DoctorMother, TreatmentMother
 from app.tests.test_client import MediSolveAiAdminClient
 
@@ -176,3 +178,195 @@ async def test_get_appointments_invalid_page_size(
 
     # Then: 검증 실패 확인
     assert response.status_code == 422
+
+
+async def test_get_appointments_without_total(
+    medisolveai_admin_client: MediSolveAiAdminClient,
+    session_maker_medisolveai: async_sessionmaker[AsyncSession],
+) -> None:
+    """예약 목록 조회 - include_total=false면 총 건수 없이 다음 페이지 존재 여부만 반환"""
+
+    doctor_mother = DoctorMother(medisolveai_admin_client)
+    treatment_mother = TreatmentMother(medisolveai_admin_client)
+    appointment_mother = AppointmentMother(session_maker_medisolveai)
+
+    # Given: 예약 3건 생성
+    doctor, treatment = await asyncio.gather(
+        doctor_mother.create(name="Dr. Kim"),
+        treatment_mother.create(name="레이저 시술", duration_minutes=30),
+    )
+    await asyncio.gather(
+        *[
+            appointment_mother.create(
+                doctor_id=doctor["id"],
+                treatment_id=treatment["id"],
+                appointment_datetime=datetime(2025, 1, 10, 10, 0) - timedelta(hours=idx),
+                patient_phone=f"010-1234-000{idx}",
+            )
+            for idx in range(3)
+        ]
+    )
+
+    # When: 총 건수 없이 1, 2페이지 조회 (동시 실행)
+    response_page1, response_page2 = await asyncio.gather(
+        medisolveai_admin_client.get_appointments(page=1, page_size=2, include_total="false"),
+        medisolveai_admin_client.get_appointments(page=2, page_size=2, include_total="false"),
+    )
+
+    # Then: 총 건수/총 페이지 수는 null, 마지막 페이지에서만 has_next가 false
+    page1 = response_page1.json()
+    page2 = response_page2.json()
+    assert (page1["total_count"], page1["total_pages"], page1["has_next"]) == (None, None, True)
+    assert (page2["total_count"], page2["total_pages"], page2["has_next"]) == (None, None, False)
+    assert len(page1["items"]) == 2
+    assert len(page2["items"]) == 1
+
+
+async def test_get_appointments_total_count_cached_per_filter(
+    medisolveai_admin_client: MediSolveAiAdminClient,
+    session_maker_medisolveai: async_sessionmaker[AsyncSession],
+) -> None:
+    """예약 목록 조회 - 같은 필터의 페이지 이동은 캐시된 총 건수를 쓰고, 상태 변경 후에는 다시 집계"""
+
+    doctor_mother = DoctorMother(medisolveai_admin_client)
+    treatment_mother = TreatmentMother(medisolveai_admin_client)
+    appointment_mother = AppointmentMother(session_maker_medisolveai)
+
+    # Given: 예약 3건 생성
+    doctor, treatment = await asyncio.gather(
+        doctor_mother.create(name="Dr. Kim"),
+        treatment_mother.create(name="레이저 시술", duration_minutes=30),
+    )
+    appointments = await asyncio.gather(
+        *[
+            appointment_mother.create(
+                doctor_id=doctor["id"],
+                treatment_id=treatment["id"],
+                appointment_datetime=datetime(2025, 1, 10, 10, 0) - timedelta(hours=idx),
+                status=AppointmentStatus.CONFIRMED,
+                patient_phone=f"010-1234-000{idx}",
+            )
+            for idx in range(3)
+        ]
+    )
+
+    # When: 확정 예약 1페이지 조회 후 같은 필터로 2페이지 조회
+    stats_before = appointment_count_cache.get_stats()
+    response_page1 = await medisolveai_admin_client.get_appointments(
+        page=1, page_size=2, status=AppointmentStatus.CONFIRMED.value
+    )
+    response_page2 = await medisolveai_admin_client.get_appointments(
+        page=2, page_size=2, status=AppointmentStatus.CONFIRMED.value
+    )
+
+    # Then: 첫 조회만 집계하고 2페이지는 캐시 사용
+    stats_after = appointment_count_cache.get_stats()
+    assert response_page1.json()["total_count"] == 3
+    assert response_page2.json()["total_count"] == 3
+    assert stats_after["misses"] == stats_before["misses"] + 1
+    assert stats_after["hits"] == stats_before["hits"] + 1
+
+    # When: 예약 한 건 완료 처리 후 다시 조회
+    update_response = await medisolveai_admin_client.update_appointment_status(
+        appointments[0]["id"], status=AppointmentStatus.COMPLETED.value
+    )
+    response_after_update = await medisolveai_admin_client.get_appointments(
+        page=1, page_size=2, status=AppointmentStatus.CONFIRMED.value
+    )
+
+    # Then: 캐시가 폐기되어 변경된 건수 반환
+    assert update_response.status_code == 200
+    assert response_after_update.json()["total_count"] == 2
+    assert response_after_update.json()["total_pages"] == 1
+
+
+async def test_get_appointments_with_cursor(
+    medisolveai_admin_client: MediSolveAiAdminClient,
+    session_maker_medisolveai: async_sessionmaker[AsyncSession],
+) -> None:
+    """예약 목록 조회 - next_cursor로 이어서 조회하면 같은 일시의 예약도 누락/중복 없이 끝까지 조회"""
+
+    doctor_mother = DoctorMother(medisolveai_admin_client)
+    treatment_mother = TreatmentMother(medisolveai_admin_client)
+    appointment_mother = AppointmentMother(session_maker_medisolveai)
+
+    # Given: 예약 5건 생성 (두 건씩 같은 일시)
+    doctors, treatment = await asyncio.gather(
+        doctor_mother.create_bulk(count=2, base_name="Dr. Cursor"),
+        treatment_mother.create(name="레이저 시술", duration_minutes=30),
+    )
+    appointments = await asyncio.gather(
+        *[
+            appointment_mother.create(
+                doctor_id=doctors[idx % 2]["id"],
+                treatment_id=treatment["id"],
+                appointment_datetime=datetime(2025, 1, 10, 10, 0) - timedelta(hours=idx // 2),
+                patient_phone=f"010-1234-010{idx}",
+            )
+            for idx in range(5)
+        ]
+    )
+
+    # When: 커서 없이 1페이지 조회 후 next_cursor로 끝까지 조회
+    pages = [(await medisolveai_admin_client.get_appointments(page_size=2, include_total="false")).json()]
+    while pages[-1]["next_cursor"] is not None:
+        response = await medisolveai_admin_client.get_appointments(
+            page_size=2, include_total="false", cursor=pages[-1]["next_cursor"]
+        )
+        assert response.status_code == 200
+        pages.append(response.json())
+
+    # Then: (예약 일시, ID) 내림차순으로 전체 예약을 한 번씩 조회, 커서 방식 응답의 page는 null
+    expected_ids = [
+        appointment["id"]
+        for appointment in sorted(
+            appointments, key=lambda item: (item["appointment_datetime"], item["id"]), reverse=True
+        )
+    ]
+    assert [item["id"] for page in pages for item in page["items"]] == expected_ids
+    assert [len(page["items"]) for page in pages] == [2, 2, 1]
+    assert [page["has_next"] for page in pages] == [True, True, False]
+    assert [page["page"] for page in pages] == [1, None, None]
+
+
+async def test_get_appointments_invalid_cursor(
+    medisolveai_admin_client: MediSolveAiAdminClient,
+) -> None:
+    """예약 목록 조회 - 해석할 수 없는 커서는 400"""
+
+    # When: 잘못된 커서로 조회
+    response = await medisolveai_admin_client.get_appointments(page_size=2, cursor="invalid-cursor")
+
+    # Then: 커서 에러 확인
+    assert response.status_code == 400
+    assert response.json()["message"] == ErrorMessages.INVALID_CURSOR
+
+
+async def test_appointment_count_cache_drops_expired_entries() -> None:
+    """만료된 총 건수는 조회/저장 시 캐시에서 제거되어 남지 않음"""
+    # Given: 유지 시간이 짧은 캐시에 필터 2개의 총 건수 저장
+    cache = AppointmentCountCache(ttl_seconds=0.05, max_entries=10)
+    first_key = cache.build_key(start_datetime=None, end_datetime=None, doctor_id=1, treatment_id=None, status=None)
+    second_key = cache.build_key(start_datetime=None, end_datetime=None, doctor_id=2, treatment_id=None, status=None)
+    cache.put(first_key, 3)
+    cache.put(second_key, 5)
+    assert cache.get(first_key) == 3
+    time.sleep(0.06)
+
+    # When: 만료 후 첫 번째 필터 조회
+    expired_total = cache.get(first_key)
+
+    # Then: 미스로 처리되고 항목 제거
+    assert expired_total is None
+    assert cache.get_stats()["size"] == 1
+
+    # When: 다른 필터의 총 건수 저장
+    third_key = cache.build_key(start_datetime=None, end_datetime=None, doctor_id=3, treatment_id=None, status=None)
+    cache.put(third_key, 7)
+
+    # Then: 만료된 두 번째 필터 항목도 제거되고 새 항목만 남음
+    stats = cache.get_stats()
+    assert stats["size"] == 1
+    assert stats["expirations"] == 2
+    assert stats["evictions"] == 0
+    assert cache.get(third_key) == 7
@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime
+from datetime import datetime, timedelta
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy import NullPool, func, insert, make_url, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from app.core.constants import AppointmentStatus
+from app.core.configs.settings import settings
+from app.core.constants import AppointmentStatus, CacheNames
+from app.models import AppointmentSlotTick, CacheVersion, Patient
+from app.services.cache_version_publisher import CacheVersionPublisher
 from app.tests.mothers import AppointmentMother, DoctorMother, TreatmentMother
 from app.tests.test_client import MediSolveAiAdminClient
 
@@ -51,6 +55,55 @@ async def test_update_appointment_status_success(
     assert any(item["id"] == appointment["id"] for item in items)
 
 
+async def test_update_appointment_status_complete_updates_patient_visit_summary(
+    medisolveai_admin_client: MediSolveAiAdminClient,
+    session_maker_medisolveai: async_sessionmaker[AsyncSession],
+) -> None:
+    """예약 완료 시 환자 방문 요약(완료 수, 마지막 완료 일시)이 갱신되는지 테스트"""
+
+    async def get_visit_summary(patient_id: int) -> tuple[int, datetime | None]:
+        async with session_maker_medisolveai() as session:
+            result = await session.execute(
+                select(Patient.completed_visit_count, Patient.last_completed_at).where(Patient.id == patient_id)
+            )
+            row = result.one()
+            return row.completed_visit_count, row.last_completed_at
+
+    doctor_mother = DoctorMother(medisolveai_admin_client)
+    treatment_mother = TreatmentMother(medisolveai_admin_client)
+    appointment_mother = AppointmentMother(session_maker_medisolveai)
+
+    doctor, treatment = await asyncio.gather(
+        doctor_mother.create(name="Dr. Visit"),
+        treatment_mother.create(name="레이저", duration_minutes=30),
+    )
+
+    # Given: 같은 환자의 확정된 예약 2건
+    later, earlier = [
+        await appointment_mother.create(
+            doctor_id=doctor["id"],
+            treatment_id=treatment["id"],
+            appointment_datetime=appointment_datetime,
+            status=AppointmentStatus.CONFIRMED,
+            patient_name="방문 요약",
+            patient_phone="010-9000-0005",
+        )
+        for appointment_datetime in [datetime(2025, 1, 24, 10, 0), datetime(2025, 1, 20, 10, 0)]
+    ]
+    assert await get_visit_summary(later["patient_id"]) == (0, None)
+
+    # When: 나중 예약 완료 → 같은 상태로 다시 요청 → 이전 예약 완료
+    for appointment in [later, later, earlier]:
+        response = await medisolveai_admin_client.update_appointment_status(
+            appointment_id=appointment["id"],
+            status=AppointmentStatus.COMPLETED.value,
+        )
+        assert response.status_code == 200
+
+    # Then: 완료 수는 예약별로 한 번씩만 반영되고, 마지막 완료 일시는 가장 최근 예약 일시 유지
+    assert await get_visit_summary(later["patient_id"]) == (2, datetime(2025, 1, 24, 10, 0))
+
+
 async def test_update_appointment_status_invalid_transition(
     medisolveai_admin_client: MediSolveAiAdminClient,
     session_maker_medisolveai: async_sessionmaker[AsyncSession],
@@ -82,3 +135,124 @@ async def test_update_appointment_status_invalid_transition(
 
     assert response.status_code == 400
     assert response.json()["message"] == "해당 예약 상태로 변경할 수 없습니다."
+
+
+async def test_update_appointment_status_bumps_date_cache_version(
+    medisolveai_admin_client: MediSolveAiAdminClient,
+    session_maker_medisolveai: async_sessionmaker[AsyncSession],
+) -> None:
+    """예약 상태 변경 시 해당 날짜의 예약 캐시 버전 증가"""
+
+    appointment_datetime = datetime(2025, 1, 22, 10, 0)
+    cache_name = CacheNames.appointments(appointment_datetime.date())
+
+    async def get_cache_version() -> int:
+        async with session_maker_medisolveai() as session:
+            result = await session.execute(select(CacheVersion.version).where(CacheVersion.name == cache_name))
+            return result.scalar_one_or_none() or 0
+
+    doctor_mother = DoctorMother(medisolveai_admin_client)
+    treatment_mother = TreatmentMother(medisolveai_admin_client)
+    appointment_mother = AppointmentMother(session_maker_medisolveai)
+
+    doctor, treatment = await asyncio.gather(
+        doctor_mother.create(name="Dr. Cache"),
+        treatment_mother.create(name="레이저", duration_minutes=30),
+    )
+
+    appointment = await appointment_mother.create(
+        doctor_id=doctor["id"],
+        treatment_id=treatment["id"],
+        appointment_datetime=appointment_datetime,
+        status=AppointmentStatus.PENDING,
+        patient_name="캐시 테스트",
+        patient_phone="010-9000-0003",
+    )
+    initial_version = await get_cache_version()
+
+    # When: 예약 취소
+    response = await medisolveai_admin_client.update_appointment_status(
+        appointment_id=appointment["id"],
+        status=AppointmentStatus.CANCELLED.value,
+    )
+
+    # Then: 해당 날짜의 캐시 버전 증가
+    assert response.status_code == 200
+    assert await get_cache_version() == initial_version + 1
+
+
+async def test_cache_version_publish_failure_is_counted_without_raising() -> None:
+    """상태 변경 커밋 후 캐시 버전 증가에 실패해도 예외 없이 실패 지표만 기록"""
+    # Given: 접속할 수 없는 DB의 세션 (커밋 후 버전 증가 단계의 DB 장애)
+    publisher = CacheVersionPublisher()
+    unreachable_engine = create_async_engine(make_url(settings.database_url).set(port=1), poolclass=NullPool)
+    try:
+        async with async_sessionmaker(bind=unreachable_engine)() as session:
+            # When: 버전 증가
+            await publisher.publish_appointment_dates(session=session, dates=[datetime(2025, 1, 22).date()])
+    finally:
+        await unreachable_engine.dispose()
+
+    # Then: 실패 지표만 증가
+    assert publisher.get_stats() == {"published": 0, "failures": 1}
+
+
+async def test_update_appointment_status_cancel_releases_slot_ticks(
+    medisolveai_admin_client: MediSolveAiAdminClient,
+    session_maker_medisolveai: async_sessionmaker[AsyncSession],
+) -> None:
+    """예약 취소 시 의사 점유 구간이 해제되는지 테스트"""
+
+    appointment_datetime = datetime(2025, 1, 23, 10, 0)
+
+    async def count_ticks(appointment_id: int) -> int:
+        async with session_maker_medisolveai() as session:
+            result = await session.execute(
+                select(func.count()).where(AppointmentSlotTick.appointment_id == appointment_id)
+            )
+            return result.scalar_one()
+
+    doctor_mother = DoctorMother(medisolveai_admin_client)
+    treatment_mother = TreatmentMother(medisolveai_admin_client)
+    appointment_mother = AppointmentMother(session_maker_medisolveai)
+
+    doctor, treatment = await asyncio.gather(
+        doctor_mother.create(name="Dr. Tick"),
+        treatment_mother.create(name="레이저", duration_minutes=30),
+    )
+
+    appointment = await appointment_mother.create(
+        doctor_id=doctor["id"],
+        treatment_id=treatment["id"],
+        appointment_datetime=appointment_datetime,
+        status=AppointmentStatus.CONFIRMED,
+        patient_name="점유 테스트",
+        patient_phone="010-9000-0004",
+    )
+
+    # Given: 30분 예약의 점유 구간 (15분 × 2)
+    async with session_maker_medisolveai() as session:
+        await session.execute(
+            insert(AppointmentSlotTick).values(
+                [
+                    {"appointment_id": appointment["id"], "doctor_id": doctor["id"], "tick": appointment_datetime},
+                    {
+                        "appointment_id": appointment["id"],
+                        "doctor_id": doctor["id"],
+                        "tick": appointment_datetime + timedelta(minutes=15),
+                    },
+                ]
+            )
+        )
+        await session.commit()
+    assert await count_ticks(appointment["id"]) == 2
+
+    # When: 예약 취소
+    response = await medisolveai_admin_client.update_appointment_status(
+        appointment_id=appointment["id"],
+        status=AppointmentStatus.CANCELLED.value,
+    )
+
+    # Then: 점유 구간 해제
+    assert response.status_code == 200
+    assert await count_ticks(appointment["id"]) == 0
@@ -4,7 +4,11 @@ from __future__ import annotations
 
 import asyncio
 
-from app.core.constants import ErrorMessages
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.constants import CacheNames, ErrorMessages
+from app.models import CacheVersion
 from app.tests.mothers import HospitalSlotMother
 from app.tests.test_client import MediSolveAiAdminClient
 
@@ -184,3 +188,33 @@ async def test_delete_hospital_slot_not_found(medisolveai_admin_client: MediSolv
     assert response.status_code == 400
     error = response.json()
     assert error["message"] == ErrorMessages.HOSPITAL_SLOT_NOT_FOUND
+
+
+async def test_hospital_slot_changes_bump_cache_version(
+    medisolveai_admin_client: MediSolveAiAdminClient,
+    session_maker_medisolveai: async_sessionmaker[AsyncSession],
+) -> None:
+    """병원 시간대 생성/수정/비활성화 시 캐시 버전 증가"""
+
+    async def get_cache_version() -> int:
+        async with session_maker_medisolveai() as session:
+            result = await session.execute(
+                select(CacheVersion.version).where(CacheVersion.name == CacheNames.HOSPITAL_SLOTS)
+            )
+            return result.scalar_one_or_none() or 0
+
+    mother = HospitalSlotMother(medisolveai_admin_client)
+    initial_version = await get_cache_version()
+
+    # When: 슬롯 생성 → 수정 → 비활성화
+    slot = await mother.create(start_time="16:00", end_time="16:30", max_capacity=3)
+    created_version = await get_cache_version()
+
+    await medisolveai_admin_client.update_hospital_slot(slot["id"], max_capacity=1)
+    updated_version = await get_cache_version()
+
+    await medisolveai_admin_client.delete_hospital_slot(slot["id"])
+    deleted_version = await get_cache_version()
+
+    # Then: 변경마다 버전이 증가
+    assert initial_version < created_version < updated_version < deleted_version
@@ -0,0 +1,47 @@
+"""스키마 마이그레이션 테스트 (init.sql과 database/migrations가 어긋나면 실패)"""
+
+from __future__ import annotations
+
+from sqlalchemy import NullPool, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.configs.settings import settings
+from app.core.database import apply_migrations, get_applied_versions, load_migrations
+
+
+async def test_init_schema_includes_all_migrations() -> None:
+    """init.sql로 만든 테스트 DB에는 모든 마이그레이션이 기록되어 있고, 다시 실행해도 적용할 것이 없음"""
+    # Given: 마이그레이션 파일 목록
+    migrations = load_migrations()
+    assert [migration.version for migration in migrations] == sorted(migration.version for migration in migrations)
+
+    engine = create_async_engine(settings.database_url, poolclass=NullPool)
+    try:
+        async with engine.connect() as connection:
+            # When: 기록된 버전 조회 후 마이그레이션 실행
+            applied_versions = await get_applied_versions(connection)
+            applied = await apply_migrations(connection, migrations)
+
+            # Then: 모든 버전이 기록되어 있어 적용한 마이그레이션 없음
+            assert applied_versions == {migration.version for migration in migrations}
+            assert applied == []
+
+            # Then: 마이그레이션에서 추가한 인덱스/테이블/컬럼이 실제 스키마에 존재
+            result = await connection.execute(text("SHOW INDEX FROM appointments"))
+            index_names = {row._mapping["Key_name"] for row in result.all()}
+            assert {
+                "idx_appointments_datetime_id",
+                "idx_appointments_status_datetime",
+                "idx_appointments_datetime_status",
+                "idx_appointments_patient_datetime_id",
+            } <= index_names
+
+            result = await connection.execute(text("SHOW TABLES"))
+            table_names = {row[0] for row in result.all()}
+            assert {"cache_versions", "appointment_slot_ticks", "idempotency_keys", "appointment_holds"} <= table_names
+
+            result = await connection.execute(text("SHOW COLUMNS FROM patients"))
+            column_names = {row._mapping["Field"] for row in result.all()}
+            assert {"completed_visit_count", "last_completed_at"} <= column_names
+    finally:
+        await engine.dispose()
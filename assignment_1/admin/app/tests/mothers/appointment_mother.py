@@ -49,12 +49,11 @@ class AppointmentMother:
             )
             session.add(appointment)
             await session.commit()
-            await session.refresh(appointment)
-            await session.refresh(appointment.doctor)
-            await session.refresh(appointment.treatment)
-            await session.refresh(appointment.patient)
 
-            return self._map_appointment_to_dict(appointment)
+            # 관계는 지연 로딩하지 않으므로 의사/진료 항목/환자를 함께 다시 조회
+            loaded = await Appointment.get_by_id(session=session, appointment_id=appointment.id)
+            assert loaded is not None
+            return self._map_appointment_to_dict(loaded)
 
     @staticmethod
     def _map_appointment_to_dict(appointment: Appointment) -> dict[str, Any]:
@@ -0,0 +1,173 @@
+"""Admin 예약 조회 쿼리 실행 계획 테스트 (날짜 조건을 함수로 감싸 인덱스를 못 쓰게 되면 실패)"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.constants import AppointmentStatus, VisitType
+from app.models import Appointment, Patient
+from app.tests.mothers import DoctorMother, TreatmentMother
+from app.tests.test_client import MediSolveAiAdminClient
+from app.tests.utils import explain, get_table_plan, record_statements
+
+SEED_START_DATETIME = datetime(2025, 1, 1, 9, 0)
+SEED_DAYS = 40
+SEED_STATUSES = list(AppointmentStatus)
+
+
+async def _seed_appointments(
+    admin_client: MediSolveAiAdminClient,
+    session_maker: async_sessionmaker[AsyncSession],
+) -> list[int]:
+    """의사 5명 × 40일 × 하루 4건 예약 생성 (상태는 고르게 분포) 후 통계 갱신, 의사 ID 목록 반환"""
+    doctors, treatments = await asyncio.gather(
+        DoctorMother(admin_client).create_bulk(count=5, base_name="Dr. Plan"),
+        TreatmentMother(admin_client).create_bulk(count=4, base_name="Plan"),
+    )
+
+    async with session_maker() as session:
+        patient = Patient(name="실행계획", phone="010-7000-0000")
+        session.add(patient)
+        await session.flush()
+
+        session.add_all(
+            [
+                Appointment(
+                    doctor_id=doctor["id"],
+                    patient_id=patient.id,
+                    treatment_id=treatments[hour % len(treatments)]["id"],
+                    appointment_datetime=SEED_START_DATETIME + timedelta(days=day, hours=hour * 2),
+                    status=SEED_STATUSES[(day + hour) % len(SEED_STATUSES)],
+                    visit_type=VisitType.FIRST_VISIT,
+                )
+                for day in range(SEED_DAYS)
+                for doctor in doctors
+                for hour in range(4)
+            ]
+        )
+        await session.commit()
+        await session.execute(text("ANALYZE TABLE appointments"))
+
+    return [doctor["id"] for doctor in doctors]
+
+
+async def test_filtered_appointments_by_doctor_use_doctor_datetime_index(
+    medisolveai_admin_client: MediSolveAiAdminClient,
+    session_maker_medisolveai: async_sessionmaker[AsyncSession],
+) -> None:
+    """의사·기간 조건 목록 조회(개수/데이터)가 idx_appointments_doctor_datetime_status를 범위 검색"""
+
+    doctor_ids = await _seed_appointments(medisolveai_admin_client, session_maker_medisolveai)
+
+    async with session_maker_medisolveai() as session:
+        async with record_statements(session) as statements:
+            await Appointment.count_filtered(
+                session=session,
+                start_datetime=datetime(2025, 1, 20),
+                end_datetime=datetime(2025, 1, 21),
+                doctor_id=doctor_ids[0],
+            )
+            await Appointment.get_filtered(
+                session=session,
+                offset=0,
+                limit=21,
+                start_datetime=datetime(2025, 1, 20),
+                end_datetime=datetime(2025, 1, 21),
+                doctor_id=doctor_ids[0],
+            )
+        plans = [await explain(session, statement, parameters) for statement, parameters in statements]
+
+    assert len(plans) == 2
+    for plan in plans:
+        appointments_plan = get_table_plan(plan, "appointments")
+        assert appointments_plan["key"] == "idx_appointments_doctor_datetime_status"
+        assert appointments_plan["type"] == "range"
+
+
+async def test_appointments_after_cursor_use_datetime_id_index(
+    medisolveai_admin_client: MediSolveAiAdminClient,
+    session_maker_medisolveai: async_sessionmaker[AsyncSession],
+) -> None:
+    """필터 없는 커서 목록 조회가 idx_appointments_datetime_id를 범위 검색 (OFFSET 없이 커서 다음부터 읽음)"""
+
+    await _seed_appointments(medisolveai_admin_client, session_maker_medisolveai)
+
+    async with session_maker_medisolveai() as session:
+        async with record_statements(session) as statements:
+            await Appointment.get_filtered(
+                session=session,
+                offset=0,
+                limit=21,
+                after=(datetime(2025, 1, 20, 9, 0), 1),
+            )
+        plan = await explain(session, *statements[0])
+
+    appointments_plan = get_table_plan(plan, "appointments")
+    assert appointments_plan["key"] == "idx_appointments_datetime_id"
+    assert appointments_plan["type"] == "range"
+
+
+async def test_status_counts_by_period_use_datetime_index(
+    medisolveai_admin_client: MediSolveAiAdminClient,
+    session_maker_medisolveai: async_sessionmaker[AsyncSession],
+) -> None:
+    """기간 조건 통계 조회가 idx_appointments_datetime_status를 범위 검색 (행 조회 없이 인덱스만으로 집계)"""
+
+    await _seed_appointments(medisolveai_admin_client, session_maker_medisolveai)
+
+    async with session_maker_medisolveai() as session:
+        async with record_statements(session) as statements:
+            await Appointment.get_status_counts(
+                session=session,
+                start_datetime=datetime(2025, 1, 20),
+                end_datetime=datetime(2025, 1, 21),
+            )
+        plan = await explain(session, *statements[0])
+
+    appointments_plan = get_table_plan(plan, "appointments")
+    assert appointments_plan["key"] == "idx_appointments_datetime_status"
+    assert appointments_plan["type"] == "range"
+    assert "Using index" in (appointments_plan["Extra"] or "")
+
+
+async def test_appointments_by_status_and_period_use_status_datetime_index(
+    medisolveai_admin_client: MediSolveAiAdminClient,
+    session_maker_medisolveai: async_sessionmaker[AsyncSession],
+) -> None:
+    """상태·기간 조건 목록(개수/데이터)·상태별 통계 조회가 idx_appointments_status_datetime을 범위 검색"""
+
+    await _seed_appointments(medisolveai_admin_client, session_maker_medisolveai)
+
+    async with session_maker_medisolveai() as session:
+        async with record_statements(session) as statements:
+            await Appointment.count_filtered(
+                session=session,
+                start_datetime=datetime(2025, 1, 20),
+                end_datetime=datetime(2025, 1, 21),
+                status=AppointmentStatus.CANCELLED,
+            )
+            await Appointment.get_filtered(
+                session=session,
+                offset=0,
+                limit=21,
+                start_datetime=datetime(2025, 1, 20),
+                end_datetime=datetime(2025, 1, 21),
+                status=AppointmentStatus.CANCELLED,
+            )
+            await Appointment.get_status_counts(
+                session=session,
+                start_datetime=datetime(2025, 1, 20),
+                end_datetime=datetime(2025, 1, 21),
+                status=AppointmentStatus.CANCELLED,
+            )
+        plans = [await explain(session, statement, parameters) for statement, parameters in statements]
+
+    assert len(plans) == 3
+    for plan in plans:
+        appointments_plan = get_table_plan(plan, "appointments")
+        assert appointments_plan["key"] == "idx_appointments_status_datetime"
+        assert appointments_plan["type"] == "range"
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from app.core.database.orm import Base
 from app.tests.test_client import MediSolveAiAdminClient
 
 
@@ -19,3 +20,18 @@ async def test_admin_app_health(medisolveai_admin_client: MediSolveAiAdminClient
     assert response["status"] == "healthy"
     assert response["service"] == "admin_api"
     assert "environment" in response
+
+
+def test_relationships_never_lazy_load() -> None:
+    """
+    모든 관계가 암묵적 지연 로딩 대신 접근 시 에러를 내도록 설정되었는지 테스트
+
+    엔드포인트가 로딩 옵션 없이 관계에 접근하면 에러가 발생하므로, API 테스트 통과 = 암묵적 지연 로딩 없음
+    """
+    lazy_relationships = [
+        f"{mapper.class_.__name__}.{relationship.key}"
+        for mapper in Base.registry.mappers
+        for relationship in mapper.relationships
+        if relationship.lazy != "raise"
+    ]
+    assert lazy_relationships == []
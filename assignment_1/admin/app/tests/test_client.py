@@ -152,6 +152,12 @@ class MediSolveAiAdminClient:
         query_params = {key: value for key, value in params.items() if value is not None}
         return await self._client.get("/api/v1/admin/appointments", params=query_params)
 
+    async def export_appointments(self, **params: Any) -> httpx.Response:
+        """예약 내보내기"""
+
+        query_params = {key: value for key, value in params.items() if value is not None}
+        return await self._client.get("/api/v1/admin/appointments/export", params=query_params)
+
     async def update_appointment_status(self, appointment_id: int, *, status: str) -> httpx.Response:
         """예약 상태 변경"""
 
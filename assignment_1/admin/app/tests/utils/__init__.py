@@ -1,5 +1,6 @@
 """테스트 유틸리티"""
 
 from app.tests.utils.db_cleanup import reset_test_tables
+from app.tests.utils.query_plan import explain, get_table_plan, record_statements
 
-__all__ = ["reset_test_tables"]
+__all__ = ["reset_test_tables", "record_statements", "explain", "get_table_plan"]
@@ -10,6 +10,7 @@ from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import Appointment, Doctor, HospitalSlot, Patient, Treatment
+from app.services.appointment_count_cache import appointment_count_cache
 
 
 async def reset_test_tables(session: AsyncSession) -> None:
@@ -29,3 +30,6 @@ async def reset_test_tables(session: AsyncSession) -> None:
     await session.execute(delete(Treatment))
     await session.execute(delete(HospitalSlot))
     await session.commit()
+
+    # 테이블 초기화에 맞춰 인메모리 캐시도 초기화
+    appointment_count_cache.invalidate()
@@ -0,0 +1,44 @@
+"""
+쿼리 실행 계획(EXPLAIN) 검증 유틸리티
+
+모델 조회 메서드가 실행한 SQL을 그대로 기록한 뒤 같은 파라미터로 EXPLAIN 하여 사용 인덱스를 확인
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@asynccontextmanager
+async def record_statements(session: AsyncSession) -> AsyncIterator[list[tuple[str, Any]]]:
+    """블록 안에서 세션이 실행한 (SQL, 파라미터) 목록 기록"""
+    statements: list[tuple[str, Any]] = []
+
+    def before_cursor_execute(
+        conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        statements.append((statement, parameters))
+
+    sync_engine = session.get_bind()
+    event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+async def explain(session: AsyncSession, statement: str, parameters: Any) -> list[dict[str, Any]]:
+    """기록된 SQL의 EXPLAIN 결과 (행별 dict)"""
+    connection = await session.connection()
+    result = await connection.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+    return [dict(row._mapping) for row in result.all()]
+
+
+def get_table_plan(plan: list[dict[str, Any]], table: str) -> dict[str, Any]:
+    """EXPLAIN 결과에서 특정 테이블의 접근 계획"""
+    return next(row for row in plan if row["table"] == table)
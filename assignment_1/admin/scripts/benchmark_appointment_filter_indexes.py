@@ -0,0 +1,195 @@
+"""관리자 예약 목록/통계 조회의 필터 조합(기간, 상태, 상태 + 기간)별 실행 계획과 지연 시간을 측정하는 벤치마크 스크립트.
+
+상태 조건 인덱스(idx_appointments_status_datetime)를 보이지 않게(INVISIBLE) 했을 때와 비교해 실제로 사용되는지 확인합니다.
+테스트 DB(포트 3309)를 초기화하므로 테스트 DB 컨테이너를 띄운 뒤 실행합니다.
+
+    cd admin
+    ENVIRONMENT=test uv run python scripts/benchmark_appointment_filter_indexes.py --rows 1000000 --iterations 10
+"""
+
+from __future__ import annotations
+
+import asyncio
+import pathlib
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+from functools import partial
+from typing import Any
+
+ROOT_DIR = pathlib.Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from sqlalchemy import insert, text  # noqa: E402
+
+from app.core.configs.settings import settings  # noqa: E402
+from app.core.constants import AppointmentStatus, VisitType  # noqa: E402
+from app.core.database.connection_async import get_async_session  # noqa: E402
+from app.models import Appointment, Doctor, Patient, Treatment  # noqa: E402
+from app.tests.utils import explain, get_table_plan, record_statements, reset_test_tables  # noqa: E402
+
+SEED_START_DATETIME = datetime(2020, 1, 1, 9, 0)
+SEED_CHUNK_SIZE = 10000
+# 완료 70%, 취소/확정/대기 각 10%
+SEED_STATUSES = [AppointmentStatus.COMPLETED] * 7 + [
+    AppointmentStatus.CANCELLED,
+    AppointmentStatus.CONFIRMED,
+    AppointmentStatus.PENDING,
+]
+STATUS_INDEX_NAME = "idx_appointments_status_datetime"
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    filters: dict[str, Any]
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    scenario: str
+    query: str
+    index_visible: bool
+    key: str | None
+    access_type: str
+    rows: int
+    latencies: list[float]
+
+
+# 모델 조회 메서드 (관리자 목록 API의 데이터/개수 조회, 통계 API의 4개 집계)
+QUERIES: dict[str, Callable[..., Awaitable[Any]]] = {
+    "list": partial(Appointment.get_filtered, offset=0, limit=21),
+    "count": Appointment.count_filtered,
+    "status_counts": Appointment.get_status_counts,
+    "daily_counts": Appointment.get_daily_counts,
+    "hourly_counts": Appointment.get_hourly_counts,
+    "visit_type_counts": Appointment.get_visit_type_counts,
+}
+
+
+def parse_args() -> tuple[int, int]:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark admin appointment filter combinations and index usage.")
+    parser.add_argument("--rows", type=int, default=1000000, help="생성할 예약 건수")
+    parser.add_argument("--iterations", type=int, default=10, help="조회별 반복 횟수")
+
+    args = parser.parse_args()
+    return args.rows, args.iterations
+
+
+def build_scenarios(rows: int) -> list[Scenario]:
+    """데이터 기간 가운데의 1주일을 기준으로 필터 조합 생성"""
+    middle_datetime = SEED_START_DATETIME + timedelta(minutes=rows // 2 // 5 * 15)
+    period = {"start_datetime": middle_datetime, "end_datetime": middle_datetime + timedelta(days=7)}
+    return [
+        Scenario(name="period", filters=period),
+        Scenario(name="status", filters={"status": AppointmentStatus.CANCELLED}),
+        Scenario(name="status+period", filters={**period, "status": AppointmentStatus.CANCELLED}),
+    ]
+
+
+async def prepare_data(rows: int) -> None:
+    """테이블 초기화 후 의사 10명, 진료 항목 2개, 환자 1,000명, 예약 rows건 생성 (15분마다 5건)"""
+    async with get_async_session() as session:
+        await reset_test_tables(session)
+        doctors = [Doctor(name=f"의사{i + 1}", department="피부과", is_active=True) for i in range(10)]
+        treatments = [
+            Treatment(name="기본 진료", duration_minutes=30, price=Decimal("50000.00"), is_active=True),
+            Treatment(name="복합 치료", duration_minutes=60, price=Decimal("100000.00"), is_active=True),
+        ]
+        patients = [Patient(name=f"환자{i + 1}", phone=f"010-9000-{i:04d}") for i in range(1000)]
+        session.add_all([*doctors, *treatments, *patients])
+        await session.flush()
+
+        # ORM 단위 작업 없이 Core INSERT로 청크 단위 생성
+        for chunk_start in range(0, rows, SEED_CHUNK_SIZE):
+            await session.execute(
+                insert(Appointment),
+                [
+                    {
+                        "doctor_id": doctors[index % len(doctors)].id,
+                        "patient_id": patients[index % len(patients)].id,
+                        "treatment_id": treatments[index % len(treatments)].id,
+                        "appointment_datetime": SEED_START_DATETIME + timedelta(minutes=index // 5 * 15),
+                        "status": SEED_STATUSES[index % len(SEED_STATUSES)],
+                        "visit_type": VisitType.FIRST_VISIT if index % 4 == 0 else VisitType.RETURN_VISIT,
+                    }
+                    for index in range(chunk_start, min(chunk_start + SEED_CHUNK_SIZE, rows))
+                ],
+            )
+            await session.commit()
+        await session.execute(text("ANALYZE TABLE appointments"))
+
+
+async def set_status_index_visible(visible: bool) -> None:
+    """상태 조건 인덱스를 옵티마이저에서 보이게/안 보이게 전환 (인덱스는 유지)"""
+    async with get_async_session() as session:
+        visibility = "VISIBLE" if visible else "INVISIBLE"
+        await session.execute(text(f"ALTER TABLE appointments ALTER INDEX {STATUS_INDEX_NAME} {visibility}"))
+
+
+async def run_query(
+    scenario: Scenario,
+    query_name: str,
+    query: Callable[..., Awaitable[Any]],
+    index_visible: bool,
+    iterations: int,
+) -> BenchmarkResult:
+    async with get_async_session() as session:
+        # 실행 계획 (실행한 SQL을 그대로 EXPLAIN), 워밍업 겸용
+        async with record_statements(session) as statements:
+            await query(session=session, **scenario.filters)
+        plan = get_table_plan(await explain(session, *statements[0]), "appointments")
+
+        latencies: list[float] = []
+        for _ in range(iterations):
+            started_at = time.perf_counter()
+            await query(session=session, **scenario.filters)
+            latencies.append(time.perf_counter() - started_at)
+
+    return BenchmarkResult(
+        scenario=scenario.name,
+        query=query_name,
+        index_visible=index_visible,
+        key=plan["key"],
+        access_type=plan["type"],
+        rows=plan["rows"],
+        latencies=latencies,
+    )
+
+
+def print_result(result: BenchmarkResult) -> None:
+    latencies_ms = sorted(latency * 1000 for latency in result.latencies)
+    visibility = "visible" if result.index_visible else "invisible"
+
+    print(f"[{result.scenario}] {result.query} ({STATUS_INDEX_NAME} {visibility})")
+    print(f"  plan            : key={result.key} type={result.access_type} rows={result.rows}")
+    print(f"  latency p50/max : {statistics.median(latencies_ms):.1f}ms / {latencies_ms[-1]:.1f}ms")
+
+
+async def main(rows: int = 1000000, iterations: int = 10) -> None:
+    if not settings.is_test:
+        raise SystemExit("테스트 DB를 초기화하므로 ENVIRONMENT=test 에서만 실행합니다.")
+
+    await prepare_data(rows)
+    try:
+        for scenario in build_scenarios(rows):
+            for query_name, query in QUERIES.items():
+                for index_visible in (False, True):
+                    await set_status_index_visible(index_visible)
+                    print_result(await run_query(scenario, query_name, query, index_visible, iterations))
+    finally:
+        await set_status_index_visible(True)
+
+    async with get_async_session() as session:
+        await reset_test_tables(session)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(*parse_args()))
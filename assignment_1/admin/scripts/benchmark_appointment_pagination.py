@@ -0,0 +1,157 @@
+"""관리자 예약 목록 조회에서 OFFSET 페이지 방식과 커서 방식의 페이지 위치별 지연 시간을 비교하는 벤치마크 스크립트.
+
+테스트 DB(포트 3309)를 초기화하므로 테스트 DB 컨테이너를 띄운 뒤 실행합니다.
+
+    cd admin
+    ENVIRONMENT=test uv run python scripts/benchmark_appointment_pagination.py --rows 250000 --pages 1 100 10000
+"""
+
+from __future__ import annotations
+
+import asyncio
+import pathlib
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+from functools import partial
+
+ROOT_DIR = pathlib.Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from sqlalchemy import insert, text  # noqa: E402
+
+from app.core.configs.settings import settings  # noqa: E402
+from app.core.constants import AppointmentStatus, VisitType  # noqa: E402
+from app.core.database.connection_async import get_async_session  # noqa: E402
+from app.dtos.appointment import AppointmentSummaryData  # noqa: E402
+from app.models import Appointment, Doctor, Patient, Treatment  # noqa: E402
+from app.tests.utils import reset_test_tables  # noqa: E402
+
+SEED_START_DATETIME = datetime(2020, 1, 1, 9, 0)
+SEED_CHUNK_SIZE = 5000
+PAGE_SIZE = 20
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    method: str
+    page: int
+    latencies: list[float]
+
+
+def parse_args() -> tuple[int, list[int], int]:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark OFFSET vs cursor pagination for admin appointment list.")
+    parser.add_argument("--rows", type=int, default=250000, help="생성할 예약 건수")
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 100, 10000], help="측정할 페이지 번호")
+    parser.add_argument("--iterations", type=int, default=20, help="방식/페이지별 조회 반복 횟수")
+
+    args = parser.parse_args()
+    return args.rows, args.pages, args.iterations
+
+
+async def prepare_data(rows: int) -> None:
+    """테이블 초기화 후 의사 10명, 진료 항목 2개, 환자 100명, 예약 rows건 생성 (같은 일시 예약 다수 포함)"""
+    async with get_async_session() as session:
+        await reset_test_tables(session)
+        doctors = [Doctor(name=f"의사{i + 1}", department="피부과", is_active=True) for i in range(10)]
+        treatments = [
+            Treatment(name="기본 진료", duration_minutes=30, price=Decimal("50000.00"), is_active=True),
+            Treatment(name="복합 치료", duration_minutes=60, price=Decimal("100000.00"), is_active=True),
+        ]
+        patients = [Patient(name=f"환자{i + 1}", phone=f"010-9000-{i:04d}") for i in range(100)]
+        session.add_all([*doctors, *treatments, *patients])
+        await session.flush()
+
+        # ORM 단위 작업 없이 Core INSERT로 청크 단위 생성
+        for chunk_start in range(0, rows, SEED_CHUNK_SIZE):
+            await session.execute(
+                insert(Appointment),
+                [
+                    {
+                        "doctor_id": doctors[index % len(doctors)].id,
+                        "patient_id": patients[index % len(patients)].id,
+                        "treatment_id": treatments[index % len(treatments)].id,
+                        "appointment_datetime": SEED_START_DATETIME + timedelta(minutes=index // 10 * 30),
+                        "status": AppointmentStatus.CONFIRMED,
+                        "visit_type": VisitType.RETURN_VISIT,
+                    }
+                    for index in range(chunk_start, min(chunk_start + SEED_CHUNK_SIZE, rows))
+                ],
+            )
+        await session.commit()
+        await session.execute(text("ANALYZE TABLE appointments"))
+
+
+async def read_page_with_offset(page: int) -> list[AppointmentSummaryData]:
+    """기존 방식: OFFSET으로 앞 페이지의 행을 건너뛰고 조회"""
+    async with get_async_session() as session:
+        return await Appointment.get_filtered(session=session, offset=(page - 1) * PAGE_SIZE, limit=PAGE_SIZE + 1)
+
+
+async def read_page_with_cursor(after: tuple[datetime, int] | None) -> list[AppointmentSummaryData]:
+    """변경 후 방식: 이전 페이지 마지막 예약의 (예약 일시, ID) 다음부터 조회"""
+    async with get_async_session() as session:
+        return await Appointment.get_filtered(session=session, offset=0, limit=PAGE_SIZE + 1, after=after)
+
+
+async def find_cursor(page: int) -> tuple[datetime, int] | None:
+    """page 직전 페이지의 마지막 예약 (커서 방식 측정용, 측정 시간에는 포함하지 않음)"""
+    if page == 1:
+        return None
+    async with get_async_session() as session:
+        summaries = await Appointment.get_filtered(session=session, offset=(page - 1) * PAGE_SIZE - 1, limit=1)
+    return summaries[0].appointment_datetime, summaries[0].id
+
+
+async def run_method(
+    method: str,
+    read: Callable[[], Awaitable[list[AppointmentSummaryData]]],
+    page: int,
+    iterations: int,
+) -> BenchmarkResult:
+    # 워밍업 (커넥션 풀, 컴파일 캐시, 버퍼 풀)
+    assert len(await read()) == PAGE_SIZE + 1
+
+    latencies: list[float] = []
+    for _ in range(iterations):
+        started_at = time.perf_counter()
+        await read()
+        latencies.append(time.perf_counter() - started_at)
+
+    return BenchmarkResult(method=method, page=page, latencies=latencies)
+
+
+def print_result(result: BenchmarkResult) -> None:
+    latencies_ms = sorted(latency * 1000 for latency in result.latencies)
+
+    print(f"[{result.method}] page={result.page}")
+    print(f"  latency p50/max : {statistics.median(latencies_ms):.1f}ms / {latencies_ms[-1]:.1f}ms")
+
+
+async def main(rows: int = 250000, pages: list[int] | None = None, iterations: int = 20) -> None:
+    if not settings.is_test:
+        raise SystemExit("테스트 DB를 초기화하므로 ENVIRONMENT=test 에서만 실행합니다.")
+
+    pages = pages or [1, 100, 10000]
+    if max(pages) * PAGE_SIZE >= rows:
+        raise SystemExit(f"가장 뒤 페이지까지 조회하려면 --rows가 {max(pages) * PAGE_SIZE}보다 커야 합니다.")
+
+    await prepare_data(rows)
+    for page in pages:
+        after = await find_cursor(page)
+        print_result(await run_method("offset", partial(read_page_with_offset, page), page, iterations))
+        print_result(await run_method("cursor", partial(read_page_with_cursor, after), page, iterations))
+
+    async with get_async_session() as session:
+        await reset_test_tables(session)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(*parse_args()))
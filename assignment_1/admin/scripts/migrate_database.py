@@ -0,0 +1,64 @@
+"""database/migrations의 스키마 마이그레이션 중 적용되지 않은 것을 버전 순으로 적용하는 스크립트.
+
+DB_HOST/DB_PORT 등 서비스와 같은 설정으로 접속하며, 새 DB(init.sql로 생성)는 이미 반영된 버전이 기록되어 있어 적용할 것이 없습니다.
+
+    cd admin
+    uv run python scripts/migrate_database.py --dry-run   # 적용할 마이그레이션만 확인
+    uv run python scripts/migrate_database.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import pathlib
+import sys
+
+ROOT_DIR = pathlib.Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from sqlalchemy.ext.asyncio import create_async_engine  # noqa: E402
+
+from app.core.configs.settings import settings  # noqa: E402
+from app.core.database.migrations import (  # noqa: E402
+    MIGRATIONS_DIR,
+    apply_migrations,
+    get_applied_versions,
+    load_migrations,
+)
+
+
+def parse_args() -> tuple[pathlib.Path, bool]:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Apply pending schema migrations.")
+    parser.add_argument("--directory", type=pathlib.Path, default=MIGRATIONS_DIR, help="마이그레이션 디렉터리")
+    parser.add_argument("--dry-run", action="store_true", help="적용하지 않고 적용할 마이그레이션만 출력")
+
+    args = parser.parse_args()
+    return args.directory, args.dry_run
+
+
+async def main(directory: pathlib.Path = MIGRATIONS_DIR, dry_run: bool = False) -> None:
+    migrations = load_migrations(directory)
+
+    # 네임드 락은 커넥션 단위이므로 확인/적용/기록을 한 커넥션에서 실행
+    engine = create_async_engine(settings.database_url)
+    try:
+        async with engine.connect() as connection:
+            if dry_run:
+                applied_versions = await get_applied_versions(connection)
+                pending = [migration for migration in migrations if migration.version not in applied_versions]
+            else:
+                pending = await apply_migrations(connection, migrations)
+    finally:
+        await engine.dispose()
+
+    label = "pending" if dry_run else "applied"
+    for migration in pending:
+        print(f"[{label}] {migration.version} {migration.name}")
+    print(f"{len(pending)} migration(s) {label}, {len(migrations)} total")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(*parse_args()))
@@ -62,6 +62,8 @@ CREATE TABLE patients (
     id BIGINT AUTO_INCREMENT PRIMARY KEY,
     name VARCHAR(100) NOT NULL COMMENT '환자 이름',
     phone VARCHAR(20) NOT NULL UNIQUE COMMENT '연락처 (인증 및 조회용)',
+    completed_visit_count INT NOT NULL DEFAULT 0 COMMENT '완료된 진료 수 (초진/재진 판단용, 예약 완료 처리 시 갱신)',
+    last_completed_at DATETIME NULL COMMENT '마지막 완료 진료 일시',
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     
@@ -110,10 +112,95 @@ CREATE TABLE appointments (
     
     -- 성능 최적화 인덱스
     INDEX idx_appointments_doctor_datetime_status (doctor_id, appointment_datetime, status),
+    INDEX idx_appointments_datetime_status (appointment_datetime, status),
     INDEX idx_appointments_treatment_datetime_status (treatment_id, appointment_datetime, status),
-    INDEX idx_appointments_patient_status_datetime (patient_id, status, appointment_datetime)
+    INDEX idx_appointments_patient_status_datetime (patient_id, status, appointment_datetime),
+    INDEX idx_appointments_patient_datetime_id (patient_id, appointment_datetime, id),
+    INDEX idx_appointments_datetime_id (appointment_datetime, id),
+    INDEX idx_appointments_status_datetime (status, appointment_datetime)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='예약 정보';
 
+-- 예약 점유 구간 테이블 (의사별 15분 단위 점유, 유니크 키로 중복 예약을 DB에서 차단)
+CREATE TABLE appointment_slot_ticks (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    appointment_id BIGINT NOT NULL COMMENT '예약',
+    doctor_id BIGINT NOT NULL COMMENT '담당 의사',
+    tick DATETIME NOT NULL COMMENT '점유 구간 시작 일시 (15분 단위)',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+
+    -- 외래키 제약조건 (예약 삭제 시 점유 구간도 삭제)
+    FOREIGN KEY (appointment_id) REFERENCES appointments(id) ON DELETE CASCADE,
+    FOREIGN KEY (doctor_id) REFERENCES doctors(id) ON DELETE RESTRICT,
+
+    -- 같은 의사의 같은 15분 구간은 하나의 예약만 점유
+    UNIQUE KEY uq_appointment_slot_ticks_doctor_tick (doctor_id, tick),
+    INDEX idx_appointment_slot_ticks_appointment (appointment_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='예약 점유 구간 (의사별 15분 단위)';
+
+-- 캐시 버전 테이블 (서비스 간 인메모리 캐시 무효화용)
+CREATE TABLE cache_versions (
+    name VARCHAR(100) PRIMARY KEY COMMENT '캐시 이름',
+    version BIGINT NOT NULL DEFAULT 0 COMMENT '캐시 버전 (데이터 변경 시 증가)',
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='캐시 버전 정보';
+
+-- 멱등성 키 테이블 (Idempotency-Key 헤더로 재시도된 요청에 첫 응답을 그대로 반환)
+CREATE TABLE idempotency_keys (
+    scope VARCHAR(50) NOT NULL COMMENT '요청 종류 (예: appointments:create)',
+    idempotency_key VARCHAR(255) NOT NULL COMMENT '클라이언트가 보낸 Idempotency-Key',
+    request_hash CHAR(64) NOT NULL COMMENT '요청 내용 해시 (SHA-256, 같은 키로 다른 요청 방지)',
+    status_code SMALLINT NULL COMMENT '저장된 응답 상태 코드 (NULL: 처리 중)',
+    response_body JSON NULL COMMENT '저장된 응답 본문',
+    expires_at DATETIME NOT NULL COMMENT '만료 일시 (처리 중이면 짧은 점유 시간, 완료 후 보관 기간)',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (scope, idempotency_key),
+    INDEX idx_idempotency_keys_expires_at (expires_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='멱등성 키 (저장된 응답)';
+
+-- 예약 선점 테이블 (예약 가능 시간 조회 후 확정 전까지 몇 분간 시간대를 확보)
+CREATE TABLE appointment_holds (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    doctor_id BIGINT NOT NULL COMMENT '담당 의사',
+    treatment_id BIGINT NOT NULL COMMENT '진료항목',
+    patient_phone VARCHAR(20) NOT NULL COMMENT '선점한 환자 연락처 (확정/해제 시 본인 확인)',
+    appointment_datetime DATETIME NOT NULL COMMENT '예약 시작 일시',
+    duration_minutes INT NOT NULL COMMENT '진료 소요 시간 (분, 선점 시점 기준)',
+    expires_at DATETIME NOT NULL COMMENT '만료 일시 (지나면 예약 가능 시간/수용 인원 계산에서 제외)',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+    -- 외래키 제약조건 (의사/진료 항목 삭제 시 선점도 삭제, 만료된 선점이 삭제를 막지 않도록)
+    FOREIGN KEY (doctor_id) REFERENCES doctors(id) ON DELETE CASCADE,
+    FOREIGN KEY (treatment_id) REFERENCES treatments(id) ON DELETE CASCADE,
+
+    INDEX idx_appointment_holds_datetime (appointment_datetime, expires_at),
+    INDEX idx_appointment_holds_phone (patient_phone),
+    INDEX idx_appointment_holds_expires_at (expires_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='예약 선점 (만료 시 자동 해제)';
+
+-- 스키마 마이그레이션 이력 (database/migrations/*.sql 중 적용된 버전, admin/scripts/migrate_database.py가 기록)
+CREATE TABLE schema_migrations (
+    version VARCHAR(20) PRIMARY KEY COMMENT '마이그레이션 버전 (파일명 앞 번호)',
+    name VARCHAR(255) NOT NULL COMMENT '마이그레이션 이름',
+    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP COMMENT '적용 일시'
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='스키마 마이그레이션 이력';
+
+-- 이 스크립트의 스키마에 이미 반영된 마이그레이션 (새 DB에서는 다시 적용하지 않음)
+-- 마이그레이션을 추가하면 위 테이블 정의와 이 목록도 함께 갱신
+INSERT INTO schema_migrations (version, name) VALUES
+    ('0001', 'add_appointments_datetime_id_index'),
+    ('0002', 'add_appointments_status_datetime_index'),
+    ('0003', 'create_cache_versions'),
+    ('0004', 'add_appointments_datetime_status_index'),
+    ('0005', 'create_appointment_slot_ticks'),
+    ('0006', 'backfill_appointment_slot_ticks'),
+    ('0007', 'add_patients_visit_summary'),
+    ('0008', 'backfill_patients_visit_summary'),
+    ('0009', 'create_idempotency_keys'),
+    ('0010', 'create_appointment_holds'),
+    ('0011', 'add_appointments_patient_datetime_id_index');
+
 -- ============================================================================
 -- 2. 스키마 생성 완료
 -- ============================================================================
@@ -0,0 +1,9 @@
+-- ============================================================================
+-- 0001. 관리자 예약 목록 커서 조회용 인덱스
+-- ============================================================================
+-- (예약 일시, ID) 내림차순 목록을 마지막 예약 다음부터 OFFSET 없이 범위 검색
+-- 온라인 DDL (인덱스 생성 중에도 예약 생성/변경 가능)
+
+ALTER TABLE appointments
+    ADD INDEX idx_appointments_datetime_id (appointment_datetime, id),
+    ALGORITHM=INPLACE, LOCK=NONE;
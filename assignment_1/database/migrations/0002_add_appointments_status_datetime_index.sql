@@ -0,0 +1,10 @@
+-- ============================================================================
+-- 0002. 상태 조건 예약 조회용 인덱스
+-- ============================================================================
+-- 관리자 목록/통계의 상태만 지정한 조회, 상태 + 기간 조회를 상태 동등 조건 + 기간 범위로 검색
+-- (기간만 지정한 조회는 idx_appointments_datetime_status / idx_appointments_datetime_id 사용)
+-- 온라인 DDL (인덱스 생성 중에도 예약 생성/변경 가능)
+
+ALTER TABLE appointments
+    ADD INDEX idx_appointments_status_datetime (status, appointment_datetime),
+    ALGORITHM=INPLACE, LOCK=NONE;
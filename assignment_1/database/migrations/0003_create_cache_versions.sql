@@ -0,0 +1,11 @@
+-- ============================================================================
+-- 0003. 캐시 버전 테이블
+-- ============================================================================
+-- 서비스 간 인메모리 캐시 무효화용 (Admin 변경 → Patient 캐시 재구성, 날짜별 예약 현황 버전 포함)
+-- 행이 없는 캐시는 버전 0으로 취급하므로 초기 데이터 없음
+
+CREATE TABLE cache_versions (
+    name VARCHAR(100) PRIMARY KEY COMMENT '캐시 이름',
+    version BIGINT NOT NULL DEFAULT 0 COMMENT '캐시 버전 (데이터 변경 시 증가)',
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='캐시 버전 정보';
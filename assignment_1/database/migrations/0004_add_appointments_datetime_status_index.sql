@@ -0,0 +1,12 @@
+-- ============================================================================
+-- 0004. 기간 조건 예약 조회용 인덱스
+-- ============================================================================
+-- 날짜별 취소되지 않은 예약 조회(예약 가능 시간, 수용 인원 검증), 기간 조건 상태별 통계를 기간 범위로 검색
+-- (예약 일시, 상태)만으로 상태 조건을 확인하고 상태별 통계는 행 조회 없이 인덱스만으로 집계
+-- idx_appointments_datetime_id(커서 목록)는 상태를 포함하지 않고, idx_appointments_status_datetime은
+-- 상태가 앞이라 기간만 지정한 조회를 범위 검색할 수 없으므로 세 인덱스 모두 유지
+-- 온라인 DDL (인덱스 생성 중에도 예약 생성/변경 가능)
+
+ALTER TABLE appointments
+    ADD INDEX idx_appointments_datetime_status (appointment_datetime, status),
+    ALGORITHM=INPLACE, LOCK=NONE;
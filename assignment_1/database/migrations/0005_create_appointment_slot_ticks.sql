@@ -0,0 +1,20 @@
+-- ============================================================================
+-- 0005. 예약 점유 구간 테이블
+-- ============================================================================
+-- 의사별 15분 단위 점유 (유니크 키로 같은 의사의 중복 예약을 DB에서 차단, BOOKING_ENGINE=slot_ticks)
+-- 기존 예약의 점유 구간은 0006에서 채움
+
+CREATE TABLE appointment_slot_ticks (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    appointment_id BIGINT NOT NULL COMMENT '예약',
+    doctor_id BIGINT NOT NULL COMMENT '담당 의사',
+    tick DATETIME NOT NULL COMMENT '점유 구간 시작 일시 (15분 단위)',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+
+    FOREIGN KEY (appointment_id) REFERENCES appointments(id) ON DELETE CASCADE,
+    FOREIGN KEY (doctor_id) REFERENCES doctors(id) ON DELETE RESTRICT,
+
+    UNIQUE KEY uq_appointment_slot_ticks_doctor_tick (doctor_id, tick),
+    INDEX idx_appointment_slot_ticks_appointment (appointment_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='예약 점유 구간 (의사별 15분 단위)';
@@ -0,0 +1,20 @@
+-- ============================================================================
+-- 0006. 기존 예약의 점유 구간 채우기
+-- ============================================================================
+-- 취소되지 않은 예약마다 시작 일시부터 진료 소요 시간 동안 15분 단위 구간 생성 (예약 생성 시와 같은 규칙)
+-- 같은 의사의 겹치는 예약이 이미 있으면 유니크 키 위반으로 실패 (한 트랜잭션이므로 아무것도 기록되지 않음)
+-- → 겹치는 예약을 정리한 뒤 다시 실행
+-- 새 버전의 Patient 앱은 이 마이그레이션 적용 후 배포 (그 전에 생긴 예약은 점유 구간이 없음)
+
+INSERT INTO appointment_slot_ticks (appointment_id, doctor_id, tick)
+WITH RECURSIVE ticks (appointment_id, doctor_id, tick, end_datetime) AS (
+    SELECT a.id, a.doctor_id, a.appointment_datetime, a.appointment_datetime + INTERVAL t.duration_minutes MINUTE
+    FROM appointments a
+    JOIN treatments t ON t.id = a.treatment_id
+    WHERE a.status != 'CANCELLED' AND t.duration_minutes > 0
+    UNION ALL
+    SELECT appointment_id, doctor_id, tick + INTERVAL 15 MINUTE, end_datetime
+    FROM ticks
+    WHERE tick + INTERVAL 15 MINUTE < end_datetime
+)
+SELECT appointment_id, doctor_id, tick FROM ticks;
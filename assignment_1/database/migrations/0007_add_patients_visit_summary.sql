@@ -0,0 +1,11 @@
+-- ============================================================================
+-- 0007. 환자 방문 요약 컬럼
+-- ============================================================================
+-- 예약 생성 시 예약 테이블 조회 없이 초진/재진 판단 (예약 완료 처리 시 갱신)
+-- 기존 환자의 값은 0008에서 채움
+-- 온라인 DDL (컬럼 추가 중에도 환자 조회/생성 가능)
+
+ALTER TABLE patients
+    ADD COLUMN completed_visit_count INT NOT NULL DEFAULT 0 COMMENT '완료된 진료 수 (초진/재진 판단용, 예약 완료 처리 시 갱신)' AFTER phone,
+    ADD COLUMN last_completed_at DATETIME NULL COMMENT '마지막 완료 진료 일시' AFTER completed_visit_count,
+    ALGORITHM=INPLACE, LOCK=NONE;
@@ -0,0 +1,16 @@
+-- ============================================================================
+-- 0008. 기존 환자의 방문 요약 채우기
+-- ============================================================================
+-- 완료된 예약 수와 마지막 완료 예약 일시로 갱신 (완료된 예약이 없는 환자는 기본값 0 / NULL 유지)
+-- 다시 계산한 값으로 덮어쓰므로 중간에 완료 처리가 반영되었어도 결과가 같음
+-- 새 버전의 앱은 이 마이그레이션 적용 후 배포 (그 전에는 기존 재진 환자가 초진으로 판단됨)
+
+UPDATE patients p
+JOIN (
+    SELECT patient_id, COUNT(*) AS completed_visit_count, MAX(appointment_datetime) AS last_completed_at
+    FROM appointments
+    WHERE status = 'COMPLETED'
+    GROUP BY patient_id
+) completed ON completed.patient_id = p.id
+SET p.completed_visit_count = completed.completed_visit_count,
+    p.last_completed_at = completed.last_completed_at;
@@ -0,0 +1,17 @@
+-- ============================================================================
+-- 0009. 멱등성 키 테이블
+-- ============================================================================
+-- Idempotency-Key 헤더로 재시도된 예약 요청에 첫 응답을 그대로 반환
+
+CREATE TABLE idempotency_keys (
+    scope VARCHAR(50) NOT NULL COMMENT '요청 종류 (예: appointments:create)',
+    idempotency_key VARCHAR(255) NOT NULL COMMENT '클라이언트가 보낸 Idempotency-Key',
+    request_hash CHAR(64) NOT NULL COMMENT '요청 내용 해시 (SHA-256, 같은 키로 다른 요청 방지)',
+    status_code SMALLINT NULL COMMENT '저장된 응답 상태 코드 (NULL: 처리 중)',
+    response_body JSON NULL COMMENT '저장된 응답 본문',
+    expires_at DATETIME NOT NULL COMMENT '만료 일시 (처리 중이면 짧은 점유 시간, 완료 후 보관 기간)',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (scope, idempotency_key),
+    INDEX idx_idempotency_keys_expires_at (expires_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='멱등성 키 (저장된 응답)';
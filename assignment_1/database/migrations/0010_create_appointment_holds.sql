@@ -0,0 +1,22 @@
+-- ============================================================================
+-- 0010. 예약 선점 테이블
+-- ============================================================================
+-- 예약 가능 시간 조회 후 확정 전까지 몇 분간 시간대를 확보 (만료된 선점은 Patient 앱이 주기적으로 정리)
+
+CREATE TABLE appointment_holds (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    doctor_id BIGINT NOT NULL COMMENT '담당 의사',
+    treatment_id BIGINT NOT NULL COMMENT '진료항목',
+    patient_phone VARCHAR(20) NOT NULL COMMENT '선점한 환자 연락처 (확정/해제 시 본인 확인)',
+    appointment_datetime DATETIME NOT NULL COMMENT '예약 시작 일시',
+    duration_minutes INT NOT NULL COMMENT '진료 소요 시간 (분, 선점 시점 기준)',
+    expires_at DATETIME NOT NULL COMMENT '만료 일시 (지나면 예약 가능 시간/수용 인원 계산에서 제외)',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+    FOREIGN KEY (doctor_id) REFERENCES doctors(id) ON DELETE CASCADE,
+    FOREIGN KEY (treatment_id) REFERENCES treatments(id) ON DELETE CASCADE,
+
+    INDEX idx_appointment_holds_datetime (appointment_datetime, expires_at),
+    INDEX idx_appointment_holds_phone (patient_phone),
+    INDEX idx_appointment_holds_expires_at (expires_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='예약 선점 (만료 시 자동 해제)';
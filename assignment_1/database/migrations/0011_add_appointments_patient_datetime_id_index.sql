@@ -0,0 +1,10 @@
+-- ============================================================================
+-- 0011. 환자 예약 이력 커서 조회용 인덱스
+-- ============================================================================
+-- 환자 예약을 (예약 일시, ID) 순서로 마지막 예약 다음부터 OFFSET/정렬 없이 범위 검색
+-- idx_appointments_patient_status_datetime은 상태가 중간에 있어 상태 조건 없는 이력 조회는 매 페이지 정렬 필요
+-- 온라인 DDL (인덱스 생성 중에도 예약 생성/변경 가능)
+
+ALTER TABLE appointments
+    ADD INDEX idx_appointments_patient_datetime_id (patient_id, appointment_datetime, id),
+    ALGORITHM=INPLACE, LOCK=NONE;
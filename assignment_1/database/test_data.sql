@@ -7,11 +7,14 @@ USE hospital_management;
 
 -- 기존 데이터를 안전하게 초기화 (재실행 대비)
 SET FOREIGN_KEY_CHECKS = 0;
+TRUNCATE TABLE appointment_holds;
+TRUNCATE TABLE appointment_slot_ticks;
 TRUNCATE TABLE appointments;
 TRUNCATE TABLE hospital_slots;
 TRUNCATE TABLE patients;
 TRUNCATE TABLE treatments;
 TRUNCATE TABLE doctors;
+TRUNCATE TABLE idempotency_keys;
 SET FOREIGN_KEY_CHECKS = 1;
 
 -- ============================================================================
@@ -111,5 +114,35 @@ VALUES
     (1, 5, 3, '2024-11-13 17:00:00', 'PENDING', 'FIRST_VISIT', '추가 예약 요청'),
     (4, 6, 4, '2024-11-14 09:30:00', 'CONFIRMED', 'RETURN_VISIT', '재진 진행');
 
+-- ============================================================================
+-- 6. 예약 점유 구간 데이터
+--  - 취소되지 않은 예약의 15분 단위 점유 구간 생성 (이미 점유된 구간은 건너뜀)
+-- ============================================================================
+INSERT IGNORE INTO appointment_slot_ticks (appointment_id, doctor_id, tick)
+WITH RECURSIVE tick_offsets (minutes) AS (
+    SELECT 0
+    UNION ALL
+    SELECT minutes + 15 FROM tick_offsets WHERE minutes + 15 < (SELECT MAX(duration_minutes) FROM treatments)
+)
+SELECT a.id, a.doctor_id, a.appointment_datetime + INTERVAL o.minutes MINUTE
+FROM appointments a
+JOIN treatments t ON t.id = a.treatment_id
+JOIN tick_offsets o ON o.minutes < t.duration_minutes
+WHERE a.status <> 'CANCELLED';
+
+-- ============================================================================
+-- 7. 환자 방문 요약 데이터
+--  - 완료된 예약 수와 마지막 완료 일시 (예약 생성 시 초진/재진 판단에 사용)
+-- ============================================================================
+UPDATE patients p
+JOIN (
+    SELECT patient_id, COUNT(*) AS completed_visit_count, MAX(appointment_datetime) AS last_completed_at
+    FROM appointments
+    WHERE status = 'COMPLETED'
+    GROUP BY patient_id
+) c ON c.patient_id = p.id
+SET p.completed_visit_count = c.completed_visit_count,
+    p.last_completed_at = c.last_completed_at;
+
 -- 완료 메시지
 SELECT '테스트 데이터 삽입이 완료되었습니다.' AS message;
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import httpx
 from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 
 from app.core import settings
 
@@ -68,13 +70,14 @@ async def proxy_request(
         # 요청 바디 읽기
         body = await request.body()
 
-        # 타겟 서비스로 요청 전달
-        response = await client.request(
+        # 타겟 서비스로 요청 전달 (응답 본문은 아래에서 길이에 따라 읽거나 스트리밍)
+        upstream_request = client.build_request(
             method=request.method,
             url=target_url,
             headers=headers,
             content=body,
         )
+        response = await client.send(upstream_request, stream=True)
 
         # 응답 헤더에서 불필요한 것들 제거
         excluded_headers = {
@@ -88,9 +91,21 @@ async def proxy_request(
             key: value for key, value in response.headers.items() if key.lower() not in excluded_headers
         }
 
+        # 길이를 모르는 응답(내보내기 등 스트리밍 응답)은 받은 청크를 그대로 전달 (본문 전체를 메모리에 올리지 않음)
+        if "content-length" not in response.headers:
+            return StreamingResponse(
+                response.aiter_bytes(),
+                status_code=response.status_code,
+                headers=response_headers,
+                media_type=response.headers.get("content-type"),
+                background=BackgroundTask(response.aclose),
+            )
+
         # 응답 반환
+        content = await response.aread()
+        await response.aclose()
         return Response(
-            content=response.content,
+            content=content,
             status_code=response.status_code,
             headers=response_headers,
             media_type=response.headers.get("content-type"),
@@ -2,15 +2,24 @@
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 from app.apis.v1.appointment_router import router as appointment_router
 from app.apis.v1.doctor_router import router as doctor_router
 from app.core import settings
+from app.core.database import STATEMENT_COUNT_HEADER, count_statements
 from app.core.exceptions import MediSolveAiException
+from app.services.appointment_hold_sweeper import appointment_hold_sweeper
+from app.services.availability_cache import availability_cache
+from app.services.booking_locks import booking_lock_metrics
+from app.services.cache_version_publisher import cache_version_publisher
+from app.services.idempotency import idempotency_store
+from app.services.patient_cache import patient_cache
+from app.services.reference_data_cache import doctor_cache, treatment_cache
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -32,6 +41,19 @@ async def medi_solve_ai_exception_handler(request: Request, exc: MediSolveAiExce
     )
 
 
+# 요청별 SQL 실행 횟수를 응답 헤더로 노출 (DB 왕복 횟수 확인용, 로컬/테스트 환경에서만 등록)
+async def statement_count_middleware(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+    """요청 처리 중 실행된 SQL 문 수를 X-DB-Statement-Count 헤더에 기록"""
+    with count_statements() as counter:
+        response = await call_next(request)
+    response.headers[STATEMENT_COUNT_HEADER] = str(counter.count)
+    return response
+
+
+if settings.is_local or settings.is_test:
+    app.middleware("http")(statement_count_middleware)
+
+
 # 라우터 등록
 app.include_router(doctor_router, prefix="/api/v1/patient")
 app.include_router(appointment_router, prefix="/api/v1/patient/appointments")
@@ -52,3 +74,18 @@ async def root() -> dict[str, Any]:
 async def health_check() -> dict[str, str]:
     """헬스체크 엔드포인트"""
     return {"status": "healthy", "service": "patient_api", "environment": settings.environment.value}
+
+
+@app.get("/metrics")
+async def metrics() -> dict[str, Any]:
+    """인메모리 캐시 지표 엔드포인트"""
+    return {
+        "availability_cache": availability_cache.get_stats(),
+        "doctor_cache": doctor_cache.get_stats(),
+        "treatment_cache": treatment_cache.get_stats(),
+        "patient_cache": patient_cache.get_stats(),
+        "booking_locks": booking_lock_metrics.get_stats(),
+        "idempotency": idempotency_store.get_stats(),
+        "appointment_holds": appointment_hold_sweeper.get_stats(),
+        "cache_versions": cache_version_publisher.get_stats(),
+    }
@@ -8,19 +8,35 @@ from __future__ import annotations
 
 from datetime import date
 
-from fastapi import APIRouter, Path, Query, status
+from fastapi import APIRouter, Header, Path, Query, status
+from fastapi.responses import JSONResponse
 
+from app.core.constants import AppointmentHistoryMode, IdempotencyScopes
 from app.dtos.appointment import (
+    AppointmentHistoryResponse,
+    AppointmentHoldResponse,
     AppointmentResponse,
+    AvailableCalendarResponse,
     AvailableTimeResponse,
+    BatchCreateAppointmentRequest,
+    BatchCreateAppointmentResponse,
+    ConfirmAppointmentHoldRequest,
+    CreateAppointmentHoldRequest,
     CreateAppointmentRequest,
 )
 from app.services.appointment_service import (
     service_cancel_appointment,
+    service_confirm_appointment_hold,
     service_create_appointment,
+    service_create_appointment_hold,
+    service_create_appointments_batch,
+    service_get_appointment_history,
     service_get_appointments,
+    service_get_available_calendar,
     service_get_available_times,
+    service_release_appointment_hold,
 )
+from app.services.idempotency import IDEMPOTENCY_KEY_HEADER, idempotency_store
 
 router = APIRouter(tags=["appointments"])
 
@@ -43,6 +59,25 @@ async def api_get_available_times(
     )
 
 
+@router.get(
+    "/available-times/calendar",
+    response_model=AvailableCalendarResponse,
+    status_code=status.HTTP_200_OK,
+    summary="예약 가능 시간 캘린더 조회",
+    description="기간(최대 31일) 동안 여러 의사의 예약 가능한 시간대를 한 번에 조회합니다.",
+)
+async def api_get_available_calendar(
+    treatment_id: int = Query(..., description="진료 항목 ID"),
+    date_from: date = Query(..., description="조회 시작 날짜 (YYYY-MM-DD)"),
+    date_to: date = Query(..., description="조회 종료 날짜 (YYYY-MM-DD, 포함)"),
+    doctor_ids: list[int] | None = Query(None, description="의사 ID 목록 (미지정 시 활성 의사 전체)"),
+) -> AvailableCalendarResponse:
+    """예약 가능 시간 캘린더 조회 API"""
+    return await service_get_available_calendar(
+        treatment_id=treatment_id, date_from=date_from, date_to=date_to, doctor_ids=doctor_ids
+    )
+
+
 @router.get(
     "",
     response_model=list[AppointmentResponse],
@@ -57,16 +92,110 @@ async def api_get_appointments(
     return await service_get_appointments(patient_phone=patient_phone)
 
 
+@router.get(
+    "/history",
+    response_model=AppointmentHistoryResponse,
+    status_code=status.HTTP_200_OK,
+    summary="예약 이력 조회",
+    description="환자 본인의 다가오는/지난 예약을 커서 기반으로 페이지 단위 조회합니다. 다음 페이지는 next_cursor를 cursor로 전달합니다.",
+)
+async def api_get_appointment_history(
+    patient_phone: str = Query(..., description="환자 전화번호"),
+    mode: AppointmentHistoryMode = Query(
+        AppointmentHistoryMode.UPCOMING, description="조회 구분 (upcoming: 다가오는 예약, past: 지난 예약)"
+    ),
+    cursor: str | None = Query(None, min_length=1, description="이전 응답의 next_cursor (첫 페이지는 생략)"),
+    page_size: int = Query(10, ge=1, le=100, description="페이지당 항목 수"),
+) -> AppointmentHistoryResponse:
+    """예약 이력 조회 API"""
+    return await service_get_appointment_history(
+        patient_phone=patient_phone, mode=mode, cursor=cursor, page_size=page_size
+    )
+
+
 @router.post(
     "",
     response_model=AppointmentResponse,
     status_code=status.HTTP_201_CREATED,
     summary="예약 생성",
-    description="새로운 예약을 생성합니다.",
+    description="새로운 예약을 생성합니다. Idempotency-Key 헤더를 보내면 같은 키의 재시도에 첫 응답을 그대로 반환합니다.",
 )
-async def api_create_appointment(request: CreateAppointmentRequest) -> AppointmentResponse:
+async def api_create_appointment(
+    request: CreateAppointmentRequest,
+    idempotency_key: str | None = Header(
+        None, alias=IDEMPOTENCY_KEY_HEADER, min_length=1, max_length=255, description="재시도 구분용 멱등성 키"
+    ),
+) -> AppointmentResponse | JSONResponse:
     """예약 생성 API"""
-    return await service_create_appointment(request=request)
+    return await idempotency_store.run(
+        scope=IdempotencyScopes.CREATE_APPOINTMENT,
+        idempotency_key=idempotency_key,
+        payload=request.model_dump(mode="json"),
+        status_code=status.HTTP_201_CREATED,
+        operation=lambda: service_create_appointment(request=request),
+    )
+
+
+@router.post(
+    ":batch",
+    response_model=BatchCreateAppointmentResponse,
+    status_code=status.HTTP_200_OK,
+    summary="예약 일괄 생성",
+    description="여러 예약(최대 500건)을 한 번에 생성하고 항목별 성공/실패 결과를 반환합니다.",
+)
+async def api_create_appointments_batch(request: BatchCreateAppointmentRequest) -> BatchCreateAppointmentResponse:
+    """예약 일괄 생성 API"""
+    return await service_create_appointments_batch(request=request)
+
+
+@router.post(
+    "/holds",
+    response_model=AppointmentHoldResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="예약 선점",
+    description="예약 시간대를 몇 분간 선점합니다. 선점된 시간대는 다른 환자의 예약 가능 시간에서 제외됩니다.",
+)
+async def api_create_appointment_hold(request: CreateAppointmentHoldRequest) -> AppointmentHoldResponse:
+    """예약 선점 API"""
+    return await service_create_appointment_hold(request=request)
+
+
+@router.post(
+    "/holds/{hold_id}/confirm",
+    response_model=AppointmentResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="예약 선점 확정",
+    description="만료되지 않은 선점을 예약으로 확정합니다. Idempotency-Key 헤더를 보내면 같은 키의 재시도에 첫 응답을 그대로 반환합니다.",
+)
+async def api_confirm_appointment_hold(
+    request: ConfirmAppointmentHoldRequest,
+    hold_id: int = Path(..., description="선점 ID"),
+    idempotency_key: str | None = Header(
+        None, alias=IDEMPOTENCY_KEY_HEADER, min_length=1, max_length=255, description="재시도 구분용 멱등성 키"
+    ),
+) -> AppointmentResponse | JSONResponse:
+    """예약 선점 확정 API"""
+    return await idempotency_store.run(
+        scope=IdempotencyScopes.CONFIRM_APPOINTMENT_HOLD,
+        idempotency_key=idempotency_key,
+        payload={"hold_id": hold_id, **request.model_dump(mode="json")},
+        status_code=status.HTTP_201_CREATED,
+        operation=lambda: service_confirm_appointment_hold(hold_id=hold_id, request=request),
+    )
+
+
+@router.delete(
+    "/holds/{hold_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="예약 선점 해제",
+    description="확정하지 않을 선점을 만료 전에 해제합니다.",
+)
+async def api_release_appointment_hold(
+    hold_id: int = Path(..., description="선점 ID"),
+    patient_phone: str = Query(..., description="환자 전화번호"),
+) -> None:
+    """예약 선점 해제 API"""
+    await service_release_appointment_hold(hold_id=hold_id, patient_phone=patient_phone)
 
 
 @router.patch(
@@ -74,11 +203,20 @@ async def api_create_appointment(request: CreateAppointmentRequest) -> Appointme
     response_model=AppointmentResponse,
     status_code=status.HTTP_200_OK,
     summary="예약 취소",
-    description="예약을 취소 상태로 변경합니다.",
+    description="예약을 취소 상태로 변경합니다. Idempotency-Key 헤더를 보내면 같은 키의 재시도에 첫 응답을 그대로 반환합니다.",
 )
 async def api_cancel_appointment(
     appointment_id: int = Path(..., description="예약 ID"),
     patient_phone: str = Query(..., description="환자 전화번호"),
-) -> AppointmentResponse:
+    idempotency_key: str | None = Header(
+        None, alias=IDEMPOTENCY_KEY_HEADER, min_length=1, max_length=255, description="재시도 구분용 멱등성 키"
+    ),
+) -> AppointmentResponse | JSONResponse:
     """예약 취소 API"""
-    return await service_cancel_appointment(appointment_id=appointment_id, patient_phone=patient_phone)
+    return await idempotency_store.run(
+        scope=IdempotencyScopes.CANCEL_APPOINTMENT,
+        idempotency_key=idempotency_key,
+        payload={"appointment_id": appointment_id, "patient_phone": patient_phone},
+        status_code=status.HTTP_200_OK,
+        operation=lambda: service_cancel_appointment(appointment_id=appointment_id, patient_phone=patient_phone),
+    )
@@ -14,6 +14,7 @@ from .database import (
     BaseModel,
     TimestampMixin,
     get_async_session,
+    get_pinned_async_session,
 )
 from .exceptions import MediSolveAiException
 
@@ -25,6 +26,7 @@ __all__ = [
     "BaseModel",
     "TimestampMixin",
     "get_async_session",
+    "get_pinned_async_session",
     # 상수
     "AppointmentStatus",
     "VisitType",
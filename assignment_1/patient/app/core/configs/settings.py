@@ -6,6 +6,8 @@ from enum import StrEnum
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from app.core.constants.booking_engine import BookingEngine
+
 
 class Env(StrEnum):
     LOCAL = "local"
@@ -75,6 +77,57 @@ class Settings(BaseSettings):
     max_advance_booking_days: int = Field(default=30, description="최대 예약 가능 일수")
     min_advance_booking_hours: int = Field(default=2, description="최소 예약 시간 (시간)")
 
+    # 예약 선점 (확정 전까지 시간대를 확보하는 시간, 만료된 선점은 정리 주기마다 일부 삭제)
+    appointment_hold_seconds: int = Field(default=300, description="예약 선점 유지 시간 (초)")
+    appointment_hold_purge_interval_seconds: float = Field(default=60.0, description="만료된 예약 선점 정리 주기 (초)")
+    appointment_hold_purge_batch_size: int = Field(default=1000, description="만료된 예약 선점 1회 정리 건수")
+
+    # ============================================================================
+    # 캐시 설정
+    # ============================================================================
+
+    # 다른 서비스(Admin)의 변경 사항을 감지하기 위해 cache_versions 테이블을 다시 읽는 주기
+    cache_version_sync_seconds: float = Field(default=1.0, description="캐시 버전 동기화 주기 (초)")
+
+    # 지난 날짜의 예약 현황 버전 정리 (날짜마다 한 행씩 늘어나므로 보관 기간이 지난 행은 정리 주기마다 일부 삭제)
+    cache_version_retention_days: int = Field(default=7, description="날짜별 예약 현황 버전 보관 기간 (일)")
+    cache_version_purge_interval_seconds: float = Field(
+        default=3600.0, description="지난 예약 현황 버전 정리 주기 (초)"
+    )
+    cache_version_purge_batch_size: int = Field(default=1000, description="지난 예약 현황 버전 1회 정리 건수")
+
+    # 예약 가능 시간 계산 결과 캐시 (LRU, 항목 수 상한)
+    availability_cache_max_entries: int = Field(default=10000, description="예약 가능 시간 캐시 최대 항목 수")
+
+    # 전화번호별 환자 정보 캐시 (LRU, 항목 수 상한)
+    patient_cache_max_entries: int = Field(default=50000, description="환자 정보 캐시 최대 항목 수")
+
+    # ============================================================================
+    # 멱등성 키 설정
+    # ============================================================================
+
+    # Idempotency-Key 헤더로 재시도된 요청에 첫 응답을 반환하는 기간
+    idempotency_ttl_seconds: int = Field(default=86400, description="멱등성 키 응답 보관 기간 (초)")
+    # 처리 중인 요청의 키 점유 시간 (프로세스가 중단되어 응답이 저장되지 않아도 이후 재시도 가능)
+    idempotency_lease_seconds: int = Field(default=60, description="멱등성 키 처리 중 점유 시간 (초)")
+    # 만료된 키 정리 주기 (한 번에 최대 idempotency_purge_batch_size건 삭제)
+    idempotency_purge_interval_seconds: float = Field(default=60.0, description="만료된 멱등성 키 정리 주기 (초)")
+    idempotency_purge_batch_size: int = Field(default=1000, description="만료된 멱등성 키 1회 정리 건수")
+
+    # ============================================================================
+    # 예약 잠금 설정
+    # ============================================================================
+
+    # 의사 중복 예약 판단 방식 (validator: 잠금 후 조회, slot_ticks: 점유 구간 유니크 키)
+    booking_engine: BookingEngine = Field(default=BookingEngine.VALIDATOR, description="예약 생성 방식")
+
+    # (의사, 날짜) / (날짜, 30분 단위) 네임드 락 대기 시간
+    booking_lock_timeout_seconds: int = Field(default=5, description="예약 잠금 최대 대기 시간 (초)")
+
+    # 데드락/잠금 대기 시간 초과 시 트랜잭션 재시도 (지수 백오프)
+    booking_retry_max_attempts: int = Field(default=3, description="예약 생성 최대 시도 횟수")
+    booking_retry_backoff_seconds: float = Field(default=0.05, description="예약 생성 재시도 기본 대기 시간 (초)")
+
     # ============================================================================
     # 계산된 속성들
     # ============================================================================
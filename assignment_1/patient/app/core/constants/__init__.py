@@ -1,19 +1,29 @@
 """상수 모듈"""
 
+from .appointment_history_mode import AppointmentHistoryMode
 from .appointment_status import AppointmentStatus
+from .booking_engine import BookingEngine
+from .cache_names import CacheNames
 from .day_of_week import DayOfWeek
 from .department import Department
 from .error_messages import ErrorMessages
 from .hospital_operation_constants import HospitalOperationConstants
+from .idempotency_scopes import IdempotencyScopes
+from .lock_names import LockNames
 from .time_constants import TimeConstants
 from .visit_type import VisitType
 
 __all__ = [
+    "AppointmentHistoryMode",
     "AppointmentStatus",
+    "BookingEngine",
+    "CacheNames",
     "Department",
     "VisitType",
     "TimeConstants",
     "DayOfWeek",
     "HospitalOperationConstants",
+    "IdempotencyScopes",
+    "LockNames",
     "ErrorMessages",
 ]
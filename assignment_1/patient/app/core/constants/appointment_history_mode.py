@@ -0,0 +1,12 @@
+"""예약 이력 조회 구분 상수"""
+
+from __future__ import annotations
+
+from enum import StrEnum
+
+
+class AppointmentHistoryMode(StrEnum):
+    """예약 이력 조회 구분 (조회 시점 기준)"""
+
+    UPCOMING = "upcoming"  # 다가오는 예약 (예약 일시 오름차순)
+    PAST = "past"  # 지난 예약 (예약 일시 내림차순)
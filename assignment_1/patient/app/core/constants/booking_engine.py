@@ -0,0 +1,12 @@
+"""예약 생성 방식 상수"""
+
+from __future__ import annotations
+
+from enum import StrEnum
+
+
+class BookingEngine(StrEnum):
+    """예약 생성 시 의사 중복 예약을 판단하는 방식"""
+
+    VALIDATOR = "validator"  # (의사, 날짜) 잠금 후 기존 예약 조회로 판단
+    SLOT_TICKS = "slot_ticks"  # 사전 조회/의사 잠금 없이 점유 구간 유니크 키 위반으로 판단
@@ -0,0 +1,22 @@
+"""캐시 이름 상수"""
+
+from __future__ import annotations
+
+from datetime import date
+
+
+class CacheNames:
+    """cache_versions 테이블에서 사용하는 캐시 이름 (Admin App과 동일하게 유지)"""
+
+    HOSPITAL_SLOTS = "hospital_slots"  # 병원 시간대별 수용 인원
+    DOCTORS = "doctors"  # 의사 정보
+    TREATMENTS = "treatments"  # 진료 항목 정보 (소요 시간 포함)
+    APPOINTMENTS_PURGED = (
+        "appointments_purged"  # 지난 날짜의 예약 현황 버전 정리 (삭제 후 1부터 다시 시작하는 버전과 구분)
+    )
+    APPOINTMENTS_PREFIX = "appointments:"  # 날짜별 예약 현황 캐시 이름 접두사
+
+    @staticmethod
+    def appointments(appointment_date: date) -> str:
+        """날짜별 예약 현황 캐시 이름 (예: appointments:2024-12-02)"""
+        return f"{CacheNames.APPOINTMENTS_PREFIX}{appointment_date.isoformat()}"
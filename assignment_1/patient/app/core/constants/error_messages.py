@@ -15,6 +15,17 @@ class ErrorMessages:
     APPOINTMENT_TOO_LATE = "예약은 최대 30일 전까지만 가능합니다."
     APPOINTMENT_ALREADY_CANCELLED = "이미 취소된 예약입니다."
     APPOINTMENT_NOT_OWNED = "본인의 예약만 취소할 수 있습니다."
+    APPOINTMENT_LOCK_TIMEOUT = "예약 요청이 많아 처리하지 못했습니다. 잠시 후 다시 시도해주세요."
+    AVAILABLE_CALENDAR_RANGE_INVALID = "조회 기간이 올바르지 않습니다. (최대 31일)"
+    APPOINTMENT_HISTORY_CURSOR_INVALID = "유효하지 않은 예약 이력 커서입니다."
+
+    # 예약 선점 관련
+    APPOINTMENT_HOLD_NOT_FOUND = "예약 선점 정보를 찾을 수 없습니다."
+    APPOINTMENT_HOLD_EXPIRED = "예약 선점 시간이 만료되었습니다. 예약 가능 시간을 다시 확인해주세요."
+
+    # 멱등성 키 관련
+    IDEMPOTENCY_KEY_REUSED = "같은 Idempotency-Key로 다른 요청을 보낼 수 없습니다."
+    IDEMPOTENCY_REQUEST_IN_PROGRESS = "같은 Idempotency-Key의 요청이 처리 중입니다. 잠시 후 다시 시도해주세요."
 
     # 환자 관련
     PATIENT_NOT_FOUND = "환자를 찾을 수 없습니다."
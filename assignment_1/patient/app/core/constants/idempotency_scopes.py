@@ -0,0 +1,11 @@
+"""멱등성 키 범위 상수"""
+
+from __future__ import annotations
+
+
+class IdempotencyScopes:
+    """idempotency_keys 테이블의 요청 종류 (같은 키라도 요청 종류가 다르면 별개로 처리)"""
+
+    CREATE_APPOINTMENT = "appointments:create"  # 예약 생성
+    CANCEL_APPOINTMENT = "appointments:cancel"  # 예약 취소
+    CONFIRM_APPOINTMENT_HOLD = "appointments:confirm-hold"  # 예약 선점 확정
@@ -0,0 +1,19 @@
+"""네임드 락 이름 상수"""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+
+
+class LockNames:
+    """예약 생성 시 사용하는 MySQL 네임드 락(GET_LOCK) 이름 (최대 64자)"""
+
+    @staticmethod
+    def doctor_day(doctor_id: int, appointment_date: date) -> str:
+        """의사별 하루 예약 잠금 (예: booking:doctor:1:2024-12-02)"""
+        return f"booking:doctor:{doctor_id}:{appointment_date.isoformat()}"
+
+    @staticmethod
+    def capacity_unit(unit_start: datetime) -> str:
+        """병원 수용 인원 30분 단위 잠금 (예: booking:unit:2024-12-02T10:30)"""
+        return f"booking:unit:{unit_start:%Y-%m-%dT%H:%M}"
@@ -15,3 +15,6 @@ class TimeConstants(int, Enum):
     # 예약 제한
     MAX_ADVANCE_BOOKING_DAYS = 30  # 최대 예약 가능 일수
     MIN_ADVANCE_BOOKING_HOURS = 2  # 최소 예약 시간 (시간)
+
+    # 조회 제한
+    MAX_CALENDAR_RANGE_DAYS = 31  # 예약 가능 시간 캘린더 최대 조회 일수
@@ -2,14 +2,20 @@
 
 from .connection_async import (
     get_async_session,
+    get_pinned_async_session,
 )
 from .orm import Base, BaseModel, TimestampMixin
+from .statement_counter import STATEMENT_COUNT_HEADER, count_statements
 
 __all__ = [
     # 연결 관리
     "get_async_session",
+    "get_pinned_async_session",
     # ORM 기본 클래스
     "Base",
     "BaseModel",
     "TimestampMixin",
+    # SQL 실행 횟수 측정
+    "STATEMENT_COUNT_HEADER",
+    "count_statements",
 ]
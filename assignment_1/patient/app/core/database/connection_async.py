@@ -1,14 +1,21 @@
 """비동기 데이터베이스 연결 관리"""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from ..configs.settings import settings
+from .statement_counter import install_statement_counter
 
 # 비동기 엔진 생성
 _async_engine = create_async_engine(
     settings.database_url,
     echo=settings.is_local,
 )
+# SQL 실행 횟수 측정은 로컬/테스트 환경에서만 (운영 요청마다 실행되는 리스너 제외)
+if settings.is_local or settings.is_test:
+    install_statement_counter(_async_engine.sync_engine)
 
 # 세션 팩토리 생성
 _AsyncSessionFactory = async_sessionmaker(
@@ -22,3 +29,16 @@ _AsyncSessionFactory = async_sessionmaker(
 def get_async_session() -> AsyncSession:
     """비동기 세션 생성"""
     return _AsyncSessionFactory()
+
+
+@asynccontextmanager
+async def get_pinned_async_session() -> AsyncIterator[AsyncSession]:
+    """
+    커넥션을 고정한 비동기 세션 생성
+
+    기본 세션은 커밋/롤백마다 커넥션을 풀에 반환하므로, 네임드 락처럼 커넥션에 묶인 상태를
+    여러 트랜잭션에 걸쳐 유지할 때 사용 (블록 종료 시 커넥션 반환)
+    """
+    async with _async_engine.connect() as connection:
+        async with _AsyncSessionFactory(bind=connection) as session:
+            yield session
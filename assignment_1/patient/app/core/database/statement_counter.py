@@ -0,0 +1,53 @@
+"""
+요청 단위 SQL 실행 횟수 측정
+
+요청(또는 임의 구간) 동안 DB로 전송된 SQL 문 수를 세어 왕복 횟수를 확인
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+STATEMENT_COUNT_HEADER = "X-DB-Statement-Count"
+
+
+class StatementCounter:
+    """구간 내 실행된 SQL 문 수"""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+
+_current_counter: ContextVar[StatementCounter | None] = ContextVar("statement_counter", default=None)
+
+
+@contextmanager
+def count_statements() -> Iterator[StatementCounter]:
+    """
+    구간 내 SQL 실행 횟수 측정
+
+    같은 컨텍스트(요청 처리 태스크)에서 실행된 SQL 문만 셈
+    """
+    counter = StatementCounter()
+    token = _current_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _current_counter.reset(token)
+
+
+def install_statement_counter(engine: Engine) -> None:
+    """엔진에 SQL 실행 횟수 측정 리스너 등록"""
+    event.listen(engine, "before_cursor_execute", _on_before_cursor_execute)
+
+
+def _on_before_cursor_execute(*args: Any) -> None:
+    counter = _current_counter.get()
+    if counter is not None:
+        counter.count += 1
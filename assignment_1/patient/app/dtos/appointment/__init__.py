@@ -2,14 +2,32 @@
 Appointment DTOs
 """
 
+from .appointment_history_response import AppointmentHistoryResponse
+from .appointment_hold_response import AppointmentHoldResponse
 from .appointment_response import AppointmentResponse
 from .appointment_with_treatment_data import AppointmentWithTreatmentData
+from .available_calendar_response import AvailableCalendarResponse
 from .available_time_response import AvailableTimeResponse
+from .batch_create_appointment_request import MAX_BATCH_APPOINTMENTS, BatchCreateAppointmentRequest
+from .batch_create_appointment_response import BatchAppointmentResult, BatchCreateAppointmentResponse
+from .confirm_appointment_hold_request import ConfirmAppointmentHoldRequest
+from .create_appointment_hold_request import CreateAppointmentHoldRequest
 from .create_appointment_request import CreateAppointmentRequest
+from .patient_appointment_data import PatientAppointmentData
 
 __all__ = [
     "CreateAppointmentRequest",
     "AppointmentResponse",
+    "AppointmentHistoryResponse",
     "AppointmentWithTreatmentData",
+    "PatientAppointmentData",
     "AvailableTimeResponse",
+    "AvailableCalendarResponse",
+    "BatchCreateAppointmentRequest",
+    "BatchAppointmentResult",
+    "BatchCreateAppointmentResponse",
+    "MAX_BATCH_APPOINTMENTS",
+    "CreateAppointmentHoldRequest",
+    "ConfirmAppointmentHoldRequest",
+    "AppointmentHoldResponse",
 ]
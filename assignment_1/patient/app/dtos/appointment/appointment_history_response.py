@@ -0,0 +1,22 @@
+"""
+예약 이력 응답 DTO
+"""
+
+from __future__ import annotations
+
+from pydantic import BaseModel, Field
+
+from app.dtos.appointment.appointment_response import AppointmentResponse
+from app.dtos.frozen_config import FROZEN_CONFIG
+
+
+class AppointmentHistoryResponse(BaseModel):
+    """예약 이력 응답 DTO (커서 기반 페이지)"""
+
+    model_config = FROZEN_CONFIG
+
+    mode: str = Field(..., description="조회 구분 (upcoming: 다가오는 예약, past: 지난 예약)")
+    items: list[AppointmentResponse] = Field(
+        ..., description="예약 리스트 (upcoming은 예약 일시 오름차순, past는 내림차순)"
+    )
+    next_cursor: str | None = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
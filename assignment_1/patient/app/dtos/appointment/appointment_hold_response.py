@@ -0,0 +1,25 @@
+"""
+예약 선점 응답 DTO
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+from app.dtos.frozen_config import FROZEN_CONFIG
+
+
+class AppointmentHoldResponse(BaseModel):
+    """예약 선점 응답 DTO"""
+
+    model_config = FROZEN_CONFIG
+
+    id: int = Field(..., description="선점 ID")
+    patient_phone: str = Field(..., description="환자 연락처")
+    doctor_id: int = Field(..., description="의사 ID")
+    treatment_id: int = Field(..., description="진료 항목 ID")
+    appointment_datetime: datetime = Field(..., description="예약 시작 일시")
+    duration_minutes: int = Field(..., description="진료 소요 시간 (분)")
+    expires_at: datetime = Field(..., description="선점 만료 일시 (이후에는 확정 불가)")
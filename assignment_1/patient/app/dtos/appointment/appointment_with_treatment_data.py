@@ -10,11 +10,12 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppointmentWithTreatmentData:
-    """예약과 진료 항목 데이터"""
+    """예약과 진료 항목 데이터 (선점은 appointment_id가 0이고 hold_expires_at이 있음)"""
 
     appointment_id: int
     doctor_id: int
     appointment_datetime: datetime
     treatment_duration_minutes: int
+    hold_expires_at: datetime | None = None
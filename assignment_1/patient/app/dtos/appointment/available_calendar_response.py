@@ -0,0 +1,23 @@
+"""
+예약 가능 시간 캘린더 응답 DTO
+"""
+
+from __future__ import annotations
+
+from pydantic import BaseModel, Field
+
+from app.dtos.appointment.available_time_response import AvailableTimeResponse
+from app.dtos.frozen_config import FROZEN_CONFIG
+
+
+class AvailableCalendarResponse(BaseModel):
+    """예약 가능 시간 캘린더 응답 DTO"""
+
+    model_config = FROZEN_CONFIG
+
+    treatment_id: int = Field(..., description="진료 항목 ID")
+    date_from: str = Field(..., description="조회 시작 날짜 (YYYY-MM-DD)")
+    date_to: str = Field(..., description="조회 종료 날짜 (YYYY-MM-DD, 포함)")
+    available_times: list[AvailableTimeResponse] = Field(
+        ..., description="날짜·의사별 예약 가능 시간 리스트 (날짜순, 같은 날짜 내에서는 의사 순)"
+    )
@@ -0,0 +1,23 @@
+"""
+예약 일괄 생성 요청 DTO
+"""
+
+from __future__ import annotations
+
+from pydantic import BaseModel, Field
+
+from app.dtos.appointment.create_appointment_request import CreateAppointmentRequest
+from app.dtos.frozen_config import FROZEN_CONFIG
+
+# 한 번에 생성할 수 있는 최대 예약 수
+MAX_BATCH_APPOINTMENTS = 500
+
+
+class BatchCreateAppointmentRequest(BaseModel):
+    """예약 일괄 생성 요청 DTO"""
+
+    model_config = FROZEN_CONFIG
+
+    items: list[CreateAppointmentRequest] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_APPOINTMENTS, description="생성할 예약 목록 (최대 500건)"
+    )
@@ -0,0 +1,32 @@
+"""
+예약 일괄 생성 응답 DTO
+"""
+
+from __future__ import annotations
+
+from pydantic import BaseModel, Field
+
+from app.dtos.appointment.appointment_response import AppointmentResponse
+from app.dtos.frozen_config import FROZEN_CONFIG
+
+
+class BatchAppointmentResult(BaseModel):
+    """예약 일괄 생성 항목별 결과 DTO"""
+
+    model_config = FROZEN_CONFIG
+
+    index: int = Field(..., description="요청 목록에서의 순서 (0부터)")
+    success: bool = Field(..., description="생성 성공 여부")
+    appointment: AppointmentResponse | None = Field(None, description="생성된 예약 (성공 시)")
+    error: str | None = Field(None, description="실패 사유 (실패 시)")
+
+
+class BatchCreateAppointmentResponse(BaseModel):
+    """예약 일괄 생성 응답 DTO"""
+
+    model_config = FROZEN_CONFIG
+
+    total_count: int = Field(..., description="요청 건수")
+    success_count: int = Field(..., description="생성 성공 건수")
+    failure_count: int = Field(..., description="생성 실패 건수")
+    results: list[BatchAppointmentResult] = Field(..., description="항목별 결과 (요청 순서)")
@@ -0,0 +1,19 @@
+"""
+예약 선점 확정 요청 DTO
+"""
+
+from __future__ import annotations
+
+from pydantic import BaseModel, Field
+
+from app.dtos.frozen_config import FROZEN_CONFIG
+
+
+class ConfirmAppointmentHoldRequest(BaseModel):
+    """예약 선점 확정 요청 DTO"""
+
+    model_config = FROZEN_CONFIG
+
+    patient_name: str = Field(..., description="환자 이름")
+    patient_phone: str = Field(..., description="환자 연락처 (선점 시와 같아야 함)")
+    memo: str | None = Field(None, description="예약 메모")
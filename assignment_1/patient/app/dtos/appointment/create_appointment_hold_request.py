@@ -0,0 +1,22 @@
+"""
+예약 선점 요청 DTO
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+from app.dtos.frozen_config import FROZEN_CONFIG
+
+
+class CreateAppointmentHoldRequest(BaseModel):
+    """예약 선점 요청 DTO"""
+
+    model_config = FROZEN_CONFIG
+
+    patient_phone: str = Field(..., description="환자 연락처 (확정/해제 시 본인 확인)")
+    doctor_id: int = Field(..., description="의사 ID")
+    treatment_id: int = Field(..., description="진료 항목 ID")
+    appointment_datetime: datetime = Field(..., description="예약 시작 일시")
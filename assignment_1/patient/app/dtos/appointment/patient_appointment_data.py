@@ -0,0 +1,28 @@
+"""
+Patient Appointment Data
+
+환자 예약 목록 조회용 데이터 타입 (필요한 컬럼만 조회한 결과)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from app.core.constants.appointment_status import AppointmentStatus
+from app.core.constants.visit_type import VisitType
+
+
+@dataclass(frozen=True, slots=True)
+class PatientAppointmentData:
+    """환자 예약 목록 데이터 (의사/진료 항목 이름 포함, 환자 정보는 호출 측에서 이미 가지고 있음)"""
+
+    id: int
+    appointment_datetime: datetime
+    status: AppointmentStatus
+    visit_type: VisitType
+    memo: str | None
+    doctor_id: int
+    doctor_name: str
+    treatment_id: int
+    treatment_name: str
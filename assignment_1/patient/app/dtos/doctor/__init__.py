@@ -2,8 +2,10 @@
 Doctor DTOs
 """
 
+from .doctor_data import DoctorData
 from .doctors_response import DoctorResponse
 
 __all__ = [
     "DoctorResponse",
+    "DoctorData",
 ]
@@ -0,0 +1,19 @@
+"""
+Doctor Data
+
+예약 검증에 필요한 의사 정보만 담는 데이터 타입 (캐시 저장용)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class DoctorData:
+    """의사 기본 정보"""
+
+    id: int
+    name: str
+    department: str
+    is_active: bool
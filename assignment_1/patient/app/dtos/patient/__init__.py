@@ -0,0 +1,9 @@
+"""
+Patient DTOs
+"""
+
+from .patient_data import PatientData
+
+__all__ = [
+    "PatientData",
+]
@@ -0,0 +1,19 @@
+"""
+Patient Data
+
+예약 생성에 필요한 환자 정보만 담는 데이터 타입 (캐시 저장용)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PatientData:
+    """환자 기본 정보 + 완료된 진료 존재 여부 (초진/재진 판단용)"""
+
+    id: int
+    name: str
+    phone: str
+    has_completed_visit: bool
@@ -2,8 +2,10 @@
 Treatment DTOs
 """
 
+from .treatment_data import TreatmentData
 from .treatments_response import TreatmentResponse
 
 __all__ = [
     "TreatmentResponse",
+    "TreatmentData",
 ]
@@ -0,0 +1,19 @@
+"""
+Treatment Data
+
+예약 검증에 필요한 진료 항목 정보만 담는 데이터 타입 (캐시 저장용)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class TreatmentData:
+    """진료 항목 기본 정보"""
+
+    id: int
+    name: str
+    duration_minutes: int
+    is_active: bool
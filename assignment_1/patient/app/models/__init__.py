@@ -5,15 +5,23 @@ Patient App Models
 """
 
 from .appointment import Appointment
+from .appointment_hold import AppointmentHold
+from .appointment_slot_tick import AppointmentSlotTick
+from .cache_version import CacheVersion
 from .doctor import Doctor
 from .hospital_slot import HospitalSlot
+from .idempotency_key import IdempotencyKey
 from .patient import Patient
 from .treatment import Treatment
 
 __all__ = [
     "Appointment",
+    "AppointmentHold",
+    "AppointmentSlotTick",
+    "CacheVersion",
     "Doctor",
     "HospitalSlot",
+    "IdempotencyKey",
     "Patient",
     "Treatment",
 ]
@@ -6,10 +6,26 @@ Patient App - Appointment 모델
 
 from __future__ import annotations
 
-from datetime import date, datetime
-from typing import TYPE_CHECKING
-
-from sqlalchemy import Date, DateTime, Enum, ForeignKey, Text, cast, select
+from datetime import date, datetime, time, timedelta
+from typing import TYPE_CHECKING, Any, cast
+
+from sqlalchemy import (
+    CursorResult,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Select,
+    Text,
+    and_,
+    exists,
+    func,
+    insert,
+    literal_column,
+    or_,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -18,7 +34,7 @@ from app.core.constants.visit_type import VisitType
 from app.core.database.orm import BaseModel, TimestampMixin
 
 if TYPE_CHECKING:
-    from app.dtos.appointment import AppointmentWithTreatmentData
+    from app.dtos.appointment import AppointmentWithTreatmentData, PatientAppointmentData
 
     from .doctor import Doctor
     from .patient import Patient
@@ -43,17 +59,10 @@ class Appointment(BaseModel, TimestampMixin):
     visit_type: Mapped[VisitType] = mapped_column(Enum(VisitType), nullable=False, comment="초진/재진")
     memo: Mapped[str | None] = mapped_column(Text, nullable=True, comment="예약 메모")
 
-    # 관계 설정
-    doctor: Mapped["Doctor"] = relationship("Doctor", back_populates="appointments", lazy="joined")
-    patient: Mapped["Patient"] = relationship("Patient", back_populates="appointments", lazy="joined")
-    treatment: Mapped["Treatment"] = relationship("Treatment", back_populates="appointments", lazy="joined")
-
-    @property
-    def appointment_end_datetime(self) -> datetime:
-        """예약 종료 시간 계산 (시작 시간 + 진료 소요 시간)"""
-        from datetime import timedelta
-
-        return self.appointment_datetime + timedelta(minutes=self.treatment.duration_minutes)
+    # 관계 설정 (기본은 로딩하지 않고 접근 시 에러, 관련 데이터가 필요한 조회에서만 로딩 옵션을 명시)
+    doctor: Mapped["Doctor"] = relationship("Doctor", back_populates="appointments", lazy="raise")
+    patient: Mapped["Patient"] = relationship("Patient", back_populates="appointments", lazy="raise")
+    treatment: Mapped["Treatment"] = relationship("Treatment", back_populates="appointments", lazy="raise")
 
     @property
     def is_completed(self) -> bool:
@@ -87,121 +96,265 @@ class Appointment(BaseModel, TimestampMixin):
             status=AppointmentStatus.PENDING,
         )
         session.add(appointment)
+        # 생성된 ID는 flush 시 채워지므로 다시 조회하지 않음 (관계가 필요하면 호출 측에서 조회)
         await session.flush()
-        await session.refresh(appointment)
         return appointment
 
     @classmethod
-    async def get_active_by_doctor_with_treatment(
+    async def create_many(cls, session: AsyncSession, rows: list[dict[str, Any]]) -> dict[tuple[int, datetime], int]:
+        """
+        예약 일괄 생성 (다중 행 INSERT 한 번 + 생성된 ID 조회 한 번)
+
+        rows는 검증을 마친 (의사, 시작 일시)가 서로 겹치지 않는 예약이어야 함
+
+        Returns:
+            (의사 ID, 예약 시작 일시) → 생성된 예약 ID
+        """
+        await session.execute(insert(cls).values([{**row, "status": AppointmentStatus.PENDING} for row in rows]))
+
+        # 취소되지 않은 예약은 의사별로 시작 일시가 겹치지 않으므로 (의사, 시작 일시)로 생성된 ID 조회
+        keys = [(row["doctor_id"], row["appointment_datetime"]) for row in rows]
+        query = select(cls.id, cls.doctor_id, cls.appointment_datetime).where(
+            tuple_(cls.doctor_id, cls.appointment_datetime).in_(keys),
+            cls.status != AppointmentStatus.CANCELLED,
+        )
+        result = await session.execute(query)
+        return {
+            (doctor_id, appointment_datetime): appointment_id
+            for appointment_id, doctor_id, appointment_datetime in result.all()
+        }
+
+    @classmethod
+    async def exists_overlapping_for_doctor(
         cls,
         session: AsyncSession,
         doctor_id: int,
+        start_datetime: datetime,
+        end_datetime: datetime,
+        max_duration_minutes: int,
+    ) -> bool:
+        """
+        의사의 취소되지 않은 예약 중 [start_datetime, end_datetime)와 겹치는 예약 존재 여부
+
+        겹치는 예약의 시작 시각은 (start_datetime - 최장 소요 시간, end_datetime) 범위에 있으므로
+        idx_appointments_doctor_datetime_status 인덱스의 해당 범위만 확인
+        """
+        from app.models.treatment import Treatment
+
+        existing_end_datetime = func.timestampadd(
+            literal_column("MINUTE"), Treatment.duration_minutes, cls.appointment_datetime
+        )
+        query = select(
+            exists().where(
+                cls.doctor_id == doctor_id,
+                cls.appointment_datetime > start_datetime - timedelta(minutes=max_duration_minutes),
+                cls.appointment_datetime < end_datetime,
+                cls.status != AppointmentStatus.CANCELLED,
+                cls.treatment_id == Treatment.id,
+                existing_end_datetime > start_datetime,
+            )
+        )
+        result = await session.execute(query)
+        return bool(result.scalar())
+
+    @classmethod
+    async def get_active_with_treatment(
+        cls,
+        session: AsyncSession,
         appointment_date: date | None = None,
     ) -> list[AppointmentWithTreatmentData]:
-        """의사의 취소되지 않은 예약과 진료 항목 조회"""
+        """취소되지 않은 예약과 진료 항목 조회 (필요한 컬럼만 조회, ORM 객체를 만들지 않음)"""
         from app.dtos.appointment import AppointmentWithTreatmentData
         from app.models.treatment import Treatment
 
         query = (
-            select(cls, Treatment)
+            select(cls.id, cls.doctor_id, cls.appointment_datetime, Treatment.duration_minutes)
             .join(Treatment, cls.treatment_id == Treatment.id)
-            .where(
-                cls.doctor_id == doctor_id,
-                cls.status != AppointmentStatus.CANCELLED,
-            )
+            .where(cls.status != AppointmentStatus.CANCELLED)
         )
 
-        # 날짜 필터링 추가
+        # 날짜 필터링 추가 (인덱스 범위 검색이 가능하도록 [당일 00:00, 다음날 00:00) 범위로 비교)
         if appointment_date is not None:
-            query = query.where(cast(cls.appointment_datetime, Date) == appointment_date)
+            day_start = datetime.combine(appointment_date, time.min)
+            query = query.where(
+                cls.appointment_datetime >= day_start,
+                cls.appointment_datetime < day_start + timedelta(days=1),
+            )
 
         result = await session.execute(query)
-        rows = result.all()
         return [
             AppointmentWithTreatmentData(
-                appointment_id=appointment.id,
-                doctor_id=appointment.doctor_id,
-                appointment_datetime=appointment.appointment_datetime,
-                treatment_duration_minutes=treatment.duration_minutes,
+                appointment_id=appointment_id,
+                doctor_id=doctor_id,
+                appointment_datetime=appointment_datetime,
+                treatment_duration_minutes=duration_minutes,
             )
-            for appointment, treatment in rows
+            for appointment_id, doctor_id, appointment_datetime, duration_minutes in result.all()
         ]
 
     @classmethod
-    async def get_active_with_treatment(
+    async def get_active_with_treatment_between(
         cls,
         session: AsyncSession,
-        appointment_date: date | None = None,
+        start_datetime: datetime,
+        end_datetime: datetime,
     ) -> list[AppointmentWithTreatmentData]:
-        """취소되지 않은 예약과 진료 항목 조회"""
+        """기간 내 취소되지 않은 예약과 진료 항목 조회 (start_datetime 이상 end_datetime 미만)"""
         from app.dtos.appointment import AppointmentWithTreatmentData
         from app.models.treatment import Treatment
 
         query = (
-            select(cls, Treatment)
+            select(cls.id, cls.doctor_id, cls.appointment_datetime, Treatment.duration_minutes)
             .join(Treatment, cls.treatment_id == Treatment.id)
-            .where(cls.status != AppointmentStatus.CANCELLED)
+            .where(
+                cls.appointment_datetime >= start_datetime,
+                cls.appointment_datetime < end_datetime,
+                cls.status != AppointmentStatus.CANCELLED,
+            )
         )
 
-        # 날짜 필터링 추가
-        if appointment_date is not None:
-            query = query.where(cast(cls.appointment_datetime, Date) == appointment_date)
-
         result = await session.execute(query)
-        rows = result.all()
         return [
             AppointmentWithTreatmentData(
-                appointment_id=appointment.id,
-                doctor_id=appointment.doctor_id,
-                appointment_datetime=appointment.appointment_datetime,
-                treatment_duration_minutes=treatment.duration_minutes,
+                appointment_id=appointment_id,
+                doctor_id=doctor_id,
+                appointment_datetime=appointment_datetime,
+                treatment_duration_minutes=duration_minutes,
             )
-            for appointment, treatment in rows
+            for appointment_id, doctor_id, appointment_datetime, duration_minutes in result.all()
         ]
 
     @classmethod
-    async def get_by_patient_phone(
+    async def get_data_by_id(cls, session: AsyncSession, appointment_id: int) -> PatientAppointmentData | None:
+        """예약 ID로 응답에 필요한 예약/의사/진료 항목 컬럼만 조회"""
+        from app.dtos.appointment import PatientAppointmentData
+
+        result = await session.execute(cls._build_patient_data_query().where(cls.id == appointment_id))
+        row = result.one_or_none()
+        return PatientAppointmentData(*row) if row is not None else None
+
+    @classmethod
+    async def get_data_by_patient_id(
         cls,
         session: AsyncSession,
-        patient_phone: str,
-    ) -> list[Appointment]:
-        """환자 전화번호로 예약 목록 조회 (최신순)"""
-        from app.models.patient import Patient
+        patient_id: int,
+    ) -> list[PatientAppointmentData]:
+        """
+        환자 ID로 예약 목록 조회 (최신순)
+
+        응답에 필요한 예약/의사/진료 항목 컬럼만 조회 (ORM 객체와 identity map 등록 없이 가벼운 데이터로 변환)
+        """
+        from app.dtos.appointment import PatientAppointmentData
 
         query = (
-            select(cls)
-            .join(Patient, cls.patient_id == Patient.id)
-            .where(Patient.phone == patient_phone)
+            cls._build_patient_data_query()
+            .where(cls.patient_id == patient_id)
             .order_by(cls.appointment_datetime.desc())
         )
         result = await session.execute(query)
-        return list(result.scalars().all())
+        return [PatientAppointmentData(*row) for row in result.all()]
 
     @classmethod
-    async def get_by_id_and_patient_phone(
+    async def get_data_page_by_patient_id(
         cls,
         session: AsyncSession,
-        appointment_id: int,
-        patient_phone: str,
-    ) -> "Appointment | None":
-        """예약 ID와 환자 전화번호로 예약 조회 (본인 확인용)"""
-        from app.models.patient import Patient
+        patient_id: int,
+        now: datetime,
+        upcoming: bool,
+        after: tuple[datetime, int] | None,
+        limit: int,
+    ) -> list[PatientAppointmentData]:
+        """
+        환자 ID로 예약 이력 한 페이지 조회 (커서 기반)
+
+        upcoming이면 now 이후 예약을 (예약 일시, ID) 오름차순, 아니면 now 이전 예약을 내림차순으로 조회
+        after는 이전 페이지 마지막 예약의 (예약 일시, ID)이며, 그 다음 항목부터 최대 limit건 반환
+        (idx_appointments_patient_datetime_id 인덱스를 정렬 순서대로 범위 검색,
+        커서 조건은 MySQL이 범위 검색으로 처리하도록 행 생성자 비교 대신 OR로 풀어서 작성)
+        """
+        from app.dtos.appointment import PatientAppointmentData
+
+        query = cls._build_patient_data_query().where(cls.patient_id == patient_id)
+        if upcoming:
+            query = query.where(cls.appointment_datetime >= now).order_by(cls.appointment_datetime, cls.id)
+            if after is not None:
+                after_datetime, after_id = after
+                query = query.where(
+                    or_(
+                        cls.appointment_datetime > after_datetime,
+                        and_(cls.appointment_datetime == after_datetime, cls.id > after_id),
+                    )
+                )
+        else:
+            query = query.where(cls.appointment_datetime < now).order_by(cls.appointment_datetime.desc(), cls.id.desc())
+            if after is not None:
+                after_datetime, after_id = after
+                query = query.where(
+                    or_(
+                        cls.appointment_datetime < after_datetime,
+                        and_(cls.appointment_datetime == after_datetime, cls.id < after_id),
+                    )
+                )
+
+        result = await session.execute(query.limit(limit))
+        return [PatientAppointmentData(*row) for row in result.all()]
 
+    @classmethod
+    async def get_status_for_patient(
+        cls, session: AsyncSession, appointment_id: int, patient_id: int
+    ) -> AppointmentStatus | None:
+        """
+        환자 본인 예약의 상태 조회 (본인 예약이 아니거나 없으면 None)
+
+        공유 잠금 읽기로 트랜잭션 스냅샷이 아닌 최신 커밋 상태를 조회 (동시에 취소된 예약도 취소 상태로 확인)
+        """
         query = (
-            select(cls)
-            .join(Patient, cls.patient_id == Patient.id)
-            .where(cls.id == appointment_id, Patient.phone == patient_phone)
+            select(cls.status).where(cls.id == appointment_id, cls.patient_id == patient_id).with_for_update(read=True)
         )
         result = await session.execute(query)
         return result.scalar_one_or_none()
 
-    async def cancel(self, session: AsyncSession) -> None:
-        """예약 취소 (소프트 삭제)"""
-        if self.status == AppointmentStatus.CANCELLED:
-            from app.core.constants.error_messages import ErrorMessages
-            from app.core.exceptions import MediSolveAiException
+    @classmethod
+    async def cancel_for_patient(cls, session: AsyncSession, appointment_id: int, patient_id: int) -> bool:
+        """
+        환자 본인의 취소되지 않은 예약을 취소 (소프트 삭제, 점유 구간 해제)
 
-            raise MediSolveAiException(ErrorMessages.APPOINTMENT_ALREADY_CANCELLED)
+        조회 없이 조건부 UPDATE 한 번으로 변경하며, 변경된 행이 없으면 False
+        (없는 예약/다른 환자의 예약/이미 취소된 예약, 구분이 필요하면 get_status_for_patient로 확인)
+        """
+        from app.models.appointment_slot_tick import AppointmentSlotTick
 
-        self.status = AppointmentStatus.CANCELLED
-        await session.flush()
+        query = (
+            update(cls)
+            .where(cls.id == appointment_id, cls.patient_id == patient_id, cls.status != AppointmentStatus.CANCELLED)
+            .values(status=AppointmentStatus.CANCELLED)
+            .execution_options(synchronize_session=False)
+        )
+        result = cast(CursorResult[Any], await session.execute(query))
+        if result.rowcount != 1:
+            return False
+
+        await AppointmentSlotTick.release(session=session, appointment_id=appointment_id)
+        return True
+
+    @classmethod
+    def _build_patient_data_query(cls) -> Select[*tuple[Any, ...]]:
+        """환자 예약 조회 쿼리 (PatientAppointmentData 필드 순서의 예약/의사/진료 항목 컬럼)"""
+        from app.models.doctor import Doctor
+        from app.models.treatment import Treatment
+
+        return (
+            select(
+                cls.id,
+                cls.appointment_datetime,
+                cls.status,
+                cls.visit_type,
+                cls.memo,
+                Doctor.id,
+                Doctor.name,
+                Treatment.id,
+                Treatment.name,
+            )
+            .join(Doctor, cls.doctor_id == Doctor.id)
+            .join(Treatment, cls.treatment_id == Treatment.id)
+        )
@@ -0,0 +1,135 @@
+"""
+Patient App - AppointmentHold 모델
+
+예약 가능 시간 조회 후 확정 전까지 (의사, 시작 일시, 소요 시간)을 몇 분간 확보하는 선점 모델
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, cast
+
+from sqlalchemy import CursorResult, DateTime, ForeignKey, Integer, String, delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database.orm import BaseModel
+
+if TYPE_CHECKING:
+    from app.dtos.appointment import AppointmentWithTreatmentData
+
+
+class AppointmentHold(BaseModel):
+    """
+    예약 선점 (expires_at이 지나면 무효, 만료된 행은 주기적으로 삭제)
+
+    유효한 선점은 예약과 같게 의사 중복/병원 수용 인원 계산에 포함
+    """
+
+    __tablename__ = "appointment_holds"
+
+    doctor_id: Mapped[int] = mapped_column(ForeignKey("doctors.id"), nullable=False, comment="담당 의사")
+    treatment_id: Mapped[int] = mapped_column(ForeignKey("treatments.id"), nullable=False, comment="진료항목")
+    patient_phone: Mapped[str] = mapped_column(String(20), nullable=False, comment="선점한 환자 연락처")
+    appointment_datetime: Mapped[datetime] = mapped_column(DateTime, nullable=False, comment="예약 시작 일시")
+    duration_minutes: Mapped[int] = mapped_column(Integer, nullable=False, comment="진료 소요 시간 (분)")
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, comment="만료 일시")
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), comment="생성 시간"
+    )
+
+    @classmethod
+    async def create_one(
+        cls,
+        session: AsyncSession,
+        doctor_id: int,
+        treatment_id: int,
+        patient_phone: str,
+        appointment_datetime: datetime,
+        duration_minutes: int,
+        expires_at: datetime,
+    ) -> AppointmentHold:
+        """선점 생성"""
+        hold = cls(
+            doctor_id=doctor_id,
+            treatment_id=treatment_id,
+            patient_phone=patient_phone,
+            appointment_datetime=appointment_datetime,
+            duration_minutes=duration_minutes,
+            expires_at=expires_at,
+        )
+        session.add(hold)
+        await session.flush()
+        return hold
+
+    @classmethod
+    async def get_by_id_and_patient_phone(
+        cls, session: AsyncSession, hold_id: int, patient_phone: str
+    ) -> AppointmentHold | None:
+        """선점 ID와 환자 전화번호로 선점 조회 (본인 확인용, 만료 여부는 호출 측에서 확인)"""
+        query = select(cls).where(cls.id == hold_id, cls.patient_phone == patient_phone)
+        result = await session.execute(query)
+        return result.scalar_one_or_none()
+
+    @classmethod
+    async def get_active_by_patient_phone(
+        cls, session: AsyncSession, patient_phone: str, now: datetime
+    ) -> list[AppointmentHold]:
+        """환자의 만료되지 않은 선점 목록"""
+        query = select(cls).where(cls.patient_phone == patient_phone, cls.expires_at > now)
+        result = await session.execute(query)
+        return list(result.scalars().all())
+
+    @classmethod
+    async def get_active_between(
+        cls,
+        session: AsyncSession,
+        start_datetime: datetime,
+        end_datetime: datetime,
+        now: datetime,
+        exclude_patient_phone: str | None = None,
+    ) -> list[AppointmentWithTreatmentData]:
+        """
+        기간 내 만료되지 않은 선점 조회 (start_datetime 이상 end_datetime 미만, exclude_patient_phone의 선점 제외)
+
+        예약 현황과 같은 형태로 반환 (appointment_id는 0, 의사 중복/수용 인원 계산에 그대로 사용)
+        """
+        from app.dtos.appointment import AppointmentWithTreatmentData
+
+        query = select(cls.doctor_id, cls.appointment_datetime, cls.duration_minutes, cls.expires_at).where(
+            cls.appointment_datetime >= start_datetime,
+            cls.appointment_datetime < end_datetime,
+            cls.expires_at > now,
+        )
+        if exclude_patient_phone is not None:
+            query = query.where(cls.patient_phone != exclude_patient_phone)
+        result = await session.execute(query)
+        return [
+            AppointmentWithTreatmentData(
+                appointment_id=0,
+                doctor_id=doctor_id,
+                appointment_datetime=appointment_datetime,
+                treatment_duration_minutes=duration_minutes,
+                hold_expires_at=expires_at,
+            )
+            for doctor_id, appointment_datetime, duration_minutes, expires_at in result.all()
+        ]
+
+    @classmethod
+    async def consume(cls, session: AsyncSession, hold_id: int, patient_phone: str, now: datetime) -> bool:
+        """만료되지 않은 본인 선점을 삭제 (예약 확정 시, 삭제했으면 True)"""
+        query = delete(cls).where(cls.id == hold_id, cls.patient_phone == patient_phone, cls.expires_at > now)
+        result = cast(CursorResult[Any], await session.execute(query))
+        return result.rowcount == 1
+
+    @classmethod
+    async def delete_by_ids(cls, session: AsyncSession, hold_ids: list[int]) -> None:
+        """선점 삭제"""
+        await session.execute(delete(cls).where(cls.id.in_(hold_ids)).execution_options(synchronize_session=False))
+
+    @classmethod
+    async def delete_expired(cls, session: AsyncSession, now: datetime, limit: int) -> int:
+        """만료된 선점 삭제 (최대 limit건, 삭제 건수 반환)"""
+        query = delete(cls).where(cls.expires_at <= now).execution_options(synchronize_session=False)
+        result = cast(CursorResult[Any], await session.execute(query.with_dialect_options(mysql_limit=limit)))
+        return result.rowcount
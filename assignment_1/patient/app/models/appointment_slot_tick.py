@@ -0,0 +1,69 @@
+"""
+Patient App - AppointmentSlotTick 모델
+
+의사별 15분 단위 예약 점유 구간 모델 (유니크 키로 중복 예약을 DB에서 차단)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+
+from sqlalchemy import DateTime, ForeignKey, delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.constants import TimeConstants
+from app.core.database.orm import BaseModel, TimestampMixin
+
+# (doctor_id, tick) 유니크 키 이름 (중복 키 에러가 이 키에서 발생했는지 판단용)
+DOCTOR_TICK_UNIQUE_KEY = "uq_appointment_slot_ticks_doctor_tick"
+
+
+class AppointmentSlotTick(BaseModel, TimestampMixin):
+    """취소되지 않은 예약이 점유한 의사별 15분 구간 (예약 1건당 소요 시간 / 15분 개 행)"""
+
+    __tablename__ = "appointment_slot_ticks"
+
+    appointment_id: Mapped[int] = mapped_column(ForeignKey("appointments.id"), nullable=False, comment="예약")
+    doctor_id: Mapped[int] = mapped_column(ForeignKey("doctors.id"), nullable=False, comment="담당 의사")
+    tick: Mapped[datetime] = mapped_column(DateTime, nullable=False, comment="점유 구간 시작 일시 (15분 단위)")
+
+    @classmethod
+    async def occupy(
+        cls,
+        session: AsyncSession,
+        appointment_id: int,
+        doctor_id: int,
+        start_datetime: datetime,
+        end_datetime: datetime,
+    ) -> None:
+        """
+        예약 구간의 15분 단위 점유 행을 한 번의 INSERT로 생성
+
+        같은 의사의 구간이 이미 점유돼 있으면 (doctor_id, tick) 유니크 키 위반으로 IntegrityError 발생
+        """
+        await cls.occupy_many(session=session, slots=[(appointment_id, doctor_id, start_datetime, end_datetime)])
+
+    @classmethod
+    async def occupy_many(
+        cls,
+        session: AsyncSession,
+        slots: Iterable[tuple[int, int, datetime, datetime]],
+    ) -> None:
+        """여러 예약의 점유 행을 한 번의 INSERT로 생성 (slots: (예약 ID, 의사 ID, 시작, 종료) 목록)"""
+        tick_minutes = TimeConstants.SLOT_INTERVAL_MINUTES.value
+        ticks = []
+        for appointment_id, doctor_id, start_datetime, end_datetime in slots:
+            tick = start_datetime
+            while tick < end_datetime:
+                ticks.append({"appointment_id": appointment_id, "doctor_id": doctor_id, "tick": tick})
+                tick += timedelta(minutes=tick_minutes)
+
+        if ticks:
+            await session.execute(insert(cls).values(ticks))
+
+    @classmethod
+    async def release(cls, session: AsyncSession, appointment_id: int) -> None:
+        """예약의 점유 구간 해제 (취소 시)"""
+        await session.execute(delete(cls).where(cls.appointment_id == appointment_id))
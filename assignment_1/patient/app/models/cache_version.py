@@ -0,0 +1,69 @@
+"""
+Patient App - CacheVersion 모델
+
+서비스 간 인메모리 캐시 무효화를 위한 버전 정보 모델
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Any, cast
+
+from sqlalchemy import BigInteger, CursorResult, DateTime, String, delete, func, select
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.constants import CacheNames
+from app.core.database.orm import Base
+
+
+class CacheVersion(Base):
+    """캐시 버전 정보 모델 (데이터 변경 시 버전 증가, 각 프로세스가 버전 변경을 감지해 캐시를 다시 구성)"""
+
+    __tablename__ = "cache_versions"
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True, comment="캐시 이름")
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, comment="캐시 버전")
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        comment="수정 시간",
+    )
+
+    @classmethod
+    async def get_versions(cls, session: AsyncSession, updated_since: datetime | None = None) -> list[CacheVersion]:
+        """캐시 버전 조회 (updated_since 지정 시 해당 시각 이후 변경된 버전만 조회)"""
+        query = select(cls)
+        if updated_since is not None:
+            query = query.where(cls.updated_at >= updated_since)
+        result = await session.execute(query)
+        return list(result.scalars().all())
+
+    @classmethod
+    async def bump(cls, session: AsyncSession, name: str) -> None:
+        """캐시 버전 증가 (호출한 트랜잭션과 함께 커밋됨, 행 잠금이 커밋까지 유지되므로 짧은 트랜잭션에서 호출)"""
+        query = insert(cls).values(name=name, version=1)
+        query = query.on_duplicate_key_update(version=cls.version + 1)
+        await session.execute(query)
+
+    @classmethod
+    async def bump_many(cls, session: AsyncSession, names: list[str]) -> None:
+        """여러 캐시 버전을 한 번의 쿼리로 증가 (호출한 트랜잭션과 함께 커밋됨)"""
+        if not names:
+            return
+        query = insert(cls).values([{"name": name, "version": 1} for name in names])
+        query = query.on_duplicate_key_update(version=cls.version + 1)
+        await session.execute(query)
+
+    @classmethod
+    async def delete_appointments_before(cls, session: AsyncSession, before_date: date, limit: int) -> int:
+        """before_date 이전 날짜의 예약 현황 버전 삭제 (최대 limit건, 삭제 건수 반환, 이름이 날짜 순으로 정렬되므로 PK 범위 조회)"""
+        query = (
+            delete(cls)
+            .where(cls.name >= CacheNames.APPOINTMENTS_PREFIX, cls.name < CacheNames.appointments(before_date))
+            .execution_options(synchronize_session=False)
+        )
+        result = cast(CursorResult[Any], await session.execute(query.with_dialect_options(mysql_limit=limit)))
+        return result.rowcount
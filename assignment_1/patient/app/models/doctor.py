@@ -15,6 +15,8 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.core.database.orm import BaseModel, TimestampMixin
 
 if TYPE_CHECKING:
+    from app.dtos.doctor import DoctorData
+
     from .appointment import Appointment
 
 
@@ -31,7 +33,7 @@ class Doctor(BaseModel, TimestampMixin):
     )
 
     # 관계 설정 (Patient App에서는 예약과의 관계만 필요)
-    appointments: Mapped[list[Appointment]] = relationship("Appointment", back_populates="doctor", lazy="select")
+    appointments: Mapped[list[Appointment]] = relationship("Appointment", back_populates="doctor", lazy="raise")
 
     @classmethod
     async def create_one(
@@ -72,6 +74,30 @@ class Doctor(BaseModel, TimestampMixin):
         result = await session.execute(query)
         return result.scalar_one_or_none()
 
+    @classmethod
+    async def get_all_data(cls, session: AsyncSession) -> list[DoctorData]:
+        """전체 의사 기본 정보 조회 (관계 로딩 없이 필요한 컬럼만)"""
+        from app.dtos.doctor import DoctorData
+
+        query = select(cls.id, cls.name, cls.department, cls.is_active)
+        result = await session.execute(query)
+        return [
+            DoctorData(id=row.id, name=row.name, department=row.department, is_active=row.is_active)
+            for row in result.all()
+        ]
+
+    @classmethod
+    async def get_data_by_id(cls, session: AsyncSession, doctor_id: int) -> DoctorData | None:
+        """ID로 의사 기본 정보 조회 (관계 로딩 없이 필요한 컬럼만)"""
+        from app.dtos.doctor import DoctorData
+
+        query = select(cls.id, cls.name, cls.department, cls.is_active).where(cls.id == doctor_id)
+        result = await session.execute(query)
+        row = result.one_or_none()
+        if row is None:
+            return None
+        return DoctorData(id=row.id, name=row.name, department=row.department, is_active=row.is_active)
+
     @classmethod
     async def get_active_doctors(cls, session: AsyncSession, department: str | None = None) -> list[Doctor]:
         """활성 의사 목록 조회"""
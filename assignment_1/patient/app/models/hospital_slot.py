@@ -68,41 +68,8 @@ class HospitalSlot(BaseModel, TimestampMixin):
             return check_time >= self.start_time or check_time < self.end_time
 
     @classmethod
-    async def get_active_slots(
-        cls,
-        session: AsyncSession,
-        slot_time: time,
-        day_of_week: DayOfWeek | None = None,
-    ) -> list[HospitalSlot]:
-        """특정 시간에 해당하는 활성 슬롯 조회"""
-        # 활성 슬롯 모두 조회
-        query = select(cls).where(cls.is_active)
+    async def get_all_active(cls, session: AsyncSession) -> list[HospitalSlot]:
+        """활성 슬롯 전체 조회 (ID 순, 먼저 등록된 슬롯이 우선 적용됨)"""
+        query = select(cls).where(cls.is_active).order_by(cls.id)
         result = await session.execute(query)
-        all_slots = list(result.scalars().all())
-
-        # Python 레벨에서 필터링
-        matching_slots = []
-        for slot in all_slots:
-            # 시간이 슬롯에 포함되는지 확인
-            if not slot.is_time_in_slot(slot_time):
-                continue
-
-            # 요일 필터 (NULL이면 모든 요일, 특정 요일이면 해당 요일만)
-            if slot.day_of_week is None or slot.day_of_week == day_of_week:
-                matching_slots.append(slot)
-
-        return matching_slots
-
-    @classmethod
-    async def get_default_capacity(
-        cls,
-        session: AsyncSession,
-        slot_time: time,
-        day_of_week: DayOfWeek | None = None,
-    ) -> int:
-        """특정 시간대의 기본 수용 인원 조회 (슬롯이 없으면 기본값 3)"""
-        slots = await cls.get_active_slots(session=session, slot_time=slot_time, day_of_week=day_of_week)
-        if slots:
-            # 여러 슬롯이 있으면 첫 번째 슬롯의 max_capacity 사용
-            return slots[0].max_capacity
-        return 3  # 기본값
+        return list(result.scalars().all())
@@ -0,0 +1,119 @@
+"""
+Patient App - IdempotencyKey 모델
+
+Idempotency-Key 헤더로 재시도된 요청에 첫 응답을 그대로 돌려주기 위한 저장소
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, cast
+
+from sqlalchemy import (
+    JSON,
+    CursorResult,
+    DateTime,
+    SmallInteger,
+    String,
+    delete,
+    func,
+    insert,
+    literal_column,
+    select,
+    update,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database.orm import Base
+
+
+class IdempotencyKey(Base):
+    """멱등성 키와 저장된 응답 (status_code가 NULL이면 처리 중)"""
+
+    __tablename__ = "idempotency_keys"
+
+    scope: Mapped[str] = mapped_column(String(50), primary_key=True, comment="요청 종류")
+    idempotency_key: Mapped[str] = mapped_column(String(255), primary_key=True, comment="Idempotency-Key")
+    request_hash: Mapped[str] = mapped_column(String(64), nullable=False, comment="요청 내용 해시")
+    status_code: Mapped[int | None] = mapped_column(SmallInteger, nullable=True, comment="저장된 응답 상태 코드")
+    response_body: Mapped[Any | None] = mapped_column(JSON, nullable=True, comment="저장된 응답 본문")
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, comment="만료 일시")
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), comment="생성 시간"
+    )
+
+    @property
+    def is_completed(self) -> bool:
+        """응답이 저장되었는지 확인 (False면 다른 요청이 처리 중)"""
+        return self.status_code is not None
+
+    @classmethod
+    async def reserve(
+        cls, session: AsyncSession, scope: str, idempotency_key: str, request_hash: str, lease_seconds: int
+    ) -> bool:
+        """
+        처리 중 상태로 키 선점 (이미 유효한 키가 있으면 False)
+
+        만료된 키는 먼저 삭제하고, 선점은 INSERT IGNORE로 동시 요청 중 하나만 성공
+        """
+        await session.execute(
+            delete(cls).where(cls.scope == scope, cls.idempotency_key == idempotency_key, cls.expires_at <= func.now())
+        )
+        query = (
+            insert(cls)
+            .prefix_with("IGNORE")
+            .values(
+                scope=scope,
+                idempotency_key=idempotency_key,
+                request_hash=request_hash,
+                expires_at=_seconds_from_now(lease_seconds),
+            )
+        )
+        result = cast(CursorResult[Any], await session.execute(query))
+        return result.rowcount == 1
+
+    @classmethod
+    async def get(cls, session: AsyncSession, scope: str, idempotency_key: str) -> IdempotencyKey | None:
+        """유효한(만료되지 않은) 키 조회"""
+        query = select(cls).where(
+            cls.scope == scope, cls.idempotency_key == idempotency_key, cls.expires_at > func.now()
+        )
+        result = await session.execute(query)
+        return result.scalar_one_or_none()
+
+    @classmethod
+    async def complete(
+        cls,
+        session: AsyncSession,
+        scope: str,
+        idempotency_key: str,
+        status_code: int,
+        response_body: Any,
+        ttl_seconds: int,
+    ) -> None:
+        """응답 저장 (보관 기간 동안 같은 키의 재시도에 반환)"""
+        query = (
+            update(cls)
+            .where(cls.scope == scope, cls.idempotency_key == idempotency_key)
+            .values(status_code=status_code, response_body=response_body, expires_at=_seconds_from_now(ttl_seconds))
+        )
+        await session.execute(query)
+
+    @classmethod
+    async def release(cls, session: AsyncSession, scope: str, idempotency_key: str) -> None:
+        """처리 중인 키 삭제 (응답을 저장하지 않는 실패 시, 다음 재시도가 다시 처리하도록)"""
+        query = delete(cls).where(cls.scope == scope, cls.idempotency_key == idempotency_key, cls.status_code.is_(None))
+        await session.execute(query)
+
+    @classmethod
+    async def delete_expired(cls, session: AsyncSession, limit: int) -> int:
+        """만료된 키 삭제 (최대 limit건, 삭제 건수 반환)"""
+        query = delete(cls).where(cls.expires_at <= func.now()).execution_options(synchronize_session=False)
+        result = cast(CursorResult[Any], await session.execute(query.with_dialect_options(mysql_limit=limit)))
+        return result.rowcount
+
+
+def _seconds_from_now(seconds: int) -> Any:
+    """DB 현재 시각 기준 seconds초 뒤 (서버 간 시계 차이의 영향을 받지 않도록 DB 시각 사용)"""
+    return func.timestampadd(literal_column("SECOND"), seconds, func.now())
@@ -6,15 +6,19 @@ Patient App - Patient 모델
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, cast
 
-from sqlalchemy import String, select
+from sqlalchemy import CursorResult, DateTime, Integer, Row, String, func, select
+from sqlalchemy.dialects.mysql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database.orm import BaseModel, TimestampMixin
 
 if TYPE_CHECKING:
+    from app.dtos.patient import PatientData
+
     from .appointment import Appointment
 
 
@@ -27,45 +31,97 @@ class Patient(BaseModel, TimestampMixin):
     name: Mapped[str] = mapped_column(String(100), nullable=False, comment="환자 이름")
     phone: Mapped[str] = mapped_column(String(20), nullable=False, unique=True, comment="연락처")
 
+    # 방문 요약 (관리자 앱에서 예약 완료 처리 시 갱신)
+    completed_visit_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment="완료된 진료 수")
+    last_completed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True, comment="마지막 완료 진료 일시")
+
     # 관계 설정 (Patient App에서는 예약과의 관계만 필요)
     appointments: Mapped[list["Appointment"]] = relationship(
         "Appointment",
         back_populates="patient",
-        lazy="select",
+        lazy="raise",
         order_by="Appointment.appointment_datetime.desc()",  # 최신 예약 순으로 정렬
     )
 
+    @property
+    def has_completed_visit(self) -> bool:
+        """완료된 진료가 있는지 확인 (초진/재진 판단용)"""
+        return self.completed_visit_count > 0
+
+    @classmethod
+    async def get_data_by_phone(cls, session: AsyncSession, phone: str) -> PatientData | None:
+        """전화번호로 환자 기본 정보 조회 (관계 로딩 없이 필요한 컬럼만)"""
+        query = select(cls.id, cls.name, cls.phone, cls.completed_visit_count).where(cls.phone == phone)
+        result = await session.execute(query)
+        row = result.one_or_none()
+        if row is None:
+            return None
+        return _to_patient_data(row)
+
     @classmethod
-    async def get_by_phone(cls, session: AsyncSession, phone: str) -> Patient | None:
-        """전화번호로 환자 조회"""
-        query = select(cls).where(cls.phone == phone)
+    async def get_data_by_id(cls, session: AsyncSession, patient_id: int) -> PatientData | None:
+        """ID로 환자 기본 정보 조회 (관계 로딩 없이 필요한 컬럼만)"""
+        query = select(cls.id, cls.name, cls.phone, cls.completed_visit_count).where(cls.id == patient_id)
         result = await session.execute(query)
-        return result.scalar_one_or_none()
+        row = result.one_or_none()
+        if row is None:
+            return None
+        return _to_patient_data(row)
 
     @classmethod
-    async def get_or_create(
+    async def upsert(cls, session: AsyncSession, name: str, phone: str) -> int:
+        """
+        환자 생성 (이미 있으면 기존 환자 사용) 후 환자 ID 반환
+
+        INSERT ... ON DUPLICATE KEY UPDATE id = LAST_INSERT_ID(id) 한 문장으로 처리
+        - 동시에 같은 전화번호로 첫 예약이 들어와도 유니크 키 위반 없이 같은 환자 ID를 받음
+        - 기존 환자의 이름은 변경하지 않음
+        """
+        query = insert(cls).values(name=name, phone=phone, completed_visit_count=0)
+        query = query.on_duplicate_key_update(id=func.last_insert_id(cls.id))
+        result = cast(CursorResult[Any], await session.execute(query))
+        return int(result.lastrowid)
+
+    @classmethod
+    async def get_or_create_many_data(
         cls,
         session: AsyncSession,
-        name: str,
-        phone: str,
-    ) -> Patient:
-        """전화번호로 환자 조회 또는 생성"""
-        patient = await cls.get_by_phone(session=session, phone=phone)
-        if patient is None:
-            patient = cls(name=name, phone=phone)
-            session.add(patient)
-            await session.flush()
-            await session.refresh(patient)
-        return patient
-
-    async def has_completed_appointment(self, session: AsyncSession) -> bool:
-        """완료된 예약이 있는지 확인"""
-        from app.core.constants.appointment_status import AppointmentStatus
-        from app.models.appointment import Appointment
-
-        query = select(Appointment).where(
-            Appointment.patient_id == self.id,
-            Appointment.status == AppointmentStatus.COMPLETED,
-        )
-        result = await session.execute(query)
-        return result.scalar_one_or_none() is not None
+        names_by_phone: dict[str, str],
+    ) -> dict[str, PatientData]:
+        """
+        여러 환자를 한 번에 조회 또는 생성 (예약 일괄 생성용)
+
+        조회 한 번, 신규 환자가 있으면 다중 행 INSERT(이미 있으면 무시) 한 번과 생성된 환자 조회 한 번
+
+        Args:
+            names_by_phone: 전화번호 → 이름 (신규 환자 생성 시 사용)
+
+        Returns:
+            전화번호 → 환자 기본 정보
+        """
+        columns = (cls.id, cls.name, cls.phone, cls.completed_visit_count)
+        result = await session.execute(select(*columns).where(cls.phone.in_(names_by_phone)))
+        patients = {row.phone: _to_patient_data(row) for row in result.all()}
+
+        new_phones = [phone for phone in names_by_phone if phone not in patients]
+        if new_phones:
+            query = insert(cls).values(
+                [{"name": names_by_phone[phone], "phone": phone, "completed_visit_count": 0} for phone in new_phones]
+            )
+            await session.execute(query.on_duplicate_key_update(id=cls.id))
+            result = await session.execute(select(*columns).where(cls.phone.in_(new_phones)))
+            patients.update({row.phone: _to_patient_data(row) for row in result.all()})
+
+        return patients
+
+
+def _to_patient_data(row: Row[int, str, str, int]) -> PatientData:
+    """조회 결과 행 → 환자 기본 정보"""
+    from app.dtos.patient import PatientData
+
+    return PatientData(
+        id=row.id,
+        name=row.name,
+        phone=row.phone,
+        has_completed_visit=row.completed_visit_count > 0,
+    )
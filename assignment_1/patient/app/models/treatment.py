@@ -16,6 +16,8 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.core.database.orm import BaseModel, TimestampMixin
 
 if TYPE_CHECKING:
+    from app.dtos.treatment import TreatmentData
+
     from .appointment import Appointment
 
 
@@ -34,7 +36,7 @@ class Treatment(BaseModel, TimestampMixin):
     )
 
     # 관계 설정 (Patient App에서는 예약과의 관계만 필요)
-    appointments: Mapped[list["Appointment"]] = relationship("Appointment", back_populates="treatment", lazy="select")
+    appointments: Mapped[list["Appointment"]] = relationship("Appointment", back_populates="treatment", lazy="raise")
 
     @classmethod
     async def get_by_id(cls, session: AsyncSession, treatment_id: int) -> Treatment | None:
@@ -44,3 +46,31 @@ class Treatment(BaseModel, TimestampMixin):
         query = select(cls).where(cls.id == treatment_id)
         result = await session.execute(query)
         return result.scalar_one_or_none()
+
+    @classmethod
+    async def get_all_data(cls, session: AsyncSession) -> list[TreatmentData]:
+        """전체 진료 항목 기본 정보 조회 (관계 로딩 없이 필요한 컬럼만)"""
+        from sqlalchemy import select
+
+        from app.dtos.treatment import TreatmentData
+
+        query = select(cls.id, cls.name, cls.duration_minutes, cls.is_active)
+        result = await session.execute(query)
+        return [
+            TreatmentData(id=row.id, name=row.name, duration_minutes=row.duration_minutes, is_active=row.is_active)
+            for row in result.all()
+        ]
+
+    @classmethod
+    async def get_data_by_id(cls, session: AsyncSession, treatment_id: int) -> TreatmentData | None:
+        """ID로 진료 항목 기본 정보 조회 (관계 로딩 없이 필요한 컬럼만)"""
+        from sqlalchemy import select
+
+        from app.dtos.treatment import TreatmentData
+
+        query = select(cls.id, cls.name, cls.duration_minutes, cls.is_active).where(cls.id == treatment_id)
+        result = await session.execute(query)
+        row = result.one_or_none()
+        if row is None:
+            return None
+        return TreatmentData(id=row.id, name=row.name, duration_minutes=row.duration_minutes, is_active=row.is_active)
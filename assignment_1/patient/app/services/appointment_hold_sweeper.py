@@ -0,0 +1,45 @@
+"""
+Appointment Hold Sweeper
+
+만료된 예약 선점 정리 (만료된 선점은 조회 조건에서 이미 제외되므로 테이블 크기 관리용)
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.configs.settings import settings
+from app.models.appointment_hold import AppointmentHold
+
+
+class AppointmentHoldSweeper:
+    """정리 주기마다 요청 경로에서 만료된 선점을 일부 삭제 (삭제 지표 포함)"""
+
+    def __init__(self, interval_seconds: float, batch_size: int) -> None:
+        self._interval_seconds = interval_seconds
+        self._batch_size = batch_size
+        self._swept_at: float | None = None
+        self._runs = 0
+        self._deleted = 0
+
+    async def sweep_if_due(self, session: AsyncSession, now: datetime) -> None:
+        """정리 주기가 지났으면 만료된 선점 최대 batch_size건 삭제 (호출 측 트랜잭션에 포함)"""
+        monotonic_now = time.monotonic()
+        if self._swept_at is not None and monotonic_now - self._swept_at < self._interval_seconds:
+            return
+        self._swept_at = monotonic_now
+        self._runs += 1
+        self._deleted += await AppointmentHold.delete_expired(session=session, now=now, limit=self._batch_size)
+
+    def get_stats(self) -> dict[str, int]:
+        """정리 지표 (정리 실행 횟수, 삭제 건수)"""
+        return {"runs": self._runs, "deleted": self._deleted}
+
+
+appointment_hold_sweeper = AppointmentHoldSweeper(
+    interval_seconds=settings.appointment_hold_purge_interval_seconds,
+    batch_size=settings.appointment_hold_purge_batch_size,
+)
@@ -0,0 +1,127 @@
+"""
+Appointment Occupancy
+
+하루 단위 예약 점유 현황 (예약 가능 시간 계산용)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from datetime import date, datetime, time
+from itertools import accumulate
+
+from app.core.constants import TimeConstants
+from app.dtos.appointment import AppointmentWithTreatmentData
+
+MINUTES_PER_DAY = 24 * 60
+TICK_MINUTES = TimeConstants.SLOT_INTERVAL_MINUTES.value
+UNIT_MINUTES = TimeConstants.TREATMENT_UNIT_MINUTES.value
+TICKS_PER_DAY = MINUTES_PER_DAY // TICK_MINUTES
+UNITS_PER_DAY = MINUTES_PER_DAY // UNIT_MINUTES
+
+
+class DailyOccupancy:
+    """
+    하루 동안의 의사 스케줄 점유(15분 tick)와 병원 수용 인원 점유(30분 단위)를 한 번에 계산한 구조
+
+    - 의사 점유: tick별 점유 여부의 누적합 → 구간 내 점유 tick 수를 O(1)로 확인
+    - 병원 점유: 30분 단위별 겹치는 예약 수와 수용 인원을 비교한 만석 여부의 누적합 → 구간 내 만석 단위 수를 O(1)로 확인
+    """
+
+    def __init__(self, target_date: date, doctor_busy_prefix: list[int], full_unit_prefix: list[int]) -> None:
+        self._day_start = datetime.combine(target_date, time.min)
+        self._doctor_busy_prefix = doctor_busy_prefix
+        self._full_unit_prefix = full_unit_prefix
+
+    @classmethod
+    def build(
+        cls,
+        target_date: date,
+        appointments: Iterable[AppointmentWithTreatmentData],
+        doctor_id: int,
+        unit_capacities: Sequence[int],
+    ) -> DailyOccupancy:
+        """
+        해당 날짜의 취소되지 않은 예약 목록으로 점유 현황 생성
+
+        Args:
+            target_date: 조회 날짜
+            appointments: 해당 날짜의 모든 활성 예약 (병원 전체)
+            doctor_id: 의사 점유를 계산할 의사 ID
+            unit_capacities: 30분 단위별 최대 수용 인원 (길이 UNITS_PER_DAY)
+        """
+        day_start = datetime.combine(target_date, time.min)
+        doctor_tick_diff = [0] * (TICKS_PER_DAY + 1)
+        unit_count_diff = [0] * (UNITS_PER_DAY + 1)
+
+        for appointment_data in appointments:
+            start_minute = _minutes_from(day_start, appointment_data.appointment_datetime)
+            end_minute = start_minute + appointment_data.treatment_duration_minutes
+            start_minute = max(start_minute, 0)
+            end_minute = min(end_minute, MINUTES_PER_DAY)
+            if start_minute >= end_minute:
+                continue
+
+            # 예약이 걸치는 30분 단위 (예: 10:15~10:45 → 10:00, 10:30 단위)
+            unit_count_diff[start_minute // UNIT_MINUTES] += 1
+            unit_count_diff[-(-end_minute // UNIT_MINUTES)] -= 1
+
+            if appointment_data.doctor_id == doctor_id:
+                doctor_tick_diff[start_minute // TICK_MINUTES] += 1
+                doctor_tick_diff[-(-end_minute // TICK_MINUTES)] -= 1
+
+        doctor_busy = [1 if count > 0 else 0 for count in accumulate(doctor_tick_diff[:TICKS_PER_DAY])]
+        unit_counts = list(accumulate(unit_count_diff[:UNITS_PER_DAY]))
+        full_units = [1 if count >= capacity else 0 for count, capacity in zip(unit_counts, unit_capacities)]
+
+        return cls(
+            target_date=target_date,
+            doctor_busy_prefix=[0, *accumulate(doctor_busy)],
+            full_unit_prefix=[0, *accumulate(full_units)],
+        )
+
+    def is_available(self, slot_datetime: datetime, slot_end_datetime: datetime) -> bool:
+        """의사 스케줄과 병원 수용 인원 모두 여유가 있는지 확인"""
+        return self.is_available_minutes(
+            _minutes_from(self._day_start, slot_datetime), _minutes_from(self._day_start, slot_end_datetime)
+        )
+
+    def is_available_minutes(self, start_minute: int, end_minute: int) -> bool:
+        """자정 기준 분 단위 구간 [start_minute, end_minute)에 의사 스케줄과 병원 수용 인원 모두 여유가 있는지 확인"""
+        return self._is_doctor_available_minutes(start_minute, end_minute) and self._is_capacity_available_minutes(
+            start_minute, end_minute
+        )
+
+    def is_doctor_available(self, slot_datetime: datetime, slot_end_datetime: datetime) -> bool:
+        """해당 구간에 의사 예약이 겹치지 않는지 확인"""
+        return self._is_doctor_available_minutes(
+            _minutes_from(self._day_start, slot_datetime), _minutes_from(self._day_start, slot_end_datetime)
+        )
+
+    def is_capacity_available(self, slot_datetime: datetime, slot_end_datetime: datetime) -> bool:
+        """해당 구간이 걸치는 모든 30분 단위에 수용 인원 여유가 있는지 확인"""
+        return self._is_capacity_available_minutes(
+            _minutes_from(self._day_start, slot_datetime), _minutes_from(self._day_start, slot_end_datetime)
+        )
+
+    def _is_doctor_available_minutes(self, start_minute: int, end_minute: int) -> bool:
+        start_tick, end_tick = _range(start_minute, end_minute, TICK_MINUTES, TICKS_PER_DAY)
+        return self._doctor_busy_prefix[end_tick] - self._doctor_busy_prefix[start_tick] == 0
+
+    def _is_capacity_available_minutes(self, start_minute: int, end_minute: int) -> bool:
+        start_unit, end_unit = _range(start_minute, end_minute, UNIT_MINUTES, UNITS_PER_DAY)
+        return self._full_unit_prefix[end_unit] - self._full_unit_prefix[start_unit] == 0
+
+
+def _range(start_minute: int, end_minute: int, step_minutes: int, size: int) -> tuple[int, int]:
+    """분 단위 구간을 [시작 인덱스, 종료 인덱스) 형태로 변환 (시작은 내림, 종료는 올림)"""
+    start_minute = max(start_minute, 0)
+    end_minute = min(end_minute, MINUTES_PER_DAY)
+    start_index = min(start_minute // step_minutes, size)
+    end_index = max(min(-(-end_minute // step_minutes), size), start_index)
+    return start_index, end_index
+
+
+def _minutes_from(day_start: datetime, target: datetime) -> int:
+    """자정 기준 경과 분"""
+    return int((target - day_start).total_seconds() // 60)
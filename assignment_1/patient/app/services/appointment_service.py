@@ -6,31 +6,67 @@ Appointment Service
 
 from __future__ import annotations
 
+import base64
+import binascii
+import json
+from collections import defaultdict
 from datetime import date, datetime, time, timedelta
 
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.constants import ErrorMessages, HospitalOperationConstants, TimeConstants, VisitType
+from app.core.configs.settings import settings
+from app.core.constants import (
+    AppointmentHistoryMode,
+    AppointmentStatus,
+    BookingEngine,
+    ErrorMessages,
+    HospitalOperationConstants,
+    TimeConstants,
+    VisitType,
+)
 from app.core.constants.day_of_week import DayOfWeek
-from app.core.database.connection_async import get_async_session
+from app.core.database.connection_async import get_async_session, get_pinned_async_session
 from app.core.exceptions import MediSolveAiException
 from app.dtos.appointment import (
+    AppointmentHistoryResponse,
+    AppointmentHoldResponse,
     AppointmentResponse,
     AppointmentWithTreatmentData,
+    AvailableCalendarResponse,
     AvailableTimeResponse,
+    BatchAppointmentResult,
+    BatchCreateAppointmentRequest,
+    BatchCreateAppointmentResponse,
+    ConfirmAppointmentHoldRequest,
+    CreateAppointmentHoldRequest,
     CreateAppointmentRequest,
+    PatientAppointmentData,
 )
+from app.dtos.doctor import DoctorData
+from app.dtos.patient import PatientData
+from app.dtos.treatment import TreatmentData
 from app.models.appointment import Appointment
-from app.models.doctor import Doctor
+from app.models.appointment_hold import AppointmentHold
+from app.models.appointment_slot_tick import DOCTOR_TICK_UNIQUE_KEY, AppointmentSlotTick
 from app.models.patient import Patient
-from app.models.treatment import Treatment
+from app.services.appointment_hold_sweeper import appointment_hold_sweeper
+from app.services.appointment_occupancy import DailyOccupancy
 from app.services.appointment_validators import (
-    check_doctor_available,
-    check_slot_capacity_available,
     validate_appointment_time_interval,
+    validate_capacity_in_schedule,
     validate_no_duplicate_appointment,
+    validate_no_duplicate_in_schedule,
     validate_slot_capacity,
 )
+from app.services.availability_cache import AvailabilityCacheStamp, availability_cache
+from app.services.booking_locks import get_booking_lock_names, hold_booking_locks, run_with_booking_retry
+from app.services.cache_version_publisher import cache_version_publisher
+from app.services.cache_version_registry import cache_version_registry
+from app.services.hospital_capacity import HospitalCapacityMatrix, hospital_capacity_matrix_cache
+from app.services.patient_cache import patient_cache
+from app.services.reference_data_cache import doctor_cache, get_max_treatment_duration_minutes, treatment_cache
+from app.services.slot_templates import get_slot_template
 
 # ============================================================================
 # 메인 서비스 함수
@@ -38,65 +74,478 @@ from app.services.appointment_validators import (
 
 
 async def service_create_appointment(request: CreateAppointmentRequest) -> AppointmentResponse:
-    """예약 생성"""
-    async with get_async_session() as session:
-        # 1. 환자 조회 또는 생성
-        patient = await Patient.get_or_create(
-            session=session,
-            name=request.patient_name,
-            phone=request.patient_phone,
-        )
+    """예약 생성 (데드락/잠금 대기 시간 초과 시 재시도)"""
+    return await run_with_booking_retry(lambda: _create_appointment(request))
+
+
+async def _create_appointment(request: CreateAppointmentRequest) -> AppointmentResponse:
+    """
+    예약 생성
 
-        # 2. 의사 존재 및 활성 상태 확인
+    DB 왕복을 고정된 소수로 유지 (캐시가 준비된 상태 기준)
+    - 잠금 획득, 환자 조회(완료 예약 여부 포함), 신규 환자 생성, 최장 소요 시간, 당일 예약 선점 조회, 의사 중복 확인, 주변 예약 조회, 예약 생성, 점유 구간 생성, 캐시 버전 갱신, 잠금 해제
+    - 의사/진료 항목/수용 인원 매트릭스는 캐시에서 확인하고, 응답은 이미 가진 데이터로 구성 (커밋 후 재조회 없음)
+    - 검증~생성은 (의사, 날짜)와 (날짜, 30분 단위) 네임드 락을 잡은 상태에서 실행해 동시 요청의 중복 예약/정원 초과 방지
+    """
+    async with get_pinned_async_session() as session:
+        # 1. 의사 존재 및 활성 상태 확인
         doctor = await _validate_doctor(session=session, doctor_id=request.doctor_id)
 
-        # 3. 진료 항목 존재 및 활성 상태 확인
+        # 2. 진료 항목 존재 및 활성 상태 확인
         treatment = await _validate_treatment(session=session, treatment_id=request.treatment_id)
 
-        # 4. 예약 시간 검증
+        # 3. 예약 시간 검증
         appointment_datetime = request.appointment_datetime
         appointment_end_datetime = appointment_datetime + timedelta(minutes=treatment.duration_minutes)
 
-        # 4-1. 예약 시간이 15분 간격인지 확인
+        # 3-1. 예약 시간이 15분 간격인지 확인
         await validate_appointment_time_interval(appointment_datetime)
 
-        # 4-2. 중복 예약 방지 (동일 의사에게 동일 시간대 중복 불가)
-        await validate_no_duplicate_appointment(
-            session=session,
-            doctor_id=request.doctor_id,
-            appointment_datetime=appointment_datetime,
-            appointment_end_datetime=appointment_end_datetime,
+        # 의사 중복 판단 방식 (slot_ticks: 사전 조회/의사 잠금 없이 점유 구간 유니크 키로 판단)
+        uses_validator = settings.booking_engine == BookingEngine.VALIDATOR
+
+        lock_names = get_booking_lock_names(
+            doctor_id=doctor.id,
+            start_datetime=appointment_datetime,
+            end_datetime=appointment_end_datetime,
+            include_doctor_lock=uses_validator,
         )
+        async with hold_booking_locks(session=session, lock_names=lock_names):
+            # 4. 환자 조회 또는 생성 (초진/재진 판단용 완료된 진료 여부 포함, 캐시 사용)
+            patient = await patient_cache.get_or_create(
+                session=session,
+                name=request.patient_name,
+                phone=request.patient_phone,
+            )
 
-        # 4-3. 병원 시간대별 최대 인원수 제한 검증 (HospitalSlot 사용)
-        day_of_week_enum = _get_day_of_week_enum(appointment_datetime)
+            # 기존 예약의 조회 범위 계산용 (최장 소요 시간보다 앞서 시작한 예약은 겹칠 수 없음)
+            max_duration_minutes = await get_max_treatment_duration_minutes(session=session)
 
-        await validate_slot_capacity(
-            session=session,
-            appointment_datetime=appointment_datetime,
-            appointment_end_datetime=appointment_end_datetime,
-            day_of_week=day_of_week_enum.value,
-        )
+            # 다른 환자가 선점한 시간대는 예약과 같게 의사 중복/수용 인원 계산에 포함 (선점은 당일 기준 소수)
+            day_start, day_end = _get_day_range(appointment_datetime.date())
+            holds = await AppointmentHold.get_active_between(
+                session=session, start_datetime=day_start, end_datetime=day_end, now=datetime.now()
+            )
 
-        # 5. 초진/재진 자동 판단
-        has_completed = await patient.has_completed_appointment(session=session)
-        visit_type = VisitType.determine_visit_type(has_previous_completed_visit=has_completed)
+            # 5. 중복 예약 방지 (동일 의사에게 동일 시간대 중복 불가)
+            validate_no_duplicate_in_schedule(
+                appointments=holds,
+                doctor_id=request.doctor_id,
+                appointment_datetime=appointment_datetime,
+                appointment_end_datetime=appointment_end_datetime,
+            )
+            if uses_validator:
+                await validate_no_duplicate_appointment(
+                    session=session,
+                    doctor_id=request.doctor_id,
+                    appointment_datetime=appointment_datetime,
+                    appointment_end_datetime=appointment_end_datetime,
+                    max_duration_minutes=max_duration_minutes,
+                )
+
+            # 6. 병원 시간대별 최대 인원수 제한 검증 (HospitalSlot 사용)
+            day_of_week_enum = _get_day_of_week_enum(appointment_datetime)
+
+            await validate_slot_capacity(
+                session=session,
+                appointment_datetime=appointment_datetime,
+                appointment_end_datetime=appointment_end_datetime,
+                max_duration_minutes=max_duration_minutes,
+                day_of_week=day_of_week_enum.value,
+                holds=holds,
+            )
 
-        # 6. 예약 생성
-        appointment = await Appointment.create_one(
-            session=session,
-            patient_id=patient.id,
+            # 7. 초진/재진 자동 판단
+            visit_type = VisitType.determine_visit_type(has_previous_completed_visit=patient.has_completed_visit)
+
+            # 8. 예약 생성
+            appointment = await Appointment.create_one(
+                session=session,
+                patient_id=patient.id,
+                doctor_id=doctor.id,
+                treatment_id=treatment.id,
+                appointment_datetime=appointment_datetime,
+                visit_type=visit_type,
+                memo=request.memo,
+            )
+
+            # 9. 의사 점유 구간 생성 (이미 점유된 구간이면 유니크 키 위반 → 중복 예약)
+            await _occupy_slot_ticks(
+                session=session, slots=[(appointment.id, doctor.id, appointment_datetime, appointment_end_datetime)]
+            )
+
+            await session.commit()
+
+        # 10. 다른 프로세스의 예약 가능 시간 캐시 무효화 (예약 잠금 해제 후 별도 트랜잭션)
+        await cache_version_publisher.publish_appointment_dates(session=session, dates=[appointment_datetime.date()])
+        patient_cache.put(patient)
+        availability_cache.invalidate_date(appointment_datetime.date())
+
+        return AppointmentResponse(
+            id=appointment.id,
+            patient_name=patient.name,
+            patient_phone=patient.phone,
             doctor_id=doctor.id,
+            doctor_name=doctor.name,
             treatment_id=treatment.id,
+            treatment_name=treatment.name,
             appointment_datetime=appointment_datetime,
-            visit_type=visit_type,
+            status=appointment.status.value,
+            visit_type=visit_type.value,
             memo=request.memo,
         )
 
-        await session.commit()
-        await session.refresh(appointment)
-        await session.refresh(appointment.doctor)
-        await session.refresh(appointment.treatment)
+
+async def service_create_appointments_batch(request: BatchCreateAppointmentRequest) -> BatchCreateAppointmentResponse:
+    """예약 일괄 생성 (항목별 성공/실패 결과, 데드락/잠금 대기 시간 초과 시 재시도)"""
+    return await run_with_booking_retry(lambda: _create_appointments_batch(request))
+
+
+async def _create_appointments_batch(request: BatchCreateAppointmentRequest) -> BatchCreateAppointmentResponse:
+    """
+    예약 일괄 생성
+
+    - 의사/진료 항목은 캐시로 검증하고, 환자는 한 번에 조회/생성, 날짜별 예약 현황(예약 선점 포함)은 날짜당 한 번씩만 조회
+    - 각 항목은 메모리의 예약 현황으로 검증하고, 통과한 항목은 현황에 추가해 같은 요청 내 충돌도 검출
+    - 통과한 항목은 다중 행 INSERT로 생성 (점유 구간, 캐시 버전 갱신도 한 번씩)
+    - 단건 예약 생성과 같은 (의사, 날짜) / (날짜, 30분 단위) 잠금을 모두 잡은 상태에서 검증~생성
+    """
+    items = request.items
+    errors: dict[int, str] = {}
+    created: dict[int, AppointmentResponse] = {}
+
+    async with get_pinned_async_session() as session:
+        # 1. 의사/진료 항목 존재 및 활성 상태, 예약 시간 간격 검증 (캐시 사용)
+        prepared: dict[int, tuple[DoctorData, TreatmentData, datetime]] = {}
+        for index, item in enumerate(items):
+            try:
+                doctor = await _validate_doctor(session=session, doctor_id=item.doctor_id)
+                treatment = await _validate_treatment(session=session, treatment_id=item.treatment_id)
+                await validate_appointment_time_interval(item.appointment_datetime)
+            except MediSolveAiException as error:
+                errors[index] = error.message
+                continue
+            end_datetime = item.appointment_datetime + timedelta(minutes=treatment.duration_minutes)
+            prepared[index] = (doctor, treatment, end_datetime)
+
+        if prepared:
+            lock_names = sorted(
+                {
+                    lock_name
+                    for index, (doctor, _, end_datetime) in prepared.items()
+                    for lock_name in get_booking_lock_names(
+                        doctor_id=doctor.id, start_datetime=items[index].appointment_datetime, end_datetime=end_datetime
+                    )
+                }
+            )
+            async with hold_booking_locks(session=session, lock_names=lock_names):
+                # 2. 환자 일괄 조회 또는 생성 (같은 전화번호는 처음 나온 이름 사용)
+                names_by_phone: dict[str, str] = {}
+                for index in prepared:
+                    names_by_phone.setdefault(items[index].patient_phone, items[index].patient_name)
+                patients = await Patient.get_or_create_many_data(session=session, names_by_phone=names_by_phone)
+
+                # 3. 날짜별 예약 현황 조회 (날짜당 한 번, 예약은 날짜를 넘기지 않음, 유효한 예약 선점 포함)
+                capacity_matrix = await hospital_capacity_matrix_cache.get(session=session)
+                schedules: dict[date, list[AppointmentWithTreatmentData]] = {}
+                now = datetime.now()
+                for appointment_date in sorted({items[index].appointment_datetime.date() for index in prepared}):
+                    day_start, day_end = _get_day_range(appointment_date)
+                    schedules[appointment_date] = [
+                        *await Appointment.get_active_with_treatment_between(
+                            session=session, start_datetime=day_start, end_datetime=day_end
+                        ),
+                        *await AppointmentHold.get_active_between(
+                            session=session, start_datetime=day_start, end_datetime=day_end, now=now
+                        ),
+                    ]
+
+                # 4. 항목별 중복 예약/수용 인원 검증 (통과한 항목은 예약 현황에 추가)
+                accepted: list[int] = []
+                for index, (doctor, treatment, end_datetime) in prepared.items():
+                    appointment_datetime = items[index].appointment_datetime
+                    schedule = schedules[appointment_datetime.date()]
+                    try:
+                        validate_no_duplicate_in_schedule(
+                            appointments=schedule,
+                            doctor_id=doctor.id,
+                            appointment_datetime=appointment_datetime,
+                            appointment_end_datetime=end_datetime,
+                        )
+                        validate_capacity_in_schedule(
+                            appointments=schedule,
+                            appointment_datetime=appointment_datetime,
+                            appointment_end_datetime=end_datetime,
+                            capacity_matrix=capacity_matrix,
+                            day_of_week=_get_day_of_week_enum(appointment_datetime),
+                        )
+                    except MediSolveAiException as error:
+                        errors[index] = error.message
+                        continue
+                    schedule.append(
+                        AppointmentWithTreatmentData(
+                            appointment_id=0,
+                            doctor_id=doctor.id,
+                            appointment_datetime=appointment_datetime,
+                            treatment_duration_minutes=treatment.duration_minutes,
+                        )
+                    )
+                    accepted.append(index)
+
+                # 5. 통과한 항목 일괄 생성
+                if accepted:
+                    visit_types = {
+                        index: VisitType.determine_visit_type(
+                            has_previous_completed_visit=patients[items[index].patient_phone].has_completed_visit
+                        )
+                        for index in accepted
+                    }
+                    appointment_ids = await Appointment.create_many(
+                        session=session,
+                        rows=[
+                            {
+                                "patient_id": patients[items[index].patient_phone].id,
+                                "doctor_id": prepared[index][0].id,
+                                "treatment_id": prepared[index][1].id,
+                                "appointment_datetime": items[index].appointment_datetime,
+                                "visit_type": visit_types[index],
+                                "memo": items[index].memo,
+                            }
+                            for index in accepted
+                        ],
+                    )
+                    ids_by_index = {
+                        index: appointment_ids[(prepared[index][0].id, items[index].appointment_datetime)]
+                        for index in accepted
+                    }
+                    await _occupy_slot_ticks(
+                        session=session,
+                        slots=[
+                            (
+                                ids_by_index[index],
+                                prepared[index][0].id,
+                                items[index].appointment_datetime,
+                                prepared[index][2],
+                            )
+                            for index in accepted
+                        ],
+                    )
+                    affected_dates = sorted({items[index].appointment_datetime.date() for index in accepted})
+                    await session.commit()
+
+                    for patient in {patients[items[index].patient_phone] for index in accepted}:
+                        patient_cache.put(patient)
+                    for appointment_date in affected_dates:
+                        availability_cache.invalidate_date(appointment_date)
+
+                    for index in accepted:
+                        item = items[index]
+                        patient = patients[item.patient_phone]
+                        doctor, treatment, _ = prepared[index]
+                        created[index] = AppointmentResponse(
+                            id=ids_by_index[index],
+                            patient_name=patient.name,
+                            patient_phone=patient.phone,
+                            doctor_id=doctor.id,
+                            doctor_name=doctor.name,
+                            treatment_id=treatment.id,
+                            treatment_name=treatment.name,
+                            appointment_datetime=item.appointment_datetime,
+                            status=AppointmentStatus.PENDING.value,
+                            visit_type=visit_types[index].value,
+                            memo=item.memo,
+                        )
+
+            # 6. 다른 프로세스의 예약 가능 시간 캐시 무효화 (예약 잠금 해제 후 별도 트랜잭션)
+            await cache_version_publisher.publish_appointment_dates(
+                session=session, dates=[item.appointment_datetime.date() for item in created.values()]
+            )
+
+    results = [
+        (
+            BatchAppointmentResult(index=index, success=True, appointment=created[index])
+            if index in created
+            else BatchAppointmentResult(index=index, success=False, error=errors[index])
+        )
+        for index in range(len(items))
+    ]
+    return BatchCreateAppointmentResponse(
+        total_count=len(items),
+        success_count=len(created),
+        failure_count=len(items) - len(created),
+        results=results,
+    )
+
+
+async def service_create_appointment_hold(request: CreateAppointmentHoldRequest) -> AppointmentHoldResponse:
+    """예약 선점 (데드락/잠금 대기 시간 초과 시 재시도)"""
+    return await run_with_booking_retry(lambda: _create_appointment_hold(request))
+
+
+async def _create_appointment_hold(request: CreateAppointmentHoldRequest) -> AppointmentHoldResponse:
+    """
+    예약 선점
+
+    - 예약 생성과 같은 잠금/검증을 거친 시간대를 appointment_hold_seconds 동안 확보 (예약 생성 검증이 선점을 포함)
+    - 환자당 유효한 선점은 하나 (새 선점에 성공하면 기존 선점 해제, 실패하면 기존 선점 유지)
+    """
+    async with get_pinned_async_session() as session:
+        # 1. 의사/진료 항목 존재 및 활성 상태, 예약 시간 간격 검증 (캐시 사용)
+        doctor = await _validate_doctor(session=session, doctor_id=request.doctor_id)
+        treatment = await _validate_treatment(session=session, treatment_id=request.treatment_id)
+        appointment_datetime = request.appointment_datetime
+        appointment_end_datetime = appointment_datetime + timedelta(minutes=treatment.duration_minutes)
+        await validate_appointment_time_interval(appointment_datetime)
+
+        now = datetime.now()
+        await appointment_hold_sweeper.sweep_if_due(session=session, now=now)
+
+        lock_names = get_booking_lock_names(
+            doctor_id=doctor.id,
+            start_datetime=appointment_datetime,
+            end_datetime=appointment_end_datetime,
+            include_doctor_lock=settings.booking_engine == BookingEngine.VALIDATOR,
+        )
+        async with hold_booking_locks(session=session, lock_names=lock_names):
+            # 2. 기존 예약/다른 환자의 선점과 의사 중복, 수용 인원 검증 (본인의 기존 선점은 교체 대상이므로 제외)
+            #    선점은 점유 구간을 만들지 않으므로 예약 방식과 무관하게 기존 예약을 조회해 의사 중복 확인
+            max_duration_minutes = await get_max_treatment_duration_minutes(session=session)
+            day_start, day_end = _get_day_range(appointment_datetime.date())
+            holds = await AppointmentHold.get_active_between(
+                session=session,
+                start_datetime=day_start,
+                end_datetime=day_end,
+                now=now,
+                exclude_patient_phone=request.patient_phone,
+            )
+            validate_no_duplicate_in_schedule(
+                appointments=holds,
+                doctor_id=doctor.id,
+                appointment_datetime=appointment_datetime,
+                appointment_end_datetime=appointment_end_datetime,
+            )
+            await validate_no_duplicate_appointment(
+                session=session,
+                doctor_id=doctor.id,
+                appointment_datetime=appointment_datetime,
+                appointment_end_datetime=appointment_end_datetime,
+                max_duration_minutes=max_duration_minutes,
+            )
+            await validate_slot_capacity(
+                session=session,
+                appointment_datetime=appointment_datetime,
+                appointment_end_datetime=appointment_end_datetime,
+                max_duration_minutes=max_duration_minutes,
+                day_of_week=_get_day_of_week_enum(appointment_datetime).value,
+                holds=holds,
+            )
+
+            # 3. 본인의 기존 선점 해제 후 선점 생성 (해제는 시간대를 비우기만 하므로 해당 잠금 없이 삭제)
+            previous_holds = await AppointmentHold.get_active_by_patient_phone(
+                session=session, patient_phone=request.patient_phone, now=now
+            )
+            if previous_holds:
+                await AppointmentHold.delete_by_ids(session=session, hold_ids=[hold.id for hold in previous_holds])
+            hold = await AppointmentHold.create_one(
+                session=session,
+                doctor_id=doctor.id,
+                treatment_id=treatment.id,
+                patient_phone=request.patient_phone,
+                appointment_datetime=appointment_datetime,
+                duration_minutes=treatment.duration_minutes,
+                expires_at=(now + timedelta(seconds=settings.appointment_hold_seconds)).replace(microsecond=0),
+            )
+            affected_dates = sorted(
+                {appointment_datetime.date(), *(previous.appointment_datetime.date() for previous in previous_holds)}
+            )
+
+            await session.commit()
+
+        await cache_version_publisher.publish_appointment_dates(session=session, dates=affected_dates)
+        for affected_date in affected_dates:
+            availability_cache.invalidate_date(affected_date)
+
+        return AppointmentHoldResponse(
+            id=hold.id,
+            patient_phone=hold.patient_phone,
+            doctor_id=hold.doctor_id,
+            treatment_id=hold.treatment_id,
+            appointment_datetime=hold.appointment_datetime,
+            duration_minutes=hold.duration_minutes,
+            expires_at=hold.expires_at,
+        )
+
+
+async def service_confirm_appointment_hold(hold_id: int, request: ConfirmAppointmentHoldRequest) -> AppointmentResponse:
+    """예약 선점 확정 (데드락/잠금 대기 시간 초과 시 재시도)"""
+    return await run_with_booking_retry(lambda: _confirm_appointment_hold(hold_id, request))
+
+
+async def _confirm_appointment_hold(hold_id: int, request: ConfirmAppointmentHoldRequest) -> AppointmentResponse:
+    """
+    예약 선점 확정
+
+    선점 이후의 예약 생성/선점은 모두 이 선점을 포함해 검증했으므로, 만료 전이면 의사 중복/수용 인원을 다시 검증하지 않고
+    선점 삭제(만료 여부 확인 겸용) → 예약 생성 → 점유 구간 생성만 실행
+    """
+    async with get_pinned_async_session() as session:
+        # 1. 선점 조회 및 본인 확인 (잠금 대상 계산용)
+        hold = await AppointmentHold.get_by_id_and_patient_phone(
+            session=session, hold_id=hold_id, patient_phone=request.patient_phone
+        )
+        if hold is None:
+            raise MediSolveAiException(ErrorMessages.APPOINTMENT_HOLD_NOT_FOUND)
+        if hold.expires_at <= datetime.now():
+            raise MediSolveAiException(ErrorMessages.APPOINTMENT_HOLD_EXPIRED)
+
+        # 2. 의사/진료 항목 활성 상태 확인 (캐시 사용, 선점 이후 소요 시간이 바뀌었으면 선점한 구간과 달라지므로 만료 처리)
+        doctor = await _validate_doctor(session=session, doctor_id=hold.doctor_id)
+        treatment = await _validate_treatment(session=session, treatment_id=hold.treatment_id)
+        if treatment.duration_minutes != hold.duration_minutes:
+            raise MediSolveAiException(ErrorMessages.APPOINTMENT_HOLD_EXPIRED)
+        appointment_datetime = hold.appointment_datetime
+        appointment_end_datetime = appointment_datetime + timedelta(minutes=hold.duration_minutes)
+
+        lock_names = get_booking_lock_names(
+            doctor_id=doctor.id,
+            start_datetime=appointment_datetime,
+            end_datetime=appointment_end_datetime,
+            include_doctor_lock=settings.booking_engine == BookingEngine.VALIDATOR,
+        )
+        async with hold_booking_locks(session=session, lock_names=lock_names):
+            # 3. 만료되지 않은 선점만 삭제 (잠금을 기다리는 동안 만료되었으면 확정 불가)
+            is_consumed = await AppointmentHold.consume(
+                session=session, hold_id=hold_id, patient_phone=request.patient_phone, now=datetime.now()
+            )
+            if not is_consumed:
+                raise MediSolveAiException(ErrorMessages.APPOINTMENT_HOLD_EXPIRED)
+
+            # 4. 환자 조회 또는 생성, 초진/재진 판단 후 예약 생성
+            patient = await patient_cache.get_or_create(
+                session=session,
+                name=request.patient_name,
+                phone=request.patient_phone,
+            )
+            visit_type = VisitType.determine_visit_type(has_previous_completed_visit=patient.has_completed_visit)
+            appointment = await Appointment.create_one(
+                session=session,
+                patient_id=patient.id,
+                doctor_id=doctor.id,
+                treatment_id=treatment.id,
+                appointment_datetime=appointment_datetime,
+                visit_type=visit_type,
+                memo=request.memo,
+            )
+            await _occupy_slot_ticks(
+                session=session, slots=[(appointment.id, doctor.id, appointment_datetime, appointment_end_datetime)]
+            )
+
+            await session.commit()
+
+        # 10. 다른 프로세스의 예약 가능 시간 캐시 무효화 (예약 잠금 해제 후 별도 트랜잭션)
+        await cache_version_publisher.publish_appointment_dates(session=session, dates=[appointment_datetime.date()])
+        patient_cache.put(patient)
+        availability_cache.invalidate_date(appointment_datetime.date())
 
         return AppointmentResponse(
             id=appointment.id,
@@ -106,11 +555,28 @@ async def service_create_appointment(request: CreateAppointmentRequest) -> Appoi
             doctor_name=doctor.name,
             treatment_id=treatment.id,
             treatment_name=treatment.name,
-            appointment_datetime=appointment.appointment_datetime,
+            appointment_datetime=appointment_datetime,
             status=appointment.status.value,
-            visit_type=appointment.visit_type.value,
-            memo=appointment.memo,
+            visit_type=visit_type.value,
+            memo=request.memo,
+        )
+
+
+async def service_release_appointment_hold(hold_id: int, patient_phone: str) -> None:
+    """예약 선점 해제 (시간대를 비우기만 하므로 예약 잠금 없이 삭제)"""
+    async with get_async_session() as session:
+        hold = await AppointmentHold.get_by_id_and_patient_phone(
+            session=session, hold_id=hold_id, patient_phone=patient_phone
         )
+        if hold is None:
+            raise MediSolveAiException(ErrorMessages.APPOINTMENT_HOLD_NOT_FOUND)
+
+        appointment_date = hold.appointment_datetime.date()
+        await AppointmentHold.delete_by_ids(session=session, hold_ids=[hold.id])
+
+        await session.commit()
+        await cache_version_publisher.publish_appointment_dates(session=session, dates=[appointment_date])
+        availability_cache.invalidate_date(appointment_date)
 
 
 async def service_get_available_times(
@@ -134,35 +600,49 @@ async def service_get_available_times(
                 available_times=[],
             )
 
-        # 4. 해당 날짜의 15분 간격 시간대 생성 (운영 시간 내, 진료 항목 소요 시간 고려)
-        time_slots = _generate_time_slots(appointment_date, treatment.duration_minutes)
-
-        # 5. 해당 의사의 기존 예약 조회 (해당 날짜만)
-        doctor_appointments = await Appointment.get_active_by_doctor_with_treatment(
-            session=session, doctor_id=doctor_id, appointment_date=appointment_date
-        )
-
-        # 6. 해당 날짜의 모든 예약 조회 (수용 인원 확인용)
-        all_appointments = await Appointment.get_active_with_treatment(
-            session=session, appointment_date=appointment_date
+        # 4. 캐시된 계산 결과가 있으면 바로 반환 (계산 이후 관련 데이터가 변경된 항목은 무효)
+        await cache_version_registry.sync(session=session)
+        cache_stamp = availability_cache.get_stamp(appointment_date)
+        cached_times = availability_cache.get(
+            doctor_id=doctor_id,
+            appointment_date=appointment_date,
+            duration_minutes=treatment.duration_minutes,
+            stamp=cache_stamp,
         )
-
-        # 7. 각 시간대별로 예약 가능 여부 확인
-        available_times = []
-        for slot_datetime in time_slots:
-            is_available = await _is_time_slot_available(
-                session=session,
-                slot_datetime=slot_datetime,
-                appointment_date=appointment_date,
-                doctor_appointments=doctor_appointments,
-                all_appointments=all_appointments,
-                day_of_week_enum=day_of_week_enum,
-                treatment_duration_minutes=treatment.duration_minutes,
+        if cached_times is not None:
+            return AvailableTimeResponse(
+                doctor_id=doctor_id,
+                date=appointment_date.isoformat(),
+                available_times=cached_times,
             )
 
-            if is_available:
-                slot_time = slot_datetime.time()
-                available_times.append(slot_time.strftime("%H:%M"))
+        # 5. 해당 날짜의 모든 예약과 유효한 예약 선점 조회 (의사 스케줄 및 수용 인원 확인용)
+        day_start, day_end = _get_day_range(appointment_date)
+        day_appointments = [
+            *await Appointment.get_active_with_treatment(session=session, appointment_date=appointment_date),
+            *await AppointmentHold.get_active_between(
+                session=session, start_datetime=day_start, end_datetime=day_end, now=datetime.now()
+            ),
+        ]
+
+        # 6. 예약 가능 시간 계산 후 캐시에 저장
+        capacity_matrix = await hospital_capacity_matrix_cache.get(session=session)
+        available_times = _calculate_available_times(
+            appointment_date=appointment_date,
+            day_of_week=day_of_week_enum,
+            doctor_id=doctor_id,
+            treatment_duration_minutes=treatment.duration_minutes,
+            day_appointments=day_appointments,
+            capacity_matrix=capacity_matrix,
+        )
+        availability_cache.put(
+            doctor_id=doctor_id,
+            appointment_date=appointment_date,
+            duration_minutes=treatment.duration_minutes,
+            available_times=available_times,
+            stamp=cache_stamp,
+            valid_until=_get_earliest_hold_expiry(day_appointments),
+        )
 
         return AvailableTimeResponse(
             doctor_id=doctor_id,
@@ -171,66 +651,187 @@ async def service_get_available_times(
         )
 
 
+async def service_get_available_calendar(
+    treatment_id: int,
+    date_from: date,
+    date_to: date,
+    doctor_ids: list[int] | None = None,
+) -> AvailableCalendarResponse:
+    """기간·의사별 예약 가능 시간 캘린더 조회 (캐시에 없는 날짜의 예약은 한 번에 조회)"""
+    # 1. 조회 기간 검증
+    if date_to < date_from or (date_to - date_from).days >= TimeConstants.MAX_CALENDAR_RANGE_DAYS:
+        raise MediSolveAiException(ErrorMessages.AVAILABLE_CALENDAR_RANGE_INVALID)
+
+    async with get_async_session() as session:
+        # 2. 진료 항목 존재 및 활성 상태 확인
+        treatment = await _validate_treatment(session=session, treatment_id=treatment_id)
+
+        # 3. 의사 존재 및 활성 상태 확인 (미지정 시 활성 의사 전체)
+        doctors = await _validate_doctors(session=session, doctor_ids=doctor_ids)
+
+        # 4. 운영일별로 캐시 조회 (휴무일은 빈 리스트)
+        await cache_version_registry.sync(session=session)
+        target_dates = [date_from + timedelta(days=day_offset) for day_offset in range((date_to - date_from).days + 1)]
+        available_times_by_key: dict[tuple[date, int], list[str]] = {}
+        cache_misses: list[tuple[date, DayOfWeek, int, AvailabilityCacheStamp]] = []
+        for appointment_date in target_dates:
+            day_of_week_enum = _check_is_operation_day(appointment_date)
+            if day_of_week_enum is None:
+                continue
+
+            cache_stamp = availability_cache.get_stamp(appointment_date)
+            for doctor in doctors:
+                cached_times = availability_cache.get(
+                    doctor_id=doctor.id,
+                    appointment_date=appointment_date,
+                    duration_minutes=treatment.duration_minutes,
+                    stamp=cache_stamp,
+                )
+                if cached_times is None:
+                    cache_misses.append((appointment_date, day_of_week_enum, doctor.id, cache_stamp))
+                else:
+                    available_times_by_key[(appointment_date, doctor.id)] = cached_times
+
+        # 5. 캐시에 없는 날짜 구간의 예약과 유효한 예약 선점을 한 번에 조회 후 날짜별로 분류하여 계산
+        if cache_misses:
+            range_start = datetime.combine(cache_misses[0][0], time.min)
+            range_end = datetime.combine(cache_misses[-1][0] + timedelta(days=1), time.min)
+            range_appointments = [
+                *await Appointment.get_active_with_treatment_between(
+                    session=session, start_datetime=range_start, end_datetime=range_end
+                ),
+                *await AppointmentHold.get_active_between(
+                    session=session, start_datetime=range_start, end_datetime=range_end, now=datetime.now()
+                ),
+            ]
+            appointments_by_date: dict[date, list[AppointmentWithTreatmentData]] = defaultdict(list)
+            for appointment_data in range_appointments:
+                appointments_by_date[appointment_data.appointment_datetime.date()].append(appointment_data)
+
+            capacity_matrix = await hospital_capacity_matrix_cache.get(session=session)
+            for appointment_date, day_of_week_enum, doctor_id, cache_stamp in cache_misses:
+                available_times = _calculate_available_times(
+                    appointment_date=appointment_date,
+                    day_of_week=day_of_week_enum,
+                    doctor_id=doctor_id,
+                    treatment_duration_minutes=treatment.duration_minutes,
+                    day_appointments=appointments_by_date[appointment_date],
+                    capacity_matrix=capacity_matrix,
+                )
+                availability_cache.put(
+                    doctor_id=doctor_id,
+                    appointment_date=appointment_date,
+                    duration_minutes=treatment.duration_minutes,
+                    available_times=available_times,
+                    stamp=cache_stamp,
+                    valid_until=_get_earliest_hold_expiry(appointments_by_date[appointment_date]),
+                )
+                available_times_by_key[(appointment_date, doctor_id)] = available_times
+
+        # 6. 날짜순, 같은 날짜 내에서는 의사 순으로 응답 구성
+        return AvailableCalendarResponse(
+            treatment_id=treatment_id,
+            date_from=date_from.isoformat(),
+            date_to=date_to.isoformat(),
+            available_times=[
+                AvailableTimeResponse(
+                    doctor_id=doctor.id,
+                    date=appointment_date.isoformat(),
+                    available_times=available_times_by_key.get((appointment_date, doctor.id), []),
+                )
+                for appointment_date in target_dates
+                for doctor in doctors
+            ],
+        )
+
+
 async def service_get_appointments(patient_phone: str) -> list[AppointmentResponse]:
     """환자 예약 목록 조회"""
     async with get_async_session() as session:
-        # 환자 전화번호로 예약 목록 조회 (최신순)
-        appointments = await Appointment.get_by_patient_phone(session=session, patient_phone=patient_phone)
-
-        # AppointmentResponse 리스트로 변환
-        return [
-            AppointmentResponse(
-                id=appointment.id,
-                patient_name=appointment.patient.name,
-                patient_phone=appointment.patient.phone,
-                doctor_id=appointment.doctor.id,
-                doctor_name=appointment.doctor.name,
-                treatment_id=appointment.treatment.id,
-                treatment_name=appointment.treatment.name,
-                appointment_datetime=appointment.appointment_datetime,
-                status=appointment.status.value,
-                visit_type=appointment.visit_type.value,
-                memo=appointment.memo,
-            )
-            for appointment in appointments
-        ]
+        # 전화번호로 환자 ID 확인 (캐시 사용), 등록되지 않은 환자는 예약 없음
+        patient = await patient_cache.get(session=session, phone=patient_phone)
+        if patient is None:
+            return []
 
+        # 환자 ID로 예약 목록 조회 (최신순, 필요한 컬럼만 조회)
+        appointments = await Appointment.get_data_by_patient_id(session=session, patient_id=patient.id)
 
-async def service_cancel_appointment(appointment_id: int, patient_phone: str) -> AppointmentResponse:
-    """예약 취소"""
+        # AppointmentResponse 리스트로 변환 (환자 정보는 캐시된 값 사용)
+        return [_to_appointment_response(appointment=appointment, patient=patient) for appointment in appointments]
+
+
+async def service_get_appointment_history(
+    patient_phone: str, mode: AppointmentHistoryMode, cursor: str | None, page_size: int
+) -> AppointmentHistoryResponse:
+    """
+    환자 예약 이력 조회 (커서 기반 페이지)
 
-    from app.core.constants.error_messages import ErrorMessages
-    from app.core.exceptions import MediSolveAiException
+    upcoming은 조회 시점 이후 예약을 오름차순, past는 이전 예약을 내림차순으로 (예약 일시, ID) 기준 page_size건씩 반환
+    다음 페이지는 응답의 next_cursor를 그대로 전달해 조회 (OFFSET 없이 이전 페이지 마지막 항목 다음부터 검색)
+    """
+    after = _decode_history_cursor(cursor=cursor, mode=mode) if cursor is not None else None
 
     async with get_async_session() as session:
-        # 1. 예약 조회 및 본인 확인
-        appointment = await Appointment.get_by_id_and_patient_phone(
-            session=session, appointment_id=appointment_id, patient_phone=patient_phone
+        # 전화번호로 환자 ID 확인 (캐시 사용), 등록되지 않은 환자는 예약 없음
+        patient = await patient_cache.get(session=session, phone=patient_phone)
+        if patient is None:
+            return AppointmentHistoryResponse(mode=mode.value, items=[], next_cursor=None)
+
+        # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+        appointments = await Appointment.get_data_page_by_patient_id(
+            session=session,
+            patient_id=patient.id,
+            now=datetime.now(),
+            upcoming=mode == AppointmentHistoryMode.UPCOMING,
+            after=after,
+            limit=page_size + 1,
         )
 
-        if appointment is None:
+    page = appointments[:page_size]
+    next_cursor = _encode_history_cursor(mode=mode, appointment=page[-1]) if len(appointments) > page_size else None
+    return AppointmentHistoryResponse(
+        mode=mode.value,
+        items=[_to_appointment_response(appointment=appointment, patient=patient) for appointment in page],
+        next_cursor=next_cursor,
+    )
+
+
+async def service_cancel_appointment(appointment_id: int, patient_phone: str) -> AppointmentResponse:
+    """
+    예약 취소
+
+    본인 확인과 상태 확인을 조건부 UPDATE 한 번으로 처리하고, 응답은 취소 후 컬럼 조회 한 번으로 구성
+    (변경된 행이 없을 때만 상태를 다시 읽어 '없는 예약'과 '이미 취소된 예약'을 구분)
+    """
+    async with get_async_session() as session:
+        # 1. 전화번호로 환자 ID 확인 (캐시 사용), 등록되지 않은 환자는 본인 예약 없음
+        patient = await patient_cache.get(session=session, phone=patient_phone)
+        if patient is None:
             raise MediSolveAiException(ErrorMessages.APPOINTMENT_NOT_FOUND)
 
-        # 2. 예약 취소
-        await appointment.cancel(session=session)
+        # 2. 본인의 취소되지 않은 예약만 취소
+        is_cancelled = await Appointment.cancel_for_patient(
+            session=session, appointment_id=appointment_id, patient_id=patient.id
+        )
+        if not is_cancelled:
+            current_status = await Appointment.get_status_for_patient(
+                session=session, appointment_id=appointment_id, patient_id=patient.id
+            )
+            if current_status == AppointmentStatus.CANCELLED:
+                raise MediSolveAiException(ErrorMessages.APPOINTMENT_ALREADY_CANCELLED)
+            raise MediSolveAiException(ErrorMessages.APPOINTMENT_NOT_FOUND)
+
+        # 3. 응답 구성용 조회 후 같은 날짜의 예약 가능 시간 캐시 무효화
+        appointment = await Appointment.get_data_by_id(session=session, appointment_id=appointment_id)
+        if appointment is None:
+            raise MediSolveAiException(ErrorMessages.APPOINTMENT_NOT_FOUND)
+        appointment_date = appointment.appointment_datetime.date()
 
         await session.commit()
-        await session.refresh(appointment)
-        await session.refresh(appointment, attribute_names=["doctor", "patient", "treatment"])
+        await cache_version_publisher.publish_appointment_dates(session=session, dates=[appointment_date])
+        availability_cache.invalidate_date(appointment_date)
 
-        return AppointmentResponse(
-            id=appointment.id,
-            patient_name=appointment.patient.name,
-            patient_phone=appointment.patient.phone,
-            doctor_id=appointment.doctor.id,
-            doctor_name=appointment.doctor.name,
-            treatment_id=appointment.treatment.id,
-            treatment_name=appointment.treatment.name,
-            appointment_datetime=appointment.appointment_datetime,
-            status=appointment.status.value,
-            visit_type=appointment.visit_type.value,
-            memo=appointment.memo,
-        )
+        return _to_appointment_response(appointment=appointment, patient=patient)
 
 
 # ============================================================================
@@ -238,22 +839,93 @@ async def service_cancel_appointment(appointment_id: int, patient_phone: str) ->
 # ============================================================================
 
 
-async def _validate_doctor(session: AsyncSession, doctor_id: int) -> Doctor:
-    """의사 존재 및 활성 상태 검증"""
-    doctor = await Doctor.get_by_id(session=session, doctor_id=doctor_id)
+async def _validate_doctor(session: AsyncSession, doctor_id: int) -> DoctorData:
+    """의사 존재 및 활성 상태 검증 (캐시 사용)"""
+    doctor = await doctor_cache.get(session=session, item_id=doctor_id)
     if doctor is None or not doctor.is_active:
         raise MediSolveAiException(ErrorMessages.DOCTOR_NOT_FOUND)
     return doctor
 
 
-async def _validate_treatment(session: AsyncSession, treatment_id: int) -> Treatment:
-    """진료 항목 존재 및 활성 상태 검증"""
-    treatment = await Treatment.get_by_id(session=session, treatment_id=treatment_id)
+async def _validate_doctors(session: AsyncSession, doctor_ids: list[int] | None) -> list[DoctorData]:
+    """의사 목록 존재 및 활성 상태 검증 (요청 순서 유지, 미지정 시 활성 의사 전체를 이름순으로)"""
+    if doctor_ids is None:
+        doctors = await doctor_cache.get_all(session=session)
+        return sorted((doctor for doctor in doctors if doctor.is_active), key=lambda doctor: (doctor.name, doctor.id))
+
+    return [await _validate_doctor(session=session, doctor_id=doctor_id) for doctor_id in dict.fromkeys(doctor_ids)]
+
+
+async def _occupy_slot_ticks(session: AsyncSession, slots: list[tuple[int, int, datetime, datetime]]) -> None:
+    """
+    예약의 의사 점유 구간 생성 (같은 의사의 구간이 이미 점유돼 있으면 중복 예약 에러)
+
+    slots: (예약 ID, 의사 ID, 시작, 종료) 목록
+    """
+    try:
+        await AppointmentSlotTick.occupy_many(session=session, slots=slots)
+    except IntegrityError as error:
+        if DOCTOR_TICK_UNIQUE_KEY in str(error.orig):
+            raise MediSolveAiException(ErrorMessages.APPOINTMENT_ALREADY_EXISTS) from error
+        raise
+
+
+async def _validate_treatment(session: AsyncSession, treatment_id: int) -> TreatmentData:
+    """진료 항목 존재 및 활성 상태 검증 (캐시 사용)"""
+    treatment = await treatment_cache.get(session=session, item_id=treatment_id)
     if treatment is None or not treatment.is_active:
         raise MediSolveAiException(ErrorMessages.TREATMENT_NOT_FOUND)
     return treatment
 
 
+def _to_appointment_response(appointment: PatientAppointmentData, patient: PatientData) -> AppointmentResponse:
+    """환자 예약 조회 결과를 AppointmentResponse로 변환 (환자 정보는 캐시된 값 사용)"""
+    return AppointmentResponse(
+        id=appointment.id,
+        patient_name=patient.name,
+        patient_phone=patient.phone,
+        doctor_id=appointment.doctor_id,
+        doctor_name=appointment.doctor_name,
+        treatment_id=appointment.treatment_id,
+        treatment_name=appointment.treatment_name,
+        appointment_datetime=appointment.appointment_datetime,
+        status=appointment.status.value,
+        visit_type=appointment.visit_type.value,
+        memo=appointment.memo,
+    )
+
+
+def _encode_history_cursor(mode: AppointmentHistoryMode, appointment: PatientAppointmentData) -> str:
+    """예약 이력 커서 생성 (조회 구분과 마지막 예약의 (예약 일시, ID)를 base64url로 인코딩)"""
+    payload = {"mode": mode.value, "datetime": appointment.appointment_datetime.isoformat(), "id": appointment.id}
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def _decode_history_cursor(cursor: str, mode: AppointmentHistoryMode) -> tuple[datetime, int]:
+    """예약 이력 커서 해석 (형식이 잘못되었거나 다른 조회 구분의 커서면 에러)"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if payload["mode"] != mode.value:
+            raise ValueError(payload["mode"])
+        return datetime.fromisoformat(payload["datetime"]), int(payload["id"])
+    except (binascii.Error, UnicodeDecodeError, TypeError, KeyError, ValueError) as error:
+        raise MediSolveAiException(ErrorMessages.APPOINTMENT_HISTORY_CURSOR_INVALID) from error
+
+
+def _get_day_range(appointment_date: date) -> tuple[datetime, datetime]:
+    """날짜의 [당일 00:00, 다음날 00:00) 범위"""
+    day_start = datetime.combine(appointment_date, time.min)
+    return day_start, day_start + timedelta(days=1)
+
+
+def _get_earliest_hold_expiry(appointments: list[AppointmentWithTreatmentData]) -> datetime | None:
+    """예약 현황에 포함된 예약 선점 중 가장 이른 만료 일시 (예약 가능 시간 캐시 유효 기한)"""
+    return min(
+        (data.hold_expires_at for data in appointments if data.hold_expires_at is not None),
+        default=None,
+    )
+
+
 def _get_day_of_week_enum(datetime_or_date: datetime | date) -> DayOfWeek:
     """datetime 또는 date에서 요일 enum 반환"""
     day_of_week = datetime_or_date.weekday()  # 0=월요일, 6=일요일
@@ -268,76 +940,29 @@ def _check_is_operation_day(appointment_date: date) -> DayOfWeek | None:
     return day_of_week_enum
 
 
-def _generate_time_slots(appointment_date: date, treatment_duration_minutes: int) -> list[datetime]:
-    """해당 날짜의 15분 간격 시간대 생성 (운영 시간 내, 점심시간 및 퇴근시간과 겹치지 않음)"""
-    open_time = time.fromisoformat(HospitalOperationConstants.DEFAULT_OPEN_TIME)
-    close_time = time.fromisoformat(HospitalOperationConstants.DEFAULT_CLOSE_TIME)
-    lunch_start = time.fromisoformat(HospitalOperationConstants.DEFAULT_LUNCH_START)
-    lunch_end = time.fromisoformat(HospitalOperationConstants.DEFAULT_LUNCH_END)
-
-    # 날짜와 시간을 결합하여 datetime 생성
-    start_datetime = datetime.combine(appointment_date, open_time)
-    end_datetime = datetime.combine(appointment_date, close_time)
-
-    # 15분 간격으로 시간대 생성
-    time_slots = []
-    current_time = start_datetime
-    while current_time < end_datetime:
-        current_time_obj = current_time.time()
-
-        # 예약 종료 시간 계산 (진료 항목의 소요 시간 사용)
-        appointment_end_time = current_time + timedelta(minutes=treatment_duration_minutes)
-        appointment_end_time_obj = appointment_end_time.time()
-
-        # 예약이 점심시간과 겹치는지 확인
-        # 겹침 조건: 예약 시작 < 점심 종료 AND 예약 종료 > 점심 시작
-        # 예: 11:45 시작 → 12:15 종료 (점심시간 12:00~13:00과 겹침)
-        if current_time_obj < lunch_end and appointment_end_time_obj > lunch_start:
-            current_time += timedelta(minutes=TimeConstants.SLOT_INTERVAL_MINUTES)
-            continue
-
-        # 예약 종료 시간이 퇴근시간을 넘어가는지 확인
-        # 예: 17:45 시작 → 18:15 종료 (퇴근시간 18:00을 넘어감)
-        if appointment_end_time_obj > close_time:
-            current_time += timedelta(minutes=TimeConstants.SLOT_INTERVAL_MINUTES)
-            continue
-
-        time_slots.append(current_time)
-        current_time += timedelta(minutes=TimeConstants.SLOT_INTERVAL_MINUTES)
-
-    return time_slots
-
-
-async def _is_time_slot_available(
-    session: AsyncSession,
-    slot_datetime: datetime,
+def _calculate_available_times(
     appointment_date: date,
-    doctor_appointments: list[AppointmentWithTreatmentData],
-    all_appointments: list[AppointmentWithTreatmentData],
-    day_of_week_enum: DayOfWeek,
+    day_of_week: DayOfWeek,
+    doctor_id: int,
     treatment_duration_minutes: int,
-) -> bool:
-    """특정 시간대가 예약 가능한지 확인"""
-    # 의사 예약 여부 확인 (진료 항목의 소요 시간 사용)
-    slot_end_datetime = slot_datetime + timedelta(minutes=treatment_duration_minutes)
-    is_doctor_available = await check_doctor_available(
-        doctor_appointments=doctor_appointments,
-        slot_datetime=slot_datetime,
-        slot_end_datetime=slot_end_datetime,
-        appointment_date=appointment_date,
-    )
-
-    if not is_doctor_available:
-        return False
-
-    # 병원 수용 인원 확인
-    is_capacity_available = await check_slot_capacity_available(
-        session=session,
-        slot_datetime=slot_datetime,
-        appointment_date=appointment_date,
-        all_appointments=all_appointments,
-        treatment_duration_minutes=treatment_duration_minutes,
-        day_of_week_enum=day_of_week_enum,
+    day_appointments: list[AppointmentWithTreatmentData],
+    capacity_matrix: HospitalCapacityMatrix,
+) -> list[str]:
+    """운영일 하루의 예약 가능 시간(HH:MM) 계산"""
+    # 소요 시간별로 미리 계산된 15분 간격 시간대 템플릿 (운영 시간 내, 점심시간/마감 시간 고려)
+    slot_template = get_slot_template(treatment_duration_minutes)
+
+    # 하루 점유 현황을 한 번에 계산 (의사 점유 tick, 30분 단위 수용 인원)
+    occupancy = DailyOccupancy.build(
+        target_date=appointment_date,
+        appointments=day_appointments,
+        doctor_id=doctor_id,
+        unit_capacities=capacity_matrix.get_unit_capacities(day_of_week),
     )
 
-    return is_capacity_available
+    # 각 시간대별로 예약 가능 여부 확인 (자정 기준 분 단위 비교)
+    return [
+        label
+        for start_minute, label in zip(slot_template.start_minutes, slot_template.labels)
+        if occupancy.is_available_minutes(start_minute, start_minute + treatment_duration_minutes)
+    ]
@@ -6,7 +6,8 @@ Appointment Validators
 
 from __future__ import annotations
 
-from datetime import date, datetime, timedelta
+from collections.abc import Iterable, Sequence
+from datetime import datetime, timedelta
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -15,7 +16,7 @@ from app.core.constants.day_of_week import DayOfWeek
 from app.core.exceptions import MediSolveAiException
 from app.dtos.appointment import AppointmentWithTreatmentData
 from app.models.appointment import Appointment
-from app.models.hospital_slot import HospitalSlot
+from app.services.hospital_capacity import HospitalCapacityMatrix, hospital_capacity_matrix_cache
 
 
 async def validate_appointment_time_interval(appointment_datetime: datetime) -> None:
@@ -29,150 +30,109 @@ async def validate_no_duplicate_appointment(
     doctor_id: int,
     appointment_datetime: datetime,
     appointment_end_datetime: datetime,
+    max_duration_minutes: int,
 ) -> None:
-    """중복 예약 방지 검증 (동일 의사에게 동일 시간대 중복 불가)"""
-    # 의사의 취소되지 않은 예약과 진료 항목 조회
-    appointments_with_treatment = await Appointment.get_active_by_doctor_with_treatment(
-        session=session, doctor_id=doctor_id
-    )
-
-    # 시간 겹침: 새 예약 시작 < 기존 예약 종료 AND 새 예약 종료 > 기존 예약 시작
-    for data in appointments_with_treatment:
-        existing_end = data.appointment_datetime + timedelta(minutes=data.treatment_duration_minutes)
-        if appointment_datetime < existing_end and appointment_end_datetime > data.appointment_datetime:
-            raise MediSolveAiException(ErrorMessages.APPOINTMENT_ALREADY_EXISTS)
-
-
-async def check_slot_capacity_available(
-    session: AsyncSession,
-    slot_datetime: datetime,
-    appointment_date: date,
-    all_appointments: list["AppointmentWithTreatmentData"],
-    treatment_duration_minutes: int,
-    day_of_week_enum: DayOfWeek | None = None,
-) -> bool:
     """
-    특정 시간대 슬롯의 수용 인원 확인 (공통 함수)
-    예약이 걸치는 모든 30분 슬롯을 확인하여 수용 인원이 충분한지 반환
+    중복 예약 방지 검증 (동일 의사에게 동일 시간대 중복 불가)
 
-    Returns:
-        True: 예약 가능 (수용 인원 여유 있음)
-        False: 예약 불가 (수용 인원 초과)
+    기존 예약은 최장 소요 시간(max_duration_minutes)보다 길 수 없으므로 그만큼 앞선 시각부터만 확인
     """
-    # 예약이 걸치는 모든 30분 슬롯 계산
-    # 예: 10:15 시작 → 10:00~10:30, 10:30~11:00 슬롯 확인 필요
-    slot_start = slot_datetime.replace(minute=(slot_datetime.minute // 30) * 30, second=0, microsecond=0)
-
-    # 진료 항목의 소요 시간 사용
-    slot_end_datetime = slot_datetime + timedelta(minutes=treatment_duration_minutes)
-
-    slots_to_check = []
-    current_slot_start = slot_start
-    while current_slot_start < slot_end_datetime:
-        current_slot_end = current_slot_start + timedelta(minutes=TimeConstants.TREATMENT_UNIT_MINUTES)
-        slots_to_check.append((current_slot_start, current_slot_end))
-        current_slot_start = current_slot_end
-
-    # 각 슬롯별로 수용 인원 확인
-    for slot_start_time, slot_end_time in slots_to_check:
-        slot_time = slot_start_time.time()
-
-        # HospitalSlot에서 최대 수용 인원 조회
-        max_capacity = await HospitalSlot.get_default_capacity(
-            session=session,
-            slot_time=slot_time,
-            day_of_week=day_of_week_enum,
-        )
-
-        # 해당 슬롯과 겹치는 예약 수 계산
-        # 주의: all_appointments는 이미 해당 날짜로 필터링된 데이터여야 함
-        count = 0
-        for appointment_data in all_appointments:
-            appointment_end = appointment_data.appointment_datetime + timedelta(
-                minutes=appointment_data.treatment_duration_minutes
-            )
-
-            # 시간 겹침 확인
-            if appointment_data.appointment_datetime < slot_end_time and slot_start_time < appointment_end:
-                count += 1
-
-        # 수용 인원 초과 시 False 반환
-        if count >= max_capacity:
-            return False
-
-    return True
-
-
-async def check_doctor_available(
-    doctor_appointments: list[AppointmentWithTreatmentData],
-    slot_datetime: datetime,
-    slot_end_datetime: datetime,
-    appointment_date: date,
-) -> bool:
-    """
-    의사가 특정 시간대에 예약 가능한지 확인 (공통 함수)
-    주의: doctor_appointments는 이미 해당 날짜로 필터링된 데이터여야 함
-
-    Returns:
-        True: 예약 가능 (의사 스케줄 비어있음)
-        False: 예약 불가 (의사 스케줄 겹침)
-    """
-    for appointment_data in doctor_appointments:
-        appointment_end = appointment_data.appointment_datetime + timedelta(
-            minutes=appointment_data.treatment_duration_minutes
-        )
-
-        # 시간 겹침 확인
-        if slot_datetime < appointment_end and slot_end_datetime > appointment_data.appointment_datetime:
-            return False
-
-    return True
+    # 시간 겹침: 새 예약 시작 < 기존 예약 종료 AND 새 예약 종료 > 기존 예약 시작
+    has_overlapping = await Appointment.exists_overlapping_for_doctor(
+        session=session,
+        doctor_id=doctor_id,
+        start_datetime=appointment_datetime,
+        end_datetime=appointment_end_datetime,
+        max_duration_minutes=max_duration_minutes,
+    )
+    if has_overlapping:
+        raise MediSolveAiException(ErrorMessages.APPOINTMENT_ALREADY_EXISTS)
 
 
 async def validate_slot_capacity(
     session: AsyncSession,
     appointment_datetime: datetime,
     appointment_end_datetime: datetime,
+    max_duration_minutes: int,
     day_of_week: int | None = None,
+    holds: Sequence[AppointmentWithTreatmentData] = (),
 ) -> None:
     """
-    병원 시간대별 최대 인원수 제한 검증
+    병원 시간대별 최대 인원수 제한 검증 (holds: 유효한 예약 선점, 예약과 같게 인원에 포함)
     예시:
         예약: 10:15~10:45 (30분)
         걸치는 슬롯: 10:00~10:30, 10:30~11:00
         각 슬롯별로 기존 예약 수를 확인하고, 최대 수용 인원을 초과하면 에러 발생
+    걸치는 슬롯과 겹칠 수 있는 예약(시작 시각이 첫 슬롯 시작 - 최장 소요 시간 이후, 마지막 슬롯 종료 이전)만 조회
     """
-    # 예약이 걸치는 모든 30분 슬롯 계산
-    slot_start = appointment_datetime.replace(minute=(appointment_datetime.minute // 30) * 30, second=0, microsecond=0)
-
-    slots_to_check = []
-    current_slot_start = slot_start
-    while current_slot_start < appointment_end_datetime:
-        current_slot_end = current_slot_start + timedelta(minutes=TimeConstants.TREATMENT_UNIT_MINUTES)
-        slots_to_check.append((current_slot_start, current_slot_end))
-        current_slot_start = current_slot_end
-
-    # 모든 취소되지 않은 예약 조회
-    all_appointments = await Appointment.get_active_with_treatment(session=session)
+    # 예약이 걸치는 30분 슬롯 범위 (첫 슬롯 시작 ~ 마지막 슬롯 종료, 슬롯별 확인은 validate_capacity_in_schedule)
+    # 마지막 슬롯 중 예약 종료 이후에 시작하는 예약도 해당 슬롯 인원에 포함되므로 조회 종료는 예약 종료가 아닌 슬롯 종료
+    unit = timedelta(minutes=TimeConstants.TREATMENT_UNIT_MINUTES.value)
+    first_slot_start = _floor_to_treatment_unit(appointment_datetime)
+    last_slot_end = first_slot_start + -(-(appointment_end_datetime - first_slot_start) // unit) * unit
+
+    # 걸치는 슬롯과 겹칠 수 있는 취소되지 않은 예약만 조회
+    nearby_appointments = await Appointment.get_active_with_treatment_between(
+        session=session,
+        start_datetime=first_slot_start - timedelta(minutes=max_duration_minutes),
+        end_datetime=last_slot_end,
+    )
 
     # 요일 변환
     day_of_week_enum = None
     if day_of_week is not None:
         day_of_week_enum = DayOfWeek(day_of_week)
 
-    # 각 슬롯별로 수용 인원 확인
-    for slot_start_time, slot_end_time in slots_to_check:
-        slot_time = slot_start_time.time()
+    # 요일 × 30분 단위 수용 인원 매트릭스 (캐시)
+    capacity_matrix = await hospital_capacity_matrix_cache.get(session=session)
+
+    validate_capacity_in_schedule(
+        appointments=[*nearby_appointments, *holds],
+        appointment_datetime=appointment_datetime,
+        appointment_end_datetime=appointment_end_datetime,
+        capacity_matrix=capacity_matrix,
+        day_of_week=day_of_week_enum,
+    )
+
+
+def validate_no_duplicate_in_schedule(
+    appointments: Iterable[AppointmentWithTreatmentData],
+    doctor_id: int,
+    appointment_datetime: datetime,
+    appointment_end_datetime: datetime,
+) -> None:
+    """이미 조회한 예약 목록 기준 중복 예약 검증 (일괄 생성 시 메모리 내 검증용)"""
+    for data in appointments:
+        if data.doctor_id != doctor_id:
+            continue
+        existing_end = data.appointment_datetime + timedelta(minutes=data.treatment_duration_minutes)
+        if appointment_datetime < existing_end and data.appointment_datetime < appointment_end_datetime:
+            raise MediSolveAiException(ErrorMessages.APPOINTMENT_ALREADY_EXISTS)
 
-        max_capacity = await HospitalSlot.get_default_capacity(
-            session=session,
-            slot_time=slot_time,
-            day_of_week=day_of_week_enum,
-        )
+
+def validate_capacity_in_schedule(
+    appointments: Sequence[AppointmentWithTreatmentData],
+    appointment_datetime: datetime,
+    appointment_end_datetime: datetime,
+    capacity_matrix: HospitalCapacityMatrix,
+    day_of_week: DayOfWeek | None,
+) -> None:
+    """
+    이미 조회한 예약 목록 기준 병원 시간대별 최대 인원수 검증
+
+    appointments는 예약이 걸치는 30분 슬롯과 겹칠 수 있는 예약을 모두 포함해야 함
+    """
+    unit_minutes = TimeConstants.TREATMENT_UNIT_MINUTES.value
+    slot_start_time = _floor_to_treatment_unit(appointment_datetime)
+
+    # 각 슬롯별로 수용 인원 확인
+    while slot_start_time < appointment_end_datetime:
+        slot_end_time = slot_start_time + timedelta(minutes=unit_minutes)
+        max_capacity = capacity_matrix.get_capacity(slot_start_time.time(), day_of_week)
 
         # 겹치는 예약 수 계산
         count = 0
-        for data in all_appointments:
+        for data in appointments:
             appointment_end = data.appointment_datetime + timedelta(minutes=data.treatment_duration_minutes)
 
             is_overlapping = data.appointment_datetime < slot_end_time and slot_start_time < appointment_end
@@ -183,3 +143,11 @@ async def validate_slot_capacity(
         # 수용 인원 초과 시 에러 발생
         if count >= max_capacity:
             raise MediSolveAiException(ErrorMessages.APPOINTMENT_CAPACITY_FULL)
+
+        slot_start_time = slot_end_time
+
+
+def _floor_to_treatment_unit(value: datetime) -> datetime:
+    """value가 속한 30분 슬롯의 시작 시각"""
+    unit_minutes = TimeConstants.TREATMENT_UNIT_MINUTES.value
+    return value.replace(minute=(value.minute // unit_minutes) * unit_minutes, second=0, microsecond=0)
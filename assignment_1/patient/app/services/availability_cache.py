@@ -0,0 +1,187 @@
+"""
+Availability Cache
+
+(의사, 날짜, 진료 소요 시간)별 예약 가능 시간 계산 결과 캐시
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime
+
+from app.core.configs.settings import settings
+from app.core.constants import CacheNames
+from app.services.cache_version_registry import cache_version_registry
+
+# (의사 ID, 날짜, 진료 소요 시간(분))
+AvailabilityCacheKey = tuple[int, date, int]
+
+
+@dataclass(frozen=True)
+class AvailabilityCacheStamp:
+    """
+    계산 시점의 캐시 버전 묶음
+
+    - 버전 중 하나라도 바뀌면 해당 항목은 무효
+    - generation: 같은 프로세스에서 직접 무효화한 횟수 (전체, 날짜별)
+    """
+
+    hospital_slots_version: int
+    doctors_version: int
+    treatments_version: int
+    appointments_version: int
+    appointments_purged_version: int
+    generation: tuple[int, int]
+
+
+@dataclass(frozen=True)
+class AvailabilityCacheEntry:
+    """캐시 항목 (valid_until: 계산에 포함된 예약 선점 중 가장 이른 만료 일시, 지나면 무효)"""
+
+    available_times: tuple[str, ...]
+    stamp: AvailabilityCacheStamp
+    valid_until: datetime | None = None
+
+
+class AvailabilityCache:
+    """
+    예약 가능 시간 LRU 캐시
+
+    - 같은 프로세스의 예약 생성/취소는 invalidate_date로 즉시 무효화
+    - 다른 프로세스(Admin)의 변경은 cache_versions 버전 비교로 무효화 (동기화 주기만큼 지연 가능)
+    - 예약 선점이 포함된 항목은 가장 이른 선점 만료 시각까지만 유효 (만료된 선점이 계속 빠져 보이지 않도록)
+    - 최대 항목 수를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+    - 지난 날짜의 항목과 날짜별 무효화 세대는 prune_dates_before로 제거
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[AvailabilityCacheKey, AvailabilityCacheEntry] = OrderedDict()
+        self._keys_by_date: dict[date, set[AvailabilityCacheKey]] = {}
+        self._generation = 0
+        # 날짜별 무효화 세대는 날짜마다 다시 세지 않고 한 번호열에서 발급 (제거한 날짜의 세대 번호가 다시 나오지 않도록)
+        self._date_generations: dict[date, int] = {}
+        self._date_generation_seq = 0
+        self._pruned_before: date | None = None
+        self._pruned_generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def get_stamp(self, appointment_date: date) -> AvailabilityCacheStamp:
+        """현재 캐시 버전 묶음 (cache_version_registry.sync 이후 호출)"""
+        return AvailabilityCacheStamp(
+            hospital_slots_version=cache_version_registry.get_version(CacheNames.HOSPITAL_SLOTS),
+            doctors_version=cache_version_registry.get_version(CacheNames.DOCTORS),
+            treatments_version=cache_version_registry.get_version(CacheNames.TREATMENTS),
+            appointments_version=cache_version_registry.get_version(CacheNames.appointments(appointment_date)),
+            appointments_purged_version=cache_version_registry.get_version(CacheNames.APPOINTMENTS_PURGED),
+            generation=self._get_generation(appointment_date),
+        )
+
+    def get(
+        self, doctor_id: int, appointment_date: date, duration_minutes: int, stamp: AvailabilityCacheStamp
+    ) -> list[str] | None:
+        """유효한 캐시 항목이 있으면 예약 가능 시간 반환, 없으면 None"""
+        key = (doctor_id, appointment_date, duration_minutes)
+        entry = self._entries.get(key)
+        if entry is None or entry.stamp != stamp:
+            self._misses += 1
+            return None
+        if entry.valid_until is not None and entry.valid_until <= datetime.now():
+            del self._entries[key]
+            self._discard_date_key(key)
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return list(entry.available_times)
+
+    def put(
+        self,
+        doctor_id: int,
+        appointment_date: date,
+        duration_minutes: int,
+        available_times: list[str],
+        stamp: AvailabilityCacheStamp,
+        valid_until: datetime | None = None,
+    ) -> None:
+        """계산 결과 저장 (계산 도중 해당 날짜가 무효화되었으면 저장하지 않음)"""
+        if stamp.generation != self._get_generation(appointment_date):
+            return
+
+        key = (doctor_id, appointment_date, duration_minutes)
+        self._entries[key] = AvailabilityCacheEntry(
+            available_times=tuple(available_times), stamp=stamp, valid_until=valid_until
+        )
+        self._entries.move_to_end(key)
+        self._keys_by_date.setdefault(appointment_date, set()).add(key)
+
+        while len(self._entries) > self._max_entries:
+            evicted_key, _ = self._entries.popitem(last=False)
+            self._discard_date_key(evicted_key)
+            self._evictions += 1
+
+    def invalidate_date(self, appointment_date: date) -> None:
+        """해당 날짜의 항목 전체 무효화 (예약 생성/취소 후 호출)"""
+        self._date_generation_seq += 1
+        self._date_generations[appointment_date] = self._date_generation_seq
+        for key in self._keys_by_date.pop(appointment_date, set()):
+            del self._entries[key]
+            self._invalidations += 1
+
+    def prune_dates_before(self, before_date: date) -> None:
+        """
+        before_date 이전 날짜의 항목과 날짜별 무효화 세대 제거 (날짜마다 늘어나는 항목 정리)
+
+        제거한 날짜는 새 세대 번호로 바뀌므로 제거 전에 계산을 시작한 결과는 저장되지 않음
+        """
+        self._date_generation_seq += 1
+        self._pruned_before = before_date
+        self._pruned_generation = self._date_generation_seq
+        for appointment_date in [day for day in self._date_generations if day < before_date]:
+            del self._date_generations[appointment_date]
+        for appointment_date in [day for day in self._keys_by_date if day < before_date]:
+            for key in self._keys_by_date.pop(appointment_date):
+                del self._entries[key]
+                self._invalidations += 1
+
+    def invalidate(self) -> None:
+        """전체 항목 무효화"""
+        self._generation += 1
+        self._invalidations += len(self._entries)
+        self._entries.clear()
+        self._keys_by_date.clear()
+
+    def get_stats(self) -> dict[str, int]:
+        """캐시 지표 (적중/미스/제거/무효화 횟수, 현재 항목 수)"""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "invalidations": self._invalidations,
+            "size": len(self._entries),
+            "max_entries": self._max_entries,
+        }
+
+    def _get_generation(self, appointment_date: date) -> tuple[int, int]:
+        """현재 무효화 세대 (전체, 날짜별)"""
+        is_pruned = self._pruned_before is not None and appointment_date < self._pruned_before
+        default_generation = self._pruned_generation if is_pruned else 0
+        return self._generation, self._date_generations.get(appointment_date, default_generation)
+
+    def _discard_date_key(self, key: AvailabilityCacheKey) -> None:
+        """날짜별 키 색인에서 제거"""
+        _, appointment_date, _ = key
+        date_keys = self._keys_by_date.get(appointment_date)
+        if date_keys is None:
+            return
+        date_keys.discard(key)
+        if not date_keys:
+            del self._keys_by_date[appointment_date]
+
+
+availability_cache = AvailabilityCache(max_entries=settings.availability_cache_max_entries)
@@ -0,0 +1,199 @@
+"""
+Booking Locks
+
+예약 생성 동시성 제어 (MySQL 네임드 락)
+
+- 의사 중복 예약: (의사, 날짜) 단위 잠금
+- 병원 수용 인원: (날짜, 30분 단위) 잠금
+- 서로 다른 의사/시간대 예약은 잠금이 겹치지 않아 병렬로 처리
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import random
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import Any, TypeVar
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.core.configs.settings import settings
+from app.core.constants import ErrorMessages, LockNames, TimeConstants
+from app.core.exceptions import MediSolveAiException
+
+T = TypeVar("T")
+
+# 재시도 대상 MySQL 에러 코드 (InnoDB 데드락, 잠금 대기 시간 초과, 네임드 락 데드락)
+RETRYABLE_ERROR_CODES = frozenset({1213, 1205, 3058})
+
+
+class BookingLockTimeoutError(MediSolveAiException):
+    """예약 잠금 대기 시간 초과"""
+
+    def __init__(self) -> None:
+        super().__init__(ErrorMessages.APPOINTMENT_LOCK_TIMEOUT)
+
+
+class BookingLockMetrics:
+    """예약 잠금 지표 (획득/대기 시간/시간 초과/재시도)"""
+
+    def __init__(self) -> None:
+        self.acquisitions = 0
+        self.timeouts = 0
+        self.retries = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record_wait(self, wait_seconds: float, acquired: bool) -> None:
+        """잠금 대기 시간 기록"""
+        if acquired:
+            self.acquisitions += 1
+        else:
+            self.timeouts += 1
+        self.wait_seconds_total += wait_seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, wait_seconds)
+
+    def get_stats(self) -> dict[str, Any]:
+        """잠금 지표"""
+        attempts = self.acquisitions + self.timeouts
+        return {
+            "acquisitions": self.acquisitions,
+            "timeouts": self.timeouts,
+            "retries": self.retries,
+            "wait_seconds_total": round(self.wait_seconds_total, 6),
+            "wait_seconds_avg": round(self.wait_seconds_total / attempts, 6) if attempts else 0.0,
+            "wait_seconds_max": round(self.wait_seconds_max, 6),
+        }
+
+
+booking_lock_metrics = BookingLockMetrics()
+
+
+def get_booking_lock_names(
+    doctor_id: int, start_datetime: datetime, end_datetime: datetime, include_doctor_lock: bool = True
+) -> list[str]:
+    """
+    예약에 필요한 잠금 이름 목록 (정렬된 순서)
+
+    - 모든 요청이 같은 순서로 잠금을 획득하므로 잠금 간 교착이 생기지 않음
+    - include_doctor_lock=False: 의사 중복을 점유 구간 유니크 키로 판단하는 경우 (30분 단위 잠금만)
+    """
+    unit_minutes = TimeConstants.TREATMENT_UNIT_MINUTES.value
+    unit_start = start_datetime.replace(
+        minute=start_datetime.minute // unit_minutes * unit_minutes, second=0, microsecond=0
+    )
+
+    lock_names = [LockNames.doctor_day(doctor_id, start_datetime.date())] if include_doctor_lock else []
+    while unit_start < end_datetime:
+        lock_names.append(LockNames.capacity_unit(unit_start))
+        unit_start += timedelta(minutes=unit_minutes)
+
+    return sorted(lock_names)
+
+
+@asynccontextmanager
+async def hold_booking_locks(session: AsyncSession, lock_names: list[str]) -> AsyncIterator[None]:
+    """
+    네임드 락을 획득한 상태로 블록 실행 (블록 종료 시 모두 해제)
+
+    - 네임드 락은 획득한 커넥션에 묶이므로 커넥션을 고정한 세션(get_pinned_async_session)에서만 사용
+      (기본 세션은 블록 안의 커밋에서 커넥션을 풀에 반환해, 해제가 다른 커넥션에서 실행되고 잠금이 남음)
+    - 잠금 이전 조회(캐시 동기화 등)로 시작된 트랜잭션은 먼저 종료 → 잠금 이후 조회가 최신 커밋을 보도록 (REPEATABLE READ 스냅샷 방지)
+    - 네임드 락은 트랜잭션이 아닌 연결 단위이므로 커밋/롤백 후 명시적으로 해제
+    """
+    connection = _get_pinned_connection(session)
+    if session.in_transaction():
+        await session.commit()
+
+    await _acquire(session=session, connection=connection, lock_names=lock_names)
+    try:
+        yield
+    finally:
+        await _release_all(session=session, connection=connection)
+
+
+async def run_with_booking_retry(operation: Callable[[], Awaitable[T]]) -> T:
+    """데드락/잠금 대기 시간 초과 시 지수 백오프(+지터) 후 전체 트랜잭션 재시도"""
+    max_attempts = settings.booking_retry_max_attempts
+    for attempt in range(1, max_attempts + 1):
+        try:
+            return await operation()
+        except DBAPIError as error:
+            if attempt == max_attempts or _get_error_code(error) not in RETRYABLE_ERROR_CODES:
+                raise
+        except BookingLockTimeoutError:
+            if attempt == max_attempts:
+                raise
+
+        booking_lock_metrics.retries += 1
+        backoff_seconds = settings.booking_retry_backoff_seconds * 2 ** (attempt - 1)
+        await asyncio.sleep(backoff_seconds * random.uniform(0.5, 1.5))
+
+    raise AssertionError("unreachable")
+
+
+async def _acquire(session: AsyncSession, connection: AsyncConnection, lock_names: list[str]) -> None:
+    """
+    잠금을 이름 순서대로 하나씩 획득 (하나라도 실패하면 뒤의 잠금은 시도하지 않고 전부 해제 후 예외)
+
+    - 앞의 잠금을 얻지 못한 채 뒤의 잠금을 잡고 기다리지 않으므로 요청 간 잠금 순서가 항상 같음
+    - 대기 시간은 잠금 전체 합계 기준 (잠금마다 남은 대기 시간만큼만 대기)
+    """
+    started_at = time.perf_counter()
+    deadline = started_at + settings.booking_lock_timeout_seconds
+    acquired = True
+    try:
+        for lock_name in sorted(lock_names):
+            timeout = max(math.ceil(deadline - time.perf_counter()), 0)
+            result = await session.scalar(
+                text("SELECT GET_LOCK(:name, :timeout)"), {"name": lock_name, "timeout": timeout}
+            )
+            if result != 1:
+                acquired = False
+                break
+    except DBAPIError:
+        booking_lock_metrics.record_wait(time.perf_counter() - started_at, acquired=False)
+        await _release_all(session=session, connection=connection)
+        raise
+    booking_lock_metrics.record_wait(time.perf_counter() - started_at, acquired=acquired)
+
+    if not acquired:
+        await _release_all(session=session, connection=connection)
+        raise BookingLockTimeoutError()
+
+
+async def _release_all(session: AsyncSession, connection: AsyncConnection) -> None:
+    """
+    고정된 커넥션의 네임드 락 모두 해제 후 남은 트랜잭션 롤백 (실패 시 연결을 폐기해 서버가 잠금을 해제하도록)
+
+    해제를 먼저 실행 (실패한 트랜잭션의 세션은 롤백 전까지 쿼리를 실행할 수 없으므로 커넥션에서 직접 실행,
+    네임드 락 해제는 트랜잭션과 무관하므로 이후 롤백에 영향받지 않음)
+    """
+    try:
+        await connection.execute(text("SELECT RELEASE_ALL_LOCKS()"))
+        await session.rollback()
+        if connection.in_transaction():
+            await connection.rollback()
+    except SQLAlchemyError:
+        await connection.invalidate()
+
+
+def _get_pinned_connection(session: AsyncSession) -> AsyncConnection:
+    """세션이 고정된 커넥션 (커넥션을 고정하지 않은 세션이면 예외)"""
+    if not isinstance(session.bind, AsyncConnection):
+        raise RuntimeError("예약 잠금은 커넥션을 고정한 세션(get_pinned_async_session)에서만 사용할 수 있습니다.")
+    return session.bind
+
+
+def _get_error_code(error: DBAPIError) -> int | None:
+    """DBAPI 예외의 MySQL 에러 코드"""
+    args = getattr(error.orig, "args", ())
+    if args and isinstance(args[0], int):
+        return args[0]
+    return None
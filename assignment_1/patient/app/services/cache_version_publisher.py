@@ -0,0 +1,97 @@
+"""
+Cache Version Publisher
+
+예약 변경 후 날짜별 예약 현황 캐시 버전 증가 (다른 프로세스의 예약 가능 시간 캐시 무효화용)
+
+- 예약 트랜잭션 안에서 버전을 올리면 같은 날짜의 예약이 모두 한 행의 잠금을 커밋까지 기다리므로,
+  예약 커밋과 예약 잠금 해제 후 별도의 짧은 트랜잭션에서 증가
+- 날짜마다 한 행씩 늘어나므로 보관 기간이 지난 날짜의 행은 정리 주기마다 일부 삭제
+  (같은 날짜 이전의 인메모리 버전/무효화 세대도 함께 제거)
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import date, timedelta
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.configs.settings import settings
+from app.core.constants import CacheNames
+from app.models.cache_version import CacheVersion
+from app.services.availability_cache import availability_cache
+from app.services.cache_version_registry import cache_version_registry
+
+
+class CacheVersionPublisher:
+    """예약 현황 버전 증가 및 지난 날짜 정리 (지표 포함)"""
+
+    def __init__(self, retention_days: int, purge_interval_seconds: float, purge_batch_size: int) -> None:
+        self._retention_days = retention_days
+        self._purge_interval_seconds = purge_interval_seconds
+        self._purge_batch_size = purge_batch_size
+        # 시작 직후 요청에 정리 쿼리가 더해지지 않도록 첫 정리는 한 주기 뒤
+        self._purged_at = time.monotonic()
+        self._published = 0
+        self._failures = 0
+        self._purge_runs = 0
+        self._purged = 0
+
+    async def publish_appointment_dates(self, session: AsyncSession, dates: list[date]) -> None:
+        """
+        날짜별 예약 현황 버전 증가 후 커밋 (예약 커밋 후 호출)
+
+        - 여러 날짜는 이름 순으로 한 번에 증가 (요청 간 행 잠금 순서를 같게 유지)
+        - 예약은 이미 커밋되었으므로 실패해도 예외 없이 실패 지표만 기록 (같은 프로세스 캐시는 호출 측에서 직접 무효화)
+        """
+        names = sorted({CacheNames.appointments(appointment_date) for appointment_date in dates})
+        if not names:
+            return
+        try:
+            await CacheVersion.bump_many(session=session, names=names)
+            await self._purge_if_due(session=session)
+            await session.commit()
+        except SQLAlchemyError:
+            await session.rollback()
+            self._failures += 1
+            return
+        self._published += len(names)
+
+    async def _purge_if_due(self, session: AsyncSession) -> None:
+        """
+        정리 주기가 지났으면 보관 기간이 지난 날짜의 버전 최대 purge_batch_size건 삭제
+
+        삭제한 날짜는 다시 변경되면 버전 1부터 시작하므로, 삭제 전 버전으로 저장된 캐시 항목과 구분되도록 정리 버전도 증가
+        같은 날짜 이전의 인메모리 버전과 예약 가능 시간 캐시의 날짜별 항목도 제거
+        """
+        monotonic_now = time.monotonic()
+        if monotonic_now - self._purged_at < self._purge_interval_seconds:
+            return
+        self._purged_at = monotonic_now
+        self._purge_runs += 1
+        before_date = date.today() - timedelta(days=self._retention_days)
+        cache_version_registry.prune_appointment_versions_before(before_date)
+        availability_cache.prune_dates_before(before_date)
+        deleted = await CacheVersion.delete_appointments_before(
+            session=session, before_date=before_date, limit=self._purge_batch_size
+        )
+        if deleted:
+            await CacheVersion.bump(session=session, name=CacheNames.APPOINTMENTS_PURGED)
+            self._purged += deleted
+
+    def get_stats(self) -> dict[str, int]:
+        """지표 (증가한 버전 수, 증가 실패 횟수, 정리 실행 횟수, 삭제 건수)"""
+        return {
+            "published": self._published,
+            "failures": self._failures,
+            "purge_runs": self._purge_runs,
+            "purged": self._purged,
+        }
+
+
+cache_version_publisher = CacheVersionPublisher(
+    retention_days=settings.cache_version_retention_days,
+    purge_interval_seconds=settings.cache_version_purge_interval_seconds,
+    purge_batch_size=settings.cache_version_purge_batch_size,
+)
@@ -0,0 +1,66 @@
+"""
+Cache Version Registry
+
+cache_versions 값을 주기적으로 읽어 인메모리 캐시의 유효성을 판단
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.configs.settings import settings
+from app.core.constants import CacheNames
+from app.models.cache_version import CacheVersion
+
+# 커밋이 늦게 반영된 변경을 놓치지 않도록 마지막 변경 시각보다 이만큼 앞에서부터 다시 읽음
+SYNC_OVERLAP = timedelta(seconds=60)
+
+
+class CacheVersionRegistry:
+    """캐시 버전 저장소 (동기화 주기 내에서는 DB를 조회하지 않음)"""
+
+    def __init__(self, sync_interval_seconds: float) -> None:
+        self._sync_interval_seconds = sync_interval_seconds
+        self._versions: dict[str, int] = {}
+        self._synced_at: float | None = None
+        self._last_updated_at: datetime | None = None
+
+    async def sync(self, session: AsyncSession) -> None:
+        """동기화 주기가 지났으면 DB에서 최근 변경된 캐시 버전을 다시 읽음"""
+        now = time.monotonic()
+        if self._synced_at is not None and now - self._synced_at < self._sync_interval_seconds:
+            return
+
+        updated_since = None if self._last_updated_at is None else self._last_updated_at - SYNC_OVERLAP
+        cache_versions = await CacheVersion.get_versions(session=session, updated_since=updated_since)
+        for cache_version in cache_versions:
+            self._versions[cache_version.name] = cache_version.version
+            if self._last_updated_at is None or cache_version.updated_at > self._last_updated_at:
+                self._last_updated_at = cache_version.updated_at
+        self._synced_at = now
+
+    def get_version(self, name: str) -> int:
+        """마지막으로 동기화된 캐시 버전 (없으면 0)"""
+        return self._versions.get(name, 0)
+
+    def prune_appointment_versions_before(self, before_date: date) -> None:
+        """
+        before_date 이전 날짜의 예약 현황 버전 제거 (날짜마다 늘어나는 항목 정리, 지난 날짜의 DB 행 정리와 함께 호출)
+
+        제거한 날짜의 버전은 다시 변경되어 동기화될 때까지 0으로 조회
+        """
+        # 날짜는 ISO 형식이므로 같은 접두사의 이름끼리 문자열 비교 순서가 날짜 순서와 같음
+        before_name = CacheNames.appointments(before_date)
+        for name in [name for name in self._versions if name.startswith(CacheNames.APPOINTMENTS_PREFIX)]:
+            if name < before_name:
+                del self._versions[name]
+
+    def expire(self) -> None:
+        """다음 sync 호출 시 DB에서 다시 읽도록 만료"""
+        self._synced_at = None
+
+
+cache_version_registry = CacheVersionRegistry(sync_interval_seconds=settings.cache_version_sync_seconds)
@@ -6,16 +6,21 @@ Doctor Service
 
 from __future__ import annotations
 
+from app.core.constants import CacheNames
 from app.core.database.connection_async import get_async_session
 from app.dtos.doctor import DoctorResponse
+from app.models.cache_version import CacheVersion
 from app.models.doctor import Doctor
+from app.services.reference_data_cache import doctor_cache
 
 
 async def service_create_doctor(name: str, department: str, is_active: bool = True) -> Doctor:
     """의사 생성"""
     async with get_async_session() as session:
         doctor = await Doctor.create_one(session=session, name=name, department=department, is_active=is_active)
+        await CacheVersion.bump(session=session, name=CacheNames.DOCTORS)
         await session.commit()
+        doctor_cache.invalidate()
         return doctor
 
 
@@ -0,0 +1,83 @@
+"""
+Hospital Capacity
+
+병원 시간대별 최대 수용 인원 매트릭스 (요일 × 30분 단위)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import time
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.constants import CacheNames, DayOfWeek, TimeConstants
+from app.models.hospital_slot import HospitalSlot
+from app.services.appointment_occupancy import UNIT_MINUTES, UNITS_PER_DAY
+from app.services.cache_version_registry import cache_version_registry
+
+
+class HospitalCapacityMatrix:
+    """
+    활성 HospitalSlot 규칙을 미리 계산한 수용 인원 매트릭스
+
+    - 키 None: 요일 정보 없이 조회하는 경우 (요일 공통 슬롯만 적용)
+    - 각 단위 시작 시각을 포함하는 슬롯 중 첫 번째(ID 순) 슬롯의 max_capacity 사용, 없으면 기본값
+    """
+
+    def __init__(self, capacities: dict[DayOfWeek | None, list[int]]) -> None:
+        self._capacities = capacities
+
+    @classmethod
+    def compile(cls, slots: Sequence[HospitalSlot]) -> HospitalCapacityMatrix:
+        """활성 슬롯 목록(ID 순)으로 매트릭스 생성"""
+        unit_times = [time(unit * UNIT_MINUTES // 60, unit * UNIT_MINUTES % 60) for unit in range(UNITS_PER_DAY)]
+
+        capacities: dict[DayOfWeek | None, list[int]] = {}
+        for day_of_week in [None, *DayOfWeek]:
+            day_slots = [slot for slot in slots if slot.day_of_week is None or slot.day_of_week == day_of_week]
+            capacities[day_of_week] = [
+                next(
+                    (slot.max_capacity for slot in day_slots if slot.is_time_in_slot(unit_time)),
+                    TimeConstants.DEFAULT_CAPACITY.value,
+                )
+                for unit_time in unit_times
+            ]
+
+        return cls(capacities=capacities)
+
+    def get_unit_capacities(self, day_of_week: DayOfWeek | None) -> list[int]:
+        """해당 요일의 30분 단위별 최대 수용 인원 (길이 UNITS_PER_DAY)"""
+        return self._capacities[day_of_week]
+
+    def get_capacity(self, slot_time: time, day_of_week: DayOfWeek | None) -> int:
+        """해당 시각이 속한 30분 단위의 최대 수용 인원"""
+        unit = (slot_time.hour * 60 + slot_time.minute) // UNIT_MINUTES
+        return self._capacities[day_of_week][unit]
+
+
+class HospitalCapacityMatrixCache:
+    """수용 인원 매트릭스 캐시 (hospital_slots 캐시 버전이 바뀌면 다시 생성)"""
+
+    def __init__(self) -> None:
+        self._matrix: HospitalCapacityMatrix | None = None
+        self._version: int | None = None
+
+    async def get(self, session: AsyncSession) -> HospitalCapacityMatrix:
+        """현재 버전의 매트릭스 반환 (버전 변경 또는 무효화 시에만 DB 조회)"""
+        await cache_version_registry.sync(session=session)
+        version = cache_version_registry.get_version(CacheNames.HOSPITAL_SLOTS)
+
+        if self._matrix is None or self._version != version:
+            slots = await HospitalSlot.get_all_active(session=session)
+            self._matrix = HospitalCapacityMatrix.compile(slots)
+            self._version = version
+
+        return self._matrix
+
+    def invalidate(self) -> None:
+        """매트릭스 폐기 (다음 조회 시 다시 생성)"""
+        self._matrix = None
+
+
+hospital_capacity_matrix_cache = HospitalCapacityMatrixCache()
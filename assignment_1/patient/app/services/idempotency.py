@@ -0,0 +1,174 @@
+"""
+Idempotency
+
+Idempotency-Key 헤더로 재시도된 예약 생성/취소 요청에 첫 응답을 그대로 반환
+
+- 첫 요청: 키를 처리 중 상태로 선점 → 서비스 실행 → 응답(성공 또는 업무 오류)을 저장
+- 같은 키의 재시도: 서비스를 다시 실행하지 않고 저장된 응답 반환
+- 잠금 대기 시간 초과/DB 오류처럼 재시도하면 성공할 수 있는 실패는 저장하지 않고 키를 해제
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.configs.settings import settings
+from app.core.constants import ErrorMessages
+from app.core.database.connection_async import get_async_session
+from app.core.exceptions import MediSolveAiException
+from app.models.idempotency_key import IdempotencyKey
+from app.services.booking_locks import BookingLockTimeoutError
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+IDEMPOTENT_REPLAYED_HEADER = "Idempotent-Replayed"
+
+ResponseT = TypeVar("ResponseT", bound=BaseModel)
+
+
+class IdempotencyStore:
+    """멱등성 키 처리 (저장/재사용 지표 포함)"""
+
+    def __init__(self, purge_interval_seconds: float) -> None:
+        self._purge_interval_seconds = purge_interval_seconds
+        self._purged_at: float | None = None
+        self._stored = 0
+        self._replays = 0
+        self._conflicts = 0
+        self._released = 0
+
+    async def run(
+        self,
+        *,
+        scope: str,
+        idempotency_key: str | None,
+        payload: dict[str, Any],
+        status_code: int,
+        operation: Callable[[], Awaitable[ResponseT]],
+    ) -> ResponseT | JSONResponse:
+        """
+        멱등성 키가 있으면 저장된 응답을 재사용하고, 없으면 operation 실행 후 응답 저장
+
+        Args:
+            scope: 요청 종류 (IdempotencyScopes)
+            idempotency_key: Idempotency-Key 헤더 값 (없으면 그대로 실행)
+            payload: 요청 내용 (같은 키로 다른 요청이 오면 거부하기 위한 비교용)
+            status_code: 성공 응답 상태 코드
+            operation: 서비스 호출
+        """
+        if idempotency_key is None:
+            return await operation()
+
+        request_hash = _hash_payload(payload)
+        async with get_async_session() as session:
+            await self._purge_expired_if_due(session=session)
+            is_reserved = await IdempotencyKey.reserve(
+                session=session,
+                scope=scope,
+                idempotency_key=idempotency_key,
+                request_hash=request_hash,
+                lease_seconds=settings.idempotency_lease_seconds,
+            )
+            stored = None
+            if not is_reserved:
+                stored = await IdempotencyKey.get(session=session, scope=scope, idempotency_key=idempotency_key)
+            await session.commit()
+
+        if not is_reserved:
+            return self._replay(stored=stored, request_hash=request_hash)
+
+        try:
+            response = await operation()
+        except BookingLockTimeoutError:
+            await self._release(scope=scope, idempotency_key=idempotency_key)
+            raise
+        except MediSolveAiException as error:
+            # 업무 오류는 재시도해도 같은 결과이므로 예외 핸들러와 같은 응답을 저장
+            await self._complete(
+                scope=scope,
+                idempotency_key=idempotency_key,
+                status_code=400,
+                response_body={"message": error.message, "details": jsonable_encoder(error.details)},
+            )
+            raise
+        except Exception:
+            await self._release(scope=scope, idempotency_key=idempotency_key)
+            raise
+
+        await self._complete(
+            scope=scope,
+            idempotency_key=idempotency_key,
+            status_code=status_code,
+            response_body=jsonable_encoder(response),
+        )
+        return response
+
+    def get_stats(self) -> dict[str, int]:
+        """멱등성 키 지표 (저장/재사용/충돌/해제 횟수)"""
+        return {
+            "stored": self._stored,
+            "replays": self._replays,
+            "conflicts": self._conflicts,
+            "released": self._released,
+        }
+
+    def _replay(self, stored: IdempotencyKey | None, request_hash: str) -> JSONResponse:
+        """저장된 응답 반환 (다른 요청이거나 아직 처리 중이면 예외)"""
+        if stored is None or not stored.is_completed:
+            # stored가 None: 선점 직후 만료/해제된 경우 → 처리 중과 같게 재시도 유도
+            self._conflicts += 1
+            raise MediSolveAiException(ErrorMessages.IDEMPOTENCY_REQUEST_IN_PROGRESS)
+        if stored.request_hash != request_hash:
+            self._conflicts += 1
+            raise MediSolveAiException(ErrorMessages.IDEMPOTENCY_KEY_REUSED)
+
+        self._replays += 1
+        return JSONResponse(
+            status_code=stored.status_code or 200,
+            content=stored.response_body,
+            headers={IDEMPOTENT_REPLAYED_HEADER: "true"},
+        )
+
+    async def _complete(self, scope: str, idempotency_key: str, status_code: int, response_body: Any) -> None:
+        async with get_async_session() as session:
+            await IdempotencyKey.complete(
+                session=session,
+                scope=scope,
+                idempotency_key=idempotency_key,
+                status_code=status_code,
+                response_body=response_body,
+                ttl_seconds=settings.idempotency_ttl_seconds,
+            )
+            await session.commit()
+        self._stored += 1
+
+    async def _release(self, scope: str, idempotency_key: str) -> None:
+        async with get_async_session() as session:
+            await IdempotencyKey.release(session=session, scope=scope, idempotency_key=idempotency_key)
+            await session.commit()
+        self._released += 1
+
+    async def _purge_expired_if_due(self, session: AsyncSession) -> None:
+        """정리 주기가 지났으면 만료된 키 일부 삭제 (요청 경로에서 조금씩 정리)"""
+        now = time.monotonic()
+        if self._purged_at is not None and now - self._purged_at < self._purge_interval_seconds:
+            return
+        self._purged_at = now
+        await IdempotencyKey.delete_expired(session=session, limit=settings.idempotency_purge_batch_size)
+
+
+def _hash_payload(payload: dict[str, Any]) -> str:
+    """요청 내용 해시 (키 순서와 무관하게 같은 요청이면 같은 값)"""
+    serialized = json.dumps(jsonable_encoder(payload), sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+idempotency_store = IdempotencyStore(purge_interval_seconds=settings.idempotency_purge_interval_seconds)
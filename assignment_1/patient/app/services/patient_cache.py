@@ -0,0 +1,112 @@
+"""
+Patient Cache
+
+전화번호별 환자 기본 정보 캐시 (예약 생성/예약 목록 조회 공용)
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.configs.settings import settings
+from app.dtos.patient import PatientData
+from app.models.patient import Patient
+
+
+class PatientCache:
+    """
+    전화번호 → 환자 기본 정보 LRU 캐시
+
+    - 환자 ID/전화번호는 바뀌지 않으므로 캐시된 ID를 그대로 사용
+    - 완료된 진료 존재 여부는 False → True로만 바뀌므로 True인 항목은 DB 조회 없이 사용하고,
+      False인 항목은 예약 생성 시 ID로 다시 확인 (Admin의 완료 처리를 놓치지 않도록)
+    - 트랜잭션 안에서 생성한 환자는 롤백될 수 있으므로 커밋 후 put으로 저장
+    - 최대 항목 수를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, PatientData] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._refreshes = 0
+        self._evictions = 0
+
+    async def get(self, session: AsyncSession, phone: str) -> PatientData | None:
+        """전화번호로 환자 조회 (없으면 DB에서 조회 후 저장)"""
+        patient = self._get_entry(phone)
+        if patient is not None:
+            self._hits += 1
+            return patient
+
+        self._misses += 1
+        patient = await Patient.get_data_by_phone(session=session, phone=phone)
+        if patient is not None:
+            self.put(patient)
+        return patient
+
+    async def get_or_create(self, session: AsyncSession, name: str, phone: str) -> PatientData:
+        """
+        예약 생성용 환자 조회 또는 생성 (저장하지 않음, 커밋 후 put 호출)
+
+        - 재진 환자로 캐시된 경우: DB 조회 없음
+        - 초진 환자로 캐시된 경우: ID로 완료된 진료 여부만 다시 조회
+        - 캐시에 없는 경우: 전화번호로 조회, 없으면 INSERT ... ON DUPLICATE KEY UPDATE 한 문장으로 생성
+
+        캐시에 없을 때 upsert를 먼저 실행하지 않는 이유: upsert는 환자 ID만 반환하므로 기존 환자인지,
+        완료된 진료가 있는지(초진/재진 판단), 저장된 이름(응답)을 알 수 없어 기존 환자는 조회가 한 번 더 필요
+        (조회를 먼저 하면 기존 환자는 조회 한 번, 신규 환자만 조회 + 생성 두 번)
+        """
+        cached = self._get_entry(phone)
+        if cached is not None and cached.has_completed_visit:
+            self._hits += 1
+            return cached
+
+        patient: PatientData | None
+        if cached is not None:
+            self._refreshes += 1
+            patient = await Patient.get_data_by_id(session=session, patient_id=cached.id)
+        else:
+            self._misses += 1
+            patient = await Patient.get_data_by_phone(session=session, phone=phone)
+        if patient is not None:
+            return patient
+
+        # 조회와 생성 사이에 같은 전화번호로 생성되었어도 upsert가 그 환자 ID를 반환 (방금 생성된 환자는 완료된 진료 없음)
+        patient_id = await Patient.upsert(session=session, name=name, phone=phone)
+        return PatientData(id=patient_id, name=name, phone=phone, has_completed_visit=False)
+
+    def put(self, patient: PatientData) -> None:
+        """환자 정보 저장 (커밋된 환자만)"""
+        self._entries[patient.phone] = patient
+        self._entries.move_to_end(patient.phone)
+
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate(self) -> None:
+        """전체 폐기"""
+        self._entries.clear()
+
+    def get_stats(self) -> dict[str, int]:
+        """캐시 지표 (적중/미스/재확인/제거 횟수, 현재 항목 수)"""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "refreshes": self._refreshes,
+            "evictions": self._evictions,
+            "size": len(self._entries),
+            "max_entries": self._max_entries,
+        }
+
+    def _get_entry(self, phone: str) -> PatientData | None:
+        patient = self._entries.get(phone)
+        if patient is not None:
+            self._entries.move_to_end(phone)
+        return patient
+
+
+patient_cache = PatientCache(max_entries=settings.patient_cache_max_entries)
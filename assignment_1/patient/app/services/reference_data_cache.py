@@ -0,0 +1,122 @@
+"""
+Reference Data Cache
+
+예약 경로에서 매번 조회하던 의사/진료 항목 기본 정보 캐시
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from typing import Generic, Protocol, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.constants import CacheNames
+from app.dtos.doctor import DoctorData
+from app.dtos.treatment import TreatmentData
+from app.models.doctor import Doctor
+from app.models.treatment import Treatment
+from app.services.cache_version_registry import cache_version_registry
+
+
+class _HasId(Protocol):
+    @property
+    def id(self) -> int: ...
+
+
+DataT = TypeVar("DataT", bound=_HasId)
+
+
+class VersionedLookupCache(Generic[DataT]):
+    """
+    ID별 조회 캐시 (cache_versions 버전이 바뀌면 전체를 다시 적재)
+
+    - 버전이 같은 동안에는 DB를 조회하지 않음
+    - 적재 이후 다른 프로세스에서 추가된 ID는 한 건만 조회해 채움 (read-through)
+    """
+
+    def __init__(
+        self,
+        cache_name: str,
+        load_all: Callable[[AsyncSession], Awaitable[list[DataT]]],
+        load_one: Callable[[AsyncSession, int], Awaitable[DataT | None]],
+    ) -> None:
+        self._cache_name = cache_name
+        self._load_all = load_all
+        self._load_one = load_one
+        self._items: dict[int, DataT] | None = None
+        self._version: int | None = None
+        self._hits = 0
+        self._misses = 0
+
+    async def get(self, session: AsyncSession, item_id: int) -> DataT | None:
+        """ID로 조회 (없으면 DB에서 한 건 조회 후 저장)"""
+        items = await self._get_items(session=session)
+        item = items.get(item_id)
+        if item is not None:
+            self._hits += 1
+            return item
+
+        self._misses += 1
+        item = await self._load_one(session, item_id)
+        if item is not None:
+            items[item_id] = item
+        return item
+
+    async def get_all(self, session: AsyncSession) -> list[DataT]:
+        """적재된 전체 항목"""
+        items = await self._get_items(session=session)
+        return list(items.values())
+
+    def invalidate(self) -> None:
+        """전체 폐기 (다음 조회 시 다시 적재)"""
+        self._items = None
+
+    def get_stats(self) -> dict[str, int]:
+        """캐시 지표 (적중/미스 횟수, 현재 항목 수)"""
+        return {"hits": self._hits, "misses": self._misses, "size": len(self._items or {})}
+
+    async def _get_items(self, session: AsyncSession) -> dict[int, DataT]:
+        """현재 버전의 항목 (버전 변경 또는 무효화 시에만 전체 적재)"""
+        await cache_version_registry.sync(session=session)
+        version = cache_version_registry.get_version(self._cache_name)
+
+        if self._items is None or self._version != version:
+            self._items = {item.id: item for item in await self._load_all(session)}
+            self._version = version
+
+        return self._items
+
+
+async def _load_doctors(session: AsyncSession) -> list[DoctorData]:
+    return await Doctor.get_all_data(session=session)
+
+
+async def _load_doctor(session: AsyncSession, doctor_id: int) -> DoctorData | None:
+    return await Doctor.get_data_by_id(session=session, doctor_id=doctor_id)
+
+
+async def _load_treatments(session: AsyncSession) -> list[TreatmentData]:
+    return await Treatment.get_all_data(session=session)
+
+
+async def _load_treatment(session: AsyncSession, treatment_id: int) -> TreatmentData | None:
+    return await Treatment.get_data_by_id(session=session, treatment_id=treatment_id)
+
+
+doctor_cache: VersionedLookupCache[DoctorData] = VersionedLookupCache(
+    cache_name=CacheNames.DOCTORS,
+    load_all=_load_doctors,
+    load_one=_load_doctor,
+)
+treatment_cache: VersionedLookupCache[TreatmentData] = VersionedLookupCache(
+    cache_name=CacheNames.TREATMENTS,
+    load_all=_load_treatments,
+    load_one=_load_treatment,
+)
+
+
+async def get_max_treatment_duration_minutes(session: AsyncSession) -> int:
+    """전체 진료 항목(비활성 포함) 중 가장 긴 소요 시간 (기존 예약의 종료 시각 범위 계산용, 진료 항목 캐시 사용)"""
+    treatments = await treatment_cache.get_all(session=session)
+    return max((treatment.duration_minutes for treatment in treatments), default=0)
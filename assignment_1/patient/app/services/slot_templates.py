@@ -0,0 +1,70 @@
+"""
+Slot Templates
+
+진료 소요 시간별 예약 시작 시간대 템플릿 (날짜와 무관하게 미리 계산해 재사용)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import time
+from functools import lru_cache
+
+from app.core.constants import HospitalOperationConstants, TimeConstants
+
+
+@dataclass(frozen=True)
+class SlotTemplate:
+    """
+    하루 중 예약 가능한 시작 시간대 (자정 기준 분, HH:MM 표기)
+
+    - 운영 시간 내 15분 간격
+    - 점심시간과 겹치거나 마감 시간을 넘기는 시간대 제외
+    """
+
+    duration_minutes: int
+    start_minutes: tuple[int, ...]
+    labels: tuple[str, ...]
+
+
+def get_slot_template(duration_minutes: int) -> SlotTemplate:
+    """진료 소요 시간에 맞는 템플릿 (운영 시간 설정값이 바뀌면 새로 생성)"""
+    return _build_slot_template(
+        duration_minutes,
+        HospitalOperationConstants.DEFAULT_OPEN_TIME,
+        HospitalOperationConstants.DEFAULT_CLOSE_TIME,
+        HospitalOperationConstants.DEFAULT_LUNCH_START,
+        HospitalOperationConstants.DEFAULT_LUNCH_END,
+    )
+
+
+@lru_cache(maxsize=64)
+def _build_slot_template(
+    duration_minutes: int, open_time: str, close_time: str, lunch_start: str, lunch_end: str
+) -> SlotTemplate:
+    """운영 시간 설정값과 소요 시간으로 템플릿 생성 (인자 조합별로 한 번만 계산)"""
+    open_minute = _to_minutes(open_time)
+    close_minute = _to_minutes(close_time)
+    lunch_start_minute = _to_minutes(lunch_start)
+    lunch_end_minute = _to_minutes(lunch_end)
+
+    start_minutes = tuple(
+        start_minute
+        for start_minute in range(open_minute, close_minute, TimeConstants.SLOT_INTERVAL_MINUTES)
+        # 점심시간과 겹치지 않음 (겹침 조건: 예약 시작 < 점심 종료 AND 예약 종료 > 점심 시작)
+        if not (start_minute < lunch_end_minute and start_minute + duration_minutes > lunch_start_minute)
+        # 마감 시간을 넘기지 않음
+        and start_minute + duration_minutes <= close_minute
+    )
+
+    return SlotTemplate(
+        duration_minutes=duration_minutes,
+        start_minutes=start_minutes,
+        labels=tuple(f"{start_minute // 60:02d}:{start_minute % 60:02d}" for start_minute in start_minutes),
+    )
+
+
+def _to_minutes(hhmm: str) -> int:
+    """HH:MM 문자열을 자정 기준 분으로 변환"""
+    parsed = time.fromisoformat(hhmm)
+    return parsed.hour * 60 + parsed.minute
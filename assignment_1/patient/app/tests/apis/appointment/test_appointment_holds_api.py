@@ -0,0 +1,284 @@
+"""
+예약 선점 API 테스트
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.configs.settings import settings
+from app.core.constants import AppointmentStatus, ErrorMessages, VisitType
+from app.services.booking_locks import get_booking_lock_names
+from app.tests.mothers import DoctorMother, HospitalSlotMother, TreatmentMother
+from app.tests.test_client import MediSolveAiPatientClient
+from app.tests.utils import get_used_locks, warm_up_pool
+
+
+async def test_appointment_hold_blocks_time_until_confirmed(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+) -> None:
+    """선점한 시간대는 다른 환자가 예약할 수 없고, 확정하면 선점한 환자의 예약이 생성되는지 테스트"""
+    # Given: 의사와 진료 항목 생성 (병렬 처리)
+    doctor, treatment = await asyncio.gather(
+        DoctorMother.create(name="김의사", department="피부과"),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+    )
+    appointment_datetime = datetime(2024, 12, 2, 10, 0)
+
+    # Given: 선점 전 예약 가능 시간 조회 (캐시 적재)
+    before_response = await medisolveai_patient_client.get_available_times(
+        doctor_id=doctor.id, treatment_id=treatment.id, date="2024-12-02"
+    )
+    assert "10:00" in before_response.json()["available_times"]
+
+    # When: 10:00 선점
+    hold_response = await medisolveai_patient_client.create_appointment_hold(
+        patient_phone="010-7777-0000",
+        doctor_id=doctor.id,
+        treatment_id=treatment.id,
+        appointment_datetime=appointment_datetime.isoformat(),
+    )
+
+    # Then: 선점 성공, 만료 일시 포함
+    assert hold_response.status_code == 201
+    hold = hold_response.json()
+    assert hold["doctor_id"] == doctor.id
+    assert hold["duration_minutes"] == 30
+    assert datetime.fromisoformat(hold["expires_at"]) > datetime.now()
+
+    # Then: 선점된 시간은 예약 가능 시간에서 제외되고, 다른 환자의 같은 시간 예약/선점은 실패
+    available_response = await medisolveai_patient_client.get_available_times(
+        doctor_id=doctor.id, treatment_id=treatment.id, date="2024-12-02"
+    )
+    assert "10:00" not in available_response.json()["available_times"]
+    other_create_response = await medisolveai_patient_client.create_appointment(
+        patient_name="다른환자",
+        patient_phone="010-7777-0001",
+        doctor_id=doctor.id,
+        treatment_id=treatment.id,
+        appointment_datetime=datetime(2024, 12, 2, 10, 15).isoformat(),
+    )
+    assert other_create_response.status_code == 400
+    assert other_create_response.json()["message"] == ErrorMessages.APPOINTMENT_ALREADY_EXISTS
+    other_hold_response = await medisolveai_patient_client.create_appointment_hold(
+        patient_phone="010-7777-0001",
+        doctor_id=doctor.id,
+        treatment_id=treatment.id,
+        appointment_datetime=appointment_datetime.isoformat(),
+    )
+    assert other_hold_response.status_code == 400
+    assert other_hold_response.json()["message"] == ErrorMessages.APPOINTMENT_ALREADY_EXISTS
+
+    # When: 선점 확정
+    confirm_response = await medisolveai_patient_client.confirm_appointment_hold(
+        hold_id=hold["id"], patient_name="홍길동", patient_phone="010-7777-0000", memo="선점 확정"
+    )
+
+    # Then: 예약 생성
+    assert confirm_response.status_code == 201
+    appointment = confirm_response.json()
+    assert appointment["doctor_id"] == doctor.id
+    assert appointment["treatment_id"] == treatment.id
+    assert appointment["appointment_datetime"] == appointment_datetime.isoformat()
+    assert appointment["status"] == AppointmentStatus.PENDING.value
+    assert appointment["visit_type"] == VisitType.FIRST_VISIT
+    assert appointment["memo"] == "선점 확정"
+
+    # Then: 예약 목록에서 조회되고, 같은 선점은 다시 확정할 수 없음
+    get_response = await medisolveai_patient_client.get_appointments(patient_phone="010-7777-0000")
+    assert [item["id"] for item in get_response.json()] == [appointment["id"]]
+    reconfirm_response = await medisolveai_patient_client.confirm_appointment_hold(
+        hold_id=hold["id"], patient_name="홍길동", patient_phone="010-7777-0000"
+    )
+    assert reconfirm_response.status_code == 400
+    assert reconfirm_response.json()["message"] == ErrorMessages.APPOINTMENT_HOLD_NOT_FOUND
+
+
+async def test_appointment_hold_counts_toward_slot_capacity(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+) -> None:
+    """선점은 병원 시간대별 수용 인원에 포함되는지 테스트"""
+    # Given: HospitalSlot(11:00~11:30, 최대 1명), 의사 2명, 진료 항목 생성 (병렬 처리)
+    _, doctors, treatment = await asyncio.gather(
+        HospitalSlotMother.create(start_time=time(11, 0), end_time=time(11, 30), max_capacity=1),
+        DoctorMother.create_bulk(count=2, department="피부과"),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+    )
+
+    # Given: 의사1의 11:00 선점
+    hold_response = await medisolveai_patient_client.create_appointment_hold(
+        patient_phone="010-7777-0100",
+        doctor_id=doctors[0].id,
+        treatment_id=treatment.id,
+        appointment_datetime=datetime(2024, 12, 2, 11, 0).isoformat(),
+    )
+    assert hold_response.status_code == 201
+
+    # When: 의사2의 11:00 예약
+    response = await medisolveai_patient_client.create_appointment(
+        patient_name="다른환자",
+        patient_phone="010-7777-0101",
+        doctor_id=doctors[1].id,
+        treatment_id=treatment.id,
+        appointment_datetime=datetime(2024, 12, 2, 11, 0).isoformat(),
+    )
+
+    # Then: 수용 인원 초과, 의사2의 예약 가능 시간에서도 11:00 제외
+    assert response.status_code == 400
+    assert response.json()["message"] == ErrorMessages.APPOINTMENT_CAPACITY_FULL
+    available_response = await medisolveai_patient_client.get_available_times(
+        doctor_id=doctors[1].id, treatment_id=treatment.id, date="2024-12-02"
+    )
+    assert "11:00" not in available_response.json()["available_times"]
+
+
+async def test_expired_appointment_hold_cannot_be_confirmed_and_frees_time(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """만료된 선점은 확정할 수 없고, 만료 후에는 시간대가 다시 예약 가능해지는지 테스트"""
+    # Given: 선점 유지 시간 2초 (만료 일시는 초 단위로 내림), 의사와 진료 항목 생성 (병렬 처리)
+    monkeypatch.setattr(settings, "appointment_hold_seconds", 2)
+    doctor, treatment = await asyncio.gather(
+        DoctorMother.create(name="김의사", department="피부과"),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+    )
+
+    # Given: 10:00 선점 후 예약 가능 시간 조회 (선점이 반영된 결과가 캐시됨)
+    hold_response = await medisolveai_patient_client.create_appointment_hold(
+        patient_phone="010-7777-0200",
+        doctor_id=doctor.id,
+        treatment_id=treatment.id,
+        appointment_datetime=datetime(2024, 12, 2, 10, 0).isoformat(),
+    )
+    held_response = await medisolveai_patient_client.get_available_times(
+        doctor_id=doctor.id, treatment_id=treatment.id, date="2024-12-02"
+    )
+    assert "10:00" not in held_response.json()["available_times"]
+
+    # When: 선점 만료 후 확정 시도
+    await asyncio.sleep(3)
+    confirm_response = await medisolveai_patient_client.confirm_appointment_hold(
+        hold_id=hold_response.json()["id"], patient_name="홍길동", patient_phone="010-7777-0200"
+    )
+
+    # Then: 만료 에러, 예약은 생성되지 않음
+    assert confirm_response.status_code == 400
+    assert confirm_response.json()["message"] == ErrorMessages.APPOINTMENT_HOLD_EXPIRED
+    get_response = await medisolveai_patient_client.get_appointments(patient_phone="010-7777-0200")
+    assert get_response.json() == []
+
+    # Then: 캐시된 결과도 선점 만료 시각 이후 무효가 되어 10:00이 다시 예약 가능
+    available_response = await medisolveai_patient_client.get_available_times(
+        doctor_id=doctor.id, treatment_id=treatment.id, date="2024-12-02"
+    )
+    assert "10:00" in available_response.json()["available_times"]
+
+
+async def test_appointment_hold_replaced_by_new_hold_and_released(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+) -> None:
+    """환자의 새 선점은 기존 선점을 대체하고, 선점 해제 시 시간대가 다시 예약 가능해지는지 테스트"""
+    # Given: 의사와 진료 항목 생성 (병렬 처리)
+    doctor, treatment = await asyncio.gather(
+        DoctorMother.create(name="김의사", department="피부과"),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+    )
+
+    # Given: 같은 환자가 10:00 선점 후 10:15 선점 (겹치는 본인 선점은 대체 대상)
+    first_hold_response = await medisolveai_patient_client.create_appointment_hold(
+        patient_phone="010-7777-0300",
+        doctor_id=doctor.id,
+        treatment_id=treatment.id,
+        appointment_datetime=datetime(2024, 12, 2, 10, 0).isoformat(),
+    )
+    second_hold_response = await medisolveai_patient_client.create_appointment_hold(
+        patient_phone="010-7777-0300",
+        doctor_id=doctor.id,
+        treatment_id=treatment.id,
+        appointment_datetime=datetime(2024, 12, 2, 10, 15).isoformat(),
+    )
+    assert second_hold_response.status_code == 201
+
+    # Then: 기존 선점은 해제되어 확정 불가
+    first_confirm_response = await medisolveai_patient_client.confirm_appointment_hold(
+        hold_id=first_hold_response.json()["id"], patient_name="홍길동", patient_phone="010-7777-0300"
+    )
+    assert first_confirm_response.status_code == 400
+    assert first_confirm_response.json()["message"] == ErrorMessages.APPOINTMENT_HOLD_NOT_FOUND
+
+    # When: 다른 전화번호로 해제 시도, 본인 전화번호로 해제
+    other_release_response = await medisolveai_patient_client.release_appointment_hold(
+        hold_id=second_hold_response.json()["id"], patient_phone="010-7777-0301"
+    )
+    release_response = await medisolveai_patient_client.release_appointment_hold(
+        hold_id=second_hold_response.json()["id"], patient_phone="010-7777-0300"
+    )
+
+    # Then: 본인만 해제 가능, 해제 후 10:15 다시 예약 가능
+    assert other_release_response.status_code == 400
+    assert other_release_response.json()["message"] == ErrorMessages.APPOINTMENT_HOLD_NOT_FOUND
+    assert release_response.status_code == 204
+    available_response = await medisolveai_patient_client.get_available_times(
+        doctor_id=doctor.id, treatment_id=treatment.id, date="2024-12-02"
+    )
+    assert {"10:00", "10:15"} <= set(available_response.json()["available_times"])
+
+
+async def test_appointment_hold_and_confirm_release_booking_locks(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+    pooled_session_maker_medisolveai: async_sessionmaker[AsyncSession],
+) -> None:
+    """선점과 확정 후 잠금이 모두 해제되어 같은 의사/날짜의 다음 예약이 대기 없이 성공하는지 테스트"""
+    # Given: 의사와 진료 항목 생성 (병렬 처리), 유휴 커넥션이 여럿인 커넥션 풀
+    doctor, treatment = await asyncio.gather(
+        DoctorMother.create(name="김의사", department="피부과"),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+    )
+    await warm_up_pool()
+    appointment_datetime = datetime(2024, 12, 2, 10, 0)
+    lock_names = get_booking_lock_names(
+        doctor_id=doctor.id,
+        start_datetime=appointment_datetime,
+        end_datetime=appointment_datetime + timedelta(minutes=treatment.duration_minutes),
+    )
+
+    async with pooled_session_maker_medisolveai() as observer:
+        # When: 10:00 선점
+        hold_response = await medisolveai_patient_client.create_appointment_hold(
+            patient_phone="010-7777-5000",
+            doctor_id=doctor.id,
+            treatment_id=treatment.id,
+            appointment_datetime=appointment_datetime.isoformat(),
+        )
+
+        # Then: 선점 성공, 사용한 잠금은 모두 해제
+        assert hold_response.status_code == 201
+        assert await get_used_locks(observer, lock_names) == {}
+
+        # When: 선점 확정
+        confirm_response = await medisolveai_patient_client.confirm_appointment_hold(
+            hold_id=hold_response.json()["id"], patient_name="홍길동", patient_phone="010-7777-5000"
+        )
+
+        # Then: 확정 성공, 사용한 잠금은 모두 해제
+        assert confirm_response.status_code == 201
+        assert await get_used_locks(observer, lock_names) == {}
+
+        # When: 같은 의사/날짜의 다음 시간 예약
+        next_datetime = appointment_datetime + timedelta(minutes=30)
+        create_response = await medisolveai_patient_client.create_appointment(
+            patient_name="다른환자",
+            patient_phone="010-7777-5001",
+            doctor_id=doctor.id,
+            treatment_id=treatment.id,
+            appointment_datetime=next_datetime.isoformat(),
+        )
+
+        # Then: 예약 성공
+        assert create_response.status_code == 201
@@ -0,0 +1,154 @@
+"""
+예약 가능 시간 캘린더 조회 API 테스트
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date, datetime
+from decimal import Decimal
+
+from app.core.constants import Department, ErrorMessages
+from app.tests.mothers import DoctorMother, TreatmentMother
+from app.tests.test_client import MediSolveAiPatientClient
+
+
+async def test_get_available_calendar_matches_available_times(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+) -> None:
+    """캘린더 조회 결과가 날짜·의사별 예약 가능 시간 조회 결과와 동일한지 테스트"""
+    # Given: 의사 2명, 진료 항목 생성 (병렬 처리)
+    doctors, treatment = await asyncio.gather(
+        DoctorMother.create_bulk(count=2, department=Department.DERMATOLOGY),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+    )
+
+    # Given: 월요일 10:00, 화요일 14:00에 첫 번째 의사 예약 생성
+    for i, appointment_datetime in enumerate([datetime(2024, 12, 2, 10, 0), datetime(2024, 12, 3, 14, 0)]):
+        response = await medisolveai_patient_client.create_appointment(
+            patient_name=f"환자{i+1}",
+            patient_phone=f"010-3333-{1000+i:04d}",
+            doctor_id=doctors[0].id,
+            treatment_id=treatment.id,
+            appointment_datetime=appointment_datetime.isoformat(),
+        )
+        assert response.status_code == 201
+
+    # 조회 기간 설정 (월요일 ~ 화요일)
+    target_dates = [date(2024, 12, 2), date(2024, 12, 3)]
+
+    # When: 캘린더 조회 및 날짜·의사별 예약 가능 시간 조회 (병렬 처리)
+    calendar_response, *single_responses = await asyncio.gather(
+        medisolveai_patient_client.get_available_calendar(
+            treatment_id=treatment.id,
+            date_from=target_dates[0].isoformat(),
+            date_to=target_dates[-1].isoformat(),
+            doctor_ids=[doctor.id for doctor in doctors],
+        ),
+        *[
+            medisolveai_patient_client.get_available_times(
+                doctor_id=doctor.id,
+                treatment_id=treatment.id,
+                date=target_date.isoformat(),
+            )
+            for target_date in target_dates
+            for doctor in doctors
+        ],
+    )
+    calendar = calendar_response.json()
+
+    # Then: 날짜순, 요청한 의사 순으로 단건 조회 결과와 동일
+    assert calendar_response.status_code == 200
+    assert calendar["treatment_id"] == treatment.id
+    assert calendar["date_from"] == target_dates[0].isoformat()
+    assert calendar["date_to"] == target_dates[-1].isoformat()
+    assert calendar["available_times"] == [response.json() for response in single_responses]
+
+    # Then: 예약된 시간은 해당 의사·날짜에서만 제외
+    monday_first, monday_second, tuesday_first, _ = calendar["available_times"]
+    assert "10:00" not in monday_first["available_times"]
+    assert "10:00" in monday_second["available_times"]
+    assert "10:00" in tuesday_first["available_times"]
+    assert "14:00" not in tuesday_first["available_times"]
+
+
+async def test_get_available_calendar_all_active_doctors_and_closed_day(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+) -> None:
+    """의사 미지정 시 활성 의사 전체를 조회하고 휴무일은 빈 리스트를 반환하는지 테스트"""
+    # Given: 활성 의사 2명, 비활성 의사 1명, 진료 항목 생성 (병렬 처리)
+    active_doctors, _, treatment = await asyncio.gather(
+        DoctorMother.create_bulk(count=2, department=Department.DERMATOLOGY),
+        DoctorMother.create(name="비활성의사", is_active=False),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+    )
+
+    # When: 토요일 ~ 월요일 캘린더 조회 (의사 미지정)
+    response = await medisolveai_patient_client.get_available_calendar(
+        treatment_id=treatment.id,
+        date_from=date(2024, 11, 30).isoformat(),
+        date_to=date(2024, 12, 2).isoformat(),
+    )
+    calendar = response.json()["available_times"]
+
+    # Then: 3일 × 활성 의사 2명
+    assert response.status_code == 200
+    assert len(calendar) == 6
+    assert {item["doctor_id"] for item in calendar} == {doctor.id for doctor in active_doctors}
+
+    # Then: 주말은 휴무일이므로 빈 리스트, 월요일은 운영 시간대 반환
+    for item in calendar:
+        if item["date"] == date(2024, 12, 2).isoformat():
+            assert "09:00" in item["available_times"]
+        else:
+            assert item["available_times"] == []
+
+
+async def test_get_available_calendar_invalid_range(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+) -> None:
+    """조회 기간이 역순이거나 최대 일수를 초과하면 실패하는지 테스트"""
+    # Given: 진료 항목 생성
+    treatment = await TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00"))
+
+    # When: 역순 기간, 32일 기간으로 조회 (병렬 처리)
+    reversed_response, too_long_response = await asyncio.gather(
+        medisolveai_patient_client.get_available_calendar(
+            treatment_id=treatment.id,
+            date_from=date(2024, 12, 3).isoformat(),
+            date_to=date(2024, 12, 2).isoformat(),
+        ),
+        medisolveai_patient_client.get_available_calendar(
+            treatment_id=treatment.id,
+            date_from=date(2024, 12, 1).isoformat(),
+            date_to=date(2025, 1, 1).isoformat(),
+        ),
+    )
+
+    # Then: 에러 응답 확인
+    for response in (reversed_response, too_long_response):
+        assert response.status_code == 400
+        assert response.json()["message"] == ErrorMessages.AVAILABLE_CALENDAR_RANGE_INVALID
+
+
+async def test_get_available_calendar_doctor_not_found(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+) -> None:
+    """존재하지 않는 의사가 포함되면 실패하는지 테스트"""
+    # Given: 의사와 진료 항목 생성 (병렬 처리)
+    doctor, treatment = await asyncio.gather(
+        DoctorMother.create(name="김의사", department=Department.DERMATOLOGY),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+    )
+
+    # When: 존재하지 않는 의사 ID를 포함하여 조회
+    response = await medisolveai_patient_client.get_available_calendar(
+        treatment_id=treatment.id,
+        date_from=date(2024, 12, 2).isoformat(),
+        date_to=date(2024, 12, 2).isoformat(),
+        doctor_ids=[doctor.id, 99999],
+    )
+
+    # Then: 에러 응답 확인
+    assert response.status_code == 400
+    assert response.json()["message"] == ErrorMessages.DOCTOR_NOT_FOUND
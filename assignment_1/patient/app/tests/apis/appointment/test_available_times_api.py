@@ -8,7 +8,7 @@ import asyncio
 from datetime import date, datetime, time
 from decimal import Decimal
 
-from app.core.constants import Department, ErrorMessages
+from app.core.constants import DayOfWeek, Department, ErrorMessages
 from app.tests.mothers import DoctorMother, HospitalSlotMother, TreatmentMother
 from app.tests.test_client import MediSolveAiPatientClient
 
@@ -236,3 +236,159 @@ async def test_get_available_times_capacity_exceeded(
     assert "10:15" not in result["available_times"]
     # 10:30은 가능해야 함 (다른 슬롯)
     assert "10:30" in result["available_times"]
+
+
+async def test_get_available_times_with_long_appointment(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+) -> None:
+    """여러 시간대에 걸친 기존 예약이 있는 경우 예약 가능 시간 조회 테스트"""
+    # Given: 의사, 진료 항목(30분, 60분) 생성 (병렬 처리)
+    doctor, treatment_30min, treatment_60min = await asyncio.gather(
+        DoctorMother.create(name="김의사", department=Department.DERMATOLOGY),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+        TreatmentMother.create(name="복합 치료", duration_minutes=60, price=Decimal("100000.00")),
+    )
+
+    # 조회할 날짜 설정
+    appointment_date = date(2024, 12, 2)
+
+    # Given: 기존 60분 예약 생성 (10:00~11:00)
+    appointment_datetime = datetime.combine(appointment_date, time(10, 0))
+    create_response = await medisolveai_patient_client.create_appointment(
+        patient_name="홍길동",
+        patient_phone="010-1234-5678",
+        doctor_id=doctor.id,
+        treatment_id=treatment_60min.id,
+        appointment_datetime=appointment_datetime.isoformat(),
+    )
+    assert create_response.status_code == 201
+
+    # When: 30분 진료 예약 가능 시간 조회
+    response = await medisolveai_patient_client.get_available_times(
+        doctor_id=doctor.id,
+        treatment_id=treatment_30min.id,
+        date=appointment_date.isoformat(),
+    )
+    result = response.json()
+
+    # Then: 응답 검증
+    assert response.status_code == 200
+    # 09:30은 가능해야 함 (09:30~10:00, 기존 예약과 겹치지 않음)
+    assert "09:30" in result["available_times"]
+    # 09:45는 제외되어야 함 (09:45~10:15, 기존 예약 시작과 겹침)
+    assert "09:45" not in result["available_times"]
+    # 10:45는 제외되어야 함 (10:45~11:15, 기존 예약 종료와 겹침)
+    assert "10:45" not in result["available_times"]
+    # 11:00은 가능해야 함 (기존 예약 종료 시각)
+    assert "11:00" in result["available_times"]
+
+
+async def test_get_available_times_day_of_week_capacity(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+) -> None:
+    """요일별 HospitalSlot 수용 인원이 해당 요일에만 적용되는지 테스트"""
+    # Given: 의사 2명, 진료 항목, 월요일 전용 HospitalSlot(최대 1명) 생성 (병렬 처리)
+    doctors, treatment, _ = await asyncio.gather(
+        DoctorMother.create_bulk(count=2, department=Department.DERMATOLOGY),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+        HospitalSlotMother.create(
+            start_time=time(10, 0),
+            end_time=time(10, 30),
+            max_capacity=1,
+            day_of_week=DayOfWeek.MONDAY,
+        ),
+    )
+
+    monday = date(2024, 12, 2)
+    tuesday = date(2024, 12, 3)
+
+    # Given: 월요일/화요일 10:00에 첫 번째 의사 예약 생성
+    responses = await asyncio.gather(
+        *[
+            medisolveai_patient_client.create_appointment(
+                patient_name=f"환자{i+1}",
+                patient_phone=f"010-2222-{1000+i:04d}",
+                doctor_id=doctors[0].id,
+                treatment_id=treatment.id,
+                appointment_datetime=datetime.combine(target_date, time(10, 0)).isoformat(),
+            )
+            for i, target_date in enumerate([monday, tuesday])
+        ]
+    )
+    for response in responses:
+        assert response.status_code == 201
+
+    # When: 두 번째 의사의 월요일/화요일 예약 가능 시간 조회
+    monday_response, tuesday_response = await asyncio.gather(
+        medisolveai_patient_client.get_available_times(
+            doctor_id=doctors[1].id,
+            treatment_id=treatment.id,
+            date=monday.isoformat(),
+        ),
+        medisolveai_patient_client.get_available_times(
+            doctor_id=doctors[1].id,
+            treatment_id=treatment.id,
+            date=tuesday.isoformat(),
+        ),
+    )
+
+    # Then: 월요일은 수용 인원(1명) 초과로 제외, 화요일은 기본 수용 인원(3명)으로 가능
+    assert monday_response.status_code == 200
+    assert "10:00" not in monday_response.json()["available_times"]
+    assert tuesday_response.status_code == 200
+    assert "10:00" in tuesday_response.json()["available_times"]
+
+
+async def test_get_available_times_cache_invalidated_by_create_and_cancel(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+) -> None:
+    """반복 조회는 캐시에서 응답하고, 예약 생성/취소 시 즉시 다시 계산되는지 테스트"""
+    # Given: 의사, 진료 항목 생성 (병렬 처리)
+    doctor, treatment = await asyncio.gather(
+        DoctorMother.create(name="김의사", department=Department.DERMATOLOGY),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+    )
+    appointment_date = date(2024, 12, 2)  # 월요일
+
+    async def get_available_times() -> list[str]:
+        response = await medisolveai_patient_client.get_available_times(
+            doctor_id=doctor.id,
+            treatment_id=treatment.id,
+            date=appointment_date.isoformat(),
+        )
+        assert response.status_code == 200
+        available_times: list[str] = response.json()["available_times"]
+        return available_times
+
+    # When: 같은 조건으로 두 번 조회
+    first_times = await get_available_times()
+    hits_before = (await medisolveai_patient_client.get_metrics())["availability_cache"]["hits"]
+    second_times = await get_available_times()
+    hits_after = (await medisolveai_patient_client.get_metrics())["availability_cache"]["hits"]
+
+    # Then: 두 번째 조회는 캐시 적중
+    assert second_times == first_times
+    assert "10:00" in first_times
+    assert hits_after == hits_before + 1
+
+    # When: 10:00 예약 생성 후 조회
+    create_response = await medisolveai_patient_client.create_appointment(
+        patient_name="홍길동",
+        patient_phone="010-1234-5678",
+        doctor_id=doctor.id,
+        treatment_id=treatment.id,
+        appointment_datetime=datetime.combine(appointment_date, time(10, 0)).isoformat(),
+    )
+    assert create_response.status_code == 201
+
+    # Then: 생성된 예약이 바로 반영됨
+    assert "10:00" not in await get_available_times()
+
+    # When: 예약 취소 후 조회
+    cancel_response = await medisolveai_patient_client.cancel_appointment(
+        appointment_id=create_response.json()["id"], patient_phone="010-1234-5678"
+    )
+    assert cancel_response.status_code == 200
+
+    # Then: 취소된 예약 시간이 바로 다시 예약 가능
+    assert await get_available_times() == first_times
@@ -0,0 +1,119 @@
+"""
+예약 잠금 테스트
+
+네임드 락은 획득한 커넥션에 묶이므로, 커넥션 풀을 사용하는 엔진에서 블록 안의 커밋 이후에도
+같은 커넥션이 잠금을 보유하고 블록 종료 후 모두 해제되는지 확인
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.database import get_async_session, get_pinned_async_session
+from app.services.booking_locks import get_booking_lock_names, hold_booking_locks
+from app.tests.mothers import DoctorMother, TreatmentMother
+from app.tests.test_client import MediSolveAiPatientClient
+from app.tests.utils import get_used_locks, warm_up_pool
+
+
+async def test_booking_locks_held_on_pinned_connection_across_commit(
+    pooled_session_maker_medisolveai: async_sessionmaker[AsyncSession],
+) -> None:
+    """블록 안에서 커밋해도 잠금을 획득한 커넥션을 계속 사용하고, 블록 종료 후 잠금이 모두 해제되는지 테스트"""
+    # Given: 유휴 커넥션이 여럿인 커넥션 풀, 예약 잠금 이름
+    await warm_up_pool()
+    start_datetime = datetime(2024, 12, 2, 10, 0)
+    lock_names = get_booking_lock_names(
+        doctor_id=900001, start_datetime=start_datetime, end_datetime=start_datetime + timedelta(minutes=60)
+    )
+
+    async with pooled_session_maker_medisolveai() as observer:
+        # When: 잠금을 잡은 상태로 커밋
+        async with get_pinned_async_session() as session:
+            async with hold_booking_locks(session=session, lock_names=lock_names):
+                connection_id = await session.scalar(text("SELECT CONNECTION_ID()"))
+                await session.commit()
+
+                # Then: 커밋 후에도 같은 커넥션이 모든 잠금을 보유
+                assert await session.scalar(text("SELECT CONNECTION_ID()")) == connection_id
+                assert await get_used_locks(observer, lock_names) == dict.fromkeys(lock_names, connection_id)
+
+        # Then: 블록 종료 후 모든 잠금 해제
+        assert await get_used_locks(observer, lock_names) == {}
+
+
+async def test_booking_locks_released_after_failed_statement(
+    pooled_session_maker_medisolveai: async_sessionmaker[AsyncSession],
+) -> None:
+    """블록 안에서 SQL이 실패해 세션이 롤백 대기 상태여도 잠금이 해제되는지 테스트"""
+    # Given: 유휴 커넥션이 여럿인 커넥션 풀, 예약 잠금 이름
+    await warm_up_pool()
+    start_datetime = datetime(2024, 12, 2, 11, 0)
+    lock_names = get_booking_lock_names(
+        doctor_id=900002, start_datetime=start_datetime, end_datetime=start_datetime + timedelta(minutes=30)
+    )
+
+    # When: 잠금을 잡은 상태로 실패하는 SQL 실행
+    with pytest.raises(DBAPIError):
+        async with get_pinned_async_session() as session:
+            async with hold_booking_locks(session=session, lock_names=lock_names):
+                await session.execute(text("SELECT * FROM no_such_table"))
+
+    # Then: 모든 잠금 해제
+    async with pooled_session_maker_medisolveai() as observer:
+        assert await get_used_locks(observer, lock_names) == {}
+
+
+async def test_booking_locks_require_pinned_session() -> None:
+    """커넥션을 고정하지 않은 세션으로는 잠금을 잡을 수 없는지 테스트"""
+    # Given: 예약 잠금 이름
+    start_datetime = datetime(2024, 12, 2, 12, 0)
+    lock_names = get_booking_lock_names(
+        doctor_id=900003, start_datetime=start_datetime, end_datetime=start_datetime + timedelta(minutes=30)
+    )
+
+    # When/Then: 기본 세션으로 잠금 획득 시 예외
+    async with get_async_session() as session:
+        with pytest.raises(RuntimeError):
+            async with hold_booking_locks(session=session, lock_names=lock_names):
+                pass
+
+
+async def test_create_appointment_twice_releases_booking_locks(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+    pooled_session_maker_medisolveai: async_sessionmaker[AsyncSession],
+) -> None:
+    """같은 의사/날짜에 연달아 예약해도 매번 잠금이 해제되어 다음 예약이 대기 없이 성공하는지 테스트"""
+    # Given: 의사와 진료 항목 생성 (병렬 처리), 유휴 커넥션이 여럿인 커넥션 풀
+    doctor, treatment = await asyncio.gather(
+        DoctorMother.create(name="김의사", department="피부과"),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+    )
+    await warm_up_pool()
+
+    async with pooled_session_maker_medisolveai() as observer:
+        for index, appointment_datetime in enumerate([datetime(2024, 12, 2, 10, 0), datetime(2024, 12, 2, 10, 30)]):
+            # When: 같은 의사/날짜에 예약 생성
+            response = await medisolveai_patient_client.create_appointment(
+                patient_name="홍길동",
+                patient_phone=f"010-8888-000{index}",
+                doctor_id=doctor.id,
+                treatment_id=treatment.id,
+                appointment_datetime=appointment_datetime.isoformat(),
+            )
+
+            # Then: 예약 성공, 사용한 잠금은 모두 해제
+            assert response.status_code == 201
+            lock_names = get_booking_lock_names(
+                doctor_id=doctor.id,
+                start_datetime=appointment_datetime,
+                end_datetime=appointment_datetime + timedelta(minutes=treatment.duration_minutes),
+            )
+            assert await get_used_locks(observer, lock_names) == {}
@@ -9,9 +9,14 @@ from datetime import datetime
 from decimal import Decimal
 
 from app.core.constants import AppointmentStatus, ErrorMessages
+from app.core.database import STATEMENT_COUNT_HEADER
 from app.tests.mothers import DoctorMother, TreatmentMother
 from app.tests.test_client import MediSolveAiPatientClient
 
+# 환자 캐시가 준비된 상태의 예약 취소 SQL 실행 횟수 상한
+# 조건부 취소, 점유 구간 해제, 응답 구성용 조회, 캐시 버전 갱신(커밋 후), 캐시 버전 동기화(주기별)
+CANCEL_APPOINTMENT_STATEMENT_BUDGET = 5
+
 
 async def test_cancel_appointment_success(
     medisolveai_patient_client: MediSolveAiPatientClient,
@@ -148,3 +153,102 @@ async def test_cancel_appointment_already_cancelled(
     assert response.status_code == 400
     result = response.json()
     assert result["message"] == ErrorMessages.APPOINTMENT_ALREADY_CANCELLED
+
+
+async def test_cancel_appointment_releases_slot_for_rebooking(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+) -> None:
+    """예약 취소 시 의사 점유 구간이 해제되어 같은 시간대에 다시 예약할 수 있는지 테스트"""
+    # Given: 의사, 진료 항목 생성 (병렬 처리)
+    doctor, treatment = await asyncio.gather(
+        DoctorMother.create(name="김의사", department="피부과"),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+    )
+    appointment_datetime = datetime(2024, 12, 2, 10, 0)
+
+    create_response = await medisolveai_patient_client.create_appointment(
+        patient_name="홍길동",
+        patient_phone="010-1234-5678",
+        doctor_id=doctor.id,
+        treatment_id=treatment.id,
+        appointment_datetime=appointment_datetime.isoformat(),
+    )
+    assert create_response.status_code == 201
+
+    # When: 예약 취소 후 같은 의사/시간대로 다시 예약
+    cancel_response = await medisolveai_patient_client.cancel_appointment(
+        appointment_id=create_response.json()["id"], patient_phone="010-1234-5678"
+    )
+    rebook_response = await medisolveai_patient_client.create_appointment(
+        patient_name="김철수",
+        patient_phone="010-2345-6789",
+        doctor_id=doctor.id,
+        treatment_id=treatment.id,
+        appointment_datetime=appointment_datetime.isoformat(),
+    )
+
+    # Then: 다시 예약 성공
+    assert cancel_response.status_code == 200
+    assert rebook_response.status_code == 201
+
+
+async def test_cancel_appointment_concurrent_requests_cancel_once(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+) -> None:
+    """같은 예약을 동시에 취소해도 한 요청만 취소하고 나머지는 이미 취소된 예약 에러를 받는지 테스트"""
+    # Given: 의사, 진료 항목, 예약 생성
+    doctor, treatment = await asyncio.gather(
+        DoctorMother.create(name="김의사", department="피부과"),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+    )
+    create_response = await medisolveai_patient_client.create_appointment(
+        patient_name="홍길동",
+        patient_phone="010-1234-5678",
+        doctor_id=doctor.id,
+        treatment_id=treatment.id,
+        appointment_datetime=datetime(2024, 12, 2, 10, 0).isoformat(),
+    )
+    appointment_id = create_response.json()["id"]
+
+    # When: 같은 예약 5건 동시 취소
+    responses = await asyncio.gather(
+        *[
+            medisolveai_patient_client.cancel_appointment(appointment_id=appointment_id, patient_phone="010-1234-5678")
+            for _ in range(5)
+        ]
+    )
+
+    # Then: 한 건만 성공, 나머지는 이미 취소된 예약
+    assert sorted(response.status_code for response in responses) == [200, 400, 400, 400, 400]
+    assert {response.json()["message"] for response in responses if response.status_code == 400} == {
+        ErrorMessages.APPOINTMENT_ALREADY_CANCELLED
+    }
+
+
+async def test_cancel_appointment_statement_budget(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+) -> None:
+    """환자 캐시가 준비된 상태에서 예약 취소가 고정된 SQL 실행 횟수 안에 끝나는지 테스트"""
+    # Given: 의사, 진료 항목, 예약 생성 (예약 생성으로 환자 캐시 준비)
+    doctor, treatment = await asyncio.gather(
+        DoctorMother.create(name="김의사", department="피부과"),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+    )
+    create_response = await medisolveai_patient_client.create_appointment(
+        patient_name="홍길동",
+        patient_phone="010-1234-5678",
+        doctor_id=doctor.id,
+        treatment_id=treatment.id,
+        appointment_datetime=datetime(2024, 12, 2, 10, 0).isoformat(),
+        memo="취소 예정",
+    )
+
+    # When: 예약 취소
+    response = await medisolveai_patient_client.cancel_appointment(
+        appointment_id=create_response.json()["id"], patient_phone="010-1234-5678"
+    )
+
+    # Then: 상한 이내, 응답은 예약 생성 응답과 상태만 다름
+    assert response.status_code == 200
+    assert int(response.headers[STATEMENT_COUNT_HEADER]) <= CANCEL_APPOINTMENT_STATEMENT_BUDGET
+    assert response.json() == {**create_response.json(), "status": AppointmentStatus.CANCELLED.value}
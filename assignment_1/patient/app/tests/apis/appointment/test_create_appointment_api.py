@@ -5,16 +5,30 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, time
+from datetime import date, datetime, time
 from decimal import Decimal
 
+import pytest
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.core.constants import AppointmentStatus, ErrorMessages, VisitType
+from app.core.configs.settings import settings
+from app.core.constants import AppointmentStatus, BookingEngine, CacheNames, ErrorMessages, VisitType
+from app.core.database import STATEMENT_COUNT_HEADER
 from app.models.appointment import Appointment
+from app.models.cache_version import CacheVersion
+from app.models.patient import Patient
+from app.services.availability_cache import availability_cache
+from app.services.cache_version_publisher import CacheVersionPublisher
+from app.services.cache_version_registry import cache_version_registry
 from app.tests.mothers import DoctorMother, HospitalSlotMother, TreatmentMother
 from app.tests.test_client import MediSolveAiPatientClient
 
+# 캐시가 준비된 상태의 예약 생성 SQL 실행 횟수 상한 (30분 진료 기준)
+# 잠금 획득(의사, 30분 단위 각 1회), 환자 조회, 환자 생성, 예약 선점 조회, 의사 중복 확인, 주변 예약 조회, 예약 생성, 점유 구간 생성,
+# 잠금 해제, 캐시 버전 갱신(커밋 후), 캐시 버전 동기화(주기별)
+CREATE_APPOINTMENT_STATEMENT_BUDGET = 12
+
 
 async def test_create_appointment_success_first_visit(
     medisolveai_patient_client: MediSolveAiPatientClient,
@@ -76,7 +90,7 @@ async def test_create_appointment_success_return_visit(
     )
     first_appointment_id = first_response.json()["id"]
 
-    # 첫 번째 예약을 완료 상태로 변경
+    # 첫 번째 예약을 완료 상태로 변경 (관리자 앱의 완료 처리와 같이 환자 방문 요약도 갱신)
     async with session_maker_medisolveai() as session:
         from sqlalchemy import update
 
@@ -86,6 +100,11 @@ async def test_create_appointment_success_return_visit(
             .values(status=AppointmentStatus.COMPLETED.value)
         )
         await session.execute(update_query)
+        await session.execute(
+            update(Patient)
+            .where(Patient.phone == "010-1234-5678")
+            .values(completed_visit_count=Patient.completed_visit_count + 1, last_completed_at=appointment_datetime)
+        )
         await session.commit()
 
     # 두 번째 예약 시간 설정
@@ -264,3 +283,420 @@ async def test_create_appointment_slot_capacity_exceeded(
     # Then: 수용 인원 초과 에러 확인
     assert response.status_code == 400
     assert response.json()["message"] == ErrorMessages.APPOINTMENT_CAPACITY_FULL
+
+
+async def test_create_appointment_overlaps_longer_existing_appointment(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+) -> None:
+    """기존 예약의 소요 시간 안에 시작하는 예약은 실패하고, 종료 이후 예약은 성공하는지 테스트"""
+    # Given: 의사와 진료 항목(30분, 60분) 생성 (병렬 처리)
+    doctor, treatment_30min, treatment_60min = await asyncio.gather(
+        DoctorMother.create(name="김의사", department="피부과"),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+        TreatmentMother.create(name="복합 치료", duration_minutes=60, price=Decimal("100000.00")),
+    )
+
+    # Given: 10:00~11:00 예약 생성
+    first_response = await medisolveai_patient_client.create_appointment(
+        patient_name="홍길동",
+        patient_phone="010-1234-5678",
+        doctor_id=doctor.id,
+        treatment_id=treatment_60min.id,
+        appointment_datetime=datetime(2024, 12, 2, 10, 0).isoformat(),
+    )
+    assert first_response.status_code == 201
+
+    # When: 10:30 예약(기존 예약과 겹침), 11:00 예약(기존 예약 종료 시각) 생성 시도
+    overlapping_response = await medisolveai_patient_client.create_appointment(
+        patient_name="김철수",
+        patient_phone="010-9876-5432",
+        doctor_id=doctor.id,
+        treatment_id=treatment_30min.id,
+        appointment_datetime=datetime(2024, 12, 2, 10, 30).isoformat(),
+    )
+    adjacent_response = await medisolveai_patient_client.create_appointment(
+        patient_name="김철수",
+        patient_phone="010-9876-5432",
+        doctor_id=doctor.id,
+        treatment_id=treatment_30min.id,
+        appointment_datetime=datetime(2024, 12, 2, 11, 0).isoformat(),
+    )
+
+    # Then: 겹치는 예약만 실패
+    assert overlapping_response.status_code == 400
+    assert overlapping_response.json()["message"] == ErrorMessages.APPOINTMENT_ALREADY_EXISTS
+    assert adjacent_response.status_code == 201
+
+
+async def test_create_appointment_slot_capacity_counts_earlier_long_appointment(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+) -> None:
+    """앞선 시간대에 시작해 슬롯까지 이어지는 예약도 수용 인원에 포함되는지 테스트"""
+    # Given: HospitalSlot(10:00~10:30, 최대 1명), 의사 2명, 진료 항목(30분, 60분) 생성 (병렬 처리)
+    _, doctors, treatment_30min, treatment_60min = await asyncio.gather(
+        HospitalSlotMother.create(start_time=time(10, 0), end_time=time(10, 30), max_capacity=1),
+        DoctorMother.create_bulk(count=2, department="피부과"),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+        TreatmentMother.create(name="복합 치료", duration_minutes=60, price=Decimal("100000.00")),
+    )
+
+    # Given: 09:30~10:30 예약 생성 (10:00 슬롯과 겹침)
+    first_response = await medisolveai_patient_client.create_appointment(
+        patient_name="환자1",
+        patient_phone="010-1111-2000",
+        doctor_id=doctors[0].id,
+        treatment_id=treatment_60min.id,
+        appointment_datetime=datetime(2024, 12, 2, 9, 30).isoformat(),
+    )
+    assert first_response.status_code == 201
+
+    # When: 다른 의사로 10:00 예약 생성 시도
+    response = await medisolveai_patient_client.create_appointment(
+        patient_name="환자2",
+        patient_phone="010-1111-2001",
+        doctor_id=doctors[1].id,
+        treatment_id=treatment_30min.id,
+        appointment_datetime=datetime(2024, 12, 2, 10, 0).isoformat(),
+    )
+
+    # Then: 수용 인원 초과 에러 확인
+    assert response.status_code == 400
+    assert response.json()["message"] == ErrorMessages.APPOINTMENT_CAPACITY_FULL
+
+
+async def test_create_appointment_validates_doctor_and_treatment_from_cache(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+) -> None:
+    """반복 예약 생성 시 의사/진료 항목 검증이 캐시에서 처리되는지 테스트"""
+    # Given: 의사와 진료 항목 생성 (병렬 처리)
+    doctor, treatment = await asyncio.gather(
+        DoctorMother.create(name="김의사", department="피부과"),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+    )
+    first_response = await medisolveai_patient_client.create_appointment(
+        patient_name="환자1",
+        patient_phone="010-1111-3000",
+        doctor_id=doctor.id,
+        treatment_id=treatment.id,
+        appointment_datetime=datetime(2024, 12, 2, 10, 0).isoformat(),
+    )
+    assert first_response.status_code == 201
+    metrics_before = await medisolveai_patient_client.get_metrics()
+
+    # When: 같은 의사/진료 항목으로 다시 예약 생성
+    second_response = await medisolveai_patient_client.create_appointment(
+        patient_name="환자2",
+        patient_phone="010-1111-3001",
+        doctor_id=doctor.id,
+        treatment_id=treatment.id,
+        appointment_datetime=datetime(2024, 12, 2, 11, 0).isoformat(),
+    )
+    metrics_after = await medisolveai_patient_client.get_metrics()
+
+    # Then: 의사/진료 항목 모두 캐시 적중
+    assert second_response.status_code == 201
+    assert second_response.json()["doctor_id"] == doctor.id
+    assert metrics_after["doctor_cache"]["hits"] == metrics_before["doctor_cache"]["hits"] + 1
+    assert metrics_after["treatment_cache"]["hits"] == metrics_before["treatment_cache"]["hits"] + 1
+
+
+async def test_create_appointment_statement_budget(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+) -> None:
+    """캐시가 준비된 상태에서 예약 생성이 고정된 SQL 실행 횟수 안에 끝나는지 테스트"""
+    # Given: 의사와 진료 항목 생성 후 첫 예약으로 캐시 준비
+    doctor, treatment = await asyncio.gather(
+        DoctorMother.create(name="김의사", department="피부과"),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+    )
+    cache_version_registry.expire()
+    warmup_response = await medisolveai_patient_client.create_appointment(
+        patient_name="환자1",
+        patient_phone="010-1111-4000",
+        doctor_id=doctor.id,
+        treatment_id=treatment.id,
+        appointment_datetime=datetime(2024, 12, 2, 9, 0).isoformat(),
+    )
+    assert warmup_response.status_code == 201
+
+    # When: 신규 환자 예약, 기존 환자 예약 생성
+    new_patient_response = await medisolveai_patient_client.create_appointment(
+        patient_name="환자2",
+        patient_phone="010-1111-4001",
+        doctor_id=doctor.id,
+        treatment_id=treatment.id,
+        appointment_datetime=datetime(2024, 12, 2, 10, 0).isoformat(),
+    )
+    existing_patient_response = await medisolveai_patient_client.create_appointment(
+        patient_name="환자1",
+        patient_phone="010-1111-4000",
+        doctor_id=doctor.id,
+        treatment_id=treatment.id,
+        appointment_datetime=datetime(2024, 12, 2, 11, 0).isoformat(),
+    )
+
+    # Then: 신규 환자는 상한 이내, 기존 환자는 환자 생성이 없으므로 한 번 더 적음
+    assert new_patient_response.status_code == 201
+    assert existing_patient_response.status_code == 201
+    assert int(new_patient_response.headers[STATEMENT_COUNT_HEADER]) <= CREATE_APPOINTMENT_STATEMENT_BUDGET
+    assert int(existing_patient_response.headers[STATEMENT_COUNT_HEADER]) <= CREATE_APPOINTMENT_STATEMENT_BUDGET - 1
+
+    # Then: 응답은 커밋 전 데이터로 구성
+    data = existing_patient_response.json()
+    assert data["doctor_name"] == "김의사"
+    assert data["treatment_name"] == "기본 진료"
+    assert data["status"] == AppointmentStatus.PENDING.value
+
+
+async def test_create_appointment_concurrent_same_doctor_slot_only_one_succeeds(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+) -> None:
+    """같은 의사/시간대에 동시에 예약해도 한 건만 생성되는지 테스트"""
+    # Given: 의사와 진료 항목 생성 (병렬 처리)
+    doctor, treatment = await asyncio.gather(
+        DoctorMother.create(name="김의사", department="피부과"),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+    )
+
+    # When: 같은 의사/시간대로 5건 동시 요청
+    responses = await asyncio.gather(
+        *[
+            medisolveai_patient_client.create_appointment(
+                patient_name=f"환자{i}",
+                patient_phone=f"010-1111-5{i:03d}",
+                doctor_id=doctor.id,
+                treatment_id=treatment.id,
+                appointment_datetime=datetime(2024, 12, 2, 10, 0).isoformat(),
+            )
+            for i in range(5)
+        ]
+    )
+
+    # Then: 한 건만 성공, 나머지는 중복 예약 에러
+    status_codes = sorted(response.status_code for response in responses)
+    assert status_codes == [201, 400, 400, 400, 400]
+    for response in responses:
+        if response.status_code == 400:
+            assert response.json()["message"] == ErrorMessages.APPOINTMENT_ALREADY_EXISTS
+
+
+async def test_create_appointment_concurrent_capacity_not_exceeded(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+) -> None:
+    """서로 다른 의사로 같은 시간대에 동시에 예약해도 병원 수용 인원을 넘지 않는지 테스트"""
+    # Given: HospitalSlot(10:00~10:30, 최대 1명), 의사 3명, 진료 항목 생성 (병렬 처리)
+    _, doctors, treatment = await asyncio.gather(
+        HospitalSlotMother.create(start_time=time(10, 0), end_time=time(10, 30), max_capacity=1),
+        DoctorMother.create_bulk(count=3, department="피부과"),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+    )
+    locks_before = (await medisolveai_patient_client.get_metrics())["booking_locks"]
+
+    # When: 의사별로 같은 시간대 동시 요청
+    responses = await asyncio.gather(
+        *[
+            medisolveai_patient_client.create_appointment(
+                patient_name=f"환자{i}",
+                patient_phone=f"010-1111-6{i:03d}",
+                doctor_id=doctor.id,
+                treatment_id=treatment.id,
+                appointment_datetime=datetime(2024, 12, 2, 10, 0).isoformat(),
+            )
+            for i, doctor in enumerate(doctors)
+        ]
+    )
+    locks_after = (await medisolveai_patient_client.get_metrics())["booking_locks"]
+
+    # Then: 한 건만 성공, 나머지는 수용 인원 초과 에러
+    status_codes = sorted(response.status_code for response in responses)
+    assert status_codes == [201, 400, 400]
+    for response in responses:
+        if response.status_code == 400:
+            assert response.json()["message"] == ErrorMessages.APPOINTMENT_CAPACITY_FULL
+
+    # Then: 요청마다 잠금 획득 및 대기 시간 기록
+    assert locks_after["acquisitions"] == locks_before["acquisitions"] + 3
+    assert locks_after["wait_seconds_total"] >= locks_before["wait_seconds_total"]
+
+
+async def test_create_appointment_slot_ticks_engine_rejects_concurrent_overlap(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """slot_ticks 방식에서 겹치는 동시 예약은 점유 구간 유니크 키로 한 건만 생성되는지 테스트"""
+    # Given: slot_ticks 방식, 의사와 진료 항목(30분, 60분) 생성 (병렬 처리)
+    monkeypatch.setattr(settings, "booking_engine", BookingEngine.SLOT_TICKS)
+    doctor, treatment_30min, treatment_60min = await asyncio.gather(
+        DoctorMother.create(name="김의사", department="피부과"),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+        TreatmentMother.create(name="복합 치료", duration_minutes=60, price=Decimal("100000.00")),
+    )
+
+    # When: 10:00~11:00 예약과 10:30~11:00 예약 동시 요청 + 겹치지 않는 11:00 예약
+    overlapping_responses = await asyncio.gather(
+        medisolveai_patient_client.create_appointment(
+            patient_name="환자1",
+            patient_phone="010-1111-7000",
+            doctor_id=doctor.id,
+            treatment_id=treatment_60min.id,
+            appointment_datetime=datetime(2024, 12, 2, 10, 0).isoformat(),
+        ),
+        medisolveai_patient_client.create_appointment(
+            patient_name="환자2",
+            patient_phone="010-1111-7001",
+            doctor_id=doctor.id,
+            treatment_id=treatment_30min.id,
+            appointment_datetime=datetime(2024, 12, 2, 10, 30).isoformat(),
+        ),
+    )
+    adjacent_response = await medisolveai_patient_client.create_appointment(
+        patient_name="환자3",
+        patient_phone="010-1111-7002",
+        doctor_id=doctor.id,
+        treatment_id=treatment_30min.id,
+        appointment_datetime=datetime(2024, 12, 2, 11, 0).isoformat(),
+    )
+
+    # Then: 겹치는 두 요청 중 한 건만 성공, 나머지는 중복 예약 에러
+    status_codes = sorted(response.status_code for response in overlapping_responses)
+    assert status_codes == [201, 400]
+    rejected = next(response for response in overlapping_responses if response.status_code == 400)
+    assert rejected.json()["message"] == ErrorMessages.APPOINTMENT_ALREADY_EXISTS
+
+    # Then: 겹치지 않는 예약은 성공
+    assert adjacent_response.status_code == 201
+
+
+async def test_create_appointment_concurrent_first_visits_share_one_patient(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+) -> None:
+    """같은 신규 환자의 첫 예약이 동시에 들어와도 환자는 한 명만 생성되는지 테스트"""
+    # Given: 의사 3명, 진료 항목 생성 (병렬 처리)
+    doctors, treatment = await asyncio.gather(
+        DoctorMother.create_bulk(count=3, department="피부과"),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+    )
+
+    # When: 같은 전화번호로 서로 다른 날짜(잠금이 겹치지 않음)에 동시 예약
+    responses = await asyncio.gather(
+        *[
+            medisolveai_patient_client.create_appointment(
+                patient_name="동시신규",
+                patient_phone="010-5555-0000",
+                doctor_id=doctor.id,
+                treatment_id=treatment.id,
+                appointment_datetime=datetime(2024, 12, 2 + index, 10, 0).isoformat(),
+            )
+            for index, doctor in enumerate(doctors)
+        ]
+    )
+
+    # Then: 모두 초진으로 성공하고, 한 환자의 예약으로 조회됨
+    assert [response.status_code for response in responses] == [201, 201, 201]
+    assert {response.json()["visit_type"] for response in responses} == {VisitType.FIRST_VISIT}
+    get_response = await medisolveai_patient_client.get_appointments(patient_phone="010-5555-0000")
+    assert sorted(appointment["id"] for appointment in get_response.json()) == sorted(
+        response.json()["id"] for response in responses
+    )
+
+
+async def test_create_appointment_bumps_date_cache_version_and_purges_past_dates(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+    session_maker_medisolveai: async_sessionmaker[AsyncSession],
+) -> None:
+    """예약 생성 후 날짜별 캐시 버전 증가, 보관 기간이 지난 날짜의 버전은 정리 테스트"""
+
+    async def get_cache_version(name: str) -> int:
+        async with session_maker_medisolveai() as session:
+            result = await session.execute(select(CacheVersion.version).where(CacheVersion.name == name))
+            return result.scalar_one_or_none() or 0
+
+    # Given: 의사, 진료 항목 생성 (병렬 처리)
+    doctor, treatment = await asyncio.gather(
+        DoctorMother.create(name="김의사", department="피부과"),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+    )
+    appointment_datetime = datetime(2024, 12, 1, 10, 0)
+    cache_name = CacheNames.appointments(appointment_datetime.date())
+    today_cache_name = CacheNames.appointments(date.today())
+    initial_version = await get_cache_version(cache_name)
+    initial_purged_version = await get_cache_version(CacheNames.APPOINTMENTS_PURGED)
+    initial_today_version = await get_cache_version(today_cache_name)
+
+    # When: 예약 생성
+    response = await medisolveai_patient_client.create_appointment(
+        patient_name="홍길동",
+        patient_phone="010-1234-5678",
+        doctor_id=doctor.id,
+        treatment_id=treatment.id,
+        appointment_datetime=appointment_datetime.isoformat(),
+    )
+
+    # Then: 예약 커밋 후 해당 날짜의 캐시 버전 증가
+    assert response.status_code == 201
+    assert await get_cache_version(cache_name) == initial_version + 1
+
+    # When: 정리 주기가 지난 상태로 다른 날짜의 버전 증가
+    publisher = CacheVersionPublisher(retention_days=7, purge_interval_seconds=0, purge_batch_size=1000)
+    async with session_maker_medisolveai() as session:
+        await publisher.publish_appointment_dates(session=session, dates=[date.today()])
+
+    # Then: 보관 기간이 지난 날짜의 버전은 삭제되고 정리 버전 증가, 오늘 날짜의 버전은 유지
+    assert await get_cache_version(cache_name) == 0
+    assert await get_cache_version(CacheNames.APPOINTMENTS_PURGED) == initial_purged_version + 1
+    assert await get_cache_version(today_cache_name) == initial_today_version + 1
+    stats = publisher.get_stats()
+    assert stats["published"] == 1
+    assert stats["purge_runs"] == 1
+    assert stats["purged"] >= 1
+
+
+async def test_cache_version_purge_prunes_in_memory_past_dates(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+    session_maker_medisolveai: async_sessionmaker[AsyncSession],
+) -> None:
+    """지난 날짜의 버전 정리 시 인메모리 버전과 예약 가능 시간 캐시의 날짜별 항목도 제거되는지 테스트"""
+    # Given: 의사, 진료 항목 생성 (병렬 처리)
+    doctor, treatment = await asyncio.gather(
+        DoctorMother.create(name="김의사", department="피부과"),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+    )
+    appointment_date = date(2024, 12, 1)
+    cache_name = CacheNames.appointments(appointment_date)
+
+    # Given: 지난 날짜의 예약 생성 (날짜별 무효화 세대 증가) 후 버전 동기화, 예약 가능 시간 조회 (캐시 적재)
+    response = await medisolveai_patient_client.create_appointment(
+        patient_name="홍길동",
+        patient_phone="010-1234-5678",
+        doctor_id=doctor.id,
+        treatment_id=treatment.id,
+        appointment_datetime=datetime(2024, 12, 1, 10, 0).isoformat(),
+    )
+    assert response.status_code == 201
+    cache_version_registry.expire()
+    async with session_maker_medisolveai() as session:
+        await cache_version_registry.sync(session=session)
+    assert cache_version_registry.get_version(cache_name) >= 1
+    available_response = await medisolveai_patient_client.get_available_times(
+        doctor_id=doctor.id, treatment_id=treatment.id, date=appointment_date.isoformat()
+    )
+    assert available_response.status_code == 200
+    stamp_before_purge = availability_cache.get_stamp(appointment_date)
+    assert availability_cache.get(doctor.id, appointment_date, 30, stamp_before_purge) is not None
+
+    # When: 정리 주기가 지난 상태로 다른 날짜의 버전 증가
+    publisher = CacheVersionPublisher(retention_days=7, purge_interval_seconds=0, purge_batch_size=1000)
+    async with session_maker_medisolveai() as session:
+        await publisher.publish_appointment_dates(session=session, dates=[date.today()])
+
+    # Then: 지난 날짜의 인메모리 버전과 캐시 항목 제거
+    assert publisher.get_stats()["purge_runs"] == 1
+    assert cache_version_registry.get_version(cache_name) == 0
+    stamp_after_purge = availability_cache.get_stamp(appointment_date)
+    assert availability_cache.get(doctor.id, appointment_date, 30, stamp_after_purge) is None
+
+    # Then: 정리 전에 계산을 시작한 결과는 저장되지 않음
+    availability_cache.put(doctor.id, appointment_date, 30, ["09:00"], stamp=stamp_before_purge)
+    assert (
+        availability_cache.get(doctor.id, appointment_date, 30, availability_cache.get_stamp(appointment_date)) is None
+    )
@@ -0,0 +1,218 @@
+"""
+예약 일괄 생성 API 테스트
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.constants import AppointmentStatus, ErrorMessages, VisitType
+from app.core.database import STATEMENT_COUNT_HEADER
+from app.services.booking_locks import get_booking_lock_names
+from app.tests.mothers import DoctorMother, HospitalSlotMother, TreatmentMother
+from app.tests.test_client import MediSolveAiPatientClient
+from app.tests.utils import get_used_locks, warm_up_pool
+
+
+def _item(
+    doctor_id: int,
+    treatment_id: int,
+    appointment_datetime: datetime,
+    patient_phone: str,
+    patient_name: str = "홍길동",
+) -> dict[str, Any]:
+    return {
+        "patient_name": patient_name,
+        "patient_phone": patient_phone,
+        "doctor_id": doctor_id,
+        "treatment_id": treatment_id,
+        "appointment_datetime": appointment_datetime.isoformat(),
+    }
+
+
+async def test_create_appointments_batch_reports_per_item_results(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+) -> None:
+    """일괄 생성 시 항목별로 성공/실패 사유가 반환되는지 테스트"""
+    # Given: HospitalSlot(11:00~11:30, 최대 1명), 의사 2명, 진료 항목 생성 (병렬 처리)
+    _, doctors, treatment = await asyncio.gather(
+        HospitalSlotMother.create(start_time=time(11, 0), end_time=time(11, 30), max_capacity=1),
+        DoctorMother.create_bulk(count=2, department="피부과"),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+    )
+    day = datetime(2024, 12, 2)
+
+    # Given: 기존 예약 (의사1, 10:00)
+    existing_response = await medisolveai_patient_client.create_appointment(
+        patient_name="기존환자",
+        patient_phone="010-2222-0000",
+        doctor_id=doctors[0].id,
+        treatment_id=treatment.id,
+        appointment_datetime=day.replace(hour=10).isoformat(),
+    )
+    assert existing_response.status_code == 201
+
+    # When: 일괄 생성 요청
+    response = await medisolveai_patient_client.create_appointments_batch(
+        items=[
+            # 0: 성공
+            _item(doctors[0].id, treatment.id, day.replace(hour=9), "010-2222-0001"),
+            # 1: 기존 예약과 겹침
+            _item(doctors[0].id, treatment.id, day.replace(hour=10, minute=15), "010-2222-0002"),
+            # 2: 성공
+            _item(doctors[1].id, treatment.id, day.replace(hour=10), "010-2222-0003"),
+            # 3: 같은 요청의 2번 항목과 겹침
+            _item(doctors[1].id, treatment.id, day.replace(hour=10), "010-2222-0004"),
+            # 4: 성공 (11:00 슬롯 수용 인원 1명)
+            _item(doctors[0].id, treatment.id, day.replace(hour=11), "010-2222-0005"),
+            # 5: 같은 요청의 4번 항목으로 11:00 슬롯 수용 인원 초과
+            _item(doctors[1].id, treatment.id, day.replace(hour=11), "010-2222-0006"),
+            # 6: 존재하지 않는 의사
+            _item(999999, treatment.id, day.replace(hour=14), "010-2222-0007"),
+            # 7: 15분 간격이 아닌 시간
+            _item(doctors[0].id, treatment.id, day.replace(hour=14, minute=10), "010-2222-0008"),
+        ]
+    )
+
+    # Then: 항목별 결과 확인
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_count"] == 8
+    assert data["success_count"] == 3
+    assert data["failure_count"] == 5
+
+    results = data["results"]
+    assert [result["index"] for result in results] == list(range(8))
+    assert [result["success"] for result in results] == [True, False, True, False, True, False, False, False]
+    assert results[1]["error"] == ErrorMessages.APPOINTMENT_ALREADY_EXISTS
+    assert results[3]["error"] == ErrorMessages.APPOINTMENT_ALREADY_EXISTS
+    assert results[5]["error"] == ErrorMessages.APPOINTMENT_CAPACITY_FULL
+    assert results[6]["error"] == ErrorMessages.DOCTOR_NOT_FOUND
+    assert results[7]["error"] == ErrorMessages.APPOINTMENT_TIME_INVALID
+
+    created = results[2]["appointment"]
+    assert created["doctor_id"] == doctors[1].id
+    assert created["patient_phone"] == "010-2222-0003"
+    assert created["status"] == AppointmentStatus.PENDING.value
+    assert created["visit_type"] == VisitType.FIRST_VISIT
+
+    # Then: 생성된 예약은 환자 예약 목록에서 조회됨
+    get_response = await medisolveai_patient_client.get_appointments(patient_phone="010-2222-0003")
+    assert [appointment["id"] for appointment in get_response.json()] == [created["id"]]
+
+    # Then: 생성된 예약 시간은 예약 가능 시간에서 제외됨
+    available_response = await medisolveai_patient_client.get_available_times(
+        doctor_id=doctors[1].id, treatment_id=treatment.id, date=day.date().isoformat()
+    )
+    assert "10:00" not in available_response.json()["available_times"]
+
+
+async def test_create_appointments_batch_statement_count_independent_of_item_count(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+) -> None:
+    """일괄 생성의 SQL 실행 횟수가 항목 수가 아닌 날짜 수와 잠금 수에 비례하는지 테스트"""
+    # Given: 의사 4명, 진료 항목 생성 (병렬 처리)
+    doctors, treatment = await asyncio.gather(
+        DoctorMother.create_bulk(count=4, department="피부과"),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+    )
+
+    # 이틀 동안 의사별 09:00~10:30 (30분 간격) 예약 → 2일 × 4명 × 4건 = 32건
+    schedule = [
+        (doctor.id, datetime(2024, 12, 2 + day, 9, 0) + timedelta(minutes=30 * slot))
+        for day in range(2)
+        for doctor in doctors
+        for slot in range(4)
+    ]
+    items = [
+        _item(doctor_id, treatment.id, appointment_datetime, f"010-3333-{index:04d}")
+        for index, (doctor_id, appointment_datetime) in enumerate(schedule)
+    ]
+
+    # When: 일괄 생성 요청
+    response = await medisolveai_patient_client.create_appointments_batch(items=items)
+
+    # Then: 모두 성공
+    assert response.status_code == 200
+    assert response.json()["success_count"] == len(items)
+
+    # Then: 잠금(잠금 이름마다 1회: (의사, 날짜) 8개 + (날짜, 30분 단위) 8개), 환자 조회/생성(3),
+    # 날짜별 예약 현황/예약 선점(4), 예약 생성/ID 조회(2), 점유 구간, 캐시 버전, 잠금 해제
+    # + 캐시 적재/동기화 여유분 (항목 수와 무관)
+    lock_count = len(doctors) * 2 + 2 * 4
+    assert int(response.headers[STATEMENT_COUNT_HEADER]) <= 19 + lock_count
+
+
+async def test_create_appointments_batch_reuses_patient_for_same_phone(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+) -> None:
+    """같은 전화번호의 항목들은 한 명의 환자로 생성되는지 테스트"""
+    # Given: 의사, 진료 항목 생성 (병렬 처리)
+    doctor, treatment = await asyncio.gather(
+        DoctorMother.create(name="김의사", department="피부과"),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+    )
+
+    # When: 같은 전화번호로 서로 다른 날짜 2건 일괄 생성
+    response = await medisolveai_patient_client.create_appointments_batch(
+        items=[
+            _item(doctor.id, treatment.id, datetime(2024, 12, 2, 10, 0), "010-4444-0000", patient_name="김환자"),
+            _item(doctor.id, treatment.id, datetime(2024, 12, 3, 10, 0), "010-4444-0000", patient_name="김환자"),
+        ]
+    )
+
+    # Then: 두 예약 모두 같은 환자로 조회됨
+    assert response.status_code == 200
+    assert response.json()["success_count"] == 2
+    get_response = await medisolveai_patient_client.get_appointments(patient_phone="010-4444-0000")
+    appointments = get_response.json()
+    assert len(appointments) == 2
+    assert {appointment["patient_name"] for appointment in appointments} == {"김환자"}
+
+
+async def test_create_appointments_batch_twice_releases_booking_locks(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+    pooled_session_maker_medisolveai: async_sessionmaker[AsyncSession],
+) -> None:
+    """같은 의사/날짜로 연달아 일괄 생성해도 매번 잠금이 해제되어 다음 요청이 대기 없이 성공하는지 테스트"""
+    # Given: 의사와 진료 항목 생성 (병렬 처리), 유휴 커넥션이 여럿인 커넥션 풀
+    doctor, treatment = await asyncio.gather(
+        DoctorMother.create(name="김의사", department="피부과"),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+    )
+    await warm_up_pool()
+    batches = [
+        [datetime(2024, 12, 2, 9, 0), datetime(2024, 12, 2, 9, 30)],
+        [datetime(2024, 12, 2, 10, 0), datetime(2024, 12, 2, 10, 30)],
+    ]
+
+    async with pooled_session_maker_medisolveai() as observer:
+        for batch_index, appointment_datetimes in enumerate(batches):
+            # When: 같은 의사/날짜로 일괄 생성
+            response = await medisolveai_patient_client.create_appointments_batch(
+                items=[
+                    _item(doctor.id, treatment.id, appointment_datetime, f"010-5555-{batch_index}00{index}")
+                    for index, appointment_datetime in enumerate(appointment_datetimes)
+                ]
+            )
+
+            # Then: 모두 성공, 사용한 잠금은 모두 해제
+            assert response.status_code == 200
+            assert response.json()["success_count"] == len(appointment_datetimes)
+            lock_names = sorted(
+                {
+                    lock_name
+                    for appointment_datetime in appointment_datetimes
+                    for lock_name in get_booking_lock_names(
+                        doctor_id=doctor.id,
+                        start_datetime=appointment_datetime,
+                        end_datetime=appointment_datetime + timedelta(minutes=treatment.duration_minutes),
+                    )
+                }
+            )
+            assert await get_used_locks(observer, lock_names) == {}
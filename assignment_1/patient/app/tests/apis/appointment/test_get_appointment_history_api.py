@@ -0,0 +1,116 @@
+"""
+예약 이력 조회 API 테스트
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+
+from app.core.constants import AppointmentHistoryMode, ErrorMessages
+from app.tests.mothers import DoctorMother, TreatmentMother
+from app.tests.test_client import MediSolveAiPatientClient
+
+PAST_MONDAY = date(2024, 12, 2)
+
+
+def _get_future_monday() -> date:
+    """조회 시점 기준 1주 이상 남은 월요일 (다가오는 예약 생성용)"""
+    today = date.today()
+    return today + timedelta(days=14 - today.weekday())
+
+
+async def test_get_appointment_history_pages_upcoming_and_past(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+) -> None:
+    """다가오는 예약은 오름차순, 지난 예약은 내림차순으로 커서를 따라 끝까지 조회되는지 테스트"""
+    # Given: 의사, 진료 항목 생성 (병렬 처리)
+    doctor, treatment = await asyncio.gather(
+        DoctorMother.create(name="김의사", department="피부과"),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+    )
+    patient_phone = "010-8888-0000"
+    hours = (time(10, 0), time(11, 0), time(14, 0))
+    past_datetimes = [datetime.combine(PAST_MONDAY, hour) for hour in hours]
+    upcoming_datetimes = [datetime.combine(_get_future_monday(), hour) for hour in hours]
+
+    # Given: 지난 예약 3건, 다가오는 예약 3건 생성 (순차 처리 - 같은 환자이므로)
+    for appointment_datetime in [*past_datetimes, *upcoming_datetimes]:
+        create_response = await medisolveai_patient_client.create_appointment(
+            patient_name="홍길동",
+            patient_phone=patient_phone,
+            doctor_id=doctor.id,
+            treatment_id=treatment.id,
+            appointment_datetime=appointment_datetime.isoformat(),
+        )
+        assert create_response.status_code == 201
+
+    async def collect_pages(mode: AppointmentHistoryMode) -> list[list[str]]:
+        pages: list[list[str]] = []
+        cursor: str | None = None
+        while True:
+            response = await medisolveai_patient_client.get_appointment_history(
+                patient_phone=patient_phone, mode=mode.value, cursor=cursor, page_size=2
+            )
+            assert response.status_code == 200
+            body = response.json()
+            assert body["mode"] == mode.value
+            pages.append([item["appointment_datetime"] for item in body["items"]])
+            cursor = body["next_cursor"]
+            if cursor is None:
+                return pages
+
+    # When: 다가오는 예약/지난 예약을 2건씩 조회
+    upcoming_pages, past_pages = await asyncio.gather(
+        collect_pages(AppointmentHistoryMode.UPCOMING), collect_pages(AppointmentHistoryMode.PAST)
+    )
+
+    # Then: 다가오는 예약은 오름차순, 지난 예약은 내림차순, 마지막 페이지에서 커서 없음
+    assert upcoming_pages == [
+        [upcoming_datetimes[0].isoformat(), upcoming_datetimes[1].isoformat()],
+        [upcoming_datetimes[2].isoformat()],
+    ]
+    assert past_pages == [
+        [past_datetimes[2].isoformat(), past_datetimes[1].isoformat()],
+        [past_datetimes[0].isoformat()],
+    ]
+
+
+async def test_get_appointment_history_rejects_invalid_cursor(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+) -> None:
+    """형식이 잘못된 커서나 다른 조회 구분의 커서는 거부되는지 테스트"""
+    # Given: 의사, 진료 항목, 다가오는 예약 2건 생성
+    doctor, treatment = await asyncio.gather(
+        DoctorMother.create(name="김의사", department="피부과"),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+    )
+    for hour in (10, 11):
+        await medisolveai_patient_client.create_appointment(
+            patient_name="홍길동",
+            patient_phone="010-8888-0001",
+            doctor_id=doctor.id,
+            treatment_id=treatment.id,
+            appointment_datetime=datetime.combine(_get_future_monday(), time(hour, 0)).isoformat(),
+        )
+    first_page = await medisolveai_patient_client.get_appointment_history(patient_phone="010-8888-0001", page_size=1)
+    upcoming_cursor = first_page.json()["next_cursor"]
+    assert upcoming_cursor is not None
+
+    # When: 잘못된 커서, 다가오는 예약 커서로 지난 예약 조회
+    invalid_response, other_mode_response = await asyncio.gather(
+        medisolveai_patient_client.get_appointment_history(patient_phone="010-8888-0001", cursor="not-a-cursor"),
+        medisolveai_patient_client.get_appointment_history(
+            patient_phone="010-8888-0001", mode=AppointmentHistoryMode.PAST.value, cursor=upcoming_cursor
+        ),
+    )
+
+    # Then: 두 요청 모두 커서 에러
+    for response in (invalid_response, other_mode_response):
+        assert response.status_code == 400
+        assert response.json()["message"] == ErrorMessages.APPOINTMENT_HISTORY_CURSOR_INVALID
+
+    # Then: 등록되지 않은 환자는 빈 페이지
+    unknown_response = await medisolveai_patient_client.get_appointment_history(patient_phone="010-8888-9999")
+    assert unknown_response.json() == {"mode": "upcoming", "items": [], "next_cursor": None}
@@ -0,0 +1,153 @@
+"""
+멱등성 키(Idempotency-Key) API 테스트
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+
+import httpx
+
+from app.core.constants import AppointmentStatus, ErrorMessages
+from app.services.idempotency import IDEMPOTENT_REPLAYED_HEADER
+from app.tests.mothers import DoctorMother, TreatmentMother
+from app.tests.test_client import MediSolveAiPatientClient
+
+
+async def test_create_appointment_retry_with_same_key_returns_stored_response(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+) -> None:
+    """같은 키로 재시도한 예약 생성은 다시 실행되지 않고 첫 응답이 반환되는지 테스트"""
+    # Given: 의사와 진료 항목 생성 (병렬 처리)
+    doctor, treatment = await asyncio.gather(
+        DoctorMother.create(name="김의사", department="피부과"),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+    )
+
+    async def create_appointment(idempotency_key: str) -> httpx.Response:
+        return await medisolveai_patient_client.create_appointment(
+            patient_name="홍길동",
+            patient_phone="010-6666-0000",
+            doctor_id=doctor.id,
+            treatment_id=treatment.id,
+            appointment_datetime=datetime(2024, 12, 2, 10, 0).isoformat(),
+            idempotency_key=idempotency_key,
+        )
+
+    # When: 같은 키로 두 번 요청
+    first_response = await create_appointment(idempotency_key="create-1")
+    retry_response = await create_appointment(idempotency_key="create-1")
+
+    # Then: 재시도도 201, 같은 예약 응답 (중복 예약 에러 없음)
+    assert first_response.status_code == 201
+    assert IDEMPOTENT_REPLAYED_HEADER not in first_response.headers
+    assert retry_response.status_code == 201
+    assert retry_response.headers[IDEMPOTENT_REPLAYED_HEADER] == "true"
+    assert retry_response.json() == first_response.json()
+
+    # Then: 예약은 한 건만 생성됨
+    get_response = await medisolveai_patient_client.get_appointments(patient_phone="010-6666-0000")
+    assert [appointment["id"] for appointment in get_response.json()] == [first_response.json()["id"]]
+
+    # Then: 다른 키로 같은 요청을 보내면 실제로 다시 처리됨
+    new_key_response = await create_appointment(idempotency_key="create-2")
+    assert new_key_response.status_code == 400
+    assert new_key_response.json()["message"] == ErrorMessages.APPOINTMENT_ALREADY_EXISTS
+
+
+async def test_create_appointment_same_key_with_different_request_rejected(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+) -> None:
+    """같은 키로 다른 내용의 요청을 보내면 거부되는지 테스트"""
+    # Given: 의사와 진료 항목 생성 후 키를 사용한 예약 생성 (병렬 처리)
+    doctor, treatment = await asyncio.gather(
+        DoctorMother.create(name="김의사", department="피부과"),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+    )
+    first_response = await medisolveai_patient_client.create_appointment(
+        patient_name="홍길동",
+        patient_phone="010-6666-0001",
+        doctor_id=doctor.id,
+        treatment_id=treatment.id,
+        appointment_datetime=datetime(2024, 12, 2, 10, 0).isoformat(),
+        idempotency_key="create-reused",
+    )
+    assert first_response.status_code == 201
+
+    # When: 같은 키로 다른 시간 예약 요청
+    response = await medisolveai_patient_client.create_appointment(
+        patient_name="홍길동",
+        patient_phone="010-6666-0001",
+        doctor_id=doctor.id,
+        treatment_id=treatment.id,
+        appointment_datetime=datetime(2024, 12, 2, 11, 0).isoformat(),
+        idempotency_key="create-reused",
+    )
+
+    # Then: 키 재사용 에러, 두 번째 예약은 생성되지 않음
+    assert response.status_code == 400
+    assert response.json()["message"] == ErrorMessages.IDEMPOTENCY_KEY_REUSED
+    get_response = await medisolveai_patient_client.get_appointments(patient_phone="010-6666-0001")
+    assert len(get_response.json()) == 1
+
+
+async def test_create_appointment_business_error_is_replayed(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+) -> None:
+    """업무 오류 응답도 저장되어 같은 키의 재시도에 그대로 반환되는지 테스트"""
+    # Given: 진료 항목만 생성
+    treatment = await TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00"))
+
+    # When: 존재하지 않는 의사로 같은 키를 사용해 두 번 요청
+    responses = [
+        await medisolveai_patient_client.create_appointment(
+            patient_name="홍길동",
+            patient_phone="010-6666-0002",
+            doctor_id=999999,
+            treatment_id=treatment.id,
+            appointment_datetime=datetime(2024, 12, 2, 10, 0).isoformat(),
+            idempotency_key="create-error",
+        )
+        for _ in range(2)
+    ]
+
+    # Then: 두 응답 모두 같은 에러, 두 번째는 저장된 응답
+    assert [response.status_code for response in responses] == [400, 400]
+    assert [response.json()["message"] for response in responses] == [ErrorMessages.DOCTOR_NOT_FOUND] * 2
+    assert responses[1].headers[IDEMPOTENT_REPLAYED_HEADER] == "true"
+
+
+async def test_cancel_appointment_retry_with_same_key_returns_stored_response(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+) -> None:
+    """같은 키로 재시도한 예약 취소는 '이미 취소된 예약' 에러 없이 첫 응답이 반환되는지 테스트"""
+    # Given: 의사, 진료 항목, 예약 생성
+    doctor, treatment = await asyncio.gather(
+        DoctorMother.create(name="김의사", department="피부과"),
+        TreatmentMother.create(name="기본 진료", duration_minutes=30, price=Decimal("50000.00")),
+    )
+    create_response = await medisolveai_patient_client.create_appointment(
+        patient_name="홍길동",
+        patient_phone="010-6666-0003",
+        doctor_id=doctor.id,
+        treatment_id=treatment.id,
+        appointment_datetime=datetime(2024, 12, 2, 10, 0).isoformat(),
+    )
+    appointment_id = create_response.json()["id"]
+
+    # When: 같은 키로 두 번 취소
+    first_response = await medisolveai_patient_client.cancel_appointment(
+        appointment_id=appointment_id, patient_phone="010-6666-0003", idempotency_key="cancel-1"
+    )
+    retry_response = await medisolveai_patient_client.cancel_appointment(
+        appointment_id=appointment_id, patient_phone="010-6666-0003", idempotency_key="cancel-1"
+    )
+
+    # Then: 두 응답 모두 취소 성공
+    assert first_response.status_code == 200
+    assert first_response.json()["status"] == AppointmentStatus.CANCELLED.value
+    assert retry_response.status_code == 200
+    assert retry_response.headers[IDEMPOTENT_REPLAYED_HEADER] == "true"
+    assert retry_response.json() == first_response.json()
@@ -32,6 +32,19 @@ def session_maker_medisolveai() -> async_sessionmaker[AsyncSession]:
     )
 
 
+@pytest.fixture()
+async def pooled_session_maker_medisolveai() -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
+    """커넥션 풀을 사용하는 테스트용 세션 메이커 (커밋 후에도 커넥션이 닫히지 않아 네임드 락 누수 확인용)"""
+    async_engine = create_async_engine(settings.database_url, echo=settings.is_local)
+    yield async_sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+        bind=async_engine,
+    )
+    await async_engine.dispose()
+
+
 @pytest.fixture()
 async def medisolveai_patient_client(
     session_maker_medisolveai: async_sessionmaker[AsyncSession],
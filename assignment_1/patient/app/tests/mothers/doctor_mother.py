@@ -10,6 +10,7 @@ from app.core.constants import Department
 from app.core.database.connection_async import get_async_session
 from app.models.doctor import Doctor
 from app.services.doctor_service import service_create_doctor
+from app.services.reference_data_cache import doctor_cache
 
 
 class DoctorMother:
@@ -67,4 +68,5 @@ class DoctorMother:
         async with get_async_session() as session:
             doctors = await Doctor.create_bulk(session=session, doctors_data=doctors_data)
             await session.commit()
+            doctor_cache.invalidate()
             return doctors
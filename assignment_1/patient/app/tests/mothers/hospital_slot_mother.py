@@ -11,6 +11,8 @@ from datetime import time
 from app.core.constants.day_of_week import DayOfWeek
 from app.core.database.connection_async import get_async_session
 from app.models.hospital_slot import HospitalSlot
+from app.services.availability_cache import availability_cache
+from app.services.hospital_capacity import hospital_capacity_matrix_cache
 
 
 class HospitalSlotMother:
@@ -48,4 +50,8 @@ class HospitalSlotMother:
             await session.flush()
             await session.refresh(hospital_slot)
             await session.commit()
+
+            # DB에 직접 생성하므로 수용 인원 매트릭스 및 예약 가능 시간 캐시를 직접 무효화
+            hospital_capacity_matrix_cache.invalidate()
+            availability_cache.invalidate()
             return hospital_slot
@@ -10,6 +10,7 @@ from decimal import Decimal
 
 from app.core.database.connection_async import get_async_session
 from app.models.treatment import Treatment
+from app.services.reference_data_cache import treatment_cache
 
 
 class TreatmentMother:
@@ -47,4 +48,5 @@ class TreatmentMother:
             await session.flush()
             await session.refresh(treatment)
             await session.commit()
+            treatment_cache.invalidate()
             return treatment
@@ -0,0 +1 @@
+"""쿼리 실행 계획 테스트"""
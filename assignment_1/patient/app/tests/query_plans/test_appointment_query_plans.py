@@ -0,0 +1,166 @@
+"""
+예약 조회 쿼리 실행 계획 테스트
+
+핫 경로 쿼리가 의도한 인덱스로 범위 검색하는지 EXPLAIN으로 확인 (날짜 조건을 함수로 감싸면 실패)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.constants import AppointmentStatus, VisitType
+from app.models import Appointment, Patient
+from app.tests.mothers import DoctorMother, TreatmentMother
+from app.tests.test_client import MediSolveAiPatientClient
+from app.tests.utils import explain, get_table_plan, record_statements
+
+SEED_START_DATETIME = datetime(2024, 11, 1, 9, 0)
+SEED_DAYS = 40
+TARGET_DATE = date(2024, 11, 20)
+
+
+async def _seed_appointments(session_maker: async_sessionmaker[AsyncSession]) -> list[int]:
+    """의사 5명 × 40일 × 하루 4건 예약 생성 후 통계 갱신, 의사 ID 목록 반환"""
+    doctors, treatments = await asyncio.gather(
+        DoctorMother.create_bulk(count=5),
+        asyncio.gather(
+            *[
+                TreatmentMother.create(name=f"진료{minutes}", duration_minutes=minutes, price=Decimal("50000.00"))
+                for minutes in (30, 60, 90, 120)
+            ]
+        ),
+    )
+
+    async with session_maker() as session:
+        patient = Patient(name="실행계획", phone="010-7000-0000")
+        session.add(patient)
+        await session.flush()
+
+        session.add_all(
+            [
+                Appointment(
+                    doctor_id=doctor.id,
+                    patient_id=patient.id,
+                    treatment_id=treatments[hour % len(treatments)].id,
+                    appointment_datetime=SEED_START_DATETIME + timedelta(days=day, hours=hour * 2),
+                    status=AppointmentStatus.PENDING,
+                    visit_type=VisitType.FIRST_VISIT,
+                )
+                for day in range(SEED_DAYS)
+                for doctor in doctors
+                for hour in range(4)
+            ]
+        )
+        await session.commit()
+        await session.execute(text("ANALYZE TABLE appointments"))
+
+    return [doctor.id for doctor in doctors]
+
+
+async def test_day_scoped_appointments_use_datetime_index(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+    session_maker_medisolveai: async_sessionmaker[AsyncSession],
+) -> None:
+    """예약 가능 시간 조회의 하루 예약 조회가 appointment_datetime 인덱스를 범위 검색하는지 테스트"""
+    # Given: 예약 데이터 생성
+    await _seed_appointments(session_maker_medisolveai)
+
+    async with session_maker_medisolveai() as session:
+        # When: 하루 예약 조회 SQL 기록 후 EXPLAIN
+        async with record_statements(session) as statements:
+            await Appointment.get_active_with_treatment(session=session, appointment_date=TARGET_DATE)
+        plan = await explain(session, *statements[0])
+
+    # Then: appointments 테이블은 idx_appointments_datetime_status 범위 검색
+    appointments_plan = get_table_plan(plan, "appointments")
+    assert appointments_plan["key"] == "idx_appointments_datetime_status"
+    assert appointments_plan["type"] == "range"
+
+
+async def test_range_scoped_appointments_use_datetime_index(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+    session_maker_medisolveai: async_sessionmaker[AsyncSession],
+) -> None:
+    """수용 인원 검증/캘린더의 기간 예약 조회가 appointment_datetime 인덱스를 범위 검색하는지 테스트"""
+    # Given: 예약 데이터 생성
+    await _seed_appointments(session_maker_medisolveai)
+
+    async with session_maker_medisolveai() as session:
+        # When: 2시간 범위 예약 조회 SQL 기록 후 EXPLAIN
+        async with record_statements(session) as statements:
+            await Appointment.get_active_with_treatment_between(
+                session=session,
+                start_datetime=datetime(2024, 11, 20, 9, 0),
+                end_datetime=datetime(2024, 11, 20, 11, 0),
+            )
+        plan = await explain(session, *statements[0])
+
+    # Then: appointments 테이블은 idx_appointments_datetime_status 범위 검색
+    appointments_plan = get_table_plan(plan, "appointments")
+    assert appointments_plan["key"] == "idx_appointments_datetime_status"
+    assert appointments_plan["type"] == "range"
+
+
+async def test_doctor_overlap_check_uses_doctor_datetime_index(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+    session_maker_medisolveai: async_sessionmaker[AsyncSession],
+) -> None:
+    """중복 예약 검증이 idx_appointments_doctor_datetime_status 인덱스를 범위 검색하는지 테스트"""
+    # Given: 예약 데이터 생성
+    doctor_ids = await _seed_appointments(session_maker_medisolveai)
+
+    async with session_maker_medisolveai() as session:
+        # When: 중복 예약 존재 여부 SQL 기록 후 EXPLAIN
+        async with record_statements(session) as statements:
+            await Appointment.exists_overlapping_for_doctor(
+                session=session,
+                doctor_id=doctor_ids[0],
+                start_datetime=datetime(2024, 11, 20, 10, 0),
+                end_datetime=datetime(2024, 11, 20, 10, 30),
+                max_duration_minutes=120,
+            )
+        plan = await explain(session, *statements[0])
+
+    # Then: appointments 테이블은 idx_appointments_doctor_datetime_status 범위 검색
+    appointments_plan = get_table_plan(plan, "appointments")
+    assert appointments_plan["key"] == "idx_appointments_doctor_datetime_status"
+    assert appointments_plan["type"] == "range"
+
+
+async def test_patient_history_page_uses_patient_datetime_id_index_without_filesort(
+    medisolveai_patient_client: MediSolveAiPatientClient,
+    session_maker_medisolveai: async_sessionmaker[AsyncSession],
+) -> None:
+    """예약 이력 커서 페이지 조회가 idx_appointments_patient_datetime_id를 정렬 순서대로 범위 검색하는지 테스트"""
+    # Given: 예약 데이터 생성 (한 환자에게 800건)
+    await _seed_appointments(session_maker_medisolveai)
+    now = datetime(2024, 11, 20, 12, 0)
+    cursors = {True: (datetime(2024, 11, 25, 9, 0), 0), False: (datetime(2024, 11, 10, 9, 0), 0)}
+
+    async with session_maker_medisolveai() as session:
+        patient = await Patient.get_data_by_phone(session=session, phone="010-7000-0000")
+        assert patient is not None
+
+        for upcoming, after in cursors.items():
+            # When: 커서 다음 페이지 조회 SQL 기록 후 EXPLAIN (upcoming: 오름차순, past: 내림차순)
+            async with record_statements(session) as statements:
+                await Appointment.get_data_page_by_patient_id(
+                    session=session,
+                    patient_id=patient.id,
+                    now=now,
+                    upcoming=upcoming,
+                    after=after,
+                    limit=11,
+                )
+            plan = await explain(session, *statements[0])
+
+            # Then: appointments 테이블은 idx_appointments_patient_datetime_id 범위 검색, 별도 정렬 없음
+            appointments_plan = get_table_plan(plan, "appointments")
+            assert appointments_plan["key"] == "idx_appointments_patient_datetime_id"
+            assert appointments_plan["type"] == "range"
+            assert "Using filesort" not in (appointments_plan["Extra"] or "")
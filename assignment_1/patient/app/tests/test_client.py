@@ -6,6 +6,8 @@ from typing import Any
 
 import httpx
 
+from app.services.idempotency import IDEMPOTENCY_KEY_HEADER
+
 
 class MediSolveAiPatientClient:
     """Patient App 테스트 클라이언트"""
@@ -26,6 +28,11 @@ class MediSolveAiPatientClient:
         response = await self._client.get("/health")
         return dict(response.json())
 
+    async def get_metrics(self) -> dict[str, Any]:
+        """Patient App 캐시 지표 조회"""
+        response = await self._client.get("/metrics")
+        return dict(response.json())
+
     async def get_doctors(self, department: str | None = None) -> httpx.Response:
         """의사 목록 조회"""
         params = {
@@ -44,6 +51,19 @@ class MediSolveAiPatientClient:
             params={"doctor_id": doctor_id, "treatment_id": treatment_id, "date": date},
         )
 
+    async def get_available_calendar(
+        self,
+        treatment_id: int,
+        date_from: str,
+        date_to: str,
+        doctor_ids: list[int] | None = None,
+    ) -> httpx.Response:
+        """예약 가능 시간 캘린더 조회"""
+        params: dict[str, Any] = {"treatment_id": treatment_id, "date_from": date_from, "date_to": date_to}
+        if doctor_ids is not None:
+            params["doctor_ids"] = doctor_ids
+        return await self._client.get("/api/v1/patient/appointments/available-times/calendar", params=params)
+
     async def get_appointments(self, patient_phone: str) -> httpx.Response:
         """예약 목록 조회"""
         return await self._client.get(
@@ -51,6 +71,23 @@ class MediSolveAiPatientClient:
             params={"patient_phone": patient_phone},
         )
 
+    async def get_appointment_history(
+        self,
+        patient_phone: str,
+        mode: str | None = None,
+        cursor: str | None = None,
+        page_size: int | None = None,
+    ) -> httpx.Response:
+        """예약 이력 조회 (커서 기반 페이지)"""
+        params: dict[str, Any] = {"patient_phone": patient_phone}
+        if mode is not None:
+            params["mode"] = mode
+        if cursor is not None:
+            params["cursor"] = cursor
+        if page_size is not None:
+            params["page_size"] = page_size
+        return await self._client.get("/api/v1/patient/appointments/history", params=params)
+
     async def create_appointment(
         self,
         patient_name: str,
@@ -59,6 +96,7 @@ class MediSolveAiPatientClient:
         treatment_id: int,
         appointment_datetime: str,
         memo: str | None = None,
+        idempotency_key: str | None = None,
     ) -> httpx.Response:
         """예약 생성"""
         data = {
@@ -70,11 +108,61 @@ class MediSolveAiPatientClient:
         }
         if memo is not None:
             data["memo"] = memo
-        return await self._client.post("/api/v1/patient/appointments", json=data)
+        return await self._client.post(
+            "/api/v1/patient/appointments", json=data, headers=_idempotency_headers(idempotency_key)
+        )
 
-    async def cancel_appointment(self, appointment_id: int, patient_phone: str) -> httpx.Response:
+    async def create_appointments_batch(self, items: list[dict[str, Any]]) -> httpx.Response:
+        """예약 일괄 생성"""
+        return await self._client.post("/api/v1/patient/appointments:batch", json={"items": items})
+
+    async def cancel_appointment(
+        self, appointment_id: int, patient_phone: str, idempotency_key: str | None = None
+    ) -> httpx.Response:
         """예약 취소"""
         return await self._client.patch(
             f"/api/v1/patient/appointments/{appointment_id}/cancel",
             params={"patient_phone": patient_phone},
+            headers=_idempotency_headers(idempotency_key),
         )
+
+    async def create_appointment_hold(
+        self, patient_phone: str, doctor_id: int, treatment_id: int, appointment_datetime: str
+    ) -> httpx.Response:
+        """예약 선점"""
+        data = {
+            "patient_phone": patient_phone,
+            "doctor_id": doctor_id,
+            "treatment_id": treatment_id,
+            "appointment_datetime": appointment_datetime,
+        }
+        return await self._client.post("/api/v1/patient/appointments/holds", json=data)
+
+    async def confirm_appointment_hold(
+        self,
+        hold_id: int,
+        patient_name: str,
+        patient_phone: str,
+        memo: str | None = None,
+        idempotency_key: str | None = None,
+    ) -> httpx.Response:
+        """예약 선점 확정"""
+        data = {"patient_name": patient_name, "patient_phone": patient_phone}
+        if memo is not None:
+            data["memo"] = memo
+        return await self._client.post(
+            f"/api/v1/patient/appointments/holds/{hold_id}/confirm",
+            json=data,
+            headers=_idempotency_headers(idempotency_key),
+        )
+
+    async def release_appointment_hold(self, hold_id: int, patient_phone: str) -> httpx.Response:
+        """예약 선점 해제"""
+        return await self._client.delete(
+            f"/api/v1/patient/appointments/holds/{hold_id}", params={"patient_phone": patient_phone}
+        )
+
+
+def _idempotency_headers(idempotency_key: str | None) -> dict[str, str]:
+    """Idempotency-Key 헤더 (키가 없으면 빈 헤더)"""
+    return {} if idempotency_key is None else {IDEMPOTENCY_KEY_HEADER: idempotency_key}
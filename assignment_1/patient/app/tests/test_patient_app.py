@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from app.core.database.orm import Base
+
 from .test_client import MediSolveAiPatientClient
 
 
@@ -19,3 +21,31 @@ async def test_patient_app_health(medisolveai_patient_client: MediSolveAiPatient
     assert response["status"] == "healthy"
     assert response["service"] == "patient_api"
     assert "environment" in response
+
+
+async def test_patient_app_metrics(medisolveai_patient_client: MediSolveAiPatientClient) -> None:
+    """Patient App 캐시 지표 조회 테스트"""
+    response = await medisolveai_patient_client.get_metrics()
+    stats = response["availability_cache"]
+    assert {"hits", "misses", "evictions", "invalidations", "size", "max_entries"} <= set(stats)
+    assert stats["size"] <= stats["max_entries"]
+    assert {"hits", "misses", "size"} <= set(response["doctor_cache"])
+    assert {"hits", "misses", "size"} <= set(response["treatment_cache"])
+    assert {"acquisitions", "timeouts", "retries", "wait_seconds_total", "wait_seconds_max"} <= set(
+        response["booking_locks"]
+    )
+
+
+def test_relationships_never_lazy_load() -> None:
+    """
+    모든 관계가 암묵적 지연 로딩 대신 접근 시 에러를 내도록 설정되었는지 테스트
+
+    엔드포인트가 로딩 옵션 없이 관계에 접근하면 에러가 발생하므로, API 테스트 통과 = 암묵적 지연 로딩 없음
+    """
+    lazy_relationships = [
+        f"{mapper.class_.__name__}.{relationship.key}"
+        for mapper in Base.registry.mappers
+        for relationship in mapper.relationships
+        if relationship.lazy != "raise"
+    ]
+    assert lazy_relationships == []
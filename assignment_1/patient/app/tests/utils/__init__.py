@@ -3,7 +3,14 @@
 """
 
 from .db_cleanup import reset_test_tables
+from .named_locks import get_used_locks, warm_up_pool
+from .query_plan import explain, get_table_plan, record_statements
 
 __all__ = [
     "reset_test_tables",
+    "record_statements",
+    "explain",
+    "get_table_plan",
+    "get_used_locks",
+    "warm_up_pool",
 ]
@@ -9,7 +9,11 @@ from __future__ import annotations
 from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import Appointment, Doctor, HospitalSlot, Patient, Treatment
+from app.models import Appointment, AppointmentHold, Doctor, HospitalSlot, IdempotencyKey, Patient, Treatment
+from app.services.availability_cache import availability_cache
+from app.services.hospital_capacity import hospital_capacity_matrix_cache
+from app.services.patient_cache import patient_cache
+from app.services.reference_data_cache import doctor_cache, treatment_cache
 
 
 async def reset_test_tables(session: AsyncSession) -> None:
@@ -23,9 +27,18 @@ async def reset_test_tables(session: AsyncSession) -> None:
     """
     # 외래키가 있는 테이블부터 삭제
     await session.execute(delete(Appointment))
+    await session.execute(delete(AppointmentHold))
     # 외래키가 없는 테이블 삭제
     await session.execute(delete(Doctor))
     await session.execute(delete(Patient))
     await session.execute(delete(Treatment))
     await session.execute(delete(HospitalSlot))
+    await session.execute(delete(IdempotencyKey))
     await session.commit()
+
+    # 테이블 초기화에 맞춰 인메모리 캐시도 초기화
+    hospital_capacity_matrix_cache.invalidate()
+    availability_cache.invalidate()
+    doctor_cache.invalidate()
+    treatment_cache.invalidate()
+    patient_cache.invalidate()
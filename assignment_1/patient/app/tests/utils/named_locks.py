@@ -0,0 +1,30 @@
+"""
+네임드 락 확인 유틸리티
+
+예약 잠금이 블록 종료 후 실제로 해제되었는지 확인 (풀에 반환된 커넥션에 남은 잠금 검출)
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_async_session
+
+
+async def warm_up_pool() -> None:
+    """서비스 엔진의 커넥션 풀에 유휴 커넥션을 둘 이상 준비 (커밋 후 다른 커넥션을 받을 수 있는 상태)"""
+    async with get_async_session() as first, get_async_session() as second:
+        await first.execute(text("SELECT 1"))
+        await second.execute(text("SELECT 1"))
+
+
+async def get_used_locks(session: AsyncSession, lock_names: list[str]) -> dict[str, int]:
+    """아직 보유 중인 네임드 락 → 보유한 커넥션 ID (IS_USED_LOCK이 NULL이 아닌 잠금만)"""
+    used_locks: dict[str, int] = {}
+    for lock_name in lock_names:
+        owner = await session.scalar(text("SELECT IS_USED_LOCK(:name)"), {"name": lock_name})
+        if owner is not None:
+            used_locks[lock_name] = int(owner)
+    await session.rollback()
+    return used_locks
@@ -0,0 +1,197 @@
+"""환자 예약 목록 조회에서 ORM 엔티티 조회와 컬럼 프로젝션 조회의 요청당 메모리/지연 시간을 비교하는 벤치마크 스크립트.
+
+테스트 DB(포트 3309)를 초기화하므로 테스트 DB 컨테이너를 띄운 뒤 실행합니다.
+
+    cd patient
+    ENVIRONMENT=test uv run python scripts/benchmark_appointment_read_models.py --histories 100 1000 5000 --iterations 20
+"""
+
+from __future__ import annotations
+
+import asyncio
+import pathlib
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+ROOT_DIR = pathlib.Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from sqlalchemy import select  # noqa: E402
+from sqlalchemy.orm import joinedload  # noqa: E402
+
+from app.core.configs.settings import settings  # noqa: E402
+from app.core.constants import AppointmentStatus, VisitType  # noqa: E402
+from app.core.database.connection_async import get_async_session  # noqa: E402
+from app.dtos.appointment import AppointmentResponse  # noqa: E402
+from app.models import Appointment, Doctor, Patient, Treatment  # noqa: E402
+from app.tests.utils.db_cleanup import reset_test_tables  # noqa: E402
+
+SEED_START_DATETIME = datetime(2020, 1, 1, 9, 0)
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    method: str
+    history: int
+    latencies: list[float]
+    peak_bytes: list[int]
+
+
+def parse_args() -> tuple[list[int], int]:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark ORM entity vs column projection appointment reads.")
+    parser.add_argument("--histories", type=int, nargs="+", default=[100, 1000, 5000], help="환자별 예약 건수")
+    parser.add_argument("--iterations", type=int, default=20, help="방식/건수별 조회 반복 횟수")
+
+    args = parser.parse_args()
+    return args.histories, args.iterations
+
+
+async def prepare_data(history: int) -> Patient:
+    """테이블 초기화 후 의사 5명, 진료 항목 2개, 예약 history건을 가진 환자 생성"""
+    async with get_async_session() as session:
+        await reset_test_tables(session)
+        doctors = [Doctor(name=f"의사{i + 1}", department="피부과", is_active=True) for i in range(5)]
+        treatments = [
+            Treatment(name="기본 진료", duration_minutes=30, price=Decimal("50000.00"), is_active=True),
+            Treatment(name="복합 치료", duration_minutes=60, price=Decimal("100000.00"), is_active=True),
+        ]
+        patient = Patient(name="장기환자", phone="010-9000-0000")
+        session.add_all([*doctors, *treatments, patient])
+        await session.flush()
+
+        session.add_all(
+            [
+                Appointment(
+                    doctor_id=doctors[index % len(doctors)].id,
+                    patient_id=patient.id,
+                    treatment_id=treatments[index % len(treatments)].id,
+                    appointment_datetime=SEED_START_DATETIME + timedelta(days=index // 4, hours=index % 4 * 2),
+                    status=AppointmentStatus.COMPLETED,
+                    visit_type=VisitType.FIRST_VISIT if index == 0 else VisitType.RETURN_VISIT,
+                    memo=f"진료 기록 {index}",
+                )
+                for index in range(history)
+            ]
+        )
+        await session.commit()
+        return patient
+
+
+async def read_with_entities(patient: Patient) -> list[AppointmentResponse]:
+    """변경 전 방식: Appointment 엔티티와 의사/진료 항목을 joinedload로 함께 로드 후 관계 속성으로 변환"""
+    async with get_async_session() as session:
+        query = (
+            select(Appointment)
+            .options(
+                joinedload(Appointment.doctor, innerjoin=True),
+                joinedload(Appointment.treatment, innerjoin=True),
+            )
+            .where(Appointment.patient_id == patient.id)
+            .order_by(Appointment.appointment_datetime.desc())
+        )
+        result = await session.execute(query)
+        return [
+            AppointmentResponse(
+                id=appointment.id,
+                patient_name=patient.name,
+                patient_phone=patient.phone,
+                doctor_id=appointment.doctor.id,
+                doctor_name=appointment.doctor.name,
+                treatment_id=appointment.treatment.id,
+                treatment_name=appointment.treatment.name,
+                appointment_datetime=appointment.appointment_datetime,
+                status=appointment.status.value,
+                visit_type=appointment.visit_type.value,
+                memo=appointment.memo,
+            )
+            for appointment in result.scalars().all()
+        ]
+
+
+async def read_with_projection(patient: Patient) -> list[AppointmentResponse]:
+    """변경 후 방식: Appointment.get_data_by_patient_id (필요한 컬럼만 조회)"""
+    async with get_async_session() as session:
+        appointments = await Appointment.get_data_by_patient_id(session=session, patient_id=patient.id)
+        return [
+            AppointmentResponse(
+                id=appointment.id,
+                patient_name=patient.name,
+                patient_phone=patient.phone,
+                doctor_id=appointment.doctor_id,
+                doctor_name=appointment.doctor_name,
+                treatment_id=appointment.treatment_id,
+                treatment_name=appointment.treatment_name,
+                appointment_datetime=appointment.appointment_datetime,
+                status=appointment.status.value,
+                visit_type=appointment.visit_type.value,
+                memo=appointment.memo,
+            )
+            for appointment in appointments
+        ]
+
+
+async def run_method(
+    method: str,
+    read: Callable[[Patient], Awaitable[list[AppointmentResponse]]],
+    patient: Patient,
+    history: int,
+    iterations: int,
+) -> BenchmarkResult:
+    # 워밍업 (커넥션 풀, 컴파일 캐시)
+    assert len(await read(patient)) == history
+
+    # 지연 시간은 tracemalloc 없이 측정
+    latencies: list[float] = []
+    for _ in range(iterations):
+        started_at = time.perf_counter()
+        await read(patient)
+        latencies.append(time.perf_counter() - started_at)
+
+    # 요청당 최대 메모리 사용량 (응답 리스트 포함)
+    peak_bytes: list[int] = []
+    tracemalloc.start()
+    for _ in range(iterations):
+        tracemalloc.clear_traces()
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        await read(patient)
+        _, peak = tracemalloc.get_traced_memory()
+        peak_bytes.append(peak - baseline)
+    tracemalloc.stop()
+
+    return BenchmarkResult(method=method, history=history, latencies=latencies, peak_bytes=peak_bytes)
+
+
+def print_result(result: BenchmarkResult) -> None:
+    latencies_ms = sorted(latency * 1000 for latency in result.latencies)
+    peak_kib = statistics.median(result.peak_bytes) / 1024
+
+    print(f"[{result.method}] history={result.history}")
+    print(f"  latency p50/max : {statistics.median(latencies_ms):.1f}ms / {latencies_ms[-1]:.1f}ms")
+    print(f"  peak memory     : {peak_kib:.1f}KiB/request ({peak_kib * 1024 / result.history:.0f}B/appointment)")
+
+
+async def main(histories: list[int] | None = None, iterations: int = 20) -> None:
+    if not settings.is_test:
+        raise SystemExit("테스트 DB를 초기화하므로 ENVIRONMENT=test 에서만 실행합니다.")
+
+    for history in histories or [100, 1000, 5000]:
+        patient = await prepare_data(history)
+        print_result(await run_method("entities", read_with_entities, patient, history, iterations))
+        print_result(await run_method("projection", read_with_projection, patient, history, iterations))
+
+    async with get_async_session() as session:
+        await reset_test_tables(session)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(*parse_args()))
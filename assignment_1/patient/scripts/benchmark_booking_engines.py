@@ -0,0 +1,199 @@
+"""동시 예약 요청 폭주 상황에서 예약 생성 방식(validator / slot_ticks)을 비교하는 벤치마크 스크립트.
+
+테스트 DB(포트 3309)를 초기화하므로 테스트 DB 컨테이너를 띄운 뒤 실행합니다.
+
+    cd patient
+    ENVIRONMENT=test uv run python scripts/benchmark_booking_engines.py --requests 500 --concurrency 15
+"""
+
+from __future__ import annotations
+
+import asyncio
+import pathlib
+import random
+import statistics
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+ROOT_DIR = pathlib.Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from sqlalchemy import func, literal_column, select  # noqa: E402
+from sqlalchemy.orm import aliased  # noqa: E402
+
+from app.core.configs.settings import settings  # noqa: E402
+from app.core.constants import AppointmentStatus, BookingEngine  # noqa: E402
+from app.core.database.connection_async import get_async_session  # noqa: E402
+from app.core.exceptions import MediSolveAiException  # noqa: E402
+from app.dtos.appointment import CreateAppointmentRequest  # noqa: E402
+from app.models import Appointment, Doctor, Treatment  # noqa: E402
+from app.services.appointment_service import service_create_appointment  # noqa: E402
+from app.services.booking_locks import booking_lock_metrics  # noqa: E402
+from app.tests.utils.db_cleanup import reset_test_tables  # noqa: E402
+
+BOOKING_DATE = datetime(2024, 12, 2)  # 월요일
+SLOT_COUNT = 12  # 09:00 ~ 11:45 (15분 간격) 에 요청 집중
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    engine: BookingEngine
+    elapsed_seconds: float
+    latencies: list[float]
+    outcomes: Counter[str]
+    overlapping_pairs: int
+    lock_wait_seconds: float
+
+
+def parse_args() -> tuple[int, int, int, int]:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark booking engines under a concurrent booking storm.")
+    parser.add_argument("--requests", type=int, default=500, help="엔진별 예약 요청 수")
+    parser.add_argument(
+        "--concurrency", type=int, default=15, help="동시 요청 수 (커넥션 풀 크기 5 + 오버플로 10 이하 권장)"
+    )
+    parser.add_argument("--doctors", type=int, default=5, help="의사 수")
+    parser.add_argument("--seed", type=int, default=42, help="요청 생성 난수 시드")
+
+    args = parser.parse_args()
+    return args.requests, args.concurrency, args.doctors, args.seed
+
+
+async def prepare_data(doctor_count: int) -> tuple[list[int], list[int]]:
+    """테이블 초기화 후 의사/진료 항목(30분, 60분) 생성"""
+    async with get_async_session() as session:
+        await reset_test_tables(session)
+        doctors = [Doctor(name=f"의사{i + 1}", department="피부과", is_active=True) for i in range(doctor_count)]
+        treatments = [
+            Treatment(name="기본 진료", duration_minutes=30, price=Decimal("50000.00"), is_active=True),
+            Treatment(name="복합 치료", duration_minutes=60, price=Decimal("100000.00"), is_active=True),
+        ]
+        session.add_all([*doctors, *treatments])
+        await session.commit()
+        return [doctor.id for doctor in doctors], [treatment.id for treatment in treatments]
+
+
+def build_requests(
+    request_count: int, doctor_ids: list[int], treatment_ids: list[int], seed: int
+) -> list[CreateAppointmentRequest]:
+    """소수의 의사/시간대에 몰리는 예약 요청 생성 (엔진 간 동일한 요청 사용)"""
+    rng = random.Random(seed)
+    return [
+        CreateAppointmentRequest(
+            patient_name=f"환자{index}",
+            patient_phone=f"010-{index // 10000:04d}-{index % 10000:04d}",
+            doctor_id=rng.choice(doctor_ids),
+            treatment_id=rng.choice(treatment_ids),
+            appointment_datetime=BOOKING_DATE.replace(hour=9) + timedelta(minutes=15 * rng.randrange(SLOT_COUNT)),
+        )
+        for index in range(request_count)
+    ]
+
+
+async def count_overlapping_pairs() -> int:
+    """같은 의사의 겹치는 활성 예약 쌍 수 (0이어야 정상)"""
+    other = aliased(Appointment)
+    treatment = aliased(Treatment)
+    other_treatment = aliased(Treatment)
+    query = (
+        select(func.count())
+        .select_from(Appointment)
+        .join(treatment, Appointment.treatment_id == treatment.id)
+        .join(other, (other.doctor_id == Appointment.doctor_id) & (other.id > Appointment.id))
+        .join(other_treatment, other.treatment_id == other_treatment.id)
+        .where(
+            Appointment.status != AppointmentStatus.CANCELLED,
+            other.status != AppointmentStatus.CANCELLED,
+            other.appointment_datetime
+            < func.timestampadd(literal_column("MINUTE"), treatment.duration_minutes, Appointment.appointment_datetime),
+            Appointment.appointment_datetime
+            < func.timestampadd(literal_column("MINUTE"), other_treatment.duration_minutes, other.appointment_datetime),
+        )
+    )
+    async with get_async_session() as session:
+        result = await session.execute(query)
+        return result.scalar_one()
+
+
+async def run_engine(
+    engine: BookingEngine, requests: list[CreateAppointmentRequest], concurrency: int, doctor_count: int
+) -> BenchmarkResult:
+    settings.booking_engine = engine
+    doctor_ids, treatment_ids = await prepare_data(doctor_count)
+    # 엔진별로 새로 생성된 ID에 맞춰 요청의 의사/진료 항목 ID를 다시 매핑
+    requests = [
+        request.model_copy(
+            update={
+                "doctor_id": doctor_ids[request.doctor_id % doctor_count],
+                "treatment_id": treatment_ids[request.treatment_id % len(treatment_ids)],
+            }
+        )
+        for request in requests
+    ]
+
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    outcomes: Counter[str] = Counter()
+    lock_wait_before = booking_lock_metrics.wait_seconds_total
+
+    async def book(request: CreateAppointmentRequest) -> None:
+        async with semaphore:
+            started_at = time.perf_counter()
+            try:
+                await service_create_appointment(request)
+                outcomes["created"] += 1
+            except MediSolveAiException as error:
+                outcomes[error.message] += 1
+            except Exception as error:  # noqa: BLE001 - 벤치마크 결과에 에러 유형으로 집계
+                outcomes[type(error).__name__] += 1
+            latencies.append(time.perf_counter() - started_at)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*[book(request) for request in requests])
+    elapsed_seconds = time.perf_counter() - started_at
+
+    return BenchmarkResult(
+        engine=engine,
+        elapsed_seconds=elapsed_seconds,
+        latencies=latencies,
+        outcomes=outcomes,
+        overlapping_pairs=await count_overlapping_pairs(),
+        lock_wait_seconds=booking_lock_metrics.wait_seconds_total - lock_wait_before,
+    )
+
+
+def print_result(result: BenchmarkResult) -> None:
+    latencies_ms = sorted(latency * 1000 for latency in result.latencies)
+    quantiles = statistics.quantiles(latencies_ms, n=100)
+    total = len(latencies_ms)
+
+    print(f"[{result.engine.value}]")
+    print(f"  requests        : {total}")
+    print(f"  elapsed         : {result.elapsed_seconds:.3f}s ({total / result.elapsed_seconds:.1f} req/s)")
+    print(f"  latency p50/p95 : {quantiles[49]:.1f}ms / {quantiles[94]:.1f}ms (max {latencies_ms[-1]:.1f}ms)")
+    print(f"  lock wait total : {result.lock_wait_seconds:.3f}s")
+    print(f"  overlapping     : {result.overlapping_pairs} (must be 0)")
+    for outcome, count in result.outcomes.most_common():
+        print(f"  {outcome}: {count}")
+
+
+async def main(request_count: int = 500, concurrency: int = 15, doctor_count: int = 5, seed: int = 42) -> None:
+    if not settings.is_test:
+        raise SystemExit("테스트 DB를 초기화하므로 ENVIRONMENT=test 에서만 실행합니다.")
+
+    requests = build_requests(request_count, list(range(doctor_count)), [0, 1], seed)
+    for engine in BookingEngine:
+        print_result(await run_engine(engine, requests, concurrency, doctor_count))
+
+    async with get_async_session() as session:
+        await reset_test_tables(session)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(*parse_args()))